@@ -45,11 +45,13 @@ def main():
         else:
             logger.info(f"UVX {check_results[LibType.UVX].version} is installed at {check_results[LibType.UVX].path}")
 
+        from mcpo_simple_server.config import MCP_WEBSOCKET_PER_MESSAGE_DEFLATE  # pylint: disable=C0415
         uvicorn.run(
             "mcpo_simple_server.main:app",
             host=args.host,
             port=args.port,
-            reload=args.reload
+            reload=args.reload,
+            ws_per_message_deflate=MCP_WEBSOCKET_PER_MESSAGE_DEFLATE
         )
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
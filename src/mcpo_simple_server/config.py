@@ -24,13 +24,51 @@ ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD")
 
 # --- Config Storage ---
 # If the path points to a file (config.json), extract the directory path
-CONFIG_STORAGE_TYPE = os.getenv("CONFIG_STORAGE_TYPE", "ddb")
+CONFIG_STORAGE_TYPE = os.getenv("CONFIG_STORAGE_TYPE", "ddb")  # ddb | nosqlite | sqlite | redis | memory
 CONFIG_STORAGE_PATH = os.getenv("CONFIG_STORAGE_PATH", str(APP_PATH / "data" / "config"))
 if CONFIG_STORAGE_PATH.endswith(".db") or CONFIG_STORAGE_PATH.endswith(".json"):
     CONFIG_STORAGE_PATH = os.path.dirname(CONFIG_STORAGE_PATH)
+CONFIG_STORAGE_IO_WORKERS = int(os.getenv("CONFIG_STORAGE_IO_WORKERS", "2"))  # Threads running blocking storage I/O off the event loop
+TOOLS_CACHE_PACK_COMPACT_RATIO = float(os.getenv("TOOLS_CACHE_PACK_COMPACT_RATIO", "0.5"))  # Garbage fraction of the tool cache pack triggering compaction
+CONFIG_WRITE_BEHIND_DELAY = float(os.getenv("CONFIG_WRITE_BEHIND_DELAY", "0"))  # Debounce window merging saves of one config document, 0 disables
+CONFIG_WRITE_BEHIND_MAX_DELAY = float(os.getenv("CONFIG_WRITE_BEHIND_MAX_DELAY", "2"))  # Longest time a config document save stays pending
+CONFIG_USER_CACHE_SIZE = int(os.getenv("CONFIG_USER_CACHE_SIZE", "1000"))  # Max number of user configs kept in memory (LRU) by the ddb/nosqlite/redis backends
+CONFIG_STORAGE_REDIS_URL = os.getenv("CONFIG_STORAGE_REDIS_URL", "redis://localhost:6379/0")  # Store shared by all gateway nodes (CONFIG_STORAGE_TYPE=redis)
+CONFIG_STORAGE_REDIS_PREFIX = os.getenv("CONFIG_STORAGE_REDIS_PREFIX", "mcpo:")  # Prefix of the keys and of the change channel in the shared store
+CONFIG_STORAGE_REDIS_TIMEOUT = float(os.getenv("CONFIG_STORAGE_REDIS_TIMEOUT", "5"))  # Seconds to wait for a reply of the shared store before reconnecting
 
 # --- Tools ---
 TOOLS_BLACKLIST = os.getenv("TOOLS_BLACKLIST", "").replace(" ", "").split(",")
+# Validate tool arguments against the tool inputSchema before forwarding to the mcpserver
+TOOLS_VALIDATE_ARGUMENTS = os.getenv("TOOLS_VALIDATE_ARGUMENTS", "True").lower() in ("true", "1", "t", "yes")
+TOOLS_SCHEMA_VALIDATOR_CACHE_SIZE = int(os.getenv("TOOLS_SCHEMA_VALIDATOR_CACHE_SIZE", "1024"))
+TOOLS_BATCH_MAX_CALLS = int(os.getenv("TOOLS_BATCH_MAX_CALLS", "50"))  # Max tool calls in one /api/v1/user/tools/batch request
+TOOLS_BATCH_MAX_CONCURRENCY_PER_SERVER = int(os.getenv("TOOLS_BATCH_MAX_CONCURRENCY_PER_SERVER", "4"))  # Calls of a batch running at once on one mcpserver
+
+# --- MCP Transports ---
+MCP_STREAMABLE_JSON_RESPONSE = os.getenv("MCP_STREAMABLE_JSON_RESPONSE", "False").lower() in ("true", "1", "t", "yes")  # Plain JSON responses on the stateful Streamable HTTP mount (/api/v1/mcp)
+MCP_STREAMABLE_STATELESS_PATH = os.getenv("MCP_STREAMABLE_STATELESS_PATH", "/api/v1/mcp-stateless")  # Stateless Streamable HTTP mount (no session affinity), empty disables
+MCP_STREAMABLE_STATELESS_JSON_RESPONSE = os.getenv("MCP_STREAMABLE_STATELESS_JSON_RESPONSE", "True").lower() in ("true", "1", "t", "yes")  # Plain JSON responses on the stateless mount
+MCP_STREAMABLE_EVENT_STORE = os.getenv("MCP_STREAMABLE_EVENT_STORE", "True").lower() in ("true", "1", "t", "yes")  # Keep sent events of stateful sessions for Last-Event-ID replay
+MCP_STREAMABLE_EVENT_STORE_MAX_EVENTS = int(os.getenv("MCP_STREAMABLE_EVENT_STORE_MAX_EVENTS", "256"))  # Ring buffer size of one stream (request) of a session
+MCP_STREAMABLE_EVENT_STORE_MAX_BYTES = int(os.getenv("MCP_STREAMABLE_EVENT_STORE_MAX_BYTES", str(16 * 1024 * 1024)))  # Byte budget of all kept events, oldest are evicted first
+MCP_STREAMABLE_EVENT_STORE_TTL = float(os.getenv("MCP_STREAMABLE_EVENT_STORE_TTL", "300"))  # Seconds an event is kept for replay
+MCP_MAX_SESSIONS = int(os.getenv("MCP_MAX_SESSIONS", "1000"))                      # Max open SSE + stateful Streamable HTTP sessions, 0 = unlimited
+MCP_MAX_SESSIONS_PER_USER = int(os.getenv("MCP_MAX_SESSIONS_PER_USER", "20"))      # Max open sessions of one user (anonymous: per client address), 0 = unlimited
+MCP_SESSION_IDLE_TIMEOUT = float(os.getenv("MCP_SESSION_IDLE_TIMEOUT", "1800"))    # Seconds without MCP messages after which a session is closed, 0 disables
+MCP_SESSION_REAP_INTERVAL = float(os.getenv("MCP_SESSION_REAP_INTERVAL", "30"))    # Seconds between idle session checks
+MCP_KEEPALIVE_INTERVAL = float(os.getenv("MCP_KEEPALIVE_INTERVAL", "15"))          # Seconds between keepalive pings on SSE streams, 0 disables
+MCP_WEBSOCKET_PATH = os.getenv("MCP_WEBSOCKET_PATH", "/api/v1/ws")                 # WebSocket MCP endpoint (one socket per session), empty disables
+MCP_WEBSOCKET_PER_MESSAGE_DEFLATE = os.getenv("MCP_WEBSOCKET_PER_MESSAGE_DEFLATE", "True").lower() in ("true", "1", "t", "yes")  # Offer permessage-deflate on WebSocket handshakes
+MCP_BATCH_MAX_MESSAGES = int(os.getenv("MCP_BATCH_MAX_MESSAGES", "20"))          # Max messages of a JSON-RPC batch POSTed to the SSE / Streamable HTTP endpoints, 0 refuses batches
+
+# --- Upstream MCPServers (streamable-http / sse transports) ---
+MCP_UPSTREAM_HTTP2 = os.getenv("MCP_UPSTREAM_HTTP2", "True").lower() in ("true", "1", "t", "yes")  # HTTP/2 to remote mcpservers, needs the optional `h2` package
+MCP_UPSTREAM_MAX_CONNECTIONS = int(os.getenv("MCP_UPSTREAM_MAX_CONNECTIONS", "100"))  # Connections of the shared pool of all remote mcpservers, 0 = unlimited
+MCP_UPSTREAM_MAX_CONNECTIONS_PER_SERVER = int(os.getenv("MCP_UPSTREAM_MAX_CONNECTIONS_PER_SERVER", "10"))  # Concurrent requests to one remote mcpserver, 0 = unlimited
+MCP_UPSTREAM_KEEPALIVE_EXPIRY = float(os.getenv("MCP_UPSTREAM_KEEPALIVE_EXPIRY", "30"))  # Seconds an idle pooled connection is kept open
+MCP_UPSTREAM_CONNECT_TIMEOUT = float(os.getenv("MCP_UPSTREAM_CONNECT_TIMEOUT", "10"))  # Seconds to connect to a remote mcpserver
+MCP_UPSTREAM_TIMEOUT = float(os.getenv("MCP_UPSTREAM_TIMEOUT", "30"))  # Seconds to wait for the response of a remote mcpserver
 
 # --- Cleanup MCPServers ---
 MCPSERVER_CLEANUP_INTERVAL = int(os.getenv("MCPSERVER_CLEANUP_INTERVAL", "5"))
@@ -71,6 +109,19 @@ if API_KEY_ENCRYPTION_KEY is None:
     logger.error("Example valid Fernet keys:\nAPI_KEY_ENCRYPTION_KEY=" + "\nAPI_KEY_ENCRYPTION_KEY=".join(example_keys))
     EXIT_ON_ERROR = 1
 
+# --- Auth Cache ---
+AUTH_CACHE_TTL = int(os.getenv("AUTH_CACHE_TTL", "300"))          # Max lifetime (seconds) of a cached authentication result
+AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", "10000"))      # Max number of cached tokens, 0 disables the cache
+AUTH_CACHE_LOCAL_TTL = int(os.getenv("AUTH_CACHE_LOCAL_TTL", "10"))     # Max lifetime (seconds) with a storage not notifying other processes of changes (file backends)
+
+# --- Login Protection ---
+AUTH_PASSWORD_HASH_WORKERS = int(os.getenv("AUTH_PASSWORD_HASH_WORKERS", "2"))      # Threads running bcrypt hash/verify off the event loop
+LOGIN_MAX_CONCURRENT = int(os.getenv("LOGIN_MAX_CONCURRENT", "4"))                  # Max logins processed at the same time
+LOGIN_QUEUE_TIMEOUT = float(os.getenv("LOGIN_QUEUE_TIMEOUT", "10"))                 # Seconds a login waits for a free slot before 503
+LOGIN_MAX_FAILURES_PER_USER = int(os.getenv("LOGIN_MAX_FAILURES_PER_USER", "5"))    # Failed logins per username and client IP within the window before 429
+LOGIN_MAX_FAILURES_PER_IP = int(os.getenv("LOGIN_MAX_FAILURES_PER_IP", "20"))       # Failed logins per client IP within the window before 429
+LOGIN_FAILURE_WINDOW = int(os.getenv("LOGIN_FAILURE_WINDOW", "300"))                # Failed login counting window (seconds)
+
 if EXIT_ON_ERROR:
     logger.error("-----")
     logger.error("Exiting due to configuration errors.")
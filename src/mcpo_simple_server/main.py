@@ -11,7 +11,8 @@ from mcpo_simple_server.config import (
     MCPSERVER_CLEANUP_TIMEOUT,
     APP_VERSION,
     APP_NAME,
-    LIB_PATH
+    LIB_PATH,
+    MCP_WEBSOCKET_PATH
 )
 import mcpo_simple_server.routers.root as root_module
 import mcpo_simple_server.routers.user as user_module
@@ -32,6 +33,8 @@ from mcpo_simple_server.services.mcp_streamable import setup_mcp_streamable
 from mcpo_simple_server.services.mcp_streamable.setup import mcp_streamable_lifespan
 # Import MCP SSE integration
 from mcpo_simple_server.services.mcp_sse import setup_mcp_sse
+from mcpo_simple_server.services.mcp_websocket import setup_mcp_websocket
+from mcpo_simple_server.services.mcp_core_logic.live_sessions import get_live_sessions
 from mcpo_simple_server.routers.mcp.v1_api_sse_docs import SSE_OPENAPI_PATHS  # Import custom SSE docs
 from dotenv import load_dotenv
 from fastapi import FastAPI
@@ -51,6 +54,7 @@ async def lifespan(fastapi_app: FastAPI):
     logger.info("Initializing Services")
     fastapi_app.state.config_service = ConfigService(options={"db_path": CONFIG_STORAGE_PATH})
     set_config_service(fastapi_app.state.config_service)
+    await fastapi_app.state.config_service.api_key_index.load()
     fastapi_app.state.mcpserver_service = McpServerService()
     await fastapi_app.state.mcpserver_service.load_blacklist_tools()
     set_mcpserver_service(fastapi_app.state.mcpserver_service)
@@ -65,6 +69,8 @@ async def lifespan(fastapi_app: FastAPI):
     await mcpo_public_tools_router.initialize()
     # Include the router with the dynamically created endpoints
     fastapi_app.include_router(mcpo_public_tools_router.router)
+    # Keep the endpoints in sync with mcpserver/tools changes
+    mcpo_public_tools_router.subscribe(fastapi_app)
 
     # Set up MCP Streamable HTTP integration
     setup_mcp_streamable(fastapi_app)
@@ -78,12 +84,22 @@ async def lifespan(fastapi_app: FastAPI):
     )
     logger.info("MCP SSE integration initialized")
 
+    # Set up MCP WebSocket integration
+    if MCP_WEBSOCKET_PATH:
+        setup_mcp_websocket(fastapi_app, path=MCP_WEBSOCKET_PATH)
+        logger.info("MCP WebSocket integration initialized")
+
     # Start periodic cleanup task for idle user-specific server instances
     cleanup_task = asyncio.create_task(periodic_idle_server_cleanup(fastapi_app, 5))
 
+    # Caps, keepalive and idle eviction of the open MCP sessions
+    get_live_sessions().start()
+
     async with mcp_streamable_lifespan():
         yield  # This is where the FastAPI application runs
 
+    await get_live_sessions().stop()
+
     # Shutdown tasks
     logger.info("Shutting down server processes...")
 
@@ -95,6 +111,10 @@ async def lifespan(fastapi_app: FastAPI):
         force_exit_handle = loop.call_later(3.0, lambda: os._exit(0))
         logger.warning("Scheduled force exit in 3 seconds if graceful shutdown fails")
 
+        # Write pending config changes before anything else can fail
+        logger.info("Flushing pending config writes...")
+        await fastapi_app.state.config_service.flush()
+
         # First, close all SSE connections
         # from mcpo_simple_server.routers.mcp.messages_handlers.utils import sse_transport    # pylint: disable=C0415
         # logger.info("Shutting down SSE transport...")
@@ -104,6 +124,7 @@ async def lifespan(fastapi_app: FastAPI):
         # Then shutdown all server processes (both global and user-specific)
         logger.info("Shutting down server manager...")
         await fastapi_app.state.mcpserver_service.admin.stop_all_mcpservers()
+        await fastapi_app.state.mcpserver_service.upstream.close()
         logger.info("All server processes terminated successfully")
 
         # If we got here successfully, we can cancel the force exit
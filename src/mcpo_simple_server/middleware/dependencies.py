@@ -41,12 +41,12 @@ Notes:
 """
 
 from typing import Optional
-from fastapi import Request
+from fastapi import HTTPException, Request
+from fastapi.security import HTTPBearer
 
-from mcpo_simple_server.services.auth import (
-    get_authenticated_by_jwt_token,
-    get_authenticated_by_api_key
-)
+from mcpo_simple_server.services.auth import get_authenticated_user
+
+bearer_scheme = HTTPBearer(auto_error=False, scheme_name="Authorization")
 
 
 async def get_username(request: Request) -> Optional[str]:
@@ -63,23 +63,13 @@ async def get_username(request: Request) -> Optional[str]:
     Returns:
         Optional[str]: Username if authenticated, None otherwise
     """
-    try:
-        # Try JWT authentication first
-        user = await get_authenticated_by_jwt_token(request)
-        if user:
-            return user.username
-    except Exception:
-        # JWT authentication failed, try API key
-        pass
+    auth = await bearer_scheme(request)
+    if auth is None:
+        return None
 
     try:
-        # Try API key authentication
-        user = await get_authenticated_by_api_key(request)
-        if user:
-            return user.username
-    except Exception:
-        # API key authentication failed
-        pass
-
-    # No authentication method succeeded
-    return None
+        user = await get_authenticated_user(request, auth)
+        return user.username
+    except HTTPException:
+        # No authentication method succeeded
+        return None
@@ -8,5 +8,10 @@ router = APIRouter(
 
 # Import modules to register routes
 from mcpo_simple_server.routers.admin import v1_post_tools_reload     # noqa: F401, E402
+from mcpo_simple_server.routers.admin import v1_get_tools_memory      # noqa: F401, E402
+from mcpo_simple_server.routers.admin import v1_get_login_stats       # noqa: F401, E402
+from mcpo_simple_server.routers.admin import v1_get_storage_stats     # noqa: F401, E402
+from mcpo_simple_server.routers.admin import v1_get_mcp_event_store_stats  # noqa: F401, E402
+from mcpo_simple_server.routers.admin import v1_get_mcp_sessions       # noqa: F401, E402
 from mcpo_simple_server.routers.admin import v1_post_user             # noqa: F401, E402
 from mcpo_simple_server.routers.admin import v1_delete_user           # noqa: F401, E402
@@ -0,0 +1,22 @@
+"""
+Admin Login Stats Router
+
+This module reports login throttling counters and login latency percentiles.
+"""
+from typing import Dict, Any
+from fastapi import Depends
+from mcpo_simple_server.services.config.models import UserConfigPublicModel
+from mcpo_simple_server.services.auth import get_current_admin_user
+from mcpo_simple_server.services.auth.login_guard import get_login_guard
+from mcpo_simple_server.routers.admin import router
+
+
+@router.get("/auth/login-stats", response_model=Dict[str, Any])
+async def get_login_stats(
+    _: UserConfigPublicModel = Depends(get_current_admin_user)
+):
+    """
+    Report login counters (succeeded, failed, throttled, rejected_busy), the number of
+    logins in progress and latency percentiles of recent logins in milliseconds.
+    """
+    return get_login_guard().get_stats()
@@ -0,0 +1,25 @@
+"""
+Admin MCP Event Store Stats Router
+
+This module reports the counters of the Streamable HTTP event store (resumable streams).
+"""
+from typing import Dict, Any
+from fastapi import Depends
+from mcpo_simple_server.services.config.models import UserConfigPublicModel
+from mcpo_simple_server.services.auth import get_current_admin_user
+from mcpo_simple_server.services.mcp_streamable.event_store import get_event_store
+from mcpo_simple_server.routers.admin import router
+
+
+@router.get("/mcp/event-store/stats", response_model=Dict[str, Any])
+async def get_mcp_event_store_stats(
+    _: UserConfigPublicModel = Depends(get_current_admin_user)
+):
+    """
+    Report event store counters (stored, replay hits / misses, replayed events, evictions by
+    stream limit, byte budget and TTL) and its current usage, just `enabled: false` when disabled.
+    """
+    event_store = get_event_store()
+    if event_store is None:
+        return {"enabled": False}
+    return {"enabled": True, **event_store.get_stats()}
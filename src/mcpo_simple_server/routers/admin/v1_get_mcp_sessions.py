@@ -0,0 +1,23 @@
+"""
+Admin MCP Sessions Router
+
+This module lists the open MCP sessions (SSE and stateful Streamable HTTP).
+"""
+from typing import Dict, Any
+from fastapi import Depends
+from mcpo_simple_server.services.config.models import UserConfigPublicModel
+from mcpo_simple_server.services.auth import get_current_admin_user
+from mcpo_simple_server.services.mcp_core_logic.live_sessions import get_live_sessions
+from mcpo_simple_server.routers.admin import router
+
+
+@router.get("/mcp/sessions", response_model=Dict[str, Any])
+async def get_mcp_sessions(
+    _: UserConfigPublicModel = Depends(get_current_admin_user)
+):
+    """
+    List the open MCP sessions with transport, user, client, age, last activity and bytes
+    sent, and the session counters (admitted, refused by cap, evicted as idle) and limits.
+    """
+    live_sessions = get_live_sessions()
+    return {"sessions": live_sessions.list_sessions(), "stats": live_sessions.get_stats()}
@@ -0,0 +1,24 @@
+"""
+Admin Storage Stats Router
+
+This module reports config storage cache counters.
+"""
+from typing import Dict, Any, TYPE_CHECKING
+from fastapi import Depends, Request
+from mcpo_simple_server.services.config.models import UserConfigPublicModel
+from mcpo_simple_server.services.auth import get_current_admin_user
+from mcpo_simple_server.routers.admin import router
+if TYPE_CHECKING:
+    from mcpo_simple_server.services.config import ConfigService
+
+
+@router.get("/storage/stats", response_model=Dict[str, Any])
+async def get_storage_stats(
+    request: Request,
+    _: UserConfigPublicModel = Depends(get_current_admin_user)
+):
+    """
+    Report config storage cache hits, misses, hit rate and disk reads.
+    """
+    config_service: 'ConfigService' = request.app.state.config_service
+    return config_service.get_storage_stats()
@@ -0,0 +1,30 @@
+"""
+Admin Tools Memory Router
+
+This module reports memory used by tool definitions held by MCP servers.
+"""
+from typing import Dict, Any, TYPE_CHECKING
+from fastapi import Depends, Request
+from mcpo_simple_server.services.config.models import UserConfigPublicModel
+from mcpo_simple_server.services.auth import get_current_admin_user
+from mcpo_simple_server.routers.admin import router
+if TYPE_CHECKING:
+    from mcpo_simple_server.services.mcpserver import McpServerService
+
+
+@router.get("/tools/memory", response_model=Dict[str, Any])
+async def get_tools_memory(
+    request: Request,
+    _: UserConfigPublicModel = Depends(get_current_admin_user)
+):
+    """
+    Report memory used by tool definitions with and without deduplication.
+
+    Identical tool definitions (e.g. the same public MCP server configured by many users)
+    are stored once and referenced by content digest.
+
+    Returns:
+        Dict with reference/definition counts and approximate sizes in bytes.
+    """
+    mcpserver_service: 'McpServerService' = request.app.state.mcpserver_service
+    return mcpserver_service.get_tools_memory_report()
@@ -36,6 +36,8 @@ async def reload_tools(
     request.app.router.routes = routes_to_keep
 
     # Replace the global tools routers with new instances
+    user_tools_module.mcpo_user_tools_router.close()
+    public_tools_module.mcpo_public_tools_router.close()
     public_tools_module.mcpo_public_tools_router = public_tools_module.MCPOPublicToolsRouter()
     user_tools_module.mcpo_user_tools_router = user_tools_module.MCPOUserToolsRouter()
 
@@ -46,6 +48,7 @@ async def reload_tools(
     # Include the new routers in the app
     request.app.include_router(public_tools_module.mcpo_public_tools_router.router)
     request.app.include_router(user_tools_module.mcpo_user_tools_router.router)
+    public_tools_module.mcpo_public_tools_router.subscribe(request.app)
 
     # Force OpenAPI schema to be rebuilt
     request.app.openapi_schema = None
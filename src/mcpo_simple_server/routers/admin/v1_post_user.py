@@ -3,7 +3,7 @@ from loguru import logger
 from typing import Optional, TYPE_CHECKING
 from fastapi import Body, Depends, HTTPException, status, Request
 from mcpo_simple_server.services.config.models import UserConfigPublicModel, UserConfigModel, UserCreateRequest
-from mcpo_simple_server.services.auth import get_current_admin_user, get_number_of_users, get_password_hash
+from mcpo_simple_server.services.auth import get_current_admin_user, get_number_of_users, get_password_hash_async
 if TYPE_CHECKING:
     from mcpo_simple_server.services.config import ConfigService
     from mcpo_simple_server.services.auth.models import AuthUserModel
@@ -59,7 +59,7 @@ async def create_new_user(
     # Create user data with hashed password
     user_data = UserConfigModel(
         username=user_in.username,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await get_password_hash_async(user_in.password),
         group="users",
         disabled=user_in.disabled,
         api_keys={},
@@ -50,9 +50,13 @@ async def status_mcpserver(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"McpServer '{mcpserver_name}' not found"
             )
+        # Copy - the registered model keeps the process, env and headers
+        mcpserver = McpServerModel(**mcpserver.model_dump())
         mcpserver.process = None
         for env in mcpserver.env:
             mcpserver.env[env] = "hidden"
+        for header in mcpserver.headers:
+            mcpserver.headers[header] = "hidden"
         return mcpserver
     except Exception as e:
         logger.error(f"Error getting status of mcpserver '{mcpserver_name}' for user '{current_user.username}': {str(e)}")
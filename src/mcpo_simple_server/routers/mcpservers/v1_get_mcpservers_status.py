@@ -56,9 +56,13 @@ async def status_mcpservers(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"McpServer '{mcpserver_id}' not found"
                 )
+            # Copy - the registered model keeps the process, env and headers
+            mcpserver = McpServerModel(**mcpserver.model_dump())
             mcpserver.process = None
             for env in mcpserver.env:
                 mcpserver.env[env] = "hidden"
+            for header in mcpserver.headers:
+                mcpserver.headers[header] = "hidden"
 
             if view == ViewType.SIMPLE:
                 mcpserver.tools = []
@@ -49,6 +49,8 @@ async def start_mcpserver(
         start_result.process = None
         for env in start_result.env:
             start_result.env[env] = "hidden"
+        for header in start_result.headers:
+            start_result.headers[header] = "hidden"
         logger.info(f"Started mcpserver '{mcpserver_name}' for user '{current_user.username}'")
         return start_result
     except Exception as e:
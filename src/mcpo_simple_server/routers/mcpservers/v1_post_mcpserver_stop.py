@@ -49,6 +49,8 @@ async def stop_mcpserver(
         stop_result.process = None
         for env in stop_result.env:
             stop_result.env[env] = "hidden"
+        for header in stop_result.headers:
+            stop_result.headers[header] = "hidden"
         logger.info(f"Stopped mcpserver '{mcpserver_name}' for user '{current_user.username}'")
         return stop_result
     except Exception as e:
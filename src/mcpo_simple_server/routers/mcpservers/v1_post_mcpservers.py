@@ -90,6 +90,7 @@ async def add_mcpserver(
         # Validate if the mcpserver configuration is valid
         try:
             mcpserver_model = McpServerConfigModel(**mcpserver_config)
+            mcpserver_model.validate_transport()
         except Exception as e:
             logger.error(f"Invalid mcpserver configuration for '{mcpserver_name}': {str(e)}")
             responses.append(McpServerResponse(
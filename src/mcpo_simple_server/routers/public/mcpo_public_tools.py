@@ -1,11 +1,15 @@
-from typing import Dict, List, Any, Type
-from fastapi import APIRouter, HTTPException, Depends, Body
+from typing import Callable, Dict, List, Any, Optional, Set, Type
+from fastapi import APIRouter, FastAPI, HTTPException, Depends, Body, Request
+from fastapi.routing import APIRoute
 from pydantic import create_model, Field
 from loguru import logger
+from sse_starlette.sse import EventSourceResponse
 from mcpo_simple_server.services.mcpserver import McpServerService
-from mcpo_simple_server.services import get_mcpserver_service
+from mcpo_simple_server.services import get_mcpserver_service, get_config_service
+from mcpo_simple_server.services.config.events import ConfigEvent, ConfigEventType
 from mcpo_simple_server.config import APP_VERSION
 from mcpo_simple_server.utils.tools.process_tool_response import process_tool_response
+from mcpo_simple_server.utils.tools.stream_tool_response import STREAM_TOOL_RESPONSES, stream_tool_response, wants_event_stream
 
 
 class MCPOPublicToolsRouter:
@@ -15,6 +19,10 @@ class MCPOPublicToolsRouter:
     This class creates a FastAPI router with dynamically generated endpoints
     for each tool available in the server. Each tool gets its own dedicated
     endpoint with proper documentation based on the tool's metadata.
+
+    Once subscribed to config events, a server or tools change re-creates only the
+    endpoints of the affected mcpserver (in this router and in the app) and drops the
+    cached app OpenAPI schema.
     """
 
     def __init__(self):
@@ -27,6 +35,9 @@ class MCPOPublicToolsRouter:
         self.tools_metadata = {}
         self.initialized = False
         self._dynamic_route_names = set()  # Track dynamic endpoint names
+        self._mcpserver_route_names: Dict[str, Set[str]] = {}  # mcpserver_id -> dynamic endpoint names
+        self._app: Optional[FastAPI] = None
+        self._unsubscribe: List[Callable[[], None]] = []
 
     async def initialize(self):
         """
@@ -45,6 +56,7 @@ class MCPOPublicToolsRouter:
                     new_routes.append(route)
             self.router.routes = new_routes
             self._dynamic_route_names.clear()
+            self._mcpserver_route_names.clear()
         self.initialized = False
 
         # Fetch all available tools
@@ -76,13 +88,94 @@ class MCPOPublicToolsRouter:
         # Return the router to allow chaining
         return self.router
 
-    def _create_tool_endpoint(self, server_id: str, tool: Dict[str, Any]):
+    def subscribe(self, app: FastAPI) -> None:
+        """
+        Keep the endpoints of `app` in sync with mcpserver and tools changes.
+
+        Args:
+            app: The FastAPI application the router is included in
+        """
+        self.close()
+        self._app = app
+        events = get_config_service().events
+        self._unsubscribe = [
+            events.subscribe(ConfigEventType.SERVER_CHANGED, self._on_mcpserver_changed),
+            events.subscribe(ConfigEventType.TOOLS_CHANGED, self._on_mcpserver_changed),
+            events.subscribe(ConfigEventType.BLACKLIST_CHANGED, self._on_blacklist_changed),
+        ]
+
+    def close(self) -> None:
+        """Unsubscribe from config events (the instance is being replaced)."""
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe = []
+        self._app = None
+
+    def _on_mcpserver_changed(self, event: ConfigEvent) -> None:
+        if event.mcpserver_id:
+            self.refresh_mcpserver(event.mcpserver_id)
+
+    def _on_blacklist_changed(self, _event: ConfigEvent) -> None:
+        mcpserver_ids = set(self._mcpserver_route_names)
+        mcpserver_ids.update(tool.get("mcpserver") for tool in self.tools_metadata.values())
+        mcpserver_ids.update(get_mcpserver_service().list_mcpservers())
+        for mcpserver_id in mcpserver_ids:
+            if mcpserver_id:
+                self.refresh_mcpserver(mcpserver_id)
+
+    def refresh_mcpserver(self, mcpserver_id: str) -> None:
+        """
+        Re-create the tool metadata and endpoints of one mcpserver from its current state.
+
+        Args:
+            mcpserver_id: ID of the changed (or deleted) mcpserver
+        """
+        if not self.initialized:
+            return
+        mcpserver = get_mcpserver_service().get_mcpserver(mcpserver_id)
+
+        # Remove the previous endpoints and metadata of this mcpserver
+        removed_names = self._mcpserver_route_names.pop(mcpserver_id, set())
+        if removed_names:
+            self.router.routes = [route for route in self.router.routes if getattr(route, "name", None) not in removed_names]
+            self._dynamic_route_names.difference_update(removed_names)
+        self.tools_metadata = {
+            tool_name: tool for tool_name, tool in self.tools_metadata.items()
+            if tool.get("mcpserver") != mcpserver_id
+        }
+
+        # Add the current ones (same data as list_all_tools)
+        added_routes: List[APIRoute] = []
+        if mcpserver is not None:
+            for tool in mcpserver.tools:
+                tool_copy = tool.copy()
+                tool_copy["mcpserver"] = mcpserver_id
+                self.tools_metadata[tool_copy["name"]] = tool_copy
+                if mcpserver.mcpserver_type == "public":
+                    route = self._create_tool_endpoint(mcpserver_id, tool_copy)
+                    if route is not None:
+                        added_routes.append(route)
+
+        if self._app is not None and (removed_names or added_routes):
+            # Routes of the app are copies made by include_router - match them by name under our prefix
+            self._app.router.routes = [
+                route for route in self._app.router.routes
+                if not (getattr(route, "name", None) in removed_names and getattr(route, "path", "").startswith(self.router.prefix))
+            ] + added_routes
+            self._app.openapi_schema = None
+        if removed_names or added_routes:
+            logger.info(f"Refreshed public tool endpoints of {mcpserver_id}: {len(removed_names)} removed, {len(added_routes)} added")
+
+    def _create_tool_endpoint(self, server_id: str, tool: Dict[str, Any]) -> Optional[APIRoute]:
         """
         Create a dedicated endpoint for a specific tool.
 
         Args:
             server_id: ID of the server containing this tool
             tool: Tool metadata dictionary
+
+        Returns:
+            The created route, None if the server is not found
         """
         mcpserver_service = get_mcpserver_service()
         tool_name = tool["name"]
@@ -91,7 +184,7 @@ class MCPOPublicToolsRouter:
         mcpserver = mcpserver_service.get_mcpserver(server_id)
         if mcpserver is None:
             logger.error(f"MCP server {server_id} not found")
-            return
+            return None
         mcpserver_name = mcpserver.name
 
         # Create a dynamic Pydantic model for the tool's input parameters
@@ -120,6 +213,7 @@ class MCPOPublicToolsRouter:
 
         # Create the endpoint function
         async def tool_endpoint(
+            request: Request,
             params: param_model = Body(..., description=f"Parameters for {tool_name}"),     # type: ignore
             server_manager: McpServerService = Depends(get_mcpserver_service)
         ):
@@ -131,6 +225,13 @@ class MCPOPublicToolsRouter:
                 # If it's already a dict, filter out None values
                 params_dict = {k: v for k, v in params.items() if v is not None}
 
+            # Server-Sent Events: progress while the tool runs, then the content blocks
+            if wants_event_stream(request):
+                server_manager.check_tool_call(tool["mcpserver"], tool_name, params_dict)
+                return EventSourceResponse(stream_tool_response(tool_name, lambda on_progress: server_manager.invoke_tool(
+                    tool["mcpserver"], tool_name, params_dict, on_progress=on_progress, checked=True
+                )))
+
             result = await server_manager.invoke_tool(tool["mcpserver"], tool_name, params_dict)
 
             if "isError" in result and result["isError"]:
@@ -160,14 +261,18 @@ class MCPOPublicToolsRouter:
             tool_endpoint,
             methods=["POST"],
             response_model=List[Any],
+            responses=STREAM_TOOL_RESPONSES,
             summary=f"Invoke {tool_name} from {mcpserver_name}",
             description=tool_description,
             operation_id=short_operation_id,  # Use explicit operation_id instead of name
             name=f"invoke_{mcpserver_name}_{tool_name}"
         )
         self._dynamic_route_names.add(f"invoke_{mcpserver_name}_{tool_name}")
+        self._mcpserver_route_names.setdefault(server_id, set()).add(f"invoke_{mcpserver_name}_{tool_name}")
 
         logger.debug(f"Created endpoint for tool: {mcpserver_name}/{tool_name}")
+        route = self.router.routes[-1]
+        return route if isinstance(route, APIRoute) else None
 
     def _get_field_type(self, type_str: str) -> Type:
         """
@@ -38,6 +38,10 @@ Endpoints:
 * /api/v1/user/config - User configuration
   - GET /api/v1/user/config - Get combined user and global configuration
 
+* /api/v1/user/tools/* - Tools
+  - GET /api/v1/user/tools/search - Search tools by name, description and parameter names
+  - POST /api/v1/user/tools/batch - Execute several tools concurrently (JSON array or NDJSON stream)
+
 Security Model:
 --------------
 - Authentication: JWT tokens with configurable expiration
@@ -90,4 +94,6 @@ from . import v1_delete_env_key  # noqa: F401, E402
 from . import v1_put_env_key  # noqa: F401, E402
 
 from . import v1_post_tool  # noqa: F401, E402
+from . import v1_post_tools_batch  # noqa: F401, E402
+from . import v1_get_tools_search  # noqa: F401, E402
 from . import v1_get_openapi_user  # noqa: F401, E402
@@ -1,7 +1,8 @@
-from typing import Dict, List, Any, Type
+from typing import Callable, Dict, List, Any, Set, Type
 from fastapi import APIRouter, HTTPException, status
 from loguru import logger
 from mcpo_simple_server.services import get_mcpserver_service, get_config_service
+from mcpo_simple_server.services.config.events import ConfigEvent, ConfigEventType
 from mcpo_simple_server.config import APP_VERSION
 
 
@@ -11,6 +12,10 @@ class MCPOUserToolsRouter:
 
     This class generates an OpenAPI schema for tools available to a specific user.
     It doesn't create actual endpoints, as invocation happens through v1_post_tool.py.
+
+    Tool metadata is cached per user and invalidated by config events: a user change
+    drops that user, a server or tools change drops the users of that mcpserver and a
+    blacklist change drops everything.
     """
 
     def __init__(self):
@@ -20,18 +25,61 @@ class MCPOUserToolsRouter:
         # Create a router just for OpenAPI schema generation
         self.router = APIRouter()
 
-        # Storage for tool metadata
-        self.user_tools: Dict[str, Dict[str, Any]] = {}
+        # Storage for tool metadata per user: {username: {tool_name: metadata}}
+        self.user_tools: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # mcpserver_id -> usernames whose cached tools were built from it
+        self._mcpserver_users: Dict[str, Set[str]] = {}
+        # Bumped by every invalidation - tools loaded meanwhile are not cached
+        self._version = 0
+        self._unsubscribe: List[Callable[[], None]] = []
 
     async def initialize(self):
         """
-        Initialize by setting up services.
+        Initialize by setting up services and subscribing to config events (once).
         """
+        if self.config_service is not None:
+            return
         self.mcpserver_service = get_mcpserver_service()
         self.config_service = get_config_service()
-
-        # Clear any existing tools
-        self.user_tools = {}
+        events = self.config_service.events
+        self._unsubscribe = [
+            events.subscribe(ConfigEventType.USER_CHANGED, self._on_user_changed),
+            events.subscribe(ConfigEventType.SERVER_CHANGED, self._on_mcpserver_changed),
+            events.subscribe(ConfigEventType.TOOLS_CHANGED, self._on_mcpserver_changed),
+            events.subscribe(ConfigEventType.BLACKLIST_CHANGED, self._on_blacklist_changed),
+        ]
+
+    def close(self) -> None:
+        """Unsubscribe from config events (the instance is being replaced)."""
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe = []
+
+    def invalidate(self, username: str) -> None:
+        """Drop the cached tools of a user."""
+        self._version += 1
+        if self.user_tools.pop(username, None) is not None:
+            logger.debug(f"Dropped cached tools of user {username}")
+        for usernames in self._mcpserver_users.values():
+            usernames.discard(username)
+
+    def _on_user_changed(self, event: ConfigEvent) -> None:
+        if event.username is None:
+            self._on_blacklist_changed(event)
+        else:
+            self.invalidate(event.username)
+
+    def _on_mcpserver_changed(self, event: ConfigEvent) -> None:
+        affected = set(self._mcpserver_users.pop(event.mcpserver_id, set())) if event.mcpserver_id else set()
+        if event.username:
+            affected.add(event.username)
+        for username in affected:
+            self.invalidate(username)
+
+    def _on_blacklist_changed(self, _event: ConfigEvent) -> None:
+        self._version += 1
+        self.user_tools.clear()
+        self._mcpserver_users.clear()
 
     async def load_tools(self, username: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -49,8 +97,9 @@ class MCPOUserToolsRouter:
         if self.config_service is None:
             raise ValueError("Config Service is not initialized")
 
-        # Clear existing tools
-        self.user_tools = {}
+        user_tools: Dict[str, Dict[str, Any]] = {}
+        mcpserver_ids: Set[str] = set()
+        version = self._version
 
         user_config = await self.config_service.user_config.get_config(username)
         if user_config is None or user_config.mcpServers is None:
@@ -70,6 +119,9 @@ class MCPOUserToolsRouter:
                     # We only load enabled mcpservers
                     continue
 
+                # Invalidated when this mcpserver changes, also while it is not registered yet
+                mcpserver_ids.add(mcpserver_id)
+
                 # Get mcpserver service model
                 mcpserver_model = self.mcpserver_service.get_mcpserver(mcpserver_id)
                 if mcpserver_model is None:
@@ -85,7 +137,7 @@ class MCPOUserToolsRouter:
                         tools = mcpserver_model.tools
                         logger.info(f"Found {len(tools)} cached tools for mcpserver '{mcpserver_name}'")
                     # If mcpserver is running, try to discover tools
-                    elif mcpserver_model.status == "running" and mcpserver_model.process:
+                    elif mcpserver_model.status == "running" and self.mcpserver_service.process_manager.is_running(mcpserver_id):
                         try:
                             logger.info(f"Discovering tools for mcpserver-id '{mcpserver_id}'")
                             tools = await self.mcpserver_service.discover_tools(mcpserver_id)
@@ -114,20 +166,26 @@ class MCPOUserToolsRouter:
                             "mcpserver_name": mcpserver_name
                         }
 
-                        self.user_tools[tool_name] = tool_metadata
+                        user_tools[tool_name] = tool_metadata
 
                 except Exception as e:
                     logger.error(f"Error loading tools from mcpserver {mcpserver_id}: {e}")
                     continue
 
             logger.info("-------------------------")
-            logger.info(f"👤 Summary: user {username} has {len(self.user_tools)} tools")
-            return self.user_tools
-
+            logger.info(f"👤 Summary: user {username} has {len(user_tools)} tools")
         except Exception as e:
             logger.error(f"Error loading tools for user {username}: {e}")
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to load tools: {str(e)}") from e
 
+        if version != self._version:
+            # Config changed while loading - serve the result, but do not cache it
+            return user_tools
+        self.user_tools[username] = user_tools
+        for mcpserver_id in mcpserver_ids:
+            self._mcpserver_users.setdefault(mcpserver_id, set()).add(username)
+        return user_tools
+
     def _get_field_type(self, type_str: str) -> Type:
         """
         Convert JSON Schema type to Python type.
@@ -160,9 +218,10 @@ class MCPOUserToolsRouter:
         Returns:
             OpenAPI schema dictionary for user-specific tools
         """
-        # Load tools for user if not already loaded or if they need to be refreshed
-        if not self.user_tools:
-            await self.load_tools(username)
+        # Load tools for user if not cached (dropped by config events when they change)
+        user_tools = self.user_tools.get(username)
+        if user_tools is None:
+            user_tools = await self.load_tools(username)
 
         # Create a minimal schema that doesn't rely on components.schemas
         user_tools_schema = {
@@ -187,7 +246,7 @@ class MCPOUserToolsRouter:
         }
 
         # Add each tool endpoint to the schema
-        for tool_name, tool_metadata in self.user_tools.items():
+        for tool_name, tool_metadata in user_tools.items():
             mcpserver_name = tool_metadata.get("mcpserver_name", "")
             description = tool_metadata.get("description", f"Tool: {tool_name}")
             input_schema = tool_metadata.get("inputSchema", {})
@@ -37,8 +37,9 @@ async def get_user_config(
         if config_data.user_config is not None:
             config_data.user_config.hashed_password = "*************"
 
-        # If user in group admins - then return also global config
+        # If user in group admins - then return also global config and tool caches
         if current_user.group == "admins":
+            await config_data.load_tools_cache()
             return config_data
 
         # Remove tools_cache and global_config from response
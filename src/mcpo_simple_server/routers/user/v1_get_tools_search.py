@@ -0,0 +1,39 @@
+"""
+Tool search handler for the user router.
+Provides an endpoint for authenticated users to search tools of their MCP servers.
+"""
+from . import router
+from typing import TYPE_CHECKING, List
+from fastapi import Depends, Request, Query
+from mcpo_simple_server.services.auth import get_authenticated_user
+from mcpo_simple_server.services import get_config_service
+from mcpo_simple_server.services.mcpserver.models import MCPoToolSearchResult
+if TYPE_CHECKING:
+    from mcpo_simple_server.services.auth.models import AuthUserModel
+    from mcpo_simple_server.services.mcpserver import McpServerService
+
+
+@router.get("/tools/search", response_model=List[MCPoToolSearchResult])
+async def search_tools(
+        request: Request,
+        q: str = Query(..., min_length=1, description="Search query (tool name, description or parameter names)"),
+        limit: int = Query(10, ge=1, le=100, description="Maximum number of results"),
+        current_user: 'AuthUserModel' = Depends(get_authenticated_user)
+):
+    """
+    Search tools of the current user's MCP servers.
+
+    Args:
+        request: The FastAPI request object
+        q: Search query
+        limit: Maximum number of results
+        current_user: Currently authenticated user
+
+    Returns:
+        Tools ranked by relevance, best match first
+    """
+    mcpserver_service: 'McpServerService' = request.app.state.mcpserver_service
+    # Same user blacklist as tools/list (get_tools)
+    user_config = await get_config_service().user_config.get_config(current_user.username)
+    return mcpserver_service.search_tools(q, username=current_user.username, limit=limit,
+                                          blacklist=getattr(user_config, 'blacklist_tools', None))
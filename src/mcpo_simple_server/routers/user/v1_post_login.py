@@ -10,6 +10,7 @@ from loguru import logger
 from pydantic import BaseModel, Field
 from mcpo_simple_server.config import ADMIN_PASSWORD, JWT_ACCESS_TOKEN_EXPIRE_MINUTES
 from mcpo_simple_server.services.auth import jwt, authenticate_user
+from mcpo_simple_server.services.auth.login_guard import get_login_guard
 from mcpo_simple_server.services.config.models import UserConfigModel
 if TYPE_CHECKING:
     from mcpo_simple_server.services.config import ConfigService
@@ -38,8 +39,34 @@ async def login_for_access_token(
        environment variable is checked and used to create the first admin account.
     2. Admin recovery: If username is 'admin' and ADMIN_PASSWORD is provided and matches,
        the login is allowed even if the stored password is different.
+
+    Logins are throttled: too many failed attempts for a username from a client IP, or
+    from a client IP overall, give HTTP 429, too many concurrent logins give HTTP 503
+    (both with Retry-After).
     """
+    login_guard = get_login_guard()
+    client_ip = request.client.host if request.client else "unknown"
+    reserved = login_guard.reserve_attempt(request_body.username, client_ip)
+
+    try:
+        async with login_guard.slot():
+            token_response = await _login(request, request_body)
+    except HTTPException as e:
+        if e.status_code == status.HTTP_401_UNAUTHORIZED:
+            login_guard.record_failure(request_body.username, client_ip)
+        else:
+            login_guard.release_attempt(request_body.username, client_ip, reserved)
+        raise
+    except BaseException:
+        login_guard.release_attempt(request_body.username, client_ip, reserved)
+        raise
+
+    login_guard.record_success(request_body.username, client_ip, reserved)
+    return token_response
+
 
+async def _login(request: Request, request_body: LoginRequest) -> TokenResponse:
+    """Verify the credentials and issue the access token."""
     config_service: 'ConfigService' = request.app.state.config_service
 
     # Check if request_body.username exist
@@ -72,7 +99,7 @@ async def login_for_access_token(
             try:
                 user_in_db = UserConfigModel(
                     username="admin",
-                    hashed_password=authenticate_user.get_password_hash(password_to_use),
+                    hashed_password=await authenticate_user.get_password_hash_async(password_to_use),
                     group="admins",
                     disabled=False
                 )
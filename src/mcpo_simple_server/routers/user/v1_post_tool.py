@@ -1,19 +1,24 @@
 """
 Tool execution handler for the user router.
 Provides an endpoint for authenticated users to invoke tools from MCP servers.
+
+With `Accept: text/event-stream` the call is answered with Server-Sent Events: progress
+of the tool while it runs, then the content blocks of the result (see stream_tool_response).
 """
 from . import router
 from typing import Dict, Any, TYPE_CHECKING, List
 from fastapi import Depends, HTTPException, status, Request, Body
 from loguru import logger
+from sse_starlette.sse import EventSourceResponse
 from mcpo_simple_server.services.auth import get_authenticated_user
 from mcpo_simple_server.utils.tools.process_tool_response import process_tool_response
+from mcpo_simple_server.utils.tools.stream_tool_response import STREAM_TOOL_RESPONSES, stream_tool_response, wants_event_stream
 if TYPE_CHECKING:
     from mcpo_simple_server.services.auth.models import AuthUserModel
     from mcpo_simple_server.services.mcpserver import McpServerService
 
 
-@router.post("/tool/{mcpserver}/{tool_name}", response_model=List[Any])
+@router.post("/tool/{mcpserver}/{tool_name}", response_model=List[Any], responses=STREAM_TOOL_RESPONSES)
 async def execute_tool(
         request: Request,
         mcpserver: str,
@@ -32,10 +37,11 @@ async def execute_tool(
         current_user: Currently authenticated user
 
     Returns:
-        Tool execution result
+        Tool execution result, or an event stream of it when the client accepts text/event-stream
 
     Raises:
         HTTPException: If tool execution fails or tool is not found
+        HTTPException: 422 if the arguments do not match the tool inputSchema
     """
     # Get the mcpserver service
     mcpserver_service: McpServerService = request.app.state.mcpserver_service
@@ -46,12 +52,44 @@ async def execute_tool(
     # Log the tool execution request
     logger.info(f"Tool execution request: user={current_user.username}, mcpserver={mcpserver}, tool={tool_name}")
     logger.info(f"Tool arguments: {request_body}")
+
+    if wants_event_stream(request):
+        arguments = request_body or {}
+        # Unknown server and invalid arguments are still answered with a plain HTTP error
+        mcpserver_service.check_tool_call(mcpserver_id, tool_name, arguments)
+        return EventSourceResponse(stream_tool_response(tool_name, lambda on_progress: mcpserver_service.invoke_tool(
+            mcpserver_id=mcpserver_id,
+            tool_name=tool_name,
+            parameters=arguments,
+            on_progress=on_progress,
+            checked=True
+        )))
+
+    return await call_user_tool(mcpserver_service, mcpserver_id, tool_name, request_body or {}, current_user.username)
+
+
+async def call_user_tool(
+        mcpserver_service: 'McpServerService',
+        mcpserver_id: str,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        username: str
+) -> Any:
+    """
+    Invoke a tool of a user mcpserver and convert the response to the REST result.
+
+    Returns:
+        Tool execution result ('content' processed by process_tool_response)
+
+    Raises:
+        HTTPException: If tool execution fails or tool is not found
+    """
     try:
         # Execute the tool with the provided parameters
         response = await mcpserver_service.invoke_tool(
             mcpserver_id=mcpserver_id,
             tool_name=tool_name,
-            parameters=request_body or {}
+            parameters=arguments
         )
         # print(result)
         # {'jsonrpc': '2.0', 'id': 1, 'result': {'content': [{'type': 'text', 'text': '5'}], 'structuredContent': {'result': '5'}, 'isError': False}}
@@ -62,7 +100,7 @@ async def execute_tool(
             raise HTTPException(status_code=404, detail=result)
 
         # Log successful execution
-        logger.info(f"Tool {tool_name} executed successfully for user {current_user.username}")
+        logger.info(f"Tool {tool_name} executed successfully for user {username}")
 
         # Return 'structuredContent' if present and 'content' is not
         if result is None or result == {}:
@@ -78,7 +116,7 @@ async def execute_tool(
 
     except Exception as e:
         # Log the error
-        logger.error(f"Failed to execute tool {tool_name} for user {current_user.username}: {str(e)}")
+        logger.error(f"Failed to execute tool {tool_name} for user {username}: {str(e)}")
 
         # Return an appropriate error response
         if isinstance(e, HTTPException):
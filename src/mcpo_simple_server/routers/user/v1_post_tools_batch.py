@@ -0,0 +1,102 @@
+"""
+Batch tool execution handler for the user router.
+Provides an endpoint for authenticated users to invoke several tools in one request.
+
+Calls run concurrently, at most TOOLS_BATCH_MAX_CONCURRENCY_PER_SERVER at a time on one
+mcpserver. Every call succeeds or fails on its own: the response holds one item per call,
+in the order of the request, or - with `Accept: application/x-ndjson` - one JSON line per
+call streamed as soon as the call finishes.
+"""
+import json
+import asyncio
+from . import router
+from typing import Dict, Any, TYPE_CHECKING, List, Optional
+from fastapi import Depends, HTTPException, status, Request, Body
+from fastapi.responses import StreamingResponse
+from loguru import logger
+from pydantic import BaseModel, Field
+from mcpo_simple_server.config import TOOLS_BATCH_MAX_CALLS, TOOLS_BATCH_MAX_CONCURRENCY_PER_SERVER
+from mcpo_simple_server.services.auth import get_authenticated_user
+from .v1_post_tool import call_user_tool
+if TYPE_CHECKING:
+    from mcpo_simple_server.services.auth.models import AuthUserModel
+    from mcpo_simple_server.services.mcpserver import McpServerService
+
+
+class ToolBatchCall(BaseModel):
+    """One tool call of a batch."""
+    server: str = Field(..., description="Name of the MCP server")
+    tool: str = Field(..., description="Name of the tool")
+    arguments: Dict[str, Any] = Field(default_factory=dict, description="Tool arguments")
+
+
+class ToolBatchResult(BaseModel):
+    """Result of one tool call of a batch."""
+    index: int = Field(..., description="Position of the call in the request")
+    server: str
+    tool: str
+    status_code: int = Field(..., description="HTTP status the single tool endpoint would answer with")
+    result: Optional[Any] = None
+    error: Optional[Any] = None
+
+
+@router.post("/tools/batch", response_model=List[ToolBatchResult])
+async def execute_tools_batch(
+        request: Request,
+        calls: List[ToolBatchCall] = Body(..., description="Tool calls, run concurrently"),
+        current_user: 'AuthUserModel' = Depends(get_authenticated_user)
+):
+    """
+    Execute several tools of the current user's MCP servers concurrently.
+
+    Args:
+        request: The FastAPI request object
+        calls: The tool calls
+        current_user: Currently authenticated user
+
+    Returns:
+        One result per call in request order, or an NDJSON stream of the results in
+        completion order when the client accepts application/x-ndjson
+
+    Raises:
+        HTTPException: 413 if the batch holds more than TOOLS_BATCH_MAX_CALLS calls
+    """
+    if len(calls) > TOOLS_BATCH_MAX_CALLS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Too many tool calls in one batch: {len(calls)} (max {TOOLS_BATCH_MAX_CALLS})"
+        )
+
+    mcpserver_service: 'McpServerService' = request.app.state.mcpserver_service
+    logger.info(f"Tool batch request: user={current_user.username}, calls={len(calls)}")
+
+    # Per-server limit - calls to different mcpservers do not wait for each other
+    limits: Dict[str, asyncio.Semaphore] = {}
+    for call in calls:
+        limits.setdefault(call.server, asyncio.Semaphore(TOOLS_BATCH_MAX_CONCURRENCY_PER_SERVER or len(calls)))
+
+    async def run_call(index: int, call: ToolBatchCall) -> ToolBatchResult:
+        mcpserver_id = call.server + "-" + current_user.username
+        async with limits[call.server]:
+            try:
+                result = await call_user_tool(mcpserver_service, mcpserver_id, call.tool, call.arguments, current_user.username)
+                return ToolBatchResult(index=index, server=call.server, tool=call.tool, status_code=200, result=result)
+            except HTTPException as e:
+                return ToolBatchResult(index=index, server=call.server, tool=call.tool, status_code=e.status_code, error=e.detail)
+
+    tasks = [asyncio.create_task(run_call(index, call)) for index, call in enumerate(calls)]
+
+    if "application/x-ndjson" not in request.headers.get("accept", ""):
+        return await asyncio.gather(*tasks)
+
+    async def stream_results():
+        try:
+            for finished in asyncio.as_completed(tasks):
+                item = await finished
+                yield json.dumps(item.model_dump()) + "\n"
+        finally:
+            # Client went away - do not keep calling tools for nobody
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
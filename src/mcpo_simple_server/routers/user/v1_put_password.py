@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 from pydantic import BaseModel
 from fastapi import Depends, HTTPException, status, Body, Request
 from loguru import logger
-from mcpo_simple_server.services.auth import get_current_user, get_password_hash, verify_password
+from mcpo_simple_server.services.auth import get_current_user, get_password_hash_async, verify_password_async
 from mcpo_simple_server.config import ADMIN_PASSWORD
 if TYPE_CHECKING:
     from mcpo_simple_server.services.config import ConfigService
@@ -39,7 +39,7 @@ async def update_my_password(
 
     # Recovery admin mode
     if current_user.username == "admin" and ADMIN_PASSWORD and password_update.current_password == ADMIN_PASSWORD:
-        new_hashed_password = get_password_hash(password_update.new_password)
+        new_hashed_password = await get_password_hash_async(password_update.new_password)
         user_data.hashed_password = new_hashed_password
         await config_service.user_config.save_config(user_data)
         await config_service.user_config.refresh_users_cache(current_user.username)
@@ -47,7 +47,7 @@ async def update_my_password(
         return
 
     # Verify current password
-    if not verify_password(password_update.current_password, user_data.hashed_password):
+    if not await verify_password_async(password_update.current_password, user_data.hashed_password):
         logger.warning(f"Invalid current password provided for user '{current_user.username}'")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -63,7 +63,7 @@ async def update_my_password(
         )
 
     # Hash new password
-    new_hashed_password = get_password_hash(password_update.new_password)
+    new_hashed_password = await get_password_hash_async(password_update.new_password)
     user_data.hashed_password = new_hashed_password
     # Save updated user data
     await config_service.user_config.save_config(user_data)
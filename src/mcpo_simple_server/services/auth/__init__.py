@@ -74,7 +74,7 @@ Security Notes:
 from . import api_key
 from .api_key import get_username_from_api_key
 from . import authenticate_user
-from .authenticate_user import verify_password, get_password_hash
+from .authenticate_user import verify_password, get_password_hash, verify_password_async, get_password_hash_async
 from . import jwt
 from .jwt import verify_jwt_token
 from .get_authenticated_by_api_key import get_authenticated_by_api_key
@@ -92,6 +92,8 @@ __all__ = [
     "authenticate_user",
     "verify_password",
     "get_password_hash",
+    "verify_password_async",
+    "get_password_hash_async",
     "jwt",
     "verify_jwt_token",
     "get_authenticated_by_api_key",
@@ -0,0 +1,157 @@
+"""
+Package/Module: Auth Cache - Cache of authentication results for API keys and JWTs
+
+High Level Concept:
+-------------------
+Authenticating a request costs a Fernet decrypt (API key) or a JWT signature check,
+a user config lookup and building an AuthUserModel. Results are cached per token, so
+steady-state authentication is a single dict lookup.
+
+Architecture:
+-------------
+- Key: sha256 digest of the token (raw tokens are not kept in memory)
+- Value: immutable principal (frozen AuthUserModel), the kind of credential and its expiry
+- Bounded LRU (AUTH_CACHE_SIZE) with TTL (AUTH_CACHE_TTL), JWT entries never outlive `exp`
+- Secondary index username -> token digests for invalidation
+
+Workflow:
+---------
+1. Auth dependencies look up the token in the cache first
+2. On miss the full verification runs and a successful result is cached
+3. Any change of the user config (API key deleted, user disabled, password changed,
+   user deleted) invalidates all cached principals of that user
+
+Notes:
+------
+Only successful authentications are cached. Disabled users are never cached.
+Invalidation reaches other processes only through the change feed of the storage
+(KeyValueStorage). With file backends every process keeps its own cache, so the
+TTL is capped to AUTH_CACHE_LOCAL_TTL - a revoked API key or disabled user is
+rejected by the other workers within that time.
+"""
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Set
+from mcpo_simple_server.config import AUTH_CACHE_SIZE, AUTH_CACHE_TTL
+from mcpo_simple_server.services.auth.models import AuthUserModel
+
+AUTH_KIND_JWT = "jwt"
+AUTH_KIND_API_KEY = "api_key"
+AUTH_KIND_ADMIN_BEARER_HACK = "admin_bearer_hack"
+
+
+class AuthCacheEntry(NamedTuple):
+    """Cached authentication result."""
+    user: AuthUserModel
+    kind: str
+    expires_at: float
+
+
+class AuthCache:
+    """Bounded TTL cache from token digest to authenticated principal."""
+
+    def __init__(self, max_size: int = AUTH_CACHE_SIZE, ttl: int = AUTH_CACHE_TTL) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: "OrderedDict[bytes, AuthCacheEntry]" = OrderedDict()
+        self._user_tokens: Dict[str, Set[bytes]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _token_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str, kinds: Optional[Set[str]] = None) -> Optional[AuthUserModel]:
+        """
+        Get the cached principal for a token.
+
+        Args:
+            token: Bearer token (JWT or API key)
+            kinds: Accepted credential kinds, None accepts any
+
+        Returns:
+            Cached AuthUserModel or None on miss/expiry/kind mismatch
+        """
+        if self._max_size <= 0:
+            return None
+        key = self._token_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= time.time():
+                self._remove(key)
+                self.misses += 1
+                return None
+            if kinds is not None and entry.kind not in kinds:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.user
+
+    def put(self, token: str, user: AuthUserModel, kind: str, expires_at: Optional[float] = None) -> None:
+        """
+        Cache a successful authentication.
+
+        Args:
+            token: Bearer token (JWT or API key)
+            user: Authenticated principal
+            kind: Credential kind (AUTH_KIND_*)
+            expires_at: Unix time when the credential expires (JWT `exp`), capped by the TTL
+        """
+        if self._max_size <= 0 or user.disabled:
+            return
+        expiry = time.time() + self._ttl
+        if expires_at is not None:
+            expiry = min(expiry, float(expires_at))
+        key = self._token_key(token)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = AuthCacheEntry(user=user, kind=kind, expires_at=expiry)
+            self._user_tokens.setdefault(user.username, set()).add(key)
+            while len(self._entries) > self._max_size:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+
+    def limit_ttl(self, ttl: int) -> None:
+        """Cap the lifetime of cached principals (entries cached from now on)."""
+        self._ttl = min(self._ttl, ttl)
+
+    def invalidate_user(self, username: str) -> None:
+        """Drop all cached principals of a user."""
+        with self._lock:
+            for key in self._user_tokens.pop(username, set()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached principals."""
+        with self._lock:
+            self._entries.clear()
+            self._user_tokens.clear()
+
+    def _remove(self, key: bytes) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        tokens = self._user_tokens.get(entry.user.username)
+        if tokens is not None:
+            tokens.discard(key)
+            if not tokens:
+                del self._user_tokens[entry.user.username]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_AUTH_CACHE = AuthCache()
+
+
+def get_auth_cache() -> AuthCache:
+    """Get the process-wide authentication result cache."""
+    return _AUTH_CACHE
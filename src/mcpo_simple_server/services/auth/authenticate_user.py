@@ -1,10 +1,12 @@
 import bcrypt
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dotenv import load_dotenv
 from loguru import logger
 from passlib.context import CryptContext
 from typing import TYPE_CHECKING
-from mcpo_simple_server.config import SALT_PEPPER
+from mcpo_simple_server.config import SALT_PEPPER, AUTH_PASSWORD_HASH_WORKERS
 from mcpo_simple_server.services import get_config_service
 from mcpo_simple_server.services.auth.models import AuthUserModel
 if TYPE_CHECKING:
@@ -18,6 +20,10 @@ load_dotenv()
 bcrypt.__about__ = bcrypt   # type: ignore - workaround for (trapped) error reading bcrypt version
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt releases the GIL, so a small thread pool keeps hashing off the event loop
+# and bounds the CPU a burst of logins can take
+_password_hash_executor = ThreadPoolExecutor(max_workers=AUTH_PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifies a plain password against a hashed password, incorporating the SALT pepper."""
@@ -36,6 +42,18 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password_with_pepper)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Async verify_password running bcrypt in the password hashing thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_hash_executor, verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Async get_password_hash running bcrypt in the password hashing thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_hash_executor, get_password_hash, password)
+
+
 async def authenticate_user(username: str, password: str) -> Optional[AuthUserModel]:
     """
     Authenticate a user with username and password using the global CONFIG_SERVICE.
@@ -59,7 +77,7 @@ async def authenticate_user(username: str, password: str) -> Optional[AuthUserMo
             return None
 
         # Verify the password
-        if not verify_password(password, user_data.hashed_password):
+        if not await verify_password_async(password, user_data.hashed_password):
             logger.debug(f"Password for user '{username}' does not match")
             return None
 
@@ -3,7 +3,7 @@ from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from loguru import logger
 
-from mcpo_simple_server.services.auth import get_username_from_api_key
+from mcpo_simple_server.services.auth.auth_cache import get_auth_cache, AUTH_KIND_API_KEY
 from mcpo_simple_server.services.auth.models import AuthUserModel
 from mcpo_simple_server.services import get_config_service
 
@@ -18,11 +18,16 @@ async def get_authenticated_by_api_key(auth: Optional[HTTPAuthorizationCredentia
 
     api_key = auth.credentials
 
+    auth_cache = get_auth_cache()
+    cached_user = auth_cache.get(api_key, kinds={AUTH_KIND_API_KEY})
+    if cached_user is not None:
+        return cached_user
+
     config_service = get_config_service()
 
+    # Hash lookup of the owner - unknown and revoked keys are not in the index (nor in the owner's config)
     try:
-        username_from_api_key = get_username_from_api_key(api_key)
-        config_user_data = await config_service.user_config.get_config(username_from_api_key)
+        config_user_data = await config_service.api_key_index.authenticate(api_key)
     except Exception as e:
         logger.error(f"Error getting users for API key authentication: {str(e)}")
         return None
@@ -32,4 +37,6 @@ async def get_authenticated_by_api_key(auth: Optional[HTTPAuthorizationCredentia
         return None
 
     logger.info(f"API key authentication successful for user '{config_user_data.username}'")
-    return AuthUserModel(**config_user_data.model_dump())
+    user = AuthUserModel(**config_user_data.model_dump())
+    auth_cache.put(api_key, user, AUTH_KIND_API_KEY)
+    return user
@@ -5,6 +5,7 @@ from loguru import logger
 from mcpo_simple_server.config import ADMIN_BEARER_HACK
 from mcpo_simple_server.services import get_config_service
 from mcpo_simple_server.services.auth import verify_jwt_token
+from mcpo_simple_server.services.auth.auth_cache import get_auth_cache, AUTH_KIND_JWT, AUTH_KIND_ADMIN_BEARER_HACK
 from mcpo_simple_server.services.auth.models import TokenData, AuthUserModel
 
 bearer_scheme = HTTPBearer(auto_error=False, scheme_name="Authorization")
@@ -16,6 +17,11 @@ async def get_authenticated_by_jwt_token(auth: Optional[HTTPAuthorizationCredent
 
     jwt_token = auth.credentials
 
+    auth_cache = get_auth_cache()
+    cached_user = auth_cache.get(jwt_token, kinds={AUTH_KIND_JWT, AUTH_KIND_ADMIN_BEARER_HACK})
+    if cached_user is not None:
+        return cached_user
+
     config_service = get_config_service()
 
     # Check if token matches ADMIN_BEARER_HACK
@@ -29,7 +35,9 @@ async def get_authenticated_by_jwt_token(auth: Optional[HTTPAuthorizationCredent
                 detail="Could not validate credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        return AuthUserModel(**user_data.model_dump())
+        user = AuthUserModel(**user_data.model_dump())
+        auth_cache.put(jwt_token, user, AUTH_KIND_ADMIN_BEARER_HACK)
+        return user
 
     jwt_token_data: Optional[TokenData] = verify_jwt_token(jwt_token)
     if jwt_token_data is None or jwt_token_data.username is None:
@@ -54,4 +62,6 @@ async def get_authenticated_by_jwt_token(auth: Optional[HTTPAuthorizationCredent
         logger.warning(f"Authentication failed. User '{config_user_data.username}' is disabled.")
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
 
-    return AuthUserModel(**config_user_data.model_dump())
+    user = AuthUserModel(**config_user_data.model_dump())
+    auth_cache.put(jwt_token, user, AUTH_KIND_JWT, expires_at=jwt_token_data.exp)
+    return user
@@ -4,7 +4,13 @@ from fastapi import Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from loguru import logger
 from mcpo_simple_server.services.auth.models import AuthUserModel
-from mcpo_simple_server.services.auth import verify_jwt_token, get_username_from_api_key
+from mcpo_simple_server.services.auth import verify_jwt_token
+from mcpo_simple_server.services.auth.auth_cache import (
+    get_auth_cache,
+    AUTH_KIND_JWT,
+    AUTH_KIND_API_KEY,
+    AUTH_KIND_ADMIN_BEARER_HACK
+)
 from mcpo_simple_server.services.auth.models import TokenData
 from mcpo_simple_server.config import ADMIN_BEARER_HACK
 if TYPE_CHECKING:
@@ -23,6 +29,8 @@ async def get_authenticated_user(
 
     This function first tries to authenticate using JWT token, then falls back to API key.
     It uses a single HTTP bearer scheme to avoid conflicts in the dependency injection system.
+    Successful results are served from the auth cache until the token expires or the user
+    config changes.
 
     Args:
         request: The FastAPI request object
@@ -44,6 +52,11 @@ async def get_authenticated_user(
 
     # Get the token from the authorization header
     token = auth.credentials
+    auth_cache = get_auth_cache()
+    cached_user = auth_cache.get(token)
+    if cached_user is not None:
+        return cached_user
+
     config_service: ConfigService = request.app.state.config_service
 
     # Try JWT token authentication first
@@ -55,7 +68,9 @@ async def get_authenticated_user(
             user_data = await config_service.user_config.get_config(username="admin")
             if user_data is None:
                 raise ValueError("Admin user not found in config")
-            return AuthUserModel(**user_data.model_dump())
+            user = AuthUserModel(**user_data.model_dump())
+            auth_cache.put(token, user, AUTH_KIND_ADMIN_BEARER_HACK)
+            return user
 
         # Try regular JWT token
         jwt_token_data: Optional[TokenData] = verify_jwt_token(token)
@@ -63,14 +78,15 @@ async def get_authenticated_user(
             config_user_data = await config_service.user_config.get_config(username=jwt_token_data.username)
             if config_user_data and not config_user_data.disabled:
                 logger.debug(f"Tool JWT authentication successful for user '{config_user_data.username}'")
-                return AuthUserModel(**config_user_data.model_dump())
+                user = AuthUserModel(**config_user_data.model_dump())
+                auth_cache.put(token, user, AUTH_KIND_JWT, expires_at=jwt_token_data.exp)
+                return user
     except Exception as e:
         logger.debug(f"JWT authentication failed, will try API key: {str(e)}")
 
     # Fall back to API key authentication
     try:
-        username_from_api_key = get_username_from_api_key(token)
-        config_user_data = await config_service.user_config.get_config(username_from_api_key)
+        config_user_data = await config_service.api_key_index.authenticate(token)
 
         if config_user_data:
             if config_user_data.disabled:
@@ -78,7 +94,9 @@ async def get_authenticated_user(
                 raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
 
             logger.debug(f"Tool API key authentication successful for user '{config_user_data.username}'")
-            return AuthUserModel(**config_user_data.model_dump())
+            user = AuthUserModel(**config_user_data.model_dump())
+            auth_cache.put(token, user, AUTH_KIND_API_KEY)
+            return user
     except Exception as e:
         logger.debug(f"API key authentication failed: {str(e)}")
 
@@ -15,8 +15,8 @@ async def get_number_of_users() -> int:
         )
 
     try:
-        all_users_dict = await config_service.user_config.get_all_users_configs()
-        return len(all_users_dict)
+        users_index = await config_service.user_config.get_users_index()
+        return len(users_index)
     except Exception as e:
         logger.error(f"Error getting user count: {str(e)} - return 0")
         return 0
@@ -0,0 +1,200 @@
+"""
+Package/Module: Login Guard - Concurrency cap, throttling and latency stats for logins
+
+High Level Concept:
+-------------------
+Password verification (bcrypt) is deliberately slow. A burst of logins, legitimate or
+not, must not starve SSE streams and tool calls served by the same worker. The login
+guard bounds how many logins are processed at once, throttles repeated failures per
+username and client IP and per client IP and records login latency.
+
+Architecture:
+-------------
+- Concurrency: asyncio.Semaphore(LOGIN_MAX_CONCURRENT), waiting at most
+  LOGIN_QUEUE_TIMEOUT seconds for a slot (HTTP 503 otherwise)
+- Throttling: sliding window of failure timestamps per username and client IP and per
+  client IP (LOGIN_FAILURE_WINDOW), exceeding LOGIN_MAX_FAILURES_PER_USER/IP gives HTTP 429.
+  Failures of a username from one client do not lock the user out on other clients
+- Latency: ring buffer of the most recent login durations, reported as percentiles
+
+Workflow:
+---------
+1. reserve_attempt() rejects a throttled username/IP before any work is done, otherwise
+   it counts the attempt as a failure right away - concurrent attempts cannot pass the
+   check before the first of them failed
+2. slot() acquires a login slot and measures the login duration
+3. record_failure() keeps the reserved failure, record_success()/release_attempt() drop it
+"""
+import time
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, List, Tuple
+from fastapi import HTTPException, status
+from mcpo_simple_server.config import (
+    LOGIN_MAX_CONCURRENT,
+    LOGIN_QUEUE_TIMEOUT,
+    LOGIN_MAX_FAILURES_PER_USER,
+    LOGIN_MAX_FAILURES_PER_IP,
+    LOGIN_FAILURE_WINDOW
+)
+
+_LATENCY_SAMPLES = 1000
+_MAX_TRACKED_KEYS = 10000
+
+
+class LoginGuard:
+    """Caps concurrent logins, throttles failed logins and tracks login latency."""
+
+    def __init__(
+        self,
+        max_concurrent: int = LOGIN_MAX_CONCURRENT,
+        queue_timeout: float = LOGIN_QUEUE_TIMEOUT,
+        max_failures_per_user: int = LOGIN_MAX_FAILURES_PER_USER,
+        max_failures_per_ip: int = LOGIN_MAX_FAILURES_PER_IP,
+        failure_window: int = LOGIN_FAILURE_WINDOW
+    ) -> None:
+        self._max_concurrent = max(max_concurrent, 1)
+        self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        self._queue_timeout = queue_timeout
+        self._max_failures_per_user = max_failures_per_user
+        self._max_failures_per_ip = max_failures_per_ip
+        self._failure_window = failure_window
+        self._failures: "OrderedDict[str, Deque[float]]" = OrderedDict()   # "user:<name>@<addr>" / "ip:<addr>" -> timestamps
+        self._latencies: Deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+        self._in_progress = 0
+        self._counters: Dict[str, int] = {"succeeded": 0, "failed": 0, "throttled": 0, "rejected_busy": 0}
+
+    # --------------------------------------------------------------------------
+    # Throttling
+    # --------------------------------------------------------------------------
+    def _recent_failures(self, key: str, now: float) -> Deque[float]:
+        failures = self._failures.get(key)
+        if failures is None:
+            return deque()
+        while failures and failures[0] <= now - self._failure_window:
+            failures.popleft()
+        if not failures:
+            del self._failures[key]
+        return failures
+
+    def _limits(self, username: str, client_ip: str) -> List[Tuple[str, int]]:
+        return [(f"user:{username}@{client_ip}", self._max_failures_per_user), (f"ip:{client_ip}", self._max_failures_per_ip)]
+
+    def reserve_attempt(self, username: str, client_ip: str) -> float:
+        """
+        Reject the login if the username or client IP had too many recent failures,
+        otherwise count the attempt as a failure until its outcome is recorded.
+
+        Returns:
+            Reservation timestamp for release_attempt()
+
+        Raises:
+            HTTPException: 429 with Retry-After header
+        """
+        now = time.monotonic()
+        limits = self._limits(username, client_ip)
+        for key, limit in limits:
+            if limit <= 0:
+                continue
+            failures = self._recent_failures(key, now)
+            if len(failures) >= limit:
+                self._counters["throttled"] += 1
+                retry_after = max(int(failures[0] + self._failure_window - now) + 1, 1)
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many failed login attempts, try again later",
+                    headers={"Retry-After": str(retry_after)},
+                )
+        # No await since the check - the reservation is atomic for the event loop
+        for key, _ in limits:
+            self._failures.setdefault(key, deque()).append(now)
+            self._failures.move_to_end(key)
+        while len(self._failures) > _MAX_TRACKED_KEYS:
+            self._failures.popitem(last=False)
+        return now
+
+    def release_attempt(self, username: str, client_ip: str, reserved: float) -> None:
+        """Drop the reserved failure of an attempt which neither failed nor succeeded (e.g. 503)."""
+        for key, _ in self._limits(username, client_ip):
+            failures = self._failures.get(key)
+            if failures is None:
+                continue
+            try:
+                failures.remove(reserved)
+            except ValueError:
+                continue
+            if not failures:
+                del self._failures[key]
+
+    def record_failure(self, username: str, client_ip: str) -> None:       # pylint: disable=unused-argument
+        """Count a failed login (the reserved failure of the attempt is kept)."""
+        self._counters["failed"] += 1
+
+    def record_success(self, username: str, client_ip: str, reserved: float) -> None:
+        """Reset failed login counting for the username on this client after a successful login."""
+        self._counters["succeeded"] += 1
+        self.release_attempt(username, client_ip, reserved)
+        self._failures.pop(f"user:{username}@{client_ip}", None)
+
+    # --------------------------------------------------------------------------
+    # Concurrency and latency
+    # --------------------------------------------------------------------------
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Acquire a login slot and record the login latency (including waiting for the slot).
+
+        Raises:
+            HTTPException: 503 if no slot is free within the queue timeout
+        """
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self._queue_timeout)
+        except asyncio.TimeoutError:
+            self._counters["rejected_busy"] += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent logins, try again later",
+                headers={"Retry-After": "1"},
+            ) from None
+        self._in_progress += 1
+        try:
+            yield
+        finally:
+            self._in_progress -= 1
+            self._semaphore.release()
+            self._latencies.append(time.perf_counter() - started)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Report login counters and latency percentiles (milliseconds) of recent logins.
+        """
+        samples = sorted(self._latencies)
+
+        def percentile(p: float) -> float:
+            if not samples:
+                return 0.0
+            index = min(int(round(p / 100 * (len(samples) - 1))), len(samples) - 1)
+            return round(samples[index] * 1000, 2)
+
+        return {
+            **self._counters,
+            "in_progress": self._in_progress,
+            "max_concurrent": self._max_concurrent,
+            "samples": len(samples),
+            "latency_ms": {
+                "p50": percentile(50),
+                "p90": percentile(90),
+                "p99": percentile(99),
+                "max": round(samples[-1] * 1000, 2) if samples else 0.0,
+            },
+        }
+
+
+_LOGIN_GUARD = LoginGuard()
+
+
+def get_login_guard() -> LoginGuard:
+    """Get the process-wide login guard."""
+    return _LOGIN_GUARD
@@ -1,9 +1,12 @@
-from pydantic import BaseModel, Field
+
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, Any
 
 
 class AuthUserModel(BaseModel):
-    """User-specific configuration model."""
+    """User-specific configuration model (immutable, shared via the auth cache)."""
+    model_config = ConfigDict(frozen=True)
+
     username: str = Field(..., min_length=3, max_length=50)
     group: str = Field(default="user", pattern=r"^(users|admins)$")
     disabled: bool = Field(default=False)
@@ -50,8 +50,8 @@ Usage Example:
 >>> user_config.user_config.disabled = True
 >>> updated_config = user_config.save()  # Save changes and get updated configuration
 >>>
->>> # Access tool caches
->>> tool_caches = user_config.tools_cache
+>>> # Access tool caches (loaded on first access)
+>>> tool_caches = await user_config.load_tools_cache()
 >>> print(tool_caches)  # Dictionary mapping MCP server names to their tool configurations
 
 Notes:
@@ -0,0 +1,108 @@
+"""
+Module/Package: KeyValueClient - Abstract interface of the networked key-value store
+
+High Level Concept:
+-------------------
+KeyValueStorage keeps the configuration in a key-value store shared by all gateway
+nodes. This module defines the small subset of the Redis command set it needs, so
+the storage works with a real Redis protocol client and with the in-process fake.
+
+Architecture:
+-------------
+- Strings: get / set / mget / delete - one JSON document per key
+- Hashes: hget / hmget / hset / hdel / hgetall / hkeys - collections of JSON entries
+- Transactions: transaction - several writes applied atomically (MULTI/EXEC)
+- Pub/Sub: publish / subscribe - change notifications between nodes
+
+Notes:
+------
+- Keys, fields and values are str (UTF-8 on the wire)
+- subscribe() calls the callback with None whenever the subscription is (re)established,
+  messages published while it was down are lost - subscribers must resync
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+MessageCallback = Callable[[Optional[str]], Union[None, Awaitable[None]]]
+# Write command of a transaction: ("SET", key, value), ("DEL", key, ...),
+# ("HSET", key, field, value, ...) or ("HDEL", key, field, ...)
+Command = Tuple[str, ...]
+
+
+class KeyValueClientAbstract(ABC):
+    """Abstract client of a Redis compatible key-value store."""
+
+    # --------------------------------------------------------------------------
+    # Strings
+    # --------------------------------------------------------------------------
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Get the value of a key, None if it does not exist."""
+
+    @abstractmethod
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Get the values of several keys in one round trip."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str) -> None:
+        """Set the value of a key."""
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> int:
+        """Delete keys, returns the number of deleted keys."""
+
+    # --------------------------------------------------------------------------
+    # Hashes
+    # --------------------------------------------------------------------------
+    @abstractmethod
+    async def hget(self, key: str, field: str) -> Optional[str]:
+        """Get a field of a hash."""
+
+    @abstractmethod
+    async def hmget(self, key: str, fields: List[str]) -> List[Optional[str]]:
+        """Get several fields of a hash in one round trip."""
+
+    @abstractmethod
+    async def hset(self, key: str, mapping: Dict[str, str]) -> None:
+        """Set fields of a hash."""
+
+    @abstractmethod
+    async def hdel(self, key: str, *fields: str) -> int:
+        """Delete fields of a hash, returns the number of deleted fields."""
+
+    @abstractmethod
+    async def hgetall(self, key: str) -> Dict[str, str]:
+        """Get all fields of a hash."""
+
+    @abstractmethod
+    async def hkeys(self, key: str) -> List[str]:
+        """Get all field names of a hash."""
+
+    # --------------------------------------------------------------------------
+    # Transactions
+    # --------------------------------------------------------------------------
+    @abstractmethod
+    async def transaction(self, commands: List[Command]) -> List[Any]:
+        """
+        Apply write commands atomically (MULTI/EXEC), other clients see all or none of them.
+        Returns the replies of the commands.
+        """
+
+    # --------------------------------------------------------------------------
+    # Pub/Sub
+    # --------------------------------------------------------------------------
+    @abstractmethod
+    async def publish(self, channel: str, message: str) -> None:
+        """Publish a message to a channel."""
+
+    @abstractmethod
+    async def subscribe(self, channel: str, callback: MessageCallback) -> None:
+        """
+        Deliver messages of a channel to the callback until close().
+        The callback gets None when the subscription is (re)established.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close connections and stop subscriptions."""
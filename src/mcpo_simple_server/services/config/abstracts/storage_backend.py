@@ -25,14 +25,20 @@ Notes:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List, Any
+from typing import Awaitable, Callable, Dict, Optional, List, Any
 
-from mcpo_simple_server.services.config.models import GlobalConfigModel, UserConfigModel
+from mcpo_simple_server.services.config.models import GlobalConfigModel, UserConfigModel, UserIndexEntry
+
+# API key digest -> {"username": ..., "metadata": {...}} to store, or None to delete
+ApiKeyIndexChanges = Dict[str, Optional[Dict[str, Any]]]
 
 
 class StorageBackendAbstract(ABC):
     """Abstract interface for configuration storage backends."""
 
+    # True if changes made by other nodes/processes are reported to the change listener
+    notifies_changes: bool = False
+
     # --------------------------------------------------------------------------
     # Global Config
     # --------------------------------------------------------------------------
@@ -52,21 +58,58 @@ class StorageBackendAbstract(ABC):
         """Get a user configuration."""
 
     @abstractmethod
-    async def save_user_config(self, config: UserConfigModel) -> None:
-        """Save a user configuration."""
+    async def save_user_config(self, config: UserConfigModel, api_key_index: Optional[ApiKeyIndexChanges] = None) -> None:
+        """
+        Save a user configuration.
+        Args:
+            config: The user configuration
+            api_key_index: Changed API key index entries of the user, written with the config
+        Raises:
+            Exception: The config or the API key index entries were not written
+        """
 
     @abstractmethod
-    async def delete_user_config(self, username: str) -> bool:
-        """Delete a user configuration."""
+    async def delete_user_config(self, username: str, api_key_index: Optional[ApiKeyIndexChanges] = None) -> bool:
+        """
+        Delete a user configuration.
+        Args:
+            username: The user to delete
+            api_key_index: API key index entries of the user to delete with the config
+        Returns:
+            True if the user config existed
+        Raises:
+            Exception: The config or the API key index entries were not deleted
+        """
 
     @abstractmethod
     async def list_users(self) -> Dict[str, UserConfigModel]:
         """List all user configurations."""
 
+    async def list_user_index(self) -> Dict[str, UserIndexEntry]:
+        """
+        List a light index entry (disabled flag, mcpserver names and types) of every user.
+        Backends override it to skip validating and caching full user configs.
+        """
+        return {username: UserIndexEntry.from_config(config) for username, config in (await self.list_users()).items()}
+
     @abstractmethod
     async def clear_cache(self, username: Optional[str] = None) -> None:
         """Clear the cache."""
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Report cache counters (hits, misses, disk reads) of the backend.
+        Backends without a cache return an empty dict.
+        """
+        return {}
+
+    def set_change_listener(self, listener: Callable[[str], Awaitable[None]]) -> None:
+        """
+        Register the callback notified about changes made by other nodes sharing the storage.
+        It gets the changed key: "global", "user:<username>", "tools:<mcpserver id>" or "*"
+        (anything may have changed). Node-local backends never call it.
+        """
+
     @abstractmethod
     async def close(self) -> None:
         """
@@ -108,3 +151,70 @@ class StorageBackendAbstract(ABC):
         Args:
             mcpserver_name: The MCP server name (used as file key)
         """
+
+    # --------------------------------------------------------------------------
+    # Tool Definitions (content-addressed, shared by tool caches)
+    # --------------------------------------------------------------------------
+    @abstractmethod
+    async def write_tool_definitions(self, definitions: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Write tool definitions referenced from tool caches.
+        Args:
+            definitions: Mapping of definition digest to tool dict
+        """
+
+    @abstractmethod
+    async def read_tool_definitions(self, digests: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Read tool definitions by digest.
+        Args:
+            digests: List of definition digests
+        Returns:
+            Mapping of digest to tool dict for the definitions which were found
+        """
+
+    @abstractmethod
+    async def list_tool_definitions(self) -> List[str]:
+        """
+        List the digests of all stored tool definitions.
+        """
+
+    @abstractmethod
+    async def delete_tool_definitions(self, digests: List[str]) -> None:
+        """
+        Delete tool definitions no tool cache references any more.
+        Args:
+            digests: List of definition digests
+        """
+
+    # --------------------------------------------------------------------------
+    # API Key Index (key digest -> username and key metadata)
+    # --------------------------------------------------------------------------
+    @abstractmethod
+    async def write_api_key_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Replace the whole API key index (rebuild, migration). Single entries are written
+        with the user config they belong to (save_user_config / delete_user_config).
+        Args:
+            index: Mapping of API key digest to {"username": ..., "metadata": {...}}
+        Raises:
+            Exception: The index was not written
+        """
+
+    @abstractmethod
+    async def read_api_key_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Read the API key index.
+        Returns:
+            Mapping of API key digest to {"username": ..., "metadata": {...}}, or None if not
+            stored yet (backends may report an empty index as None)
+        """
+
+    async def read_api_key_index_entry(self, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Read one entry of the API key index, e.g. of a key created by another process.
+        Backends override it to read the single entry instead of the whole index.
+        Returns:
+            {"username": ..., "metadata": {...}}, or None if the key is not indexed
+        """
+        return (await self.read_api_key_index() or {}).get(digest)
@@ -0,0 +1,182 @@
+import hashlib
+from loguru import logger
+from typing import Dict, NamedTuple, Optional, Set, TYPE_CHECKING
+from abc import ABC
+from mcpo_simple_server.services.config.models.user_config_model import ApiKeyMetadataModel
+if TYPE_CHECKING:
+    from mcpo_simple_server.services.config import ConfigService
+    from mcpo_simple_server.services.config.models import UserConfigModel
+    from mcpo_simple_server.services.config.abstracts.storage_backend import StorageBackendAbstract, ApiKeyIndexChanges
+
+
+def api_key_digest(api_key: str) -> str:
+    """Return the index key (sha256 hex digest) of a plain API key."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+class ApiKeyIndexEntry(NamedTuple):
+    """Owner and metadata of an API key."""
+    username: str
+    metadata: ApiKeyMetadataModel
+
+
+class ApiKeyIndexAdapter(ABC):
+    """Global index of API keys: key digest -> (username, key metadata).
+
+    API key authentication is a single dict lookup, without decrypting the key or
+    scanning user configs. The index is maintained by UserConfigAdapter whenever a
+    user config is saved or deleted (key created, deleted, metadata changed), so a
+    deleted key is rejected right away. Only digests of the keys are kept and persisted,
+    changed entries are written by the storage together with the user config.
+
+    The index only locates the owner: authenticate() also checks the key against the
+    api_keys of the owner's config, so a stale index entry never grants access.
+    """
+
+    def __init__(self, parent: 'ConfigService') -> None:
+        self.parent = parent
+        self._storage_backend: 'StorageBackendAbstract' = parent._storage_backend
+        self._index: Dict[str, ApiKeyIndexEntry] = {}
+        self._user_digests: Dict[str, Set[str]] = {}
+
+    async def load(self) -> None:
+        """Load the index from storage, rebuilding it from user configs if not stored yet."""
+        stored = await self._storage_backend.read_api_key_index()
+        if stored is None:
+            await self.rebuild()
+            return
+        self._index.clear()
+        self._user_digests.clear()
+        for digest, entry in stored.items():
+            try:
+                self._add(digest, entry["username"], ApiKeyMetadataModel(**entry.get("metadata", {})))
+            except Exception as e:
+                logger.warning(f"Skipping invalid API key index entry: {e}")
+        logger.info(f"API key index loaded: {len(self._index)} keys")
+
+    async def rebuild(self) -> None:
+        """Rebuild the index from all user configs and persist it."""
+        users = await self.parent.user_config.get_all_users_configs()
+        self._index.clear()
+        self._user_digests.clear()
+        for username, user_config in users.items():
+            for api_key, metadata in (user_config.api_keys or {}).items():
+                self._add(api_key_digest(api_key), username, metadata)
+        try:
+            await self._persist()
+        except Exception as e:
+            logger.error(f"API key index rebuilt but not stored, it is rebuilt again on the next start: {e}")
+        logger.info(f"API key index rebuilt: {len(self._index)} keys")
+
+    def lookup(self, api_key: str) -> Optional[ApiKeyIndexEntry]:
+        """Get owner and metadata of an API key, None if the key is unknown or revoked."""
+        return self._index.get(api_key_digest(api_key))
+
+    async def authenticate(self, api_key: str) -> Optional['UserConfigModel']:
+        """
+        Get the config of the owner of a valid API key.
+
+        A key missing from the in-memory index may have been created by another process
+        sharing a storage that does not notify changes: its owner is then read from the
+        stored index entry (or the key itself) and the entry is added once verified.
+
+        Returns:
+            The owner's config, None if the key is unknown or no longer one of the owner's keys
+        """
+        digest = api_key_digest(api_key)
+        entry = self._index.get(digest)
+        if entry is not None:
+            username: Optional[str] = entry.username
+        elif self._storage_backend.notifies_changes:
+            return None
+        else:
+            username = await self._stored_owner(api_key, digest)
+        if username is None:
+            return None
+        user_config = await self.parent.user_config.get_config(username)
+        if entry is None and (user_config is None or api_key not in (user_config.api_keys or {})):
+            # The backend may still cache the owner's config from before the other process saved it
+            await self._storage_backend.clear_cache(username)
+            user_config = await self.parent.user_config.get_config(username)
+        if user_config is None or api_key not in (user_config.api_keys or {}):
+            return None
+        if entry is None:
+            self._add(digest, username, user_config.api_keys[api_key])
+        return user_config
+
+    async def _stored_owner(self, api_key: str, digest: str) -> Optional[str]:
+        """Owner of a key missing from the in-memory index: stored index entry first, then the encrypted key."""
+        stored = await self._storage_backend.read_api_key_index_entry(digest)
+        if stored is not None:
+            return stored.get("username")
+        # Lazy import - services.auth imports services.config
+        from mcpo_simple_server.services.auth.api_key import get_username_from_api_key
+        try:
+            return get_username_from_api_key(api_key)
+        except ValueError:
+            return None
+
+    def lookup_digest(self, digest: str) -> Optional[ApiKeyIndexEntry]:
+        """Get owner and metadata of an API key by its digest (see api_key_digest)."""
+        return self._index.get(digest)
+
+    def get_username(self, api_key: str) -> Optional[str]:
+        """Get the owner of an API key, None if the key is unknown or revoked."""
+        entry = self.lookup(api_key)
+        return entry.username if entry is not None else None
+
+    def user_changes(self, user_config: 'UserConfigModel') -> 'ApiKeyIndexChanges':
+        """Get the index entries to write (and None for entries to delete) for a user config about to be saved."""
+        username = user_config.username
+        keys = {api_key_digest(api_key): metadata for api_key, metadata in (user_config.api_keys or {}).items()}
+        changes: 'ApiKeyIndexChanges' = {digest: None for digest in self._user_digests.get(username, set()) - set(keys)}
+        for digest, metadata in keys.items():
+            entry = self._index.get(digest)
+            if entry is None or entry.username != username or entry.metadata != metadata:
+                changes[digest] = self._entry(username, metadata)
+        return changes
+
+    def removal_changes(self, username: str) -> 'ApiKeyIndexChanges':
+        """Get the index entries to delete with a user config."""
+        return {digest: None for digest in self._user_digests.get(username, set())}
+
+    def apply(self, changes: 'ApiKeyIndexChanges') -> None:
+        """Apply changes (written to storage) to the in-memory index."""
+        for digest, entry in changes.items():
+            self._discard(digest)
+            if entry is not None:
+                self._add(digest, entry["username"], ApiKeyMetadataModel(**entry.get("metadata", {})))
+
+    def update_user(self, user_config: 'UserConfigModel') -> None:
+        """Sync the in-memory entries of a user changed by another node (already stored)."""
+        self.apply(self.user_changes(user_config))
+
+    def remove_user(self, username: str) -> None:
+        """Drop the in-memory entries of a user deleted by another node (already stored)."""
+        self.apply(self.removal_changes(username))
+
+    @staticmethod
+    def _entry(username: str, metadata: ApiKeyMetadataModel) -> Dict[str, object]:
+        return {"username": username, "metadata": metadata.model_dump(mode="json")}
+
+    def _add(self, digest: str, username: str, metadata: ApiKeyMetadataModel) -> None:
+        self._index[digest] = ApiKeyIndexEntry(username=username, metadata=metadata.model_copy())
+        self._user_digests.setdefault(username, set()).add(digest)
+
+    def _discard(self, digest: str) -> None:
+        entry = self._index.pop(digest, None)
+        if entry is None:
+            return
+        digests = self._user_digests.get(entry.username)
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._user_digests[entry.username]
+
+    async def _persist(self) -> None:
+        await self._storage_backend.write_api_key_index({
+            digest: self._entry(entry.username, entry.metadata) for digest, entry in self._index.items()
+        })
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -1,5 +1,6 @@
 from typing import Dict, Any, TYPE_CHECKING
 from mcpo_simple_server.services.config.models import GlobalConfigModel
+from mcpo_simple_server.services.config.events import ConfigEventType
 from loguru import logger
 if TYPE_CHECKING:
     from mcpo_simple_server.services.config import ConfigService
@@ -46,10 +47,14 @@ class GlobalConfigAdapter:
         return global_config or GlobalConfigModel()
 
     async def save_config(self, global_data: GlobalConfigModel) -> bool:
-        """Save global configuration."""
+        """Save global configuration, publishes blacklist_changed if the tools blacklist changed."""
         try:
+            previous = await self._storage_backend.get_global_config()
             await self._storage_backend.save_global_config(global_data)
-            return True
         except Exception as e:
             logger.error(f"Error saving global config: {str(e)}")
             return False
+        previous_blacklist = previous.tools.blackList if previous else None
+        if (previous_blacklist or []) != (global_data.tools.blackList or []):
+            await self.parent.events.publish(ConfigEventType.BLACKLIST_CHANGED)
+        return True
@@ -1,25 +1,101 @@
+import asyncio
 from loguru import logger
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import Iterable, List, Dict, Any, Optional, Set, TYPE_CHECKING
 from abc import ABC
+from mcpo_simple_server.utils.tools.tool_definition_store import (
+    get_tool_definition_store,
+    ToolDefinition,
+    TOOL_DEFINITION_REF_KEY
+)
+from mcpo_simple_server.services.config.events import ConfigEventType
 if TYPE_CHECKING:
     from mcpo_simple_server.services.config import ConfigService
     from mcpo_simple_server.services.config.abstracts.storage_backend import StorageBackendAbstract
 
 
 class ToolsCacheAdapter(ABC):
-    """Adapter for tool cache operations via config service."""
+    """Adapter for tool cache operations via config service.
+
+    Tool caches are persisted as lists of `{"$ref": "<digest>"}` entries pointing to
+    content-addressed tool definitions stored once, and returned as interned
+    ToolDefinition objects shared between all mcpservers. Caches written in the
+    old format (full tool dicts) are still read.
+
+    All tool caches are loaded from storage at most once per version: writes and
+    deletes bump the version, get_all_tool_caches() rebuilds the in-memory snapshot
+    only when it is stale and get_tool_cache() is served from a valid snapshot.
+
+    Stored definitions no tool cache references any more (the mcpserver was deleted or
+    its tools changed) are swept after the deleting or replacing write. A definition
+    written by another process after the sweep has read the tool caches, but before that
+    process has written its cache, can be swept as well - it is written again with the
+    next tool cache write of that process.
+    """
 
     def __init__(self, parent: 'ConfigService') -> None:
         self.parent = parent
         self._storage_backend: 'StorageBackendAbstract' = parent._storage_backend
+        self._tool_store = get_tool_definition_store()
+        # Digests already persisted by this process - definitions are immutable, so written once
+        self._stored_digests: Set[str] = set()
+        # Serializes sweeps with the definition + cache writes of this process
+        self._definitions_lock = asyncio.Lock()
+        # Memoized snapshot of all tool caches, valid while its version is current
+        self._version = 0
+        self._snapshot: Optional[Dict[str, List[ToolDefinition]]] = None
+        self._snapshot_version = -1
+
+    async def _resolve_tool_refs(self, mcpserver_id: str, cache: List[Dict[str, Any]]) -> List[ToolDefinition]:
+        """Resolve `$ref` entries of a persisted tool cache into interned definitions."""
+        missing = [
+            entry[TOOL_DEFINITION_REF_KEY] for entry in cache
+            if isinstance(entry, dict) and TOOL_DEFINITION_REF_KEY in entry
+            and self._tool_store.get(entry[TOOL_DEFINITION_REF_KEY]) is None
+        ]
+        loaded: Dict[str, ToolDefinition] = {}
+        if missing:
+            for digest, definition in (await self._storage_backend.read_tool_definitions(missing)).items():
+                loaded[digest] = self._tool_store.intern(definition)
+                self._stored_digests.add(digest)
+
+        tools: List[ToolDefinition] = []
+        for entry in cache:
+            if not isinstance(entry, dict):
+                continue
+            if TOOL_DEFINITION_REF_KEY not in entry:
+                tools.append(self._tool_store.intern(entry))
+                continue
+            digest = entry[TOOL_DEFINITION_REF_KEY]
+            definition = loaded.get(digest) or self._tool_store.get(digest)
+            if definition is None:
+                logger.warning(f"Tool definition '{digest}' referenced by tool cache of {mcpserver_id} not found")
+                continue
+            tools.append(definition)
+        return tools
+
+    def _invalidate(self) -> None:
+        self._version += 1
+        self._snapshot = None
 
     async def get_all_tool_caches(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Get all tool caches from storage."""
+        """Get all tool caches, loaded from storage only if the snapshot is stale."""
+        if self._snapshot is not None and self._snapshot_version == self._version:
+            return dict(self._snapshot)
+        version = self._version
         try:
-            return await self._storage_backend.get_all_tool_caches()
+            caches = await self._storage_backend.get_all_tool_caches()
+            snapshot = {
+                mcpserver_id: await self._resolve_tool_refs(mcpserver_id, cache)
+                for mcpserver_id, cache in caches.items()
+            }
         except Exception as e:
             logger.error(f"Failed to get all tool caches: {e}")
             return {}
+        # A write while loading makes this snapshot stale already - do not keep it
+        if version == self._version:
+            self._snapshot = snapshot
+            self._snapshot_version = version
+        return dict(snapshot)
 
     async def write_tool_cache(self, mcpserver_id: str, cache: List[Dict[str, Any]]) -> None:
         """Write the tool cache for a specific MCP server.
@@ -28,11 +104,31 @@ class ToolsCacheAdapter(ABC):
             mcpserver_id: The MCP server ID (used as file key)
             cache: List of tool dicts to store
         """
+        dropped: Set[str] = set()
         try:
-            await self._storage_backend.write_tool_cache(mcpserver_id, cache)
+            definitions = self._tool_store.intern_tools(cache)
+            async with self._definitions_lock:
+                previous = await self._storage_backend.read_tool_cache(mcpserver_id)
+                dropped = self._referenced_digests([previous or []]) - {definition.digest for definition in definitions}
+                new_definitions = {
+                    definition.digest: dict(definition)
+                    for definition in definitions
+                    if definition.digest not in self._stored_digests
+                }
+                if new_definitions:
+                    await self._storage_backend.write_tool_definitions(new_definitions)
+                    self._stored_digests.update(new_definitions)
+                refs = [{TOOL_DEFINITION_REF_KEY: definition.digest} for definition in definitions]
+                await self._storage_backend.write_tool_cache(mcpserver_id, refs)
         except Exception as e:
             logger.error(f"Failed to write tool cache for {mcpserver_id}: {e}")
             raise
+        finally:
+            # After the write: a snapshot loaded concurrently can not be kept with the new version
+            self._invalidate()
+        if dropped:
+            await self.sweep_tool_definitions()
+        await self.parent.events.publish(ConfigEventType.TOOLS_CHANGED, mcpserver_id=mcpserver_id)
 
     async def get_tool_cache(self, mcpserver_id: str) -> Optional[List[Dict[str, Any]]]:
         """Get the tool cache for a specific MCP server.
@@ -40,10 +136,16 @@ class ToolsCacheAdapter(ABC):
         Args:
             mcpserver_id: The MCP server ID (used as file key)
         Returns:
-            List of tool dicts, or None if not found
+            List of tool dicts (interned ToolDefinition objects), or None if not found
         """
+        if self._snapshot is not None and self._snapshot_version == self._version:
+            tools = self._snapshot.get(mcpserver_id)
+            return list(tools) if tools is not None else None
         try:
-            return await self._storage_backend.read_tool_cache(mcpserver_id)
+            cache = await self._storage_backend.read_tool_cache(mcpserver_id)
+            if cache is None:
+                return None
+            return await self._resolve_tool_refs(mcpserver_id, cache)
         except Exception as e:
             logger.error(f"Failed to read tool cache for {mcpserver_id}: {e}")
             return None
@@ -59,3 +161,35 @@ class ToolsCacheAdapter(ABC):
         except Exception as e:
             logger.error(f"Failed to delete tool cache for {mcpserver_id}: {e}")
             raise
+        finally:
+            self._invalidate()
+        await self.sweep_tool_definitions()
+        await self.parent.events.publish(ConfigEventType.TOOLS_CHANGED, mcpserver_id=mcpserver_id)
+
+    @staticmethod
+    def _referenced_digests(caches: Iterable[List[Dict[str, Any]]]) -> Set[str]:
+        return {
+            entry[TOOL_DEFINITION_REF_KEY]
+            for cache in caches for entry in cache
+            if isinstance(entry, dict) and TOOL_DEFINITION_REF_KEY in entry
+        }
+
+    async def sweep_tool_definitions(self) -> int:
+        """Delete the stored tool definitions no tool cache references any more.
+
+        Returns:
+            Number of deleted definitions
+        """
+        async with self._definitions_lock:
+            try:
+                caches = await self._storage_backend.get_all_tool_caches()
+                referenced = self._referenced_digests(caches.values())
+                orphaned = [digest for digest in await self._storage_backend.list_tool_definitions() if digest not in referenced]
+                if orphaned:
+                    await self._storage_backend.delete_tool_definitions(orphaned)
+                    self._stored_digests.difference_update(orphaned)
+                    logger.info(f"Deleted {len(orphaned)} unreferenced tool definitions")
+                return len(orphaned)
+            except Exception as e:
+                logger.error(f"Failed to sweep tool definitions: {e}")
+                return 0
@@ -1,23 +1,43 @@
 from loguru import logger
 from typing import Dict, Optional, TYPE_CHECKING
 from abc import ABC
-from mcpo_simple_server.services.config.models import UserConfigModel
+from mcpo_simple_server.config import AUTH_CACHE_LOCAL_TTL
+from mcpo_simple_server.services.config.models import UserConfigModel, UserIndexEntry
+from mcpo_simple_server.services.config.events import ConfigEvent, ConfigEventType
 if TYPE_CHECKING:
     from mcpo_simple_server.services.config import ConfigService
     from mcpo_simple_server.services.config.abstracts.storage_backend import StorageBackendAbstract
 
 
+def _invalidate_auth_cache(event: ConfigEvent) -> None:
+    """Drop cached authentication results of a user (all users if None) after a config change."""
+    # Lazy import - services.auth imports services.config
+    from mcpo_simple_server.services.auth.auth_cache import get_auth_cache
+    if event.username is None:
+        get_auth_cache().clear()
+    else:
+        get_auth_cache().invalidate_user(event.username)
+
+
 class UserConfigAdapter(ABC):
     """Compatibility adapter for existing code using config_service.users interface."""
 
     def __init__(self, parent: 'ConfigService'):
         self.parent = parent
         self._storage_backend: 'StorageBackendAbstract' = parent._storage_backend
+        parent.events.subscribe(ConfigEventType.USER_CHANGED, _invalidate_auth_cache)
+        if not self._storage_backend.notifies_changes:
+            # Changes of other processes are not published - cached principals must expire soon
+            from mcpo_simple_server.services.auth.auth_cache import get_auth_cache
+            get_auth_cache().limit_ttl(AUTH_CACHE_LOCAL_TTL)
 
     async def delete_config(self, username: str) -> bool:
         """Delete a user configuration."""
         try:
-            result = await self._storage_backend.delete_user_config(username)
+            api_key_changes = self.parent.api_key_index.removal_changes(username)
+            result = await self._storage_backend.delete_user_config(username, api_key_changes)
+            self.parent.api_key_index.apply(api_key_changes)
+            await self.parent.events.publish(ConfigEventType.USER_CHANGED, username=username)
             return result
         except Exception as e:
             logger.error(f"Error deleting user '{username}': {str(e)}")
@@ -33,7 +53,10 @@ class UserConfigAdapter(ABC):
     async def save_config(self, user_data: UserConfigModel) -> bool:
         """Save user configuration."""
         try:
-            await self._storage_backend.save_user_config(user_data)
+            api_key_changes = self.parent.api_key_index.user_changes(user_data)
+            await self._storage_backend.save_user_config(user_data, api_key_changes)
+            self.parent.api_key_index.apply(api_key_changes)
+            await self.parent.events.publish(ConfigEventType.USER_CHANGED, username=user_data.username)
             return True
         except Exception as e:
             logger.error(f"Error saving user config: {str(e)}")
@@ -52,6 +75,21 @@ class UserConfigAdapter(ABC):
             logger.error(f"Error getting all users: {str(e)}")
             return {}
 
+    async def get_users_index(self) -> Dict[str, UserIndexEntry]:
+        """Get a light index of all users (disabled flag, mcpserver names and types).
+
+        Use it instead of get_all_users_configs() when the full configs are not needed:
+        no user config is validated or cached, load them on demand with get_config().
+
+        Returns:
+            Dictionary mapping usernames to their index entry
+        """
+        try:
+            return await self._storage_backend.list_user_index()
+        except Exception as e:
+            logger.error(f"Error getting users index: {str(e)}")
+            return {}
+
     async def refresh_users_cache(self, username: Optional[str] = None) -> None:
         """Refresh the users cache. If username is provided, refresh only that user; otherwise, refresh all.
 
@@ -63,3 +101,4 @@ class UserConfigAdapter(ABC):
             Some storage backend may not support this method and will always pass None to the storage backend.
         """
         await self._storage_backend.clear_cache(username)
+        await self.parent.events.publish(ConfigEventType.USER_CHANGED, username=username)
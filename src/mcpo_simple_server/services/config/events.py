@@ -0,0 +1,113 @@
+"""
+Module: Config events - In-process pub/sub of configuration changes
+
+High Level Concept:
+-------------------
+Several caches are derived from the configuration: authenticated principals, the
+per-user tools schema, the public tool endpoints and the tools blacklist of the
+mcpserver service. Instead of rebuilding everything on every request (or never),
+ConfigService publishes a typed event for each change and every derived cache
+subscribes and refreshes only the affected keys.
+
+Architecture:
+-------------
+- ConfigEventType: user_changed, server_changed, tools_changed, blacklist_changed
+- ConfigEvent: event type plus the affected key (username and/or mcpserver_id),
+  a missing key means "all" (e.g. user_changed without username after a full refresh)
+- ConfigEventBus: handlers per event type, called in subscription order
+
+Workflow:
+---------
+1. A consumer subscribes once: `config_service.events.subscribe(type, handler)`
+2. Adapters and services publish after the change is applied: `await events.publish(...)`
+3. publish() awaits every handler (sync or async), so derived caches are consistent
+   when the changing request returns
+
+Notes:
+------
+- A failing handler is logged and does not affect the publisher or other handlers
+- Events are process-local, changes of other nodes sharing a KeyValueStorage are
+  published with remote=True by ConfigService (other backends: not notified)
+"""
+import inspect
+from enum import Enum
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+from loguru import logger
+
+
+class ConfigEventType(str, Enum):
+    """Kind of configuration change."""
+    USER_CHANGED = "user_changed"
+    SERVER_CHANGED = "server_changed"
+    TOOLS_CHANGED = "tools_changed"
+    BLACKLIST_CHANGED = "blacklist_changed"
+
+
+@dataclass(frozen=True)
+class ConfigEvent:
+    """A configuration change, keys that are None mean 'all'. remote: made by another node."""
+    type: ConfigEventType
+    username: Optional[str] = None
+    mcpserver_id: Optional[str] = None
+    remote: bool = False
+
+
+ConfigEventHandler = Callable[[ConfigEvent], Union[None, Awaitable[None]]]
+
+
+class ConfigEventBus:
+    """Lightweight in-process pub/sub bus for configuration change events."""
+
+    def __init__(self) -> None:
+        self._handlers: Dict[ConfigEventType, List[ConfigEventHandler]] = {event_type: [] for event_type in ConfigEventType}
+        self._stats: Dict[str, int] = {event_type.value: 0 for event_type in ConfigEventType}
+        self._errors = 0
+
+    def subscribe(self, event_type: ConfigEventType, handler: ConfigEventHandler) -> Callable[[], None]:
+        """
+        Subscribe a handler (sync or async) to an event type.
+
+        Returns:
+            Callable removing the subscription
+        """
+        self._handlers[event_type].append(handler)
+
+        def unsubscribe() -> None:
+            if handler in self._handlers[event_type]:
+                self._handlers[event_type].remove(handler)
+
+        return unsubscribe
+
+    async def publish(
+        self,
+        event_type: ConfigEventType,
+        username: Optional[str] = None,
+        mcpserver_id: Optional[str] = None,
+        remote: bool = False
+    ) -> ConfigEvent:
+        """
+        Publish an event and wait until all subscribed handlers processed it.
+
+        Returns:
+            The published event
+        """
+        event = ConfigEvent(type=event_type, username=username, mcpserver_id=mcpserver_id, remote=remote)
+        self._stats[event_type.value] += 1
+        for handler in list(self._handlers[event_type]):
+            try:
+                result = handler(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                self._errors += 1
+                logger.error(f"Config event handler {getattr(handler, '__qualname__', handler)} failed for {event}: {e}")
+        return event
+
+    def get_stats(self) -> Dict[str, object]:
+        """Report published events per type, subscriber counts and handler errors."""
+        return {
+            "published": dict(self._stats),
+            "subscribers": {event_type.value: len(handlers) for event_type, handlers in self._handlers.items()},
+            "errors": self._errors,
+        }
@@ -9,6 +9,7 @@ user management, server configuration, and environment variables.
 from .tools_config_model import ToolsConfigModel
 from .mcpserver import McpServerConfigModel, McpServersListResponse
 from .user_config_model import UserConfigModel, UserConfigPublicModel
+from .user_index import UserIndexEntry
 from .user_request_models import UserCreateRequest
 from .config import ConfigModel, GlobalConfigModel
 
@@ -20,6 +21,7 @@ __all__ = [
     'GlobalConfigModel',
     'UserConfigModel',
     'UserConfigPublicModel',
+    'UserIndexEntry',
     'UserCreateRequest',
     'ConfigModel'
 ]
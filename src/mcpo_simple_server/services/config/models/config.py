@@ -4,8 +4,8 @@ Configuration response model.
 This module defines the Pydantic model for configuration responses.
 """
 
-from typing import Dict, Optional, Any
-from pydantic import BaseModel, Field
+from typing import Awaitable, Callable, Dict, Optional, Any
+from pydantic import BaseModel, Field, PrivateAttr
 from .tools_config_model import ToolsConfigModel
 from .user_config_model import UserConfigModel
 
@@ -22,16 +22,31 @@ class ConfigModel(BaseModel):
     """
     Combined configuration object returned by the get_config function.
     Contains both global and user-specific configurations.
+
+    Tool caches are not loaded with the config - `tools_cache` stays None until
+    `load_tools_cache()` materializes it (from the tools cache snapshot).
     """
     global_config: GlobalConfigModel
     user_config: Optional[UserConfigModel] = None
     tools_cache: Optional[Dict[str, Any]] = None
+    _tools_cache_loader: Optional[Callable[[], Awaitable[Dict[str, Any]]]] = PrivateAttr(default=None)
 
     class Config:
         # Allow arbitrary attributes to dynamically assign the save method
         arbitrary_types_allowed = True
         extra = "allow"
 
+    async def load_tools_cache(self) -> Optional[Dict[str, Any]]:
+        """
+        Materialize the tool caches of all mcpservers on first access.
+
+        Returns:
+            Dictionary mapping mcpserver ids to their tools, None if no loader is attached
+        """
+        if self.tools_cache is None and self._tools_cache_loader is not None:
+            self.tools_cache = await self._tools_cache_loader()
+        return self.tools_cache
+
     async def save(self, clear_cache: bool = True) -> "ConfigModel":
         """
         Save the current configuration state.
@@ -5,26 +5,51 @@ This module defines the Pydantic model for MCP server instance configuration.
 """
 
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 __all__ = ['McpServerConfigModel', 'McpServersListResponse']
 
 
 class McpServerConfigModel(BaseModel):
     """Configuration for a single MCP server instance."""
-    command: str
+    command: str = ""
     args: Optional[List[str]] = Field(default_factory=list)
     env: Optional[Dict[str, str]] = Field(default_factory=dict)
     description: Optional[str] = None
     mcpserver_type: Optional[str] = Field("private", description="MCP server type: 'public' or 'private'")
     tools_blacklist: Optional[List[str]] = Field(default_factory=list, description="List of blocked tool names")
-    transport: Optional[str] = Field(default="stdio")
+    transport: Optional[str] = Field(default="stdio", description="MCP transport: 'stdio', 'streamable-http' or 'sse'")
+    url: Optional[str] = Field(None, description="URL of the remote server (streamable-http and sse transports)")
+    headers: Optional[Dict[str, str]] = Field(default_factory=dict, description="HTTP headers sent to the remote server")
     disabled: Optional[bool] = False
 
     class Config:
         extra = "allow"
         validate_by_name = True
 
+    @model_validator(mode="after")
+    def normalize_transport(self) -> "McpServerConfigModel":
+        # Stored configs are loaded as they are - an invalid entry must not make the user config unreadable
+        self.transport = self.transport or "stdio"
+        self.headers = self.headers or {}
+        return self
+
+    def validate_transport(self) -> None:
+        """
+        Check that the fields required by the transport are set (new or changed configs).
+
+        Raises:
+            ValueError: If the transport is unsupported or its command / url is missing
+        """
+        if self.transport == "stdio":
+            if not self.command:
+                raise ValueError("'command' is required for the stdio transport")
+        elif self.transport in ("streamable-http", "sse"):
+            if not self.url:
+                raise ValueError(f"'url' is required for the {self.transport} transport")
+        else:
+            raise ValueError(f"Unsupported transport '{self.transport}', expected 'stdio', 'streamable-http' or 'sse'")
+
 
 class McpServersListResponse(BaseModel):
     mcpServers: Dict[str, McpServerConfigModel]
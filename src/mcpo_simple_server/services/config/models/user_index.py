@@ -0,0 +1,44 @@
+"""
+User index model.
+
+This module defines the light per-user entry used at startup instead of full user configs.
+"""
+
+from typing import Any, Dict, Mapping, NamedTuple
+from .user_config_model import UserConfigModel
+
+__all__ = ['UserIndexEntry']
+
+
+class UserIndexEntry(NamedTuple):
+    """
+    Light view of a user: no credentials, API keys, env or mcpserver definitions.
+
+    Built from raw stored documents without model validation, so indexing all users
+    is cheap and nothing but this entry is kept in memory.
+    """
+    username: str
+    disabled: bool
+    mcpservers: Dict[str, str]     # mcpserver name -> mcpserver type ("public" / "private")
+
+    @classmethod
+    def from_document(cls, document: Mapping[str, Any]) -> "UserIndexEntry":
+        """Build the entry from a raw (JSON) user document."""
+        mcpservers = document.get("mcpServers") or {}
+        return cls(
+            username=document["username"],
+            disabled=bool(document.get("disabled", False)),
+            mcpservers={
+                name: (server or {}).get("mcpserver_type") or "private"
+                for name, server in mcpservers.items()
+            }
+        )
+
+    @classmethod
+    def from_config(cls, config: UserConfigModel) -> "UserIndexEntry":
+        """Build the entry from a user config model."""
+        return cls(
+            username=config.username,
+            disabled=config.disabled,
+            mcpservers={name: server.mcpserver_type or "private" for name, server in config.mcpServers.items()}
+        )
@@ -2,13 +2,17 @@ import types
 from fastapi import HTTPException, status
 from loguru import logger
 from typing import Dict, Optional, Any
-from mcpo_simple_server.config import CONFIG_STORAGE_PATH, CONFIG_STORAGE_TYPE
-from mcpo_simple_server.services.config.storage import NoSQLiteStorage, DDBStorage
+from mcpo_simple_server.config import CONFIG_STORAGE_PATH, CONFIG_STORAGE_TYPE, CONFIG_WRITE_BEHIND_DELAY, CONFIG_STORAGE_REDIS_URL
+from mcpo_simple_server.services.config.storage import (
+    NoSQLiteStorage, DDBStorage, SQLiteStorage, WriteBehindStorage, KeyValueStorage, RedisClient, InMemoryKeyValueClient
+)
 from mcpo_simple_server.services.config.abstracts.storage_backend import StorageBackendAbstract
 from mcpo_simple_server.services.config.models import ConfigModel
+from mcpo_simple_server.services.config.events import ConfigEventBus, ConfigEventType
 from mcpo_simple_server.services.config.adapters.global_config import GlobalConfigAdapter
 from mcpo_simple_server.services.config.adapters.user_config import UserConfigAdapter
 from mcpo_simple_server.services.config.adapters.tools_cache import ToolsCacheAdapter
+from mcpo_simple_server.services.config.adapters.api_key_index import ApiKeyIndexAdapter
 
 
 SELECTED_STORAGE_BACKEND: Optional[StorageBackendAbstract] = None
@@ -16,16 +20,28 @@ SELECTED_STORAGE_BACKEND: Optional[StorageBackendAbstract] = None
 
 def _select_storage_backend(db_path: str) -> StorageBackendAbstract:
     """
-    Select storage backend based on CONFIG_STORAGE_TYPE env var.
+    Select storage backend based on CONFIG_STORAGE_TYPE env var,
+    wrapped in WriteBehindStorage if CONFIG_WRITE_BEHIND_DELAY > 0.
 
     Returns:
         StorageBackendAbstract: Our own storage backend instance
     """
+    backend: StorageBackendAbstract
     if CONFIG_STORAGE_TYPE == "ddb":
-        return DDBStorage(db_path)
-    if CONFIG_STORAGE_TYPE == "nosqlite":
-        return NoSQLiteStorage(db_path)
-    raise ValueError(f"Unknown storage type: {CONFIG_STORAGE_TYPE}")
+        backend = DDBStorage(db_path)
+    elif CONFIG_STORAGE_TYPE == "nosqlite":
+        backend = NoSQLiteStorage(db_path)
+    elif CONFIG_STORAGE_TYPE == "sqlite":
+        backend = SQLiteStorage(db_path)
+    elif CONFIG_STORAGE_TYPE == "redis":
+        backend = KeyValueStorage(RedisClient(CONFIG_STORAGE_REDIS_URL))
+    elif CONFIG_STORAGE_TYPE == "memory":
+        backend = KeyValueStorage(InMemoryKeyValueClient())
+    else:
+        raise ValueError(f"Unknown storage type: {CONFIG_STORAGE_TYPE}")
+    if CONFIG_WRITE_BEHIND_DELAY > 0:
+        return WriteBehindStorage(backend)
+    return backend
 
 
 # Rebuild ConfigResponse model to resolve forward references
@@ -56,10 +72,46 @@ class ConfigService:
             SELECTED_STORAGE_BACKEND = _select_storage_backend(db_path)
             self._storage_backend: StorageBackendAbstract = SELECTED_STORAGE_BACKEND
 
+        # Change events for derived caches, adapters publish to it
+        self.events = ConfigEventBus()
+
         # Initialize adapters for configuration access
         self.global_config = GlobalConfigAdapter(self)
         self.user_config = UserConfigAdapter(self)
         self.tools_cache = ToolsCacheAdapter(self)
+        self.api_key_index = ApiKeyIndexAdapter(self)
+
+        # Changes made by other nodes sharing the storage (KeyValueStorage)
+        self._storage_backend.set_change_listener(self._on_storage_change)
+
+    async def _on_storage_change(self, key: str) -> None:
+        """
+        Apply a config change made by another node: refresh the API key index and publish
+        the config events (remote=True), so the derived caches of this node are refreshed.
+
+        Args:
+            key: "global", "user:<username>", "tools:<mcpserver id>" or "*" (anything may have changed)
+        """
+        if key == "*":
+            await self.api_key_index.load()
+            self.tools_cache._invalidate()
+            await self.events.publish(ConfigEventType.BLACKLIST_CHANGED, remote=True)
+            await self.events.publish(ConfigEventType.USER_CHANGED, remote=True)
+            await self.events.publish(ConfigEventType.TOOLS_CHANGED, remote=True)
+        elif key == "global":
+            await self.events.publish(ConfigEventType.BLACKLIST_CHANGED, remote=True)
+        elif key.startswith("user:"):
+            username = key[len("user:"):]
+            user_config = await self.user_config.get_config(username)
+            # Stored by the other node - only the in-memory index is updated
+            if user_config is None:
+                self.api_key_index.remove_user(username)
+            else:
+                self.api_key_index.update_user(user_config)
+            await self.events.publish(ConfigEventType.USER_CHANGED, username=username, remote=True)
+        elif key.startswith("tools:"):
+            self.tools_cache._invalidate()
+            await self.events.publish(ConfigEventType.TOOLS_CHANGED, mcpserver_id=key[len("tools:"):], remote=True)
 
     async def get_config(self, username: Optional[str] = None) -> ConfigModel:
         """
@@ -86,8 +138,8 @@ class ConfigService:
             user_config=user_config
         )
 
-        # Expose tool cache operations via response
-        response.tools_cache = await self.tools_cache.get_all_tool_caches()
+        # Tool caches are loaded only on demand (ConfigModel.load_tools_cache)
+        response._tools_cache_loader = self.tools_cache.get_all_tool_caches
 
         # Add dynamic save method
         async def save_config() -> ConfigModel:
@@ -96,13 +148,13 @@ class ConfigService:
             # Save username for later use
             current_username = username
 
-            # Save global config
+            # Save global config (through the adapters, so change events are published)
             if self._storage_backend is not None:
-                await self._storage_backend.save_global_config(response.global_config)
+                await self.global_config.save_config(response.global_config)
 
             # Save user config if present
             if response.user_config and self._storage_backend is not None:
-                await self._storage_backend.save_user_config(response.user_config)
+                await self.user_config.save_config(response.user_config)
 
             # Create new response object without recursive get_config call
             new_response = ConfigModel(
@@ -123,6 +175,23 @@ class ConfigService:
 
         return response
 
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """
+        Report the storage backend type, its cache counters and the config event counters.
+        """
+        return {
+            "storage_type": CONFIG_STORAGE_TYPE,
+            **self._storage_backend.get_cache_stats(),
+            "events": self.events.get_stats()
+        }
+
+    async def flush(self) -> None:
+        """
+        Write pending (write-behind) config changes to storage.
+        """
+        if isinstance(self._storage_backend, WriteBehindStorage):
+            await self._storage_backend.flush()
+
     async def close(self):
         """
         Close the database connection.
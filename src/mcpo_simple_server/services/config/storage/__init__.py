@@ -11,6 +11,9 @@ Architecture:
 -------------
 - StorageBackendAbstract: Abstract base class defining the storage interface
 - Concrete Implementations: Specific implementations for different storage technologies
+- WriteBehindStorage: Wrapper merging and debouncing config document writes of any backend
+- KeyValueStorage: Config shared by several gateway nodes in a Redis protocol store (RedisClient),
+  or in the in-process stand-in (InMemoryKeyValueClient)
 - Caching Layer: From Abstract StorageBackend we dont care about caching, this needs to be handled by storage technology implementation level
 
 Workflow:
@@ -21,13 +24,21 @@ Workflow:
 Notes:
 ------
 - All storage backends implement the same interface
-- The current implementation uses: NoSQLite
-- Future implementations may include: Redis, MongoDB, etc.
+- Available implementations: DDB (default), NoSQLite, SQLite (typed schema, WAL), Redis (KeyValueStorage)
+- Future implementations may include: MongoDB, etc.
 """
 
 # Import available storage backends
 from mcpo_simple_server.services.config.storage.nosqlite_storage import NoSQLiteStorage
 from mcpo_simple_server.services.config.storage.ddb_storage import DDBStorage
+from mcpo_simple_server.services.config.storage.sqlite_storage import SQLiteStorage
+from mcpo_simple_server.services.config.storage.write_behind import WriteBehindStorage
+from mcpo_simple_server.services.config.storage.kv_storage import KeyValueStorage
+from mcpo_simple_server.services.config.storage.redis_client import RedisClient
+from mcpo_simple_server.services.config.storage.memory_kv_client import InMemoryKeyValueClient
 
 # Re-export concrete implementations
-__all__ = ["NoSQLiteStorage", "DDBStorage"]
+__all__ = [
+    "NoSQLiteStorage", "DDBStorage", "SQLiteStorage", "WriteBehindStorage",
+    "KeyValueStorage", "RedisClient", "InMemoryKeyValueClient"
+]
@@ -0,0 +1,91 @@
+"""
+Module: API key index files - API key index of the file based backends
+
+The index is kept as one small JSON file per API key digest in a directory, so
+creating or revoking a key writes or removes a single file instead of rewriting the
+whole index, and concurrent changes of different users (or worker processes) can
+not overwrite each other.
+
+Notes:
+------
+- An index stored by older versions as one JSON document is imported on first access
+- The directory exists once the index was built, an empty directory is an empty index
+"""
+import os
+import json
+from typing import Any, Dict, Optional
+from loguru import logger
+from mcpo_simple_server.services.config.storage.atomic_file import atomic_write_json
+
+
+class ApiKeyIndexFiles:
+    """API key index stored as one JSON file per key digest."""
+
+    def __init__(self, directory: str, legacy_file: Optional[str] = None) -> None:
+        """
+        Args:
+            directory: Directory of the index entry files
+            legacy_file: Index document written by older versions, imported and removed
+        """
+        self.directory = directory
+        self._legacy_file = legacy_file
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def _import_legacy(self) -> None:
+        if not self._legacy_file or not os.path.exists(self._legacy_file) or os.path.isdir(self.directory):
+            return
+        with open(self._legacy_file, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        self.write(index if isinstance(index, dict) else {})
+        logger.info(f"Imported API key index {self._legacy_file} into {self.directory}")
+
+    def read(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Read all entries, None if the index was not built yet."""
+        self._import_legacy()
+        if not os.path.isdir(self.directory):
+            return None
+        index: Dict[str, Dict[str, Any]] = {}
+        for filename in os.listdir(self.directory):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.directory, filename), "r", encoding="utf-8") as f:
+                    index[filename[:-len(".json")]] = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable API key index entry {filename}: {e}")
+        return index
+
+    def read_entry(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Read the entry of one key digest, None if there is none."""
+        self._import_legacy()
+        try:
+            with open(self._path(digest), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def write(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Replace all entries."""
+        os.makedirs(self.directory, exist_ok=True)
+        for digest, entry in index.items():
+            atomic_write_json(self._path(digest), entry)
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".json") and filename[:-len(".json")] not in index:
+                os.remove(os.path.join(self.directory, filename))
+        if self._legacy_file and os.path.exists(self._legacy_file):
+            os.remove(self._legacy_file)
+
+    def update(self, changes: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Write (entry) or remove (None) single entries."""
+        self._import_legacy()
+        os.makedirs(self.directory, exist_ok=True)
+        for digest, entry in changes.items():
+            if entry is None:
+                try:
+                    os.remove(self._path(digest))
+                except FileNotFoundError:
+                    pass
+            else:
+                atomic_write_json(self._path(digest), entry)
@@ -0,0 +1,42 @@
+"""
+Module: Atomic file - Crash-safe replacement of JSON documents
+
+A document is written to a temp file in the same directory, fsynced and renamed over
+the target, then the directory is fsynced. Readers (and a restart after a crash) see
+either the complete old or the complete new document, never a truncated file.
+"""
+import os
+import json
+import threading
+from typing import Any
+
+
+def atomic_write_json(path: str, data: Any) -> None:
+    """
+    Atomically replace the file at `path` with the JSON encoding of `data`.
+
+    Args:
+        path: Target file path, parent directories are created if needed
+        data: JSON serializable data
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    # Persist the rename itself
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
@@ -0,0 +1,62 @@
+"""
+Module: Blocking I/O - Run blocking storage operations off the event loop
+
+High Level Concept:
+-------------------
+Storage backends talk to sqlite and the filesystem with blocking calls. Executed on
+the event loop, a slow disk or a large tool cache stalls every SSE stream and tool
+call of the worker. The `blocking_io` decorator turns a synchronous backend method
+into a coroutine running in a dedicated thread pool, while an asyncio.Lock of the
+backend keeps its operations serialized (as the former threading.Lock did).
+
+Usage Example:
+--------------
+>>> class MyStorage(StorageBackendAbstract):
+...     def __init__(self):
+...         self._lock = asyncio.Lock()
+...
+...     @blocking_io
+...     def read_tool_cache(self, mcpserver_name: str) -> Optional[list[dict]]:
+...         with open(...) as f:
+...             return json.load(f)
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+from mcpo_simple_server.config import CONFIG_STORAGE_IO_WORKERS
+
+T = TypeVar("T")
+
+_storage_io_executor = ThreadPoolExecutor(max_workers=CONFIG_STORAGE_IO_WORKERS, thread_name_prefix="storage-io")
+
+
+def blocking_io(method: Optional[Callable[..., T]] = None, *, exclusive: bool = True) -> Any:
+    """
+    Run a synchronous storage method in the storage I/O thread pool under the backend's
+    asyncio lock (`self._lock`). The undecorated method is available as `__wrapped__`.
+
+    Args:
+        exclusive: Hold the backend lock while the method runs. Backends which can serve
+            reads concurrently (e.g. sqlite in WAL mode) use `@blocking_io(exclusive=False)`
+            for read-only methods.
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+            loop = asyncio.get_running_loop()
+            if not exclusive:
+                return await loop.run_in_executor(_storage_io_executor, functools.partial(func, self, *args, **kwargs))
+            async with self._lock:
+                future = loop.run_in_executor(_storage_io_executor, functools.partial(func, self, *args, **kwargs))
+                try:
+                    return await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    # Keep the lock until the operation really finished - it can not be interrupted
+                    await asyncio.wait([future])
+                    raise
+        return wrapper
+
+    if method is not None:
+        return decorator(method)
+    return decorator
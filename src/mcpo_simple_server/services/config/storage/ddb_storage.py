@@ -22,70 +22,170 @@ Workflow:
 Notes:
 ------
 - Uses DictDataBase for persistent storage
-- Caching for performance optimization
+- Read-through / write-through cache for global and user configs, entries are
+  validated against the file mtime and size, so external edits are picked up
+- The user config cache is a LRU bounded by CONFIG_USER_CACHE_SIZE, memory scales
+  with active users; list_user_index() reads the raw documents without caching them
+- Blocking file I/O runs in the storage I/O thread pool (see blocking_io)
+- Tool caches are kept in a single packed file (see tool_cache_pack)
+- API key index entries are kept one file per key digest (see api_key_index_files)
+- Config documents are replaced atomically (see atomic_file) and read without the DDB file locks
 - All collections are created on first access
 """
-import threading
 import os
+import json
+import asyncio
+from collections import OrderedDict
 import dictdatabase as DDB
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from loguru import logger
-from mcpo_simple_server.services.config.models import GlobalConfigModel, UserConfigModel
-from mcpo_simple_server.services.config.abstracts.storage_backend import StorageBackendAbstract
+from mcpo_simple_server.config import CONFIG_USER_CACHE_SIZE
+from mcpo_simple_server.services.config.models import GlobalConfigModel, UserConfigModel, UserIndexEntry
+from mcpo_simple_server.services.config.models.user_config_model import ApiKeyMetadataModel
+from mcpo_simple_server.services.config.abstracts.storage_backend import StorageBackendAbstract, ApiKeyIndexChanges
+from mcpo_simple_server.services.config.storage.blocking_io import blocking_io
+from mcpo_simple_server.services.config.storage.atomic_file import atomic_write_json
+from mcpo_simple_server.services.config.storage.tool_cache_pack import PackedToolCacheStore, TOOL_CACHE_PACK_FILE
+from mcpo_simple_server.services.config.storage.api_key_index_files import ApiKeyIndexFiles
 
 
 class DDBStorage(StorageBackendAbstract):
     """DictDataBase implementation of the storage backend."""
 
-    async def write_tool_cache(self, mcpserver_name: str, cache: list[dict]) -> None:
+    @blocking_io
+    def write_tool_cache(self, mcpserver_name: str, cache: list[dict]) -> None:
         """
-        Write the tool cache for a specific MCP server as a DDB file.
+        Write the tool cache for a specific MCP server to the tool cache pack.
         """
-        tools_cache_path = f"tools_cache/{mcpserver_name}"
-        with self._lock:
+        try:
+            self._tool_cache_pack.write(mcpserver_name, cache)
+            logger.info(f"Tool cache saved for MCP server '{mcpserver_name}' at {self._tool_cache_pack.path}")
+        except Exception as e:
+            logger.error(f"Error writing tool cache for '{mcpserver_name}': {e}")
+
+    @blocking_io
+    def read_tool_cache(self, mcpserver_name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read the tool cache for a specific MCP server from the tool cache pack.
+        """
+        try:
+            cache = self._tool_cache_pack.read(mcpserver_name)
+            if cache is None:
+                logger.debug(f"Tool cache not found for MCP server '{mcpserver_name}'")
+            return cache
+        except Exception as e:
+            logger.error(f"Error reading tool cache for '{mcpserver_name}': {e}")
+            return None
+
+    @blocking_io
+    def delete_tool_cache(self, mcpserver_name: str) -> None:
+        """
+        Delete the tool cache of a specific MCP server from the tool cache pack.
+        """
+        try:
+            if self._tool_cache_pack.delete(mcpserver_name):
+                logger.info(f"Tool cache deleted for MCP server '{mcpserver_name}'")
+            else:
+                logger.debug(f"Tool cache not found for MCP server '{mcpserver_name}'")
+        except Exception as e:
+            logger.error(f"Error deleting tool cache for '{mcpserver_name}': {e}")
+
+    def _import_legacy_tool_caches(self) -> None:
+        """
+        Copy tool caches stored as one DDB file per MCP server into the new tool cache pack.
+        """
+        try:
+            legacy_caches = DDB.at("tools_cache/*").read()  # type: ignore
+        except Exception as e:
+            logger.error(f"Error reading legacy tool caches: {e}")
+            return
+        for server_name, cache in (legacy_caches or {}).items():
+            if isinstance(cache, dict):
+                cache = [cache]
+            if isinstance(cache, list):
+                self._tool_cache_pack.write(server_name, cache)
+        if legacy_caches:
+            logger.info(f"Imported {len(legacy_caches)} legacy tool caches into {self._tool_cache_pack.path}, "
+                        f"the {DDB.config.storage_directory}/tools_cache directory is no longer used")
+
+    @blocking_io
+    def write_tool_definitions(self, definitions: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Write content-addressed tool definitions as DDB files (one file per digest).
+        """
+        for digest, definition in definitions.items():
             try:
-                DDB.at(tools_cache_path).create(cache, force_overwrite=True)  # type: ignore
-                logger.info(f"Tool cache saved for MCP server '{mcpserver_name}' at {tools_cache_path}")
+                DDB.at(f"tool_definitions/{digest}").create(definition, force_overwrite=True)  # type: ignore
             except Exception as e:
-                logger.error(f"Error writing tool cache for '{mcpserver_name}': {e}")
+                logger.error(f"Error writing tool definition '{digest}': {e}")
 
-    async def read_tool_cache(self, mcpserver_name: str) -> Optional[List[Dict[str, Any]]]:
+    @blocking_io
+    def read_tool_definitions(self, digests: List[str]) -> Dict[str, Dict[str, Any]]:
         """
-        Read the tool cache for a specific MCP server from a DDB file.
+        Read content-addressed tool definitions from DDB files.
         """
-        tools_cache_path = f"tools_cache/{mcpserver_name}"
-        with self._lock:
+        definitions: Dict[str, Dict[str, Any]] = {}
+        for digest in digests:
             try:
-                if not DDB.at(tools_cache_path).exists():  # type: ignore
-                    logger.debug(f"Tool cache not found for MCP server '{mcpserver_name}' at {tools_cache_path}")
-                    return None
-                cache = DDB.at(tools_cache_path).read()  # type: ignore
-                # Ensure we return a list of dicts as expected by the abstract class
-                if isinstance(cache, list):
-                    return cache
-                # If we got a dict instead of a list, wrap it in a list
-                if isinstance(cache, dict):
-                    return [cache]
-                logger.error(f"Unexpected cache format for MCP server '{mcpserver_name}': {type(cache)}")
-                return None
+                if DDB.at(f"tool_definitions/{digest}").exists():  # type: ignore
+                    definitions[digest] = DDB.at(f"tool_definitions/{digest}").read()  # type: ignore
             except Exception as e:
-                logger.error(f"Error reading tool cache for '{mcpserver_name}': {e}")
-                return None
+                logger.error(f"Error reading tool definition '{digest}': {e}")
+        return definitions
 
-    async def delete_tool_cache(self, mcpserver_name: str) -> None:
+    @blocking_io
+    def list_tool_definitions(self) -> List[str]:
         """
-        Delete the tool cache DDB file for a specific MCP server.
+        List the digests of the tool definition files.
         """
-        tools_cache_path = f"tools_cache/{mcpserver_name}"
-        with self._lock:
+        definitions_dir = os.path.join(DDB.config.storage_directory, "tool_definitions")
+        if not os.path.isdir(definitions_dir):
+            return []
+        return [os.path.splitext(filename)[0] for filename in os.listdir(definitions_dir) if filename.endswith(".json")]
+
+    @blocking_io
+    def delete_tool_definitions(self, digests: List[str]) -> None:
+        """
+        Delete tool definition files.
+        """
+        for digest in digests:
             try:
-                if DDB.at(tools_cache_path).exists():  # type: ignore
-                    DDB.at(tools_cache_path).delete()  # type: ignore
-                    logger.info(f"Tool cache deleted for MCP server '{mcpserver_name}' at {tools_cache_path}")
-                else:
-                    logger.debug(f"Tool cache not found for MCP server '{mcpserver_name}' at {tools_cache_path}")
+                DDB.at(f"tool_definitions/{digest}").delete()  # type: ignore
             except Exception as e:
-                logger.error(f"Error deleting tool cache for '{mcpserver_name}': {e}")
+                logger.error(f"Error deleting tool definition '{digest}': {e}")
+
+    @blocking_io
+    def write_api_key_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Write the API key index (one JSON file per key digest).
+        """
+        try:
+            self._api_key_index.write(index)
+        except Exception as e:
+            logger.error(f"Error writing API key index: {e}")
+            raise
+
+    @blocking_io
+    def read_api_key_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Read the API key index from its JSON files.
+        """
+        try:
+            return self._api_key_index.read()
+        except Exception as e:
+            logger.error(f"Error reading API key index: {e}")
+            return None
+
+    @blocking_io
+    def read_api_key_index_entry(self, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Read one API key index entry from its JSON file.
+        """
+        try:
+            return self._api_key_index.read_entry(digest)
+        except Exception as e:
+            logger.error(f"Error reading API key index entry: {e}")
+            return None
 
     def __init__(self, db_path: str):
         """
@@ -99,81 +199,222 @@ class DDBStorage(StorageBackendAbstract):
         # ensure config directory exists
         os.makedirs(base_dir, exist_ok=True)
         DDB.config.storage_directory = base_dir
+        self._base_dir = base_dir
         self._global_config_cache: Optional[GlobalConfigModel] = None
-        self._user_config_cache: Dict[str, UserConfigModel] = {}
-        self._lock = threading.Lock()
+        self._global_config_signature: Optional[Tuple[int, int]] = None
+        self._user_config_cache: "OrderedDict[str, UserConfigModel]" = OrderedDict()
+        self._user_config_signatures: Dict[str, Tuple[int, int]] = {}
+        self._user_cache_size = CONFIG_USER_CACHE_SIZE
+        self._cache_stats: Dict[str, int] = {"hits": 0, "misses": 0, "disk_reads": 0, "evictions": 0}
+        self._lock = asyncio.Lock()
+        self._tool_cache_pack = PackedToolCacheStore(os.path.join(base_dir, TOOL_CACHE_PACK_FILE))
+        if self._tool_cache_pack.created:
+            self._import_legacy_tool_caches()
+        self._api_key_index = ApiKeyIndexFiles(
+            os.path.join(base_dir, "api_key_index"), legacy_file=os.path.join(base_dir, "api_key_index.json")
+        )
         logger.info("📦 Selected DDBStorage backend.")
         logger.info(f"📦 Path: {base_dir}")
 
-    async def get_global_config(self) -> GlobalConfigModel:
+    @staticmethod
+    def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of the file backing a DDB path, None if it does not exist."""
+        json_path, json_exists, ddb_path, ddb_exists = DDB.utils.file_info(path)  # type: ignore
+        if not json_exists and not ddb_exists:
+            return None
+        try:
+            stat = os.stat(json_path if json_exists else ddb_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _read_document(path: str) -> Tuple[Optional[Any], Optional[Tuple[int, int]]]:
+        """
+        Read the document of a DDB path with the (mtime_ns, size) signature of the read file.
+
+        Documents are only replaced atomically (see _write_document), a reader always opens a
+        complete file, so the JSON is read without the DDB file locks (a lock thread per read).
+        """
+        json_path, json_exists, ddb_path, ddb_exists = DDB.utils.file_info(path)  # type: ignore
+        if json_exists:
+            try:
+                with open(json_path, "rb") as f:
+                    stat = os.fstat(f.fileno())
+                    return json.load(f), (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                return None, None
+        if ddb_exists:
+            # Compressed document of older versions
+            signature = DDBStorage._file_signature(path)
+            return DDB.at(path).read(), signature  # type: ignore
+        return None, None
+
+    @staticmethod
+    def _user_document(raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Upgrade a raw user document of older versions to the current layout."""
+        # MIGRATION: If api_keys is a list, convert to dict with default metadata
+        if isinstance(raw.get("api_keys"), list):
+            default = ApiKeyMetadataModel().model_dump()
+            raw["api_keys"] = {api_key: dict(default) for api_key in raw["api_keys"]}
+        return raw
+
+    @staticmethod
+    def _write_document(path: str, data: Any) -> None:
+        """Atomically replace the JSON file backing a DDB path (temp file + fsync + rename)."""
+        json_path, _, ddb_path, ddb_exists = DDB.utils.file_info(path)  # type: ignore
+        atomic_write_json(json_path, data)
+        if ddb_exists:
+            # A compressed copy would shadow the new JSON file
+            os.remove(ddb_path)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Report config cache hits, misses and disk reads.
+        """
+        lookups = self._cache_stats["hits"] + self._cache_stats["misses"]
+        return {
+            **self._cache_stats,
+            "hit_rate": round(self._cache_stats["hits"] / lookups, 4) if lookups else 0.0,
+            "cached_users": len(self._user_config_cache),
+            "user_cache_size": self._user_cache_size,
+            "tool_cache_pack": self._tool_cache_pack.get_stats(),
+        }
+
+    @blocking_io
+    def get_global_config(self) -> GlobalConfigModel:
         # Read or initialize global config file
         path = "config"
-        with self._lock:
-            raw = DDB.at(path).read()  # type: ignore
+        signature = self._file_signature(path)
+        if signature is not None and self._global_config_cache is not None and signature == self._global_config_signature:
+            self._cache_stats["hits"] += 1
+            return self._global_config_cache.model_copy(deep=True)
+        self._cache_stats["misses"] += 1
+        raw, signature = self._read_document(path)
+        self._cache_stats["disk_reads"] += 1
         if raw:
             config = GlobalConfigModel(**raw)
         else:
             config = GlobalConfigModel()
             try:
-                DDB.at(path).create(config.model_dump(), force_overwrite=True)  # type: ignore
+                self._write_document(path, config.model_dump(mode="json"))
+                signature = self._file_signature(path)
             except Exception as e:
                 logger.error(f"Error saving default global config: {e}")
-        self._global_config_cache = config
+        self._global_config_cache = config.model_copy(deep=True)
+        self._global_config_signature = signature
         return config
 
-    async def save_global_config(self, config: GlobalConfigModel) -> None:
+    @blocking_io
+    def save_global_config(self, config: GlobalConfigModel) -> None:
         # Overwrite global config file
         path = "config"   # will become config.json
         try:
-            DDB.at(path).create(config.model_dump(), force_overwrite=True)  # type: ignore
+            self._write_document(path, config.model_dump(mode="json"))
             logger.info("Saved global config")
-            self._global_config_cache = config
+            self._global_config_cache = config.model_copy(deep=True)
+            self._global_config_signature = self._file_signature(path)
         except Exception as e:
             logger.error(f"Error saving global config: {e}")
 
     async def get_user_config(self, username: str) -> Optional[UserConfigModel]:
-        # Read user config from 'users/username'
+        """
+        Get a user configuration by username.
+
+        Cache hits are validated with a stat of the config file on the event loop, only
+        misses wait for the backend lock and a storage I/O thread.
+        """
+        cached = self._cached_user_config(username)
+        if cached is None:
+            cached = await self._load_user_config(username)
+        # Callers modify the returned model before saving it - never hand out the cached instance
+        return cached.model_copy(deep=True) if cached is not None else None
+
+    def _cached_user_config(self, username: str) -> Optional[UserConfigModel]:
+        """Return the cached user config if its file is unchanged, None otherwise."""
+        # Signature first: _cache_user_config stores the config before its signature
+        cached_signature = self._user_config_signatures.get(username)
+        cached = self._user_config_cache.get(username)
+        if cached is None or cached_signature is None or self._file_signature(f"users/{username}") != cached_signature:
+            return None
+        self._cache_stats["hits"] += 1
+        try:
+            self._user_config_cache.move_to_end(username)
+        except KeyError:
+            pass    # Evicted meanwhile by an I/O thread
+        return cached
+
+    @blocking_io
+    def _load_user_config(self, username: str) -> Optional[UserConfigModel]:
+        # Read user config from 'users/username', served from cache while the file is unchanged
         path = f"users/{username}"
-        with self._lock:
-            raw = DDB.at(path).read()  # type: ignore
-        if raw:
-            # MIGRATION: If api_keys is a list, convert to dict with default metadata
-            if "api_keys" in raw and isinstance(raw["api_keys"], list):
-                from mcpo_simple_server.services.config.models.user_config_model import ApiKeyMetadataModel
-                migrated = {}
-                for k in raw["api_keys"]:
-                    migrated[k] = ApiKeyMetadataModel().model_dump()
-                raw["api_keys"] = migrated
-            user_config = UserConfigModel(**raw)
-            self._user_config_cache[username] = user_config
+        signature = self._file_signature(path)
+        if signature is None:
+            self._user_config_cache.pop(username, None)
+            self._user_config_signatures.pop(username, None)
+            self._cache_stats["misses"] += 1
+            return None
+        cached = self._user_config_cache.get(username)
+        if cached is not None and self._user_config_signatures.get(username) == signature:
+            # Stored by a concurrent load while this one waited for the lock
+            self._cache_stats["hits"] += 1
+            self._user_config_cache.move_to_end(username)
+            return cached
+        self._cache_stats["misses"] += 1
+        raw, signature = self._read_document(path)
+        self._cache_stats["disk_reads"] += 1
+        if raw and signature is not None:
+            user_config = UserConfigModel(**self._user_document(raw))
+            self._cache_user_config(user_config, signature)
             return user_config
         return None
 
-    async def save_user_config(self, config: UserConfigModel) -> None:
-        # Write user config to 'users/username'
+    def _cache_user_config(self, config: UserConfigModel, signature: Tuple[int, int]) -> None:
+        """Put a user config into the LRU cache, evicting the least recently used ones."""
+        self._user_config_cache[config.username] = config
+        self._user_config_cache.move_to_end(config.username)
+        self._user_config_signatures[config.username] = signature
+        while len(self._user_config_cache) > self._user_cache_size:
+            username, _ = self._user_config_cache.popitem(last=False)
+            self._user_config_signatures.pop(username, None)
+            self._cache_stats["evictions"] += 1
+
+    @blocking_io
+    def save_user_config(self, config: UserConfigModel, api_key_index: Optional[ApiKeyIndexChanges] = None) -> None:
+        # Write user config to 'users/username' and through to the cache
         path = f"users/{config.username}"
         try:
-            DDB.at(path).create(config.model_dump(), force_overwrite=True)  # type: ignore
+            self._write_document(path, config.model_dump(mode="json"))
             logger.info(f"Saved user config for {config.username}")
-            self._user_config_cache[config.username] = config
+            signature = self._file_signature(path)
+            if signature is not None:
+                self._cache_user_config(config.model_copy(deep=True), signature)
+            if api_key_index:
+                self._api_key_index.update(api_key_index)
         except Exception as e:
             logger.error(f"Error saving user config: {e}")
+            raise
 
-    async def delete_user_config(self, username: str) -> bool:
+    @blocking_io
+    def delete_user_config(self, username: str, api_key_index: Optional[ApiKeyIndexChanges] = None) -> bool:
         # Delete user config file
         path = f"users/{username}"
         exists = DDB.at(path).exists()  # type: ignore
         try:
-            DDB.at(path).delete()  # type: ignore
             if exists:
-                self._user_config_cache.pop(username, None)
+                DDB.at(path).delete()  # type: ignore
+            self._user_config_cache.pop(username, None)
+            self._user_config_signatures.pop(username, None)
+            if api_key_index:
+                self._api_key_index.update(api_key_index)
             return exists
         except Exception as e:
             logger.error(f"Error deleting user config: {e}")
-            return False
+            raise
 
-    async def list_users(self) -> Dict[str, UserConfigModel]:
-        # List all user configs in 'users' directory
+    @blocking_io
+    def list_users(self) -> Dict[str, UserConfigModel]:
+        # List all user configs in 'users' directory (not cached - a full scan would evict the active users)
         result: Dict[str, UserConfigModel] = {}
 
         try:
@@ -195,11 +436,10 @@ class DDBStorage(StorageBackendAbstract):
                     username = user_path.split("/")[-1]
 
                     # Load the user data
-                    user_data = DDB.at(user_path).read()  # type: ignore
+                    user_data, _ = self._read_document(user_path)
+                    self._cache_stats["disk_reads"] += 1
                     if user_data:
-                        result[username] = UserConfigModel(**user_data)
-                        # Cache the user config
-                        self._user_config_cache[username] = result[username]
+                        result[username] = UserConfigModel(**self._user_document(user_data))
                     else:
                         logger.warning(f"Empty user data for {username} at {user_path}")
                 except Exception as e:
@@ -209,13 +449,52 @@ class DDBStorage(StorageBackendAbstract):
 
         return result
 
+    @blocking_io
+    def list_user_index(self) -> Dict[str, UserIndexEntry]:
+        # Light index of all users from the raw documents. Only users with mcpservers (loaded
+        # next by the startup) are validated and put into the LRU cache, on the same read
+        result: Dict[str, UserIndexEntry] = {}
+        users_dir = os.path.join(self._base_dir, "users")
+        if not os.path.isdir(users_dir):
+            return result
+        try:
+            # One directory scan, JSON documents are opened directly (no glob and existence checks per user)
+            with os.scandir(users_dir) as entries:
+                for dir_entry in entries:
+                    username, extension = os.path.splitext(dir_entry.name)
+                    if extension not in (".json", ".ddb"):
+                        continue
+                    try:
+                        if extension == ".json":
+                            with open(dir_entry.path, "rb") as f:
+                                stat = os.fstat(f.fileno())
+                                user_data, signature = json.load(f), (stat.st_mtime_ns, stat.st_size)
+                        else:
+                            user_data, signature = self._read_document(f"users/{username}")
+                        self._cache_stats["disk_reads"] += 1
+                        if user_data:
+                            entry = UserIndexEntry.from_document({**user_data, "username": username})
+                            result[username] = entry
+                            if entry.mcpservers and not entry.disabled and signature is not None:
+                                self._cache_user_config(UserConfigModel(**self._user_document(user_data)), signature)
+                    except FileNotFoundError:
+                        pass    # Deleted during the scan
+                    except Exception as e:
+                        logger.error(f"Error indexing user config {dir_entry.path}: {e}")
+        except Exception as e:
+            logger.error(f"Error listing user index: {e}")
+        return result
+
     async def clear_cache(self, username: Optional[str] = None) -> None:
-        with self._lock:
+        async with self._lock:
             if username:
                 self._user_config_cache.pop(username, None)
+                self._user_config_signatures.pop(username, None)
             else:
                 self._global_config_cache = None
+                self._global_config_signature = None
                 self._user_config_cache.clear()
+                self._user_config_signatures.clear()
 
     async def close(self) -> None:
         """
@@ -228,32 +507,16 @@ class DDBStorage(StorageBackendAbstract):
         except Exception as e:
             logger.error(f"Error closing DDBStorage: {e}")
 
-    async def get_all_tool_caches(self) -> Dict[str, Any]:
+    @blocking_io
+    def get_all_tool_caches(self) -> Dict[str, Any]:
         """
-        Get all tool caches from storage.
+        Get all tool caches from storage (one sequential read of the tool cache pack).
 
         Returns:
             Dict mapping MCP server names to their tool caches
         """
-        tools_caches: Dict[str, Any] = {}
-
         try:
-            # List all entries in the tools_cache directory
-            tools_cache_dir = "tools_cache"
-            if not DDB.at(tools_cache_dir).exists():  # type: ignore
-                return {}
-
-            # Get all server names (keys in the tools_cache directory)
-            server_names = DDB.at(tools_cache_dir).read().keys()  # type: ignore
-
-            # Load each tool cache
-            for server_name in server_names:
-                cache = await self.read_tool_cache(server_name)
-                if cache is not None:
-                    tools_caches[server_name] = cache
-
-            return tools_caches
-
+            return self._tool_cache_pack.read_all()
         except Exception as e:
             logger.error(f"Error getting all tool caches: {e}")
             return {}
@@ -0,0 +1,421 @@
+"""
+Module/Package: KeyValueStorage - Configuration storage shared by several gateway nodes
+
+High Level Concept:
+-------------------
+The file based backends are local to one node: a user, API key or mcpserver created
+on node A is invisible on node B until B restarts. KeyValueStorage keeps the
+configuration in a networked key-value store (Redis protocol) shared by all nodes,
+serves reads from a local read-through cache and keeps the caches of the other nodes
+coherent with change notifications over pub/sub.
+
+Architecture:
+-------------
+- Keys (below CONFIG_STORAGE_REDIS_PREFIX, default "mcpo:"):
+  - global: global config document (JSON)
+  - user:<username>: user config document (JSON)
+  - user_index (hash): username -> light UserIndexEntry, used to list users
+  - tool_caches (hash): mcpserver id -> tool cache, tool_definitions (hash): digest -> tool
+  - api_keys (hash): API key digest -> API key index entry
+- Channel <prefix>changes: "<node id> <key>" published after every write, where key is
+  "global", "user:<username>" or "tools:<mcpserver id>"
+- Local caches: global config and a LRU of user configs (CONFIG_USER_CACHE_SIZE),
+  valid until a change notification of another node drops them
+
+Workflow:
+---------
+1. The first operation subscribes to the change channel
+2. Reads are served from the local cache, misses read the document from the store
+3. Writes go to the store, update the local cache and publish the change
+4. Notifications of other nodes drop the cached document and are forwarded to the
+   change listener (ConfigService), which publishes the matching config events
+5. After the subscription was re-established (messages may have been lost) all
+   caches are dropped and the listener gets "*"
+
+Notes:
+------
+- Selected with CONFIG_STORAGE_TYPE=redis (CONFIG_STORAGE_REDIS_URL) or
+  CONFIG_STORAGE_TYPE=memory (in-process stand-in, one node, data is not persisted)
+- Documents are replaced as a whole, the last writer of a document wins
+- A user document, its user_index entry and its API key index entries are written
+  in one transaction (MULTI/EXEC)
+- API key index entries are not announced, every node updates its in-memory index
+  from the user change
+"""
+import json
+import uuid
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from loguru import logger
+from mcpo_simple_server.config import CONFIG_STORAGE_REDIS_PREFIX, CONFIG_USER_CACHE_SIZE
+from mcpo_simple_server.services.config.models import GlobalConfigModel, UserConfigModel, UserIndexEntry
+from mcpo_simple_server.services.config.abstracts.storage_backend import StorageBackendAbstract, ApiKeyIndexChanges
+from mcpo_simple_server.services.config.abstracts.key_value_client import KeyValueClientAbstract, Command
+
+
+class KeyValueStorage(StorageBackendAbstract):
+    """Key-value store implementation of the storage backend, shared by several nodes."""
+
+    notifies_changes = True
+
+    def __init__(self, client: KeyValueClientAbstract, prefix: str = CONFIG_STORAGE_REDIS_PREFIX):
+        """
+        Initialize the KeyValueStorage backend.
+
+        Args:
+            client: Client of the key-value store (RedisClient or InMemoryKeyValueClient)
+            prefix: Prefix of all keys and of the change channel
+        """
+        self._client = client
+        self._prefix = prefix
+        self._channel = f"{prefix}changes"
+        self._node_id = uuid.uuid4().hex
+        self._global_config_cache: Optional[GlobalConfigModel] = None
+        self._user_config_cache: "OrderedDict[str, UserConfigModel]" = OrderedDict()
+        self._user_cache_size = CONFIG_USER_CACHE_SIZE
+        self._cache_stats: Dict[str, int] = {
+            "hits": 0, "misses": 0, "remote_reads": 0, "evictions": 0, "remote_invalidations": 0, "resyncs": 0
+        }
+        # Bumped by every invalidation - a document read concurrently is not cached
+        self._generation = 0
+        # Local caches are only used while the change subscription is established
+        self._subscribed = False
+        self._subscribe_started = False
+        self._listener: Optional[Callable[[str], Awaitable[None]]] = None
+        self._lock = asyncio.Lock()
+        logger.info(f"📦 Selected KeyValueStorage backend ({type(client).__name__}).")
+        logger.info(f"📦 Prefix: {prefix}, node: {self._node_id}")
+
+    def _key(self, name: str) -> str:
+        return f"{self._prefix}{name}"
+
+    # --------------------------------------------------------------------------
+    # Change notifications
+    # --------------------------------------------------------------------------
+    def set_change_listener(self, listener: Callable[[str], Awaitable[None]]) -> None:
+        self._listener = listener
+
+    async def _ensure_subscribed(self) -> None:
+        if not self._subscribe_started:
+            self._subscribe_started = True
+            await self._client.subscribe(self._channel, self._on_message)
+
+    async def _announce(self, key: str) -> None:
+        try:
+            await self._client.publish(self._channel, f"{self._node_id} {key}")
+        except Exception as e:
+            logger.error(f"Error publishing config change '{key}': {e}")
+
+    def _invalidate(self, key: str) -> None:
+        self._generation += 1
+        if key == "global":
+            self._global_config_cache = None
+        elif key.startswith("user:"):
+            self._user_config_cache.pop(key[len("user:"):], None)
+
+    async def _on_message(self, message: Optional[str]) -> None:
+        if message is None:
+            # (Re)subscribed - changes published meanwhile were lost
+            resync = self._cache_stats["resyncs"] > 0
+            self._generation += 1
+            self._global_config_cache = None
+            self._user_config_cache.clear()
+            self._subscribed = True
+            self._cache_stats["resyncs"] += 1
+            if resync and self._listener is not None:
+                await self._listener("*")
+            return
+        node_id, _, key = message.partition(" ")
+        if node_id == self._node_id or not key:
+            return
+        self._cache_stats["remote_invalidations"] += 1
+        self._invalidate(key)
+        if self._listener is not None:
+            await self._listener(key)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Report local cache hits, misses, store reads and remote invalidations.
+        """
+        lookups = self._cache_stats["hits"] + self._cache_stats["misses"]
+        return {
+            **self._cache_stats,
+            "hit_rate": round(self._cache_stats["hits"] / lookups, 4) if lookups else 0.0,
+            "cached_users": len(self._user_config_cache),
+            "user_cache_size": self._user_cache_size,
+            "node_id": self._node_id,
+            "subscribed": self._subscribed,
+        }
+
+    # --------------------------------------------------------------------------
+    # Global Config
+    # --------------------------------------------------------------------------
+    async def get_global_config(self) -> GlobalConfigModel:
+        await self._ensure_subscribed()
+        if self._subscribed and self._global_config_cache is not None:
+            self._cache_stats["hits"] += 1
+            return self._global_config_cache.model_copy(deep=True)
+        self._cache_stats["misses"] += 1
+        generation = self._generation
+        raw = await self._client.get(self._key("global"))
+        self._cache_stats["remote_reads"] += 1
+        if raw:
+            config = GlobalConfigModel(**json.loads(raw))
+        else:
+            config = GlobalConfigModel()
+            try:
+                await self._client.set(self._key("global"), json.dumps(config.model_dump(mode="json")))
+            except Exception as e:
+                logger.error(f"Error saving default global config: {e}")
+        if generation == self._generation:
+            self._global_config_cache = config.model_copy(deep=True)
+        return config
+
+    async def save_global_config(self, config: GlobalConfigModel) -> None:
+        await self._ensure_subscribed()
+        try:
+            await self._client.set(self._key("global"), json.dumps(config.model_dump(mode="json")))
+            logger.info("Saved global config")
+            self._generation += 1
+            self._global_config_cache = config.model_copy(deep=True)
+            await self._announce("global")
+        except Exception as e:
+            logger.error(f"Error saving global config: {e}")
+
+    # --------------------------------------------------------------------------
+    # User Config
+    # --------------------------------------------------------------------------
+    def _cache_user_config(self, config: UserConfigModel) -> None:
+        """Put a user config into the LRU cache, evicting the least recently used ones."""
+        self._user_config_cache[config.username] = config
+        self._user_config_cache.move_to_end(config.username)
+        while len(self._user_config_cache) > self._user_cache_size:
+            self._user_config_cache.popitem(last=False)
+            self._cache_stats["evictions"] += 1
+
+    async def get_user_config(self, username: str) -> Optional[UserConfigModel]:
+        await self._ensure_subscribed()
+        cached = self._user_config_cache.get(username) if self._subscribed else None
+        if cached is not None:
+            self._cache_stats["hits"] += 1
+            self._user_config_cache.move_to_end(username)
+            # Callers modify the returned model before saving it - never hand out the cached instance
+            return cached.model_copy(deep=True)
+        self._cache_stats["misses"] += 1
+        generation = self._generation
+        raw = await self._client.get(self._key(f"user:{username}"))
+        self._cache_stats["remote_reads"] += 1
+        if not raw:
+            return None
+        user_config = UserConfigModel(**json.loads(raw))
+        if generation == self._generation:
+            self._cache_user_config(user_config.model_copy(deep=True))
+        return user_config
+
+    def _api_key_index_commands(self, changes: Optional[ApiKeyIndexChanges]) -> List[Command]:
+        """HSET / HDEL commands of API key index entry changes."""
+        commands: List[Command] = []
+        written = [
+            value for digest, entry in (changes or {}).items() if entry is not None
+            for value in (digest, json.dumps(entry))
+        ]
+        if written:
+            commands.append(("HSET", self._key("api_keys"), *written))
+        removed = [digest for digest, entry in (changes or {}).items() if entry is None]
+        if removed:
+            commands.append(("HDEL", self._key("api_keys"), *removed))
+        return commands
+
+    async def save_user_config(self, config: UserConfigModel, api_key_index: Optional[ApiKeyIndexChanges] = None) -> None:
+        await self._ensure_subscribed()
+        try:
+            await self._client.transaction([
+                ("SET", self._key(f"user:{config.username}"), json.dumps(config.model_dump(mode="json"))),
+                ("HSET", self._key("user_index"), config.username, json.dumps(UserIndexEntry.from_config(config)._asdict())),
+                *self._api_key_index_commands(api_key_index),
+            ])
+            logger.info(f"Saved user config for {config.username}")
+            self._generation += 1
+            self._cache_user_config(config.model_copy(deep=True))
+            await self._announce(f"user:{config.username}")
+        except Exception as e:
+            logger.error(f"Error saving user config: {e}")
+            raise
+
+    async def delete_user_config(self, username: str, api_key_index: Optional[ApiKeyIndexChanges] = None) -> bool:
+        await self._ensure_subscribed()
+        try:
+            replies = await self._client.transaction([
+                ("DEL", self._key(f"user:{username}")),
+                ("HDEL", self._key("user_index"), username),
+                *self._api_key_index_commands(api_key_index),
+            ])
+            deleted = replies[0]
+            self._invalidate(f"user:{username}")
+            await self._announce(f"user:{username}")
+            return deleted > 0
+        except Exception as e:
+            logger.error(f"Error deleting user config: {e}")
+            raise
+
+    async def list_users(self) -> Dict[str, UserConfigModel]:
+        # Full scan in one round trip, not cached - it would evict the active users
+        await self._ensure_subscribed()
+        result: Dict[str, UserConfigModel] = {}
+        try:
+            usernames = await self._client.hkeys(self._key("user_index"))
+            documents = await self._client.mget([self._key(f"user:{username}") for username in usernames])
+            self._cache_stats["remote_reads"] += len(usernames)
+            for username, raw in zip(usernames, documents):
+                if not raw:
+                    continue
+                try:
+                    result[username] = UserConfigModel(**json.loads(raw))
+                except Exception as e:
+                    logger.error(f"Error loading user config of {username}: {e}")
+        except Exception as e:
+            logger.error(f"Error listing users: {e}")
+        return result
+
+    async def list_user_index(self) -> Dict[str, UserIndexEntry]:
+        await self._ensure_subscribed()
+        result: Dict[str, UserIndexEntry] = {}
+        try:
+            for username, raw in (await self._client.hgetall(self._key("user_index"))).items():
+                try:
+                    result[username] = UserIndexEntry(**json.loads(raw))
+                except Exception as e:
+                    logger.error(f"Error reading user index entry of {username}: {e}")
+        except Exception as e:
+            logger.error(f"Error listing user index: {e}")
+        return result
+
+    async def clear_cache(self, username: Optional[str] = None) -> None:
+        async with self._lock:
+            self._generation += 1
+            if username:
+                self._user_config_cache.pop(username, None)
+            else:
+                self._global_config_cache = None
+                self._user_config_cache.clear()
+
+    async def close(self) -> None:
+        """
+        Stop the change subscription and close the connections.
+        """
+        try:
+            await self._client.close()
+        except Exception as e:
+            logger.error(f"Error closing KeyValueStorage: {e}")
+
+    # --------------------------------------------------------------------------
+    # Tool Caches
+    # --------------------------------------------------------------------------
+    async def get_all_tool_caches(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get all tool caches from the store in one round trip.
+
+        Returns:
+            Dict mapping MCP server names to their tool caches
+        """
+        await self._ensure_subscribed()
+        try:
+            caches = await self._client.hgetall(self._key("tool_caches"))
+            self._cache_stats["remote_reads"] += 1
+            return {mcpserver_name: json.loads(raw) for mcpserver_name, raw in caches.items()}
+        except Exception as e:
+            logger.error(f"Error getting all tool caches: {e}")
+            return {}
+
+    async def write_tool_cache(self, mcpserver_name: str, cache: list[dict]) -> None:
+        await self._ensure_subscribed()
+        try:
+            await self._client.hset(self._key("tool_caches"), {mcpserver_name: json.dumps(cache)})
+            logger.info(f"Tool cache saved for MCP server '{mcpserver_name}'")
+            await self._announce(f"tools:{mcpserver_name}")
+        except Exception as e:
+            logger.error(f"Error writing tool cache for '{mcpserver_name}': {e}")
+
+    async def read_tool_cache(self, mcpserver_name: str) -> Optional[list[dict]]:
+        await self._ensure_subscribed()
+        try:
+            raw = await self._client.hget(self._key("tool_caches"), mcpserver_name)
+            self._cache_stats["remote_reads"] += 1
+            if raw is None:
+                logger.debug(f"Tool cache not found for MCP server '{mcpserver_name}'")
+                return None
+            return json.loads(raw)
+        except Exception as e:
+            logger.error(f"Error reading tool cache for '{mcpserver_name}': {e}")
+            return None
+
+    async def delete_tool_cache(self, mcpserver_name: str) -> None:
+        await self._ensure_subscribed()
+        try:
+            if await self._client.hdel(self._key("tool_caches"), mcpserver_name):
+                logger.info(f"Tool cache deleted for MCP server '{mcpserver_name}'")
+                await self._announce(f"tools:{mcpserver_name}")
+        except Exception as e:
+            logger.error(f"Error deleting tool cache for '{mcpserver_name}': {e}")
+
+    # --------------------------------------------------------------------------
+    # Tool Definitions (content-addressed, immutable - never announced)
+    # --------------------------------------------------------------------------
+    async def write_tool_definitions(self, definitions: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            await self._client.hset(self._key("tool_definitions"), {
+                digest: json.dumps(definition) for digest, definition in definitions.items()
+            })
+        except Exception as e:
+            logger.error(f"Error writing tool definitions: {e}")
+
+    async def read_tool_definitions(self, digests: List[str]) -> Dict[str, Dict[str, Any]]:
+        try:
+            values = await self._client.hmget(self._key("tool_definitions"), digests)
+            self._cache_stats["remote_reads"] += 1
+            return {digest: json.loads(raw) for digest, raw in zip(digests, values) if raw is not None}
+        except Exception as e:
+            logger.error(f"Error reading tool definitions: {e}")
+            return {}
+
+    async def list_tool_definitions(self) -> List[str]:
+        try:
+            return await self._client.hkeys(self._key("tool_definitions"))
+        except Exception as e:
+            logger.error(f"Error listing tool definitions: {e}")
+            return []
+
+    async def delete_tool_definitions(self, digests: List[str]) -> None:
+        if not digests:
+            return
+        try:
+            await self._client.hdel(self._key("tool_definitions"), *digests)
+        except Exception as e:
+            logger.error(f"Error deleting tool definitions: {e}")
+
+    # --------------------------------------------------------------------------
+    # API Key Index
+    # --------------------------------------------------------------------------
+    async def write_api_key_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            # "api_key_index": whole index document of older versions
+            await self._client.transaction([
+                ("DEL", self._key("api_keys"), self._key("api_key_index")),
+                *self._api_key_index_commands(index),
+            ])
+        except Exception as e:
+            logger.error(f"Error writing API key index: {e}")
+            raise
+
+    async def read_api_key_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        # An empty hash does not exist - an empty index is reported as not stored (rebuilt)
+        try:
+            entries = await self._client.hgetall(self._key("api_keys"))
+            self._cache_stats["remote_reads"] += 1
+            if not entries:
+                return None
+            return {digest: json.loads(raw) for digest, raw in entries.items()}
+        except Exception as e:
+            logger.error(f"Error reading API key index: {e}")
+            return None
@@ -0,0 +1,144 @@
+"""
+Module: In-memory key-value client - In-process stand-in for a Redis server
+
+Implements KeyValueClientAbstract on top of an in-process InMemoryKeyValueServer.
+Clients created with the same server share data and pub/sub like gateway nodes
+sharing one Redis, so multi-node behaviour can be exercised in a single process.
+
+Notes:
+------
+- Data lives in the process memory only, it is lost on restart
+- Messages are delivered asynchronously (scheduled on the event loop), like over the network
+- Transactions are applied without yielding to the event loop, so they are atomic
+- Used by CONFIG_STORAGE_TYPE=memory and in tests
+"""
+import asyncio
+import inspect
+from typing import Any, Dict, List, Optional, Set, Tuple
+from loguru import logger
+from mcpo_simple_server.services.config.abstracts.key_value_client import KeyValueClientAbstract, MessageCallback, Command
+
+
+class InMemoryKeyValueServer:
+    """Data and pub/sub channels shared by InMemoryKeyValueClient instances."""
+
+    def __init__(self) -> None:
+        self.strings: Dict[str, str] = {}
+        self.hashes: Dict[str, Dict[str, str]] = {}
+        self.subscribers: Dict[str, List[Tuple["InMemoryKeyValueClient", MessageCallback]]] = {}
+
+
+# Shared by all clients created without an explicit server
+_DEFAULT_SERVER = InMemoryKeyValueServer()
+
+
+class InMemoryKeyValueClient(KeyValueClientAbstract):
+    """In-process fake of a Redis protocol client."""
+
+    def __init__(self, server: Optional[InMemoryKeyValueServer] = None) -> None:
+        self._server = server or _DEFAULT_SERVER
+        self._tasks: Set[asyncio.Task] = set()
+        self._closed = False
+
+    # --------------------------------------------------------------------------
+    # Strings
+    # --------------------------------------------------------------------------
+    async def get(self, key: str) -> Optional[str]:
+        return self._server.strings.get(key)
+
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        return [self._server.strings.get(key) for key in keys]
+
+    async def set(self, key: str, value: str) -> None:
+        self._server.strings[key] = value
+
+    async def delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            if self._server.strings.pop(key, None) is not None or self._server.hashes.pop(key, None) is not None:
+                deleted += 1
+        return deleted
+
+    # --------------------------------------------------------------------------
+    # Hashes
+    # --------------------------------------------------------------------------
+    async def hget(self, key: str, field: str) -> Optional[str]:
+        return self._server.hashes.get(key, {}).get(field)
+
+    async def hmget(self, key: str, fields: List[str]) -> List[Optional[str]]:
+        values = self._server.hashes.get(key, {})
+        return [values.get(field) for field in fields]
+
+    async def hset(self, key: str, mapping: Dict[str, str]) -> None:
+        self._server.hashes.setdefault(key, {}).update(mapping)
+
+    async def hdel(self, key: str, *fields: str) -> int:
+        values = self._server.hashes.get(key, {})
+        return sum(1 for field in fields if values.pop(field, None) is not None)
+
+    async def hgetall(self, key: str) -> Dict[str, str]:
+        return dict(self._server.hashes.get(key, {}))
+
+    async def hkeys(self, key: str) -> List[str]:
+        return list(self._server.hashes.get(key, {}))
+
+    # --------------------------------------------------------------------------
+    # Transactions
+    # --------------------------------------------------------------------------
+    async def transaction(self, commands: List[Command]) -> List[Any]:
+        unsupported = [command[0] for command in commands if command[0] not in ("SET", "DEL", "HSET", "HDEL")]
+        if unsupported:
+            raise ValueError(f"Unsupported transaction commands: {unsupported}")
+        replies: List[Any] = []
+        for name, key, *args in commands:
+            if name == "SET":
+                self._server.strings[key] = args[0]
+                replies.append("OK")
+            elif name == "DEL":
+                replies.append(sum(
+                    1 for k in (key, *args)
+                    if self._server.strings.pop(k, None) is not None or self._server.hashes.pop(k, None) is not None
+                ))
+            elif name == "HSET":
+                values = self._server.hashes.setdefault(key, {})
+                added = sum(1 for field in args[::2] if field not in values)
+                values.update(zip(args[::2], args[1::2]))
+                replies.append(added)
+            else:
+                values = self._server.hashes.get(key, {})
+                replies.append(sum(1 for field in args if values.pop(field, None) is not None))
+        return replies
+
+    # --------------------------------------------------------------------------
+    # Pub/Sub
+    # --------------------------------------------------------------------------
+    async def publish(self, channel: str, message: str) -> None:
+        for client, callback in list(self._server.subscribers.get(channel, [])):
+            client._deliver(callback, message)
+
+    async def subscribe(self, channel: str, callback: MessageCallback) -> None:
+        self._server.subscribers.setdefault(channel, []).append((self, callback))
+        self._deliver(callback, None)
+
+    def _deliver(self, callback: MessageCallback, message: Optional[str]) -> None:
+        if self._closed:
+            return
+        task = asyncio.get_running_loop().create_task(self._run_callback(callback, message))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _run_callback(callback: MessageCallback, message: Optional[str]) -> None:
+        try:
+            result = callback(message)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"In-memory key-value subscriber failed: {e}")
+
+    async def close(self) -> None:
+        self._closed = True
+        for channel, subscribers in self._server.subscribers.items():
+            self._server.subscribers[channel] = [entry for entry in subscribers if entry[0] is not self]
+        for task in list(self._tasks):
+            task.cancel()
@@ -0,0 +1,114 @@
+"""
+Module: Storage migration - Copy configuration data between storage backends
+
+Copies global config, users (with API keys, env and mcpServers), tool caches, the
+shared tool definitions they reference and the API key index from one storage
+backend to another, e.g. from the ddb layout to the sqlite backend.
+
+Usage:
+------
+    python -m mcpo_simple_server.services.config.storage.migrate --source ddb --target sqlite \\
+        [--source-path <dir>] [--target-path <dir>]
+
+Paths default to CONFIG_STORAGE_PATH, for the redis type the path is the store URL
+(default: CONFIG_STORAGE_REDIS_URL). Run it while the server is stopped, then start
+the server with CONFIG_STORAGE_TYPE set to the target type.
+"""
+import sys
+import asyncio
+import argparse
+from typing import Callable, Dict
+from loguru import logger
+from mcpo_simple_server.config import CONFIG_STORAGE_PATH, CONFIG_STORAGE_REDIS_URL
+from mcpo_simple_server.services.config.abstracts.storage_backend import StorageBackendAbstract
+from mcpo_simple_server.services.config.storage.ddb_storage import DDBStorage
+from mcpo_simple_server.services.config.storage.nosqlite_storage import NoSQLiteStorage
+from mcpo_simple_server.services.config.storage.sqlite_storage import SQLiteStorage
+from mcpo_simple_server.services.config.storage.kv_storage import KeyValueStorage
+from mcpo_simple_server.services.config.storage.redis_client import RedisClient
+from mcpo_simple_server.utils.tools.tool_definition_store import TOOL_DEFINITION_REF_KEY
+
+STORAGE_TYPES: Dict[str, Callable[[str], StorageBackendAbstract]] = {
+    "ddb": DDBStorage,
+    "nosqlite": NoSQLiteStorage,
+    "sqlite": SQLiteStorage,
+    "redis": lambda url: KeyValueStorage(RedisClient(url)),
+}
+
+
+async def migrate_storage(source: StorageBackendAbstract, target: StorageBackendAbstract) -> Dict[str, int]:
+    """
+    Copy all configuration data from the source to the target backend.
+
+    Returns:
+        Dict[str, int]: Number of migrated users, tool caches, tool definitions and API keys
+    """
+    await target.save_global_config(await source.get_global_config())
+
+    users = await source.list_users()
+    for user_config in users.values():
+        await target.save_user_config(user_config)
+
+    tool_caches = await source.get_all_tool_caches()
+    digests = {
+        tool[TOOL_DEFINITION_REF_KEY]
+        for tools in tool_caches.values()
+        for tool in tools
+        if isinstance(tool, dict) and TOOL_DEFINITION_REF_KEY in tool
+    }
+    definitions = await source.read_tool_definitions(sorted(digests))
+    if len(definitions) != len(digests):
+        logger.warning(f"{len(digests) - len(definitions)} referenced tool definitions are missing in the source storage")
+    if definitions:
+        await target.write_tool_definitions(definitions)
+    for mcpserver_name, tools in tool_caches.items():
+        await target.write_tool_cache(mcpserver_name, tools)
+
+    # Without a stored index the server rebuilds it from the migrated users on startup
+    api_key_index = await source.read_api_key_index()
+    if api_key_index is not None:
+        await target.write_api_key_index(api_key_index)
+
+    return {
+        "users": len(users),
+        "tool_caches": len(tool_caches),
+        "tool_definitions": len(definitions),
+        "api_keys": len(api_key_index or {}),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Migrate MCPOSimpleServer config storage between backends")
+    parser.add_argument("--source", choices=sorted(STORAGE_TYPES), required=True, help="Source storage type")
+    parser.add_argument("--target", choices=sorted(STORAGE_TYPES), required=True, help="Target storage type")
+    parser.add_argument("--source-path", help="Source storage path or redis URL (default: CONFIG_STORAGE_PATH / CONFIG_STORAGE_REDIS_URL)")
+    parser.add_argument("--target-path", help="Target storage path or redis URL (default: CONFIG_STORAGE_PATH / CONFIG_STORAGE_REDIS_URL)")
+    args = parser.parse_args()
+    args.source_path = args.source_path or (CONFIG_STORAGE_REDIS_URL if args.source == "redis" else CONFIG_STORAGE_PATH)
+    args.target_path = args.target_path or (CONFIG_STORAGE_REDIS_URL if args.target == "redis" else CONFIG_STORAGE_PATH)
+    return args
+
+
+async def _run(args: argparse.Namespace) -> None:
+    source = STORAGE_TYPES[args.source](args.source_path)
+    target = STORAGE_TYPES[args.target](args.target_path)
+    try:
+        counts = await migrate_storage(source, target)
+        logger.info(f"Migrated {args.source} ({args.source_path}) -> {args.target} ({args.target_path}): {counts}")
+    finally:
+        await source.close()
+        await target.close()
+
+
+def main():
+    """Run the migration."""
+    args = parse_args()
+    if args.source == args.target and args.source_path == args.target_path:
+        logger.error("Source and target storage are the same")
+        sys.exit(1)
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -22,22 +22,29 @@ Workflow:
 Notes:
 ------
 - Uses NoSQLite for persistent storage
-- Implements caching for performance optimization
-- Thread-safe operations through appropriate locking
+- Implements caching for performance optimization, the user config cache is a LRU
+  bounded by CONFIG_USER_CACHE_SIZE (memory scales with active users)
+- Database and file I/O runs in the storage I/O thread pool, serialized by an asyncio lock
 - All configuration is stored in a single SQLite file
+- Tool caches are kept in a single packed file next to it (see tool_cache_pack)
 - Global config is stored in 'global' collection with 'global_config' as ID
 - User configs are stored in 'users' collection with <username> as ID
 """
 
 import os
-import threading
-from typing import Dict, Optional, Any
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any
 
 from loguru import logger
 import nosqlite
 
-from mcpo_simple_server.services.config.models import GlobalConfigModel, UserConfigModel
-from mcpo_simple_server.services.config.abstracts.storage_backend import StorageBackendAbstract
+from mcpo_simple_server.config import CONFIG_USER_CACHE_SIZE
+from mcpo_simple_server.services.config.models import GlobalConfigModel, UserConfigModel, UserIndexEntry
+from mcpo_simple_server.services.config.abstracts.storage_backend import StorageBackendAbstract, ApiKeyIndexChanges
+from mcpo_simple_server.services.config.storage.blocking_io import blocking_io
+from mcpo_simple_server.services.config.storage.tool_cache_pack import PackedToolCacheStore, TOOL_CACHE_PACK_FILE
+from mcpo_simple_server.services.config.storage.api_key_index_files import ApiKeyIndexFiles
 
 
 import json
@@ -46,55 +53,153 @@ import json
 class NoSQLiteStorage(StorageBackendAbstract):
     """NoSQLite implementation of the storage backend."""
 
-    async def write_tool_cache(self, mcpserver_name: str, cache: list[dict]) -> None:
+    @blocking_io
+    def write_tool_cache(self, mcpserver_name: str, cache: list[dict]) -> None:
         """
-        Write the tool cache for a specific MCP server to a JSON file.
+        Write the tool cache for a specific MCP server to the tool cache pack.
+        """
+        try:
+            self._tool_cache_pack.write(mcpserver_name, cache)
+            logger.info(f"Tool cache saved for MCP server '{mcpserver_name}' at {self._tool_cache_pack.path}")
+        except Exception as e:
+            logger.error(f"Error writing tool cache for '{mcpserver_name}': {e}")
+
+    @blocking_io
+    def read_tool_cache(self, mcpserver_name: str) -> list[dict] | None:
+        """
+        Read the tool cache for a specific MCP server from the tool cache pack.
+        """
+        try:
+            cache = self._tool_cache_pack.read(mcpserver_name)
+            if cache is None:
+                logger.debug(f"Tool cache not found for MCP server '{mcpserver_name}'")
+            return cache
+        except Exception as e:
+            logger.error(f"Error reading tool cache for '{mcpserver_name}': {e}")
+            return None
+
+    @blocking_io
+    def delete_tool_cache(self, mcpserver_name: str) -> None:
+        """
+        Delete the tool cache of a specific MCP server from the tool cache pack.
+        """
+        try:
+            if self._tool_cache_pack.delete(mcpserver_name):
+                logger.info(f"Tool cache deleted for MCP server '{mcpserver_name}'")
+            else:
+                logger.debug(f"Tool cache not found for MCP server '{mcpserver_name}'")
+        except Exception as e:
+            logger.error(f"Error deleting tool cache for '{mcpserver_name}': {e}")
+
+    def _import_legacy_tool_caches(self) -> None:
+        """
+        Copy tool caches stored as one JSON file per MCP server into the new tool cache pack.
         """
         tools_cache_dir = os.path.join(os.path.dirname(self.db_path), "tools_cache")
-        os.makedirs(tools_cache_dir, exist_ok=True)
-        cache_file = os.path.join(tools_cache_dir, f"{mcpserver_name}.json")
-        with self._lock:
+        if not os.path.isdir(tools_cache_dir):
+            return
+        imported = 0
+        for filename in sorted(os.listdir(tools_cache_dir)):
+            if not filename.endswith(".json"):
+                continue
             try:
-                with open(cache_file, "w", encoding="utf-8") as f:
-                    json.dump(cache, f)
-                logger.info(f"Tool cache saved for MCP server '{mcpserver_name}' at {cache_file}")
+                with open(os.path.join(tools_cache_dir, filename), "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                self._tool_cache_pack.write(os.path.splitext(filename)[0], cache)
+                imported += 1
             except Exception as e:
-                logger.error(f"Error writing tool cache for '{mcpserver_name}': {e}")
+                logger.error(f"Error importing legacy tool cache {filename}: {e}")
+        if imported:
+            logger.info(f"Imported {imported} legacy tool caches into {self._tool_cache_pack.path}, "
+                        f"the {tools_cache_dir} directory is no longer used")
 
-    async def read_tool_cache(self, mcpserver_name: str) -> list[dict] | None:
+    @blocking_io
+    def write_tool_definitions(self, definitions: Dict[str, Dict[str, Any]]) -> None:
         """
-        Read the tool cache for a specific MCP server from a JSON file.
+        Write content-addressed tool definitions to JSON files (one file per digest).
         """
-        tools_cache_dir = os.path.join(os.path.dirname(self.db_path), "tools_cache")
-        cache_file = os.path.join(tools_cache_dir, f"{mcpserver_name}.json")
-        with self._lock:
+        definitions_dir = os.path.join(os.path.dirname(self.db_path), "tool_definitions")
+        os.makedirs(definitions_dir, exist_ok=True)
+        for digest, definition in definitions.items():
             try:
-                if not os.path.exists(cache_file):
-                    logger.debug(f"Tool cache file not found for MCP server '{mcpserver_name}' at {cache_file}")
-                    return None
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    cache = json.load(f)
-                logger.info(f"Tool cache loaded for MCP server '{mcpserver_name}' from {cache_file}")
-                return cache
+                with open(os.path.join(definitions_dir, f"{digest}.json"), "w", encoding="utf-8") as f:
+                    json.dump(definition, f)
             except Exception as e:
-                logger.error(f"Error reading tool cache for '{mcpserver_name}': {e}")
-                return None
+                logger.error(f"Error writing tool definition '{digest}': {e}")
 
-    async def delete_tool_cache(self, mcpserver_name: str) -> None:
+    @blocking_io
+    def read_tool_definitions(self, digests: List[str]) -> Dict[str, Dict[str, Any]]:
         """
-        Delete the tool cache file for a specific MCP server.
+        Read content-addressed tool definitions from JSON files.
         """
-        tools_cache_dir = os.path.join(os.path.dirname(self.db_path), "tools_cache")
-        cache_file = os.path.join(tools_cache_dir, f"{mcpserver_name}.json")
-        with self._lock:
+        definitions_dir = os.path.join(os.path.dirname(self.db_path), "tool_definitions")
+        definitions: Dict[str, Dict[str, Any]] = {}
+        for digest in digests:
+            definition_file = os.path.join(definitions_dir, f"{digest}.json")
+            try:
+                if os.path.exists(definition_file):
+                    with open(definition_file, "r", encoding="utf-8") as f:
+                        definitions[digest] = json.load(f)
+            except Exception as e:
+                logger.error(f"Error reading tool definition '{digest}': {e}")
+        return definitions
+
+    @blocking_io
+    def list_tool_definitions(self) -> List[str]:
+        """
+        List the digests of the tool definition JSON files.
+        """
+        definitions_dir = os.path.join(os.path.dirname(self.db_path), "tool_definitions")
+        if not os.path.isdir(definitions_dir):
+            return []
+        return [os.path.splitext(filename)[0] for filename in os.listdir(definitions_dir) if filename.endswith(".json")]
+
+    @blocking_io
+    def delete_tool_definitions(self, digests: List[str]) -> None:
+        """
+        Delete tool definition JSON files.
+        """
+        definitions_dir = os.path.join(os.path.dirname(self.db_path), "tool_definitions")
+        for digest in digests:
             try:
-                if os.path.exists(cache_file):
-                    os.remove(cache_file)
-                    logger.info(f"Tool cache deleted for MCP server '{mcpserver_name}' at {cache_file}")
-                else:
-                    logger.debug(f"Tool cache file not found for MCP server '{mcpserver_name}' at {cache_file}")
+                os.remove(os.path.join(definitions_dir, f"{digest}.json"))
+            except FileNotFoundError:
+                pass
             except Exception as e:
-                logger.error(f"Error deleting tool cache for '{mcpserver_name}': {e}")
+                logger.error(f"Error deleting tool definition '{digest}': {e}")
+
+    @blocking_io
+    def write_api_key_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Write the API key index as JSON files next to the database (one file per key digest).
+        """
+        try:
+            self._api_key_index.write(index)
+        except Exception as e:
+            logger.error(f"Error writing API key index: {e}")
+            raise
+
+    @blocking_io
+    def read_api_key_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Read the API key index from the JSON files next to the database.
+        """
+        try:
+            return self._api_key_index.read()
+        except Exception as e:
+            logger.error(f"Error reading API key index: {e}")
+            return None
+
+    @blocking_io
+    def read_api_key_index_entry(self, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Read one API key index entry from its JSON file next to the database.
+        """
+        try:
+            return self._api_key_index.read_entry(digest)
+        except Exception as e:
+            logger.error(f"Error reading API key index entry: {e}")
+            return None
 
     def __init__(self, db_path: str):
         """
@@ -105,18 +210,32 @@ class NoSQLiteStorage(StorageBackendAbstract):
         """
         # Initialize caches
         self._global_config_cache = None
-        self._user_config_cache: Dict[str, UserConfigModel] = {}
+        self._user_config_cache: "OrderedDict[str, UserConfigModel]" = OrderedDict()
+        self._user_cache_size = CONFIG_USER_CACHE_SIZE
+        self._user_cache_evictions = 0
         self.config_file = "config.db"
 
-        # Lock for thread safety
-        self._lock = threading.Lock()
+        # Serializes database access - operations run in the storage I/O thread pool
+        self._lock = asyncio.Lock()
 
         # Prepare database file path
         self.db_path = os.path.join(db_path, self.config_file)
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
         # Initialize database
-        self.store = nosqlite.Connection(self.db_path)
+        # The connection is used from the storage I/O threads, one operation at a time (self._lock)
+        self.store = nosqlite.Connection(self.db_path, check_same_thread=False)
+
+        # All tool caches in one packed file next to the database
+        self._tool_cache_pack = PackedToolCacheStore(os.path.join(os.path.dirname(self.db_path), TOOL_CACHE_PACK_FILE))
+        if self._tool_cache_pack.created:
+            self._import_legacy_tool_caches()
+
+        # API key index entries, one file per key digest
+        self._api_key_index = ApiKeyIndexFiles(
+            os.path.join(os.path.dirname(self.db_path), "api_key_index"),
+            legacy_file=os.path.join(os.path.dirname(self.db_path), "api_key_index.json")
+        )
 
         logger.info("📦 Selected NoSQLiteStorage backend.")
         logger.info(f"📦 Path: {self.db_path}")
@@ -128,89 +247,92 @@ class NoSQLiteStorage(StorageBackendAbstract):
         Returns:
             GlobalConfigModel: The global configuration
         """
-        # Najpierw sprawdź cache bez blokady
+        # Check the cache first, without touching the database
         if self._global_config_cache is not None:
-            return self._global_config_cache
-
-        config_to_save = None
-
-        # Zamknij blok z lockiem przed wywołaniem asynchronicznej metody
-        with self._lock:
-            # Sprawdź jeszcze raz cache po zdobyciu locka
-            if self._global_config_cache is not None:
-                return self._global_config_cache
+            return self._global_config_cache.model_copy(deep=True)
 
-            # Cache miss, load from DB
-            if self.store is None:
-                logger.error("Database connection is not available")
-                return GlobalConfigModel()
+        config_to_save = await self._load_global_config()
 
-            global_collection = self.store['global']
-            global_doc = global_collection.find_one({"id": "global_config"})
-
-            if global_doc:
-                # Remove _id field which is used internally by NoSQLite
-                if "_id" in global_doc:
-                    del global_doc["_id"]
-                self._global_config_cache = GlobalConfigModel(**global_doc)
-            else:
-                # Initialize with defaults if not exists
-                self._global_config_cache = GlobalConfigModel()
-                # Przygotuj konfigurację do zapisania, ale zapisz ją poza blockiem with
-                config_to_save = self._global_config_cache
-
-        # Jeśli potrzebujemy zapisać domyślną konfigurację, rób to poza lockiem
+        # Save the default configuration (outside of the load operation - the lock is not reentrant)
         if config_to_save is not None:
             try:
                 await self.save_global_config(config_to_save)
             except Exception as e:
                 logger.error(f"Error saving default global config: {e}")
 
+        if self._global_config_cache is None:
+            return GlobalConfigModel()
+        return self._global_config_cache.model_copy(deep=True)
+
+    @blocking_io
+    def _load_global_config(self) -> Optional[GlobalConfigModel]:
+        """Load the global config into the cache, return the default config if it has to be saved."""
+        # Check the cache again, it may have been loaded while waiting for the lock
+        if self._global_config_cache is not None:
+            return None
+
+        # Cache miss, load from DB
+        if self.store is None:
+            logger.error("Database connection is not available")
+            return None
+
+        global_collection = self.store['global']
+        global_doc = global_collection.find_one({"id": "global_config"})
+
+        if global_doc:
+            # Remove _id field which is used internally by NoSQLite
+            if "_id" in global_doc:
+                del global_doc["_id"]
+            self._global_config_cache = GlobalConfigModel(**global_doc)
+            return None
+
+        # Initialize with defaults if not exists
+        self._global_config_cache = GlobalConfigModel()
         return self._global_config_cache
 
-    async def save_global_config(self, config: GlobalConfigModel) -> None:
+    @blocking_io
+    def save_global_config(self, config: GlobalConfigModel) -> None:
         """
         Save the global configuration.
 
         Args:
             config: The global configuration to save
         """
-        with self._lock:
-            # Convert to dict
-            config_dict = config.model_dump()
+        # Convert to dict
+        config_dict = config.model_dump(mode="json")
 
-            try:
-                # Save configuration to database
-                if self.store is None:
-                    logger.error("Database connection is not available")
-                    return
-
-                global_collection = self.store['global']
-
-                # NoSQLite uses id not _id, so we need to handle this
-                if "_id" in config_dict:
-                    del config_dict["_id"]
-
-                # Find existing document
-                existing = global_collection.find_one({"id": "global_config"})
-
-                if existing:
-                    # Update existing document
-                    config_dict["id"] = "global_config"
-                    # Jeśli dokument istnieje, musimy zachować jego _id do aktualizacji
-                    if "_id" in existing:
-                        config_dict["_id"] = existing["_id"]
-                    global_collection.update(config_dict)
-                else:
-                    # Insert new document
-                    config_dict["id"] = "global_config"
-                    global_collection.insert(config_dict)
-
-                logger.info(f"Saved global config to {self.db_path}")
-
-                self._global_config_cache = config
-            except Exception as e:
-                logger.error(f"Error saving global config: {e}")
+        try:
+            # Save configuration to database
+            if self.store is None:
+                logger.error("Database connection is not available")
+                return
+
+            global_collection = self.store['global']
+
+            # NoSQLite uses id not _id, so we need to handle this
+            if "_id" in config_dict:
+                del config_dict["_id"]
+
+            # Find existing document
+            existing = global_collection.find_one({"id": "global_config"})
+
+            if existing:
+                # Update existing document
+                config_dict["id"] = "global_config"
+                # Jeśli dokument istnieje, musimy zachować jego _id do aktualizacji
+                if "_id" in existing:
+                    config_dict["_id"] = existing["_id"]
+                global_collection.update(config_dict)
+            else:
+                # Insert new document
+                config_dict["id"] = "global_config"
+                global_collection.insert(config_dict)
+
+            logger.info(f"Saved global config to {self.db_path}")
+
+            self._global_config_cache = config.model_copy(deep=True)
+        except Exception as e:
+            logger.error(f"Error saving global config: {e}")
 
     async def get_user_config(self, username: str) -> Optional[UserConfigModel]:
         """
@@ -222,141 +344,191 @@ class NoSQLiteStorage(StorageBackendAbstract):
         Returns:
             UserConfigModel or None: The user configuration if found
         """
-        with self._lock:
-            if username in self._user_config_cache:
-                return self._user_config_cache[username]
+        cached = self._user_config_cache.get(username)
+        if cached is None:
+            cached = await self._load_user_config(username)
+        else:
+            try:
+                self._user_config_cache.move_to_end(username)
+            except KeyError:
+                pass    # Evicted meanwhile by an I/O thread
+        # Callers may modify the returned config (e.g. mask the password hash), never hand out the cached object
+        return cached.model_copy(deep=True) if cached is not None else None
+
+    @blocking_io
+    def _load_user_config(self, username: str) -> Optional[UserConfigModel]:
+        if username in self._user_config_cache:
+            return self._user_config_cache[username]
+
+        # Cache miss, load from DB
+        if self.store is None:
+            logger.error("Database connection is not available")
+            return None
 
-            # Cache miss, load from DB
+        users_collection = self.store['users']
+        user_doc = users_collection.find_one({"username": username})
+
+        if user_doc:
+            # Remove _id field which is used internally by NoSQLite
+            if "_id" in user_doc:
+                del user_doc["_id"]
+            user_config = UserConfigModel(**user_doc)
+            self._cache_user_config(user_config)
+            logger.debug(f"Loaded user config for {username} from {self.db_path}")
+            return user_config
+
+        return None
+
+    def _cache_user_config(self, config: UserConfigModel) -> None:
+        """Put a user config into the LRU cache, evicting the least recently used ones."""
+        self._user_config_cache[config.username] = config
+        self._user_config_cache.move_to_end(config.username)
+        while len(self._user_config_cache) > self._user_cache_size:
+            self._user_config_cache.popitem(last=False)
+            self._user_cache_evictions += 1
+
+    @blocking_io
+    def save_user_config(self, config: UserConfigModel, api_key_index: Optional[ApiKeyIndexChanges] = None) -> None:
+        """
+        Save a user configuration.
+
+        Args:
+            config: The user configuration to save
+            api_key_index: Changed API key index entries of the user
+        """
+        username = config.username
+        config_dict = config.model_dump(mode="json")
+
+        try:
+            # Save configuration to database
             if self.store is None:
                 logger.error("Database connection is not available")
-                return None
+                return
 
             users_collection = self.store['users']
-            user_doc = users_collection.find_one({"username": username})
 
-            if user_doc:
-                # Remove _id field which is used internally by NoSQLite
-                if "_id" in user_doc:
-                    del user_doc["_id"]
-                user_config = UserConfigModel(**user_doc)
-                self._user_config_cache[username] = user_config
-                logger.debug(f"Loaded user config for {username} from {self.db_path}")
-                return user_config
+            # Find existing document
+            existing = users_collection.find_one({"username": username})
 
-            return None
+            if existing:
+                # Update existing document
+                # Jeśli dokument istnieje, musimy zachować jego _id do aktualizacji
+                if "_id" in existing:
+                    config_dict["_id"] = existing["_id"]
+                users_collection.update(config_dict)
+            else:
+                # Insert new document
+                users_collection.insert(config_dict)
 
-    async def save_user_config(self, config: UserConfigModel) -> None:
-        """
-        Save a user configuration.
+            logger.info(f"Saved user config for {username} to {self.db_path}")
 
-        Args:
-            config: The user configuration to save
-        """
-        with self._lock:
-            username = config.username
-            config_dict = config.model_dump()
+            # Update cache
+            self._cache_user_config(config.model_copy(deep=True))
 
-            try:
-                # Save configuration to database
-                if self.store is None:
-                    logger.error("Database connection is not available")
-                    return
-
-                users_collection = self.store['users']
-
-                # Find existing document
-                existing = users_collection.find_one({"username": username})
-
-                if existing:
-                    # Update existing document
-                    # Jeśli dokument istnieje, musimy zachować jego _id do aktualizacji
-                    if "_id" in existing:
-                        config_dict["_id"] = existing["_id"]
-                    users_collection.update(config_dict)
-                else:
-                    # Insert new document
-                    users_collection.insert(config_dict)
-
-                logger.info(f"Saved user config for {username} to {self.db_path}")
-
-                # Update cache
-                self._user_config_cache[username] = config
-            except Exception as e:
-                logger.error(f"Error saving user config for {username}: {e}")
+            if api_key_index:
+                self._api_key_index.update(api_key_index)
+        except Exception as e:
+            logger.error(f"Error saving user config for {username}: {e}")
+            raise
 
-    async def delete_user_config(self, username: str) -> bool:
+    @blocking_io
+    def delete_user_config(self, username: str, api_key_index: Optional[ApiKeyIndexChanges] = None) -> bool:
         """
         Delete a user configuration.
 
         Args:
             username: The username to delete configuration for
+            api_key_index: API key index entries of the user to delete
 
         Returns:
             bool: True if deleted, False if not found
         """
-        with self._lock:
-            try:
-                # Delete configuration from database
-                if self.store is None:
-                    logger.error("Database connection is not available")
-                    return False
+        try:
+            # Delete configuration from database
+            if self.store is None:
+                logger.error("Database connection is not available")
+                return False
 
-                users_collection = self.store['users']
-                user_doc = users_collection.find_one({"username": username})
+            users_collection = self.store['users']
+            user_doc = users_collection.find_one({"username": username})
 
-                deleted_count = 0
-                if user_doc:
-                    users_collection.remove(user_doc)
-                    deleted_count = 1
+            deleted_count = 0
+            if user_doc:
+                users_collection.remove(user_doc)
+                deleted_count = 1
 
-                if deleted_count > 0:
-                    logger.info(f"Deleted user config for {username} from {self.db_path}")
+            if api_key_index:
+                self._api_key_index.update(api_key_index)
 
-                    # Remove from cache
-                    if username in self._user_config_cache:
-                        del self._user_config_cache[username]
+            if deleted_count > 0:
+                logger.info(f"Deleted user config for {username} from {self.db_path}")
+
+                # Remove from cache
+                if username in self._user_config_cache:
+                    del self._user_config_cache[username]
 
-                    return True
+                return True
 
-                return False
-            except Exception as e:
-                logger.error(f"Error deleting user config for {username}: {e}")
-                return False
+            return False
+        except Exception as e:
+            logger.error(f"Error deleting user config for {username}: {e}")
+            raise
 
-    async def list_users(self) -> Dict[str, UserConfigModel]:
+    @blocking_io
+    def list_users(self) -> Dict[str, UserConfigModel]:
         """
         List all user configurations.
 
         Returns:
             Dict[str, UserConfigModel]: Dictionary of username to user configuration
         """
-        with self._lock:
-            users = {}
+        users = {}
 
-            try:
-                # Get all user configurations
-                if self.store is None:
-                    logger.error("Database connection is not available")
-                    return {}
+        try:
+            # Get all user configurations
+            if self.store is None:
+                logger.error("Database connection is not available")
+                return {}
 
-                users_collection = self.store['users']
-                user_docs = list(users_collection.find())
+            users_collection = self.store['users']
+            user_docs = list(users_collection.find())
 
-                for user_doc in user_docs:
-                    # Remove _id field which is used internally by NoSQLite
-                    if "_id" in user_doc:
-                        del user_doc["_id"]
+            for user_doc in user_docs:
+                # Remove _id field which is used internally by NoSQLite
+                if "_id" in user_doc:
+                    del user_doc["_id"]
 
-                    # Create UserConfigModel
-                    user_config = UserConfigModel(**user_doc)
-                    users[user_config.username] = user_config
+                # Create UserConfigModel (not cached - a full scan would evict the active users)
+                user_config = UserConfigModel(**user_doc)
+                users[user_config.username] = user_config
+        except Exception as e:
+            logger.error(f"Error listing users: {e}")
 
-                    # Update cache
-                    self._user_config_cache[user_config.username] = user_config
-            except Exception as e:
-                logger.error(f"Error listing users: {e}")
+        return users
 
-            return users
+    @blocking_io
+    def list_user_index(self) -> Dict[str, UserIndexEntry]:
+        """
+        List a light index entry of every user from the raw documents. Only users with mcpservers
+        (loaded next by the startup) are validated and put into the LRU cache, on the same read.
+
+        Returns:
+            Dict[str, UserIndexEntry]: Dictionary of username to index entry
+        """
+        index: Dict[str, UserIndexEntry] = {}
+        try:
+            if self.store is None:
+                logger.error("Database connection is not available")
+                return {}
+            for user_doc in self.store['users'].find():
+                user_doc.pop("_id", None)
+                entry = UserIndexEntry.from_document(user_doc)
+                index[entry.username] = entry
+                if entry.mcpservers and not entry.disabled:
+                    self._cache_user_config(UserConfigModel(**user_doc))
+        except Exception as e:
+            logger.error(f"Error listing user index: {e}")
+        return index
 
     async def clear_cache(self, username: Optional[str] = None) -> None:
         """
@@ -365,17 +537,18 @@ class NoSQLiteStorage(StorageBackendAbstract):
         Args:
             username: If provided, only clear cache for this user
         """
-        with self._lock:
+        async with self._lock:
             if username:
                 if username in self._user_config_cache:
                     del self._user_config_cache[username]
                     logger.debug(f"Cleared cache for user {username}")
             else:
                 self._global_config_cache = None
-                self._user_config_cache = {}
+                self._user_config_cache.clear()
                 logger.debug("Cleared all configuration caches")
 
-    async def close(self) -> None:
+    @blocking_io
+    def close(self) -> None:
         """
         Close the database connection.
 
@@ -389,30 +562,27 @@ class NoSQLiteStorage(StorageBackendAbstract):
             except Exception as e:
                 logger.error(f"Error closing NoSQLite storage: {e}")
 
-    async def get_all_tool_caches(self) -> Dict[str, Any]:
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Report user config cache and tool cache pack statistics.
+        """
+        return {
+            "cached_users": len(self._user_config_cache),
+            "user_cache_size": self._user_cache_size,
+            "evictions": self._user_cache_evictions,
+            "tool_cache_pack": self._tool_cache_pack.get_stats(),
+        }
+
+    @blocking_io
+    def get_all_tool_caches(self) -> Dict[str, Any]:
         """
-        Get all tool caches from storage.
+        Get all tool caches from storage (one sequential read of the tool cache pack).
 
         Returns:
             Dict mapping MCP server names to their tool caches
         """
-        tools_cache_dir = os.path.join(os.path.dirname(self.db_path), "tools_cache")
-        if not os.path.exists(tools_cache_dir):
-            return {}
-
-        result: Dict[str, Any] = {}
-
         try:
-            # Get all JSON files in the tools_cache directory
-            for filename in os.listdir(tools_cache_dir):
-                if filename.endswith('.json'):
-                    server_name = os.path.splitext(filename)[0]
-                    cache = await self.read_tool_cache(server_name)
-                    if cache is not None:
-                        result[server_name] = cache
-
-            return result
-
+            return self._tool_cache_pack.read_all()
         except Exception as e:
             logger.error(f"Error getting all tool caches: {e}")
             return {}
@@ -0,0 +1,297 @@
+"""
+Module: Redis client - Minimal Redis protocol (RESP2) client on asyncio streams
+
+Implements KeyValueClientAbstract with the handful of commands KeyValueStorage needs,
+so a shared Redis (or any RESP compatible server: Valkey, KeyDB, Dragonfly) can be
+used without an additional dependency.
+
+Architecture:
+-------------
+- Command connection: one connection, commands are serialized by a lock (a config
+  lookup is one round trip, reads are served from the local caches of the storage)
+- Transactions: MULTI, the commands and EXEC are sent in one round trip
+- Subscriber connection: a background task reading pub/sub messages, reconnects with
+  backoff and resubscribes; callbacks get None after every (re)subscribe
+
+Notes:
+------
+- URL format: redis://[[user]:password@]host[:port][/db], rediss:// for TLS
+- A broken command connection is reopened and the command retried once, so is a command
+  without reply within the timeout (CONFIG_STORAGE_REDIS_TIMEOUT) - all writes are idempotent
+"""
+import ssl
+import asyncio
+import inspect
+from urllib.parse import unquote, urlparse
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from loguru import logger
+from mcpo_simple_server.config import CONFIG_STORAGE_REDIS_TIMEOUT
+from mcpo_simple_server.services.config.abstracts.key_value_client import KeyValueClientAbstract, MessageCallback, Command
+
+
+class RedisError(Exception):
+    """Error reply of the Redis server."""
+
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+def _encode_command(*args: Any) -> bytes:
+    parts = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+        parts.append(f"${len(data)}\r\n".encode())
+        parts.append(data)
+        parts.append(b"\r\n")
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> Any:
+    """Read one RESP2 reply, bulk strings are decoded as UTF-8."""
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("Connection closed by the Redis server")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode("utf-8")
+    if kind == b"-":
+        return RedisError(payload.decode("utf-8"))
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2].decode("utf-8")
+    if kind == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+    raise ConnectionError(f"Unexpected reply from the Redis server: {line!r}")
+
+
+class RedisClient(KeyValueClientAbstract):
+    """Redis protocol client used by KeyValueStorage."""
+
+    def __init__(self, url: str, connect_timeout: float = 5.0, timeout: float = CONFIG_STORAGE_REDIS_TIMEOUT) -> None:
+        parsed = urlparse(url)
+        if parsed.scheme not in ("redis", "rediss"):
+            raise ValueError(f"Unsupported Redis URL scheme: {parsed.scheme}")
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port or 6379
+        self._username = unquote(parsed.username) if parsed.username else None
+        self._password = unquote(parsed.password) if parsed.password else None
+        self._db = int(parsed.path.lstrip("/") or 0)
+        self._ssl = ssl.create_default_context() if parsed.scheme == "rediss" else None
+        self._connect_timeout = connect_timeout
+        self._timeout = timeout
+        self._connection: Optional[Connection] = None
+        self._lock = asyncio.Lock()
+        self._subscriptions: Dict[str, List[MessageCallback]] = {}
+        self._subscriber: Optional[asyncio.Task] = None
+        self._subscriber_writer: Optional[asyncio.StreamWriter] = None
+        self._closed = False
+
+    # --------------------------------------------------------------------------
+    # Connections
+    # --------------------------------------------------------------------------
+    async def _open(self) -> Connection:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self._host, self._port, ssl=self._ssl),
+            timeout=self._connect_timeout
+        )
+        try:
+            if self._password is not None:
+                auth = ("AUTH", self._username, self._password) if self._username else ("AUTH", self._password)
+                await self._roundtrip((reader, writer), *auth)
+            if self._db:
+                await self._roundtrip((reader, writer), "SELECT", self._db)
+        except BaseException:
+            writer.close()
+            raise
+        return reader, writer
+
+    @staticmethod
+    async def _roundtrip(connection: Connection, *args: Any) -> Any:
+        reader, writer = connection
+        writer.write(_encode_command(*args))
+        await writer.drain()
+        reply = await _read_reply(reader)
+        if isinstance(reply, RedisError):
+            raise reply
+        return reply
+
+    @staticmethod
+    async def _multi_exec(connection: Connection, commands: List[Command]) -> List[Any]:
+        reader, writer = connection
+        writer.write(b"".join(_encode_command(*args) for args in (("MULTI",), *commands, ("EXEC",))))
+        await writer.drain()
+        # +OK, +QUEUED per command, then the EXEC reply
+        replies = [await _read_reply(reader) for _ in range(len(commands) + 2)]
+        result = replies[-1]
+        if isinstance(result, RedisError):
+            raise result    # EXECABORT - a command was rejected, nothing was applied
+        errors = [reply for reply in result or [] if isinstance(reply, RedisError)]
+        if errors:
+            raise errors[0]
+        return result
+
+    def _drop_connection(self) -> None:
+        if self._connection is not None:
+            self._connection[1].close()
+            self._connection = None
+
+    async def _run(self, operation: Callable[[Connection], Awaitable[Any]]) -> Any:
+        """Run an operation on the command connection, reconnect and retry once if it fails or hangs."""
+        async def attempt() -> Any:
+            if self._connection is None:
+                self._connection = await self._open()
+            return await operation(self._connection)
+
+        async with self._lock:
+            for attempt_number in (1, 2):
+                try:
+                    return await asyncio.wait_for(attempt(), timeout=self._timeout)
+                except (ConnectionError, OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+                    self._drop_connection()
+                    reason = e if not isinstance(e, asyncio.TimeoutError) else f"no reply within {self._timeout}s"
+                    if attempt_number == 2:
+                        raise ConnectionError(f"Redis {self._host}:{self._port} unavailable: {reason}") from e
+                    logger.warning(f"Redis connection lost ({reason}), reconnecting")
+
+    async def _execute(self, *args: Any) -> Any:
+        return await self._run(lambda connection: self._roundtrip(connection, *args))
+
+    # --------------------------------------------------------------------------
+    # Strings
+    # --------------------------------------------------------------------------
+    async def get(self, key: str) -> Optional[str]:
+        return await self._execute("GET", key)
+
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        if not keys:
+            return []
+        return await self._execute("MGET", *keys)
+
+    async def set(self, key: str, value: str) -> None:
+        await self._execute("SET", key, value)
+
+    async def delete(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        return await self._execute("DEL", *keys)
+
+    # --------------------------------------------------------------------------
+    # Hashes
+    # --------------------------------------------------------------------------
+    async def hget(self, key: str, field: str) -> Optional[str]:
+        return await self._execute("HGET", key, field)
+
+    async def hmget(self, key: str, fields: List[str]) -> List[Optional[str]]:
+        if not fields:
+            return []
+        return await self._execute("HMGET", key, *fields)
+
+    async def hset(self, key: str, mapping: Dict[str, str]) -> None:
+        if not mapping:
+            return
+        args: List[str] = []
+        for field, value in mapping.items():
+            args.extend((field, value))
+        await self._execute("HSET", key, *args)
+
+    async def hdel(self, key: str, *fields: str) -> int:
+        if not fields:
+            return 0
+        return await self._execute("HDEL", key, *fields)
+
+    async def hgetall(self, key: str) -> Dict[str, str]:
+        reply = await self._execute("HGETALL", key) or []
+        return dict(zip(reply[::2], reply[1::2]))
+
+    async def hkeys(self, key: str) -> List[str]:
+        return await self._execute("HKEYS", key) or []
+
+    # --------------------------------------------------------------------------
+    # Transactions
+    # --------------------------------------------------------------------------
+    async def transaction(self, commands: List[Command]) -> List[Any]:
+        if not commands:
+            return []
+        return await self._run(lambda connection: self._multi_exec(connection, commands))
+
+    # --------------------------------------------------------------------------
+    # Pub/Sub
+    # --------------------------------------------------------------------------
+    async def publish(self, channel: str, message: str) -> None:
+        await self._execute("PUBLISH", channel, message)
+
+    async def subscribe(self, channel: str, callback: MessageCallback) -> None:
+        new_channel = channel not in self._subscriptions
+        self._subscriptions.setdefault(channel, []).append(callback)
+        if self._subscriber is None:
+            self._subscriber = asyncio.create_task(self._run_subscriber())
+        elif new_channel and self._subscriber_writer is not None:
+            self._subscriber_writer.write(_encode_command("SUBSCRIBE", channel))
+        elif not new_channel and self._subscriber_writer is not None:
+            await self._notify(callback, None)
+
+    @staticmethod
+    async def _notify(callback: MessageCallback, message: Optional[str]) -> None:
+        try:
+            result = callback(message)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Redis subscriber callback failed: {e}")
+
+    async def _run_subscriber(self) -> None:
+        """Read pub/sub messages, reconnect with backoff when the connection is lost."""
+        backoff = 0.5
+        while not self._closed:
+            writer: Optional[asyncio.StreamWriter] = None
+            try:
+                reader, writer = await self._open()
+                writer.write(_encode_command("SUBSCRIBE", *self._subscriptions))
+                await writer.drain()
+                self._subscriber_writer = writer
+                while True:
+                    reply = await _read_reply(reader)
+                    if not isinstance(reply, list) or len(reply) < 3:
+                        continue
+                    kind, channel, payload = reply[0], reply[1], reply[2]
+                    if kind == "subscribe":
+                        backoff = 0.5
+                        message = None
+                    elif kind == "message":
+                        message = payload
+                    else:
+                        continue
+                    for callback in list(self._subscriptions.get(channel, [])):
+                        await self._notify(callback, message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._closed:
+                    break
+                logger.warning(f"Redis subscription lost ({e}), reconnecting in {backoff}s")
+            finally:
+                self._subscriber_writer = None
+                if writer is not None:
+                    writer.close()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 10.0)
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._subscriber is not None:
+            self._subscriber.cancel()
+            try:
+                await self._subscriber
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._subscriber = None
+        async with self._lock:
+            self._drop_connection()
@@ -0,0 +1,482 @@
+"""
+Module/Package: SQLiteStorage - Configuration storage backend implementation using sqlite3
+
+High Level Concept:
+-------------------
+SQLiteStorage implements the StorageBackend interface directly on top of sqlite3 with
+a typed relational schema. Lookups hit primary-key / secondary indexes instead of
+deserializing and scanning every document, and saves only touch the rows of one user.
+
+Architecture:
+-------------
+- Tables: global_config, users, api_keys, user_env, user_mcpservers, tool_caches,
+  tool_definitions, api_key_index
+- Primary keys on natural keys (username, api key, mcpserver id, digest) and secondary
+  indexes on the owning username / mcpserver type
+- WAL journal mode: readers run concurrently with a writer
+- One connection per storage I/O thread, statements are prepared once per connection
+  (sqlite3 statement cache) since all SQL is constant
+
+Workflow:
+---------
+1. Initialize with the storage directory, create the schema if needed
+2. Reads run concurrently in the storage I/O thread pool
+3. Writes run in the pool serialized by the backend lock, one transaction per save
+
+Notes:
+------
+- Selected with CONFIG_STORAGE_TYPE=sqlite, data file: <CONFIG_STORAGE_PATH>/config.sqlite
+- Existing ddb/nosqlite data is copied with the migration tool:
+  python -m mcpo_simple_server.services.config.storage.migrate --source ddb --target sqlite
+"""
+import os
+import json
+import asyncio
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from loguru import logger
+from mcpo_simple_server.services.config.models import GlobalConfigModel, UserConfigModel, UserIndexEntry
+from mcpo_simple_server.services.config.abstracts.storage_backend import StorageBackendAbstract, ApiKeyIndexChanges
+from mcpo_simple_server.services.config.storage.blocking_io import blocking_io
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS global_config (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    hashed_password TEXT NOT NULL,
+    user_group TEXT NOT NULL,
+    disabled INTEGER NOT NULL DEFAULT 0,
+    preferences TEXT NOT NULL DEFAULT '{}'
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS api_keys (
+    api_key TEXT PRIMARY KEY,
+    username TEXT NOT NULL REFERENCES users(username) ON DELETE CASCADE,
+    created_at TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    blacklist_tools TEXT NOT NULL DEFAULT '[]'
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_api_keys_username ON api_keys(username);
+CREATE TABLE IF NOT EXISTS user_env (
+    username TEXT NOT NULL REFERENCES users(username) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (username, name)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS user_mcpservers (
+    username TEXT NOT NULL REFERENCES users(username) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    command TEXT NOT NULL,
+    transport TEXT,
+    mcpserver_type TEXT,
+    disabled INTEGER NOT NULL DEFAULT 0,
+    config TEXT NOT NULL,
+    PRIMARY KEY (username, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_user_mcpservers_type ON user_mcpservers(mcpserver_type);
+CREATE TABLE IF NOT EXISTS tool_caches (
+    mcpserver_id TEXT PRIMARY KEY,
+    tools TEXT NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS tool_definitions (
+    digest TEXT PRIMARY KEY,
+    definition TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS api_key_index (
+    digest TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    metadata TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_api_key_index_username ON api_key_index(username);
+"""
+
+_SELECT_USER = "SELECT username, hashed_password, user_group, disabled, preferences FROM users WHERE username = ?"
+_SELECT_USERS = "SELECT username, hashed_password, user_group, disabled, preferences FROM users"
+_SELECT_USER_API_KEYS = "SELECT username, api_key, created_at, description, blacklist_tools FROM api_keys WHERE username = ?"
+_SELECT_API_KEYS = "SELECT username, api_key, created_at, description, blacklist_tools FROM api_keys"
+_SELECT_USER_ENV = "SELECT username, name, value FROM user_env WHERE username = ?"
+_SELECT_ENV = "SELECT username, name, value FROM user_env"
+_SELECT_USER_MCPSERVERS = "SELECT username, name, config FROM user_mcpservers WHERE username = ?"
+_SELECT_MCPSERVERS = "SELECT username, name, config FROM user_mcpservers"
+_SELECT_USER_INDEX = "SELECT username, disabled FROM users"
+_SELECT_MCPSERVER_INDEX = "SELECT username, name, mcpserver_type FROM user_mcpservers"
+_UPSERT_USER = """
+INSERT INTO users (username, hashed_password, user_group, disabled, preferences) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(username) DO UPDATE SET
+    hashed_password = excluded.hashed_password,
+    user_group = excluded.user_group,
+    disabled = excluded.disabled,
+    preferences = excluded.preferences
+"""
+_INSERT_API_KEY = "INSERT INTO api_keys (api_key, username, created_at, description, blacklist_tools) VALUES (?, ?, ?, ?, ?)"
+_INSERT_ENV = "INSERT INTO user_env (username, name, value) VALUES (?, ?, ?)"
+_UPSERT_API_KEY_INDEX = "INSERT OR REPLACE INTO api_key_index (digest, username, metadata) VALUES (?, ?, ?)"
+_INSERT_MCPSERVER = """
+INSERT INTO user_mcpservers (username, name, command, transport, mcpserver_type, disabled, config) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class SQLiteStorage(StorageBackendAbstract):
+    """sqlite3 implementation of the storage backend."""
+
+    def __init__(self, db_path: str):
+        """
+        Initialize the SQLite storage backend.
+
+        Args:
+            db_path: Storage directory, the database file is config.sqlite inside it
+        """
+        os.makedirs(db_path, exist_ok=True)
+        self.db_path = os.path.join(db_path, "config.sqlite")
+        self._lock = asyncio.Lock()   # Serializes writers, readers run concurrently (WAL)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+            # Empty-index marker row written by older versions
+            connection.execute("DELETE FROM api_key_index WHERE digest = ''")
+        logger.info("📦 Selected SQLiteStorage backend.")
+        logger.info(f"📦 Path: {self.db_path}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the connection of the current thread (created on first use)."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # check_same_thread=False only to allow close() from another thread
+            connection = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            connection.execute("PRAGMA busy_timeout=5000")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    # --------------------------------------------------------------------------
+    # Global Config
+    # --------------------------------------------------------------------------
+    async def get_global_config(self) -> GlobalConfigModel:
+        config = await self._read_global_config()
+        if config is None:
+            config = await self._create_global_config()
+        return config
+
+    @staticmethod
+    def _select_global_config(connection: sqlite3.Connection) -> Optional[GlobalConfigModel]:
+        row = connection.execute("SELECT data FROM global_config WHERE id = 1").fetchone()
+        return GlobalConfigModel(**json.loads(row[0])) if row else None
+
+    @blocking_io(exclusive=False)
+    def _read_global_config(self) -> Optional[GlobalConfigModel]:
+        return self._select_global_config(self._connection())
+
+    @blocking_io
+    def _create_global_config(self) -> GlobalConfigModel:
+        """Store the default global config unless another writer (or process) stored one first."""
+        connection = self._connection()
+        try:
+            with connection:
+                # Write lock before the read, the check and the insert are one step
+                connection.execute("BEGIN IMMEDIATE")
+                config = self._select_global_config(connection)
+                if config is None:
+                    config = GlobalConfigModel()
+                    connection.execute("INSERT INTO global_config (id, data) VALUES (1, ?)", (config.model_dump_json(),))
+            return config
+        except Exception as e:
+            logger.error(f"Error saving default global config: {e}")
+            return GlobalConfigModel()
+
+    @blocking_io
+    def save_global_config(self, config: GlobalConfigModel) -> None:
+        try:
+            with self._connection() as connection:
+                connection.execute(
+                    "INSERT INTO global_config (id, data) VALUES (1, ?) ON CONFLICT(id) DO UPDATE SET data = excluded.data",
+                    (config.model_dump_json(),)
+                )
+            logger.info("Saved global config")
+        except Exception as e:
+            logger.error(f"Error saving global config: {e}")
+
+    # --------------------------------------------------------------------------
+    # User Config
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def _build_user(row: tuple, api_keys: List[tuple], env: List[tuple], mcpservers: List[tuple]) -> UserConfigModel:
+        username, hashed_password, group, disabled, preferences = row
+        return UserConfigModel(
+            username=username,
+            hashed_password=hashed_password,
+            group=group,
+            disabled=bool(disabled),
+            preferences=json.loads(preferences),
+            api_keys={
+                api_key: {"createdAt": created_at, "description": description, "blackListTools": json.loads(blacklist_tools)}
+                for _, api_key, created_at, description, blacklist_tools in api_keys
+            },
+            env={name: value for _, name, value in env},
+            mcpServers={name: json.loads(config) for _, name, config in mcpservers},
+        )
+
+    @blocking_io(exclusive=False)
+    def get_user_config(self, username: str) -> Optional[UserConfigModel]:
+        connection = self._connection()
+        row = connection.execute(_SELECT_USER, (username,)).fetchone()
+        if row is None:
+            return None
+        return self._build_user(
+            row,
+            connection.execute(_SELECT_USER_API_KEYS, (username,)).fetchall(),
+            connection.execute(_SELECT_USER_ENV, (username,)).fetchall(),
+            connection.execute(_SELECT_USER_MCPSERVERS, (username,)).fetchall(),
+        )
+
+    @blocking_io
+    def save_user_config(self, config: UserConfigModel, api_key_index: Optional[ApiKeyIndexChanges] = None) -> None:
+        username = config.username
+        try:
+            with self._connection() as connection:
+                connection.execute(_UPSERT_USER, (
+                    username, config.hashed_password, config.group, int(config.disabled), json.dumps(config.preferences)
+                ))
+                connection.execute("DELETE FROM api_keys WHERE username = ?", (username,))
+                connection.executemany(_INSERT_API_KEY, [
+                    (
+                        api_key, username,
+                        (metadata.createdAt or datetime.utcnow()).isoformat(),
+                        metadata.description or "",
+                        json.dumps(metadata.blackListTools or [])
+                    )
+                    for api_key, metadata in (config.api_keys or {}).items()
+                ])
+                connection.execute("DELETE FROM user_env WHERE username = ?", (username,))
+                connection.executemany(_INSERT_ENV, [(username, name, value) for name, value in (config.env or {}).items()])
+                connection.execute("DELETE FROM user_mcpservers WHERE username = ?", (username,))
+                connection.executemany(_INSERT_MCPSERVER, [
+                    (
+                        username, name, mcpserver.command, mcpserver.transport, mcpserver.mcpserver_type,
+                        int(bool(mcpserver.disabled)), mcpserver.model_dump_json()
+                    )
+                    for name, mcpserver in (config.mcpServers or {}).items()
+                ])
+                self._update_api_key_index(connection, api_key_index)
+            logger.info(f"Saved user config for {username} to {self.db_path}")
+        except Exception as e:
+            logger.error(f"Error saving user config for {username}: {e}")
+            raise
+
+    @blocking_io
+    def delete_user_config(self, username: str, api_key_index: Optional[ApiKeyIndexChanges] = None) -> bool:
+        try:
+            with self._connection() as connection:
+                # api_keys, user_env and user_mcpservers rows are removed by ON DELETE CASCADE
+                deleted = connection.execute("DELETE FROM users WHERE username = ?", (username,)).rowcount
+                self._update_api_key_index(connection, api_key_index)
+            if deleted:
+                logger.info(f"Deleted user config for {username} from {self.db_path}")
+            return deleted > 0
+        except Exception as e:
+            logger.error(f"Error deleting user config for {username}: {e}")
+            raise
+
+    @blocking_io(exclusive=False)
+    def list_users(self) -> Dict[str, UserConfigModel]:
+        users: Dict[str, UserConfigModel] = {}
+        try:
+            connection = self._connection()
+            grouped: Dict[str, Dict[str, List[tuple]]] = {}
+            for key, query in (("api_keys", _SELECT_API_KEYS), ("env", _SELECT_ENV), ("mcpservers", _SELECT_MCPSERVERS)):
+                for row in connection.execute(query):
+                    grouped.setdefault(row[0], {}).setdefault(key, []).append(row)
+            for row in connection.execute(_SELECT_USERS):
+                user_rows = grouped.get(row[0], {})
+                users[row[0]] = self._build_user(
+                    row, user_rows.get("api_keys", []), user_rows.get("env", []), user_rows.get("mcpservers", [])
+                )
+        except Exception as e:
+            logger.error(f"Error listing users: {e}")
+        return users
+
+    @blocking_io(exclusive=False)
+    def list_user_index(self) -> Dict[str, UserIndexEntry]:
+        # Indexed columns only - api keys, env and mcpserver definitions are not read
+        index: Dict[str, UserIndexEntry] = {}
+        try:
+            connection = self._connection()
+            for username, disabled in connection.execute(_SELECT_USER_INDEX):
+                index[username] = UserIndexEntry(username=username, disabled=bool(disabled), mcpservers={})
+            for username, name, mcpserver_type in connection.execute(_SELECT_MCPSERVER_INDEX):
+                if username in index:
+                    index[username].mcpservers[name] = mcpserver_type or "private"
+        except Exception as e:
+            logger.error(f"Error listing user index: {e}")
+        return index
+
+    async def clear_cache(self, username: Optional[str] = None) -> None:
+        """Nothing to clear - every read is served by sqlite (page cache)."""
+
+    async def close(self) -> None:
+        """
+        Close all per-thread database connections.
+        """
+        with self._connections_lock:
+            for connection in self._connections:
+                try:
+                    connection.close()
+                except Exception as e:
+                    logger.error(f"Error closing SQLite storage connection: {e}")
+            self._connections.clear()
+        self._local = threading.local()
+        logger.debug("Closed SQLite storage connections")
+
+    # --------------------------------------------------------------------------
+    # Tool Caches
+    # --------------------------------------------------------------------------
+    @blocking_io(exclusive=False)
+    def get_all_tool_caches(self) -> Dict[str, Any]:
+        try:
+            return {
+                mcpserver_id: json.loads(tools)
+                for mcpserver_id, tools in self._connection().execute("SELECT mcpserver_id, tools FROM tool_caches")
+            }
+        except Exception as e:
+            logger.error(f"Error getting all tool caches: {e}")
+            return {}
+
+    @blocking_io
+    def write_tool_cache(self, mcpserver_name: str, cache: list[dict]) -> None:
+        try:
+            with self._connection() as connection:
+                connection.execute(
+                    "INSERT INTO tool_caches (mcpserver_id, tools, updated_at) VALUES (?, ?, julianday('now')) "
+                    "ON CONFLICT(mcpserver_id) DO UPDATE SET tools = excluded.tools, updated_at = excluded.updated_at",
+                    (mcpserver_name, json.dumps(cache))
+                )
+            logger.info(f"Tool cache saved for MCP server '{mcpserver_name}'")
+        except Exception as e:
+            logger.error(f"Error writing tool cache for '{mcpserver_name}': {e}")
+
+    @blocking_io(exclusive=False)
+    def read_tool_cache(self, mcpserver_name: str) -> Optional[list[dict]]:
+        try:
+            row = self._connection().execute("SELECT tools FROM tool_caches WHERE mcpserver_id = ?", (mcpserver_name,)).fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            logger.error(f"Error reading tool cache for '{mcpserver_name}': {e}")
+            return None
+
+    @blocking_io
+    def delete_tool_cache(self, mcpserver_name: str) -> None:
+        try:
+            with self._connection() as connection:
+                connection.execute("DELETE FROM tool_caches WHERE mcpserver_id = ?", (mcpserver_name,))
+        except Exception as e:
+            logger.error(f"Error deleting tool cache for '{mcpserver_name}': {e}")
+
+    # --------------------------------------------------------------------------
+    # Tool Definitions
+    # --------------------------------------------------------------------------
+    @blocking_io
+    def write_tool_definitions(self, definitions: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            with self._connection() as connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO tool_definitions (digest, definition) VALUES (?, ?)",
+                    [(digest, json.dumps(definition)) for digest, definition in definitions.items()]
+                )
+        except Exception as e:
+            logger.error(f"Error writing tool definitions: {e}")
+
+    @blocking_io(exclusive=False)
+    def read_tool_definitions(self, digests: List[str]) -> Dict[str, Dict[str, Any]]:
+        definitions: Dict[str, Dict[str, Any]] = {}
+        connection = self._connection()
+        try:
+            for digest in digests:
+                row = connection.execute("SELECT definition FROM tool_definitions WHERE digest = ?", (digest,)).fetchone()
+                if row:
+                    definitions[digest] = json.loads(row[0])
+        except Exception as e:
+            logger.error(f"Error reading tool definitions: {e}")
+        return definitions
+
+    @blocking_io(exclusive=False)
+    def list_tool_definitions(self) -> List[str]:
+        try:
+            return [row[0] for row in self._connection().execute("SELECT digest FROM tool_definitions")]
+        except Exception as e:
+            logger.error(f"Error listing tool definitions: {e}")
+            return []
+
+    @blocking_io
+    def delete_tool_definitions(self, digests: List[str]) -> None:
+        try:
+            with self._connection() as connection:
+                connection.executemany("DELETE FROM tool_definitions WHERE digest = ?", [(digest,) for digest in digests])
+        except Exception as e:
+            logger.error(f"Error deleting tool definitions: {e}")
+
+    # --------------------------------------------------------------------------
+    # API Key Index
+    # --------------------------------------------------------------------------
+    @blocking_io
+    def write_api_key_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            with self._connection() as connection:
+                connection.execute("DELETE FROM api_key_index")
+                connection.executemany(
+                    "INSERT INTO api_key_index (digest, username, metadata) VALUES (?, ?, ?)",
+                    [(digest, entry["username"], json.dumps(entry.get("metadata", {}))) for digest, entry in index.items()]
+                )
+        except Exception as e:
+            logger.error(f"Error writing API key index: {e}")
+            raise
+
+    @staticmethod
+    def _update_api_key_index(connection: sqlite3.Connection, changes: Optional[ApiKeyIndexChanges]) -> None:
+        """Write or delete API key index entries in the transaction of the user config."""
+        if not changes:
+            return
+        connection.executemany(_UPSERT_API_KEY_INDEX, [
+            (digest, entry["username"], json.dumps(entry.get("metadata", {})))
+            for digest, entry in changes.items() if entry is not None
+        ])
+        connection.executemany("DELETE FROM api_key_index WHERE digest = ?", [
+            (digest,) for digest, entry in changes.items() if entry is None
+        ])
+
+    @blocking_io(exclusive=False)
+    def read_api_key_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        try:
+            connection = self._connection()
+            rows = connection.execute("SELECT digest, username, metadata FROM api_key_index").fetchall()
+            # The index is saved in the transactions of the user configs, it is only missing
+            # for keys stored without it (e.g. by the migration tool from a source without index)
+            if not rows and connection.execute("SELECT EXISTS (SELECT 1 FROM api_keys)").fetchone()[0]:
+                return None
+        except Exception as e:
+            logger.error(f"Error reading API key index: {e}")
+            return None
+        return {
+            digest: {"username": username, "metadata": json.loads(metadata)}
+            for digest, username, metadata in rows
+        }
+
+    @blocking_io(exclusive=False)
+    def read_api_key_index_entry(self, digest: str) -> Optional[Dict[str, Any]]:
+        try:
+            row = self._connection().execute(
+                "SELECT username, metadata FROM api_key_index WHERE digest = ?", (digest,)
+            ).fetchone()
+        except Exception as e:
+            logger.error(f"Error reading API key index entry: {e}")
+            return None
+        return {"username": row[0], "metadata": json.loads(row[1])} if row is not None else None
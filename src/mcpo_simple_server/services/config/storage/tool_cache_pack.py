@@ -0,0 +1,272 @@
+"""
+Module: Tool cache pack - Single-file, append-only store for MCP server tool caches
+
+High Level Concept:
+-------------------
+Keeping one file per mcpserver makes loading all tool caches cost one open/parse per
+server - thousands of syscalls at boot and on every full config read. The pack keeps
+all tool caches in one append-only log file with an in-memory index by mcpserver id.
+Loading all caches is one sequential read.
+
+Architecture:
+-------------
+- File: 8 byte magic header followed by records
+- Record: header (payload length, crc32, op, key length), key (utf-8 mcpserver id),
+  payload (zlib compressed compact JSON of the tool cache list, empty for deletes)
+- Index: mcpserver id -> (payload offset, payload length) of the latest record
+- Writes and deletes append a record, the superseded record becomes garbage
+- Compaction: once garbage exceeds TOOLS_CACHE_PACK_COMPACT_RATIO of the file, the live
+  records are rewritten to a temp file which atomically replaces the pack
+- Processes: every operation holds a lock of the `<pack>.lock` file (shared for reads,
+  exclusive for appends and compaction) and first catches up with the records other
+  processes appended - or rescans the pack if another process compacted it
+
+Notes:
+------
+- Not thread-safe: the storage backends call it from their serialized (exclusive) I/O
+- A record failing its checksum is skipped, the records after it stay readable
+- A torn record at the end of the file (crash during append) is dropped by the next writer
+- Without fcntl (Windows) the pack is only safe for a single process
+"""
+import os
+import json
+import zlib
+import struct
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from loguru import logger
+from mcpo_simple_server.config import TOOLS_CACHE_PACK_COMPACT_RATIO
+try:
+    import fcntl
+except ImportError:     # Windows
+    fcntl = None  # type: ignore
+
+TOOL_CACHE_PACK_FILE = "tools_cache.pack"
+
+_MAGIC = b"MCPTCP1\n"
+_RECORD_HEADER = struct.Struct("<IIBH")   # payload length, crc32 (key + payload), op, key length
+_OP_PUT = 1
+_OP_DELETE = 2
+# Do not bother compacting small packs
+_COMPACT_MIN_GARBAGE_BYTES = 1024 * 1024
+
+
+def _encode(cache: List[Dict[str, Any]]) -> bytes:
+    return zlib.compress(json.dumps(cache, separators=(",", ":")).encode("utf-8"), 6)
+
+
+def _decode(payload: bytes) -> List[Dict[str, Any]]:
+    return json.loads(zlib.decompress(payload))
+
+
+class PackedToolCacheStore:
+    """Append-only tool cache log with an in-memory index by mcpserver id."""
+
+    def __init__(self, path: str, compact_ratio: float = TOOLS_CACHE_PACK_COMPACT_RATIO) -> None:
+        self.path = path
+        self._lock_path = f"{path}.lock"
+        self._compact_ratio = compact_ratio
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._file_size = 0
+        self._live_bytes = 0
+        self._stats: Dict[str, int] = {"writes": 0, "deletes": 0, "compactions": 0, "skipped_records": 0}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._file_lock(exclusive=True):
+            self.created = not os.path.exists(path)
+            if self.created:
+                with open(path, "wb") as f:
+                    f.write(_MAGIC)
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._refresh(repair=True)
+            self._compact_if_needed()
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        """Lock the pack against other processes (the pack file itself is replaced by compaction)."""
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_path, "a+b") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _refresh(self, repair: bool = False) -> None:
+        """
+        Bring the index up to date with the pack on disk.
+
+        Args:
+            repair: Truncate a torn record at the end (only with the exclusive lock)
+        """
+        stat = os.stat(self.path)
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self._file_id or stat.st_size < self._file_size:
+            # First load or compacted by another process - offsets changed, rescan
+            with open(self.path, "rb") as f:
+                buffer = f.read()
+            if buffer[:len(_MAGIC)] != _MAGIC:
+                raise ValueError(f"Not a tool cache pack: {self.path}")
+            self._file_id = file_id
+            self._index.clear()
+            self._live_bytes = 0
+            self._scan(buffer[len(_MAGIC):], len(_MAGIC), repair)
+        elif stat.st_size > self._file_size:
+            # Records appended by another process
+            with open(self.path, "rb") as f:
+                f.seek(self._file_size)
+                buffer = f.read()
+            self._scan(buffer, self._file_size, repair)
+
+    def _scan(self, buffer: bytes, base: int, repair: bool) -> None:
+        """Apply the records of `buffer` (pack content starting at offset `base`) to the index."""
+        offset = 0
+        while offset + _RECORD_HEADER.size <= len(buffer):
+            length, crc, op, key_length = _RECORD_HEADER.unpack_from(buffer, offset)
+            key_offset = offset + _RECORD_HEADER.size
+            end = key_offset + key_length + length
+            if end > len(buffer):
+                break
+            if zlib.crc32(buffer[key_offset:end]) != crc:
+                # Garbage from now on, removed by the next compaction
+                logger.warning(f"Skipping corrupt record at byte {base + offset} of {self.path}")
+                self._stats["skipped_records"] += 1
+                offset = end
+                continue
+            key = buffer[key_offset:key_offset + key_length].decode("utf-8")
+            previous = self._index.pop(key, None)
+            if previous is not None:
+                self._live_bytes -= self._record_size(key, previous[1])
+            if op == _OP_PUT:
+                self._index[key] = (base + key_offset + key_length, length)
+                self._live_bytes += end - offset
+            offset = end
+        if offset < len(buffer) and repair:
+            logger.warning(f"Dropping {len(buffer) - offset} bytes of incomplete records at the end of {self.path}")
+            with open(self.path, "r+b") as f:
+                f.truncate(base + offset)
+        self._file_size = base + offset
+
+    @staticmethod
+    def _record_size(mcpserver_id: str, length: int) -> int:
+        return _RECORD_HEADER.size + len(mcpserver_id.encode("utf-8")) + length
+
+    def _append(self, op: int, mcpserver_id: str, payload: bytes) -> int:
+        """Append a record, returns the payload offset."""
+        key = mcpserver_id.encode("utf-8")
+        header = _RECORD_HEADER.pack(len(payload), zlib.crc32(key + payload), op, len(key))
+        with open(self.path, "ab") as f:
+            f.write(header + key + payload)
+            f.flush()
+            os.fsync(f.fileno())
+        payload_offset = self._file_size + len(header) + len(key)
+        self._file_size = payload_offset + len(payload)
+        return payload_offset
+
+    # --------------------------------------------------------------------------
+    # Tool Caches
+    # --------------------------------------------------------------------------
+    def write(self, mcpserver_id: str, cache: List[Dict[str, Any]]) -> None:
+        """Store the tool cache of a mcpserver, replacing the previous one."""
+        payload = _encode(cache)
+        with self._file_lock(exclusive=True):
+            self._refresh(repair=True)
+            previous = self._index.get(mcpserver_id)
+            self._index[mcpserver_id] = (self._append(_OP_PUT, mcpserver_id, payload), len(payload))
+            if previous is not None:
+                self._live_bytes -= self._record_size(mcpserver_id, previous[1])
+            self._live_bytes += self._record_size(mcpserver_id, len(payload))
+            self._stats["writes"] += 1
+            self._compact_if_needed()
+
+    def read(self, mcpserver_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Read and decode the tool cache of one mcpserver (single positioned read)."""
+        with self._file_lock(exclusive=False):
+            self._refresh()
+            entry = self._index.get(mcpserver_id)
+            if entry is None:
+                return None
+            offset, length = entry
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                return _decode(f.read(length))
+
+    def read_all(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Read the whole pack sequentially and decode all tool caches."""
+        with self._file_lock(exclusive=False):
+            self._refresh()
+            with open(self.path, "rb") as f:
+                buffer = memoryview(f.read())
+            return {
+                mcpserver_id: _decode(buffer[offset:offset + length])
+                for mcpserver_id, (offset, length) in self._index.items()
+            }
+
+    def delete(self, mcpserver_id: str) -> bool:
+        """Delete the tool cache of a mcpserver, returns False if there was none."""
+        with self._file_lock(exclusive=True):
+            self._refresh(repair=True)
+            previous = self._index.pop(mcpserver_id, None)
+            if previous is None:
+                return False
+            self._append(_OP_DELETE, mcpserver_id, b"")
+            self._live_bytes -= self._record_size(mcpserver_id, previous[1])
+            self._stats["deletes"] += 1
+            self._compact_if_needed()
+            return True
+
+    def __contains__(self, mcpserver_id: str) -> bool:
+        return mcpserver_id in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    # --------------------------------------------------------------------------
+    # Compaction
+    # --------------------------------------------------------------------------
+    def _compact_if_needed(self) -> None:
+        garbage = self._file_size - len(_MAGIC) - self._live_bytes
+        if garbage >= _COMPACT_MIN_GARBAGE_BYTES and garbage > self._file_size * self._compact_ratio:
+            self._compact()
+
+    def compact(self) -> None:
+        """Rewrite the pack with live records only (temp file + fsync + atomic rename)."""
+        with self._file_lock(exclusive=True):
+            self._refresh(repair=True)
+            self._compact()
+
+    def _compact(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        index: Dict[str, Tuple[int, int]] = {}
+        with open(self.path, "rb") as src, open(tmp_path, "wb") as dst:
+            dst.write(_MAGIC)
+            offset = len(_MAGIC)
+            for mcpserver_id, (payload_offset, length) in self._index.items():
+                src.seek(payload_offset)
+                payload = src.read(length)
+                key = mcpserver_id.encode("utf-8")
+                dst.write(_RECORD_HEADER.pack(length, zlib.crc32(key + payload), _OP_PUT, len(key)) + key + payload)
+                index[mcpserver_id] = (offset + _RECORD_HEADER.size + len(key), length)
+                offset += _RECORD_HEADER.size + len(key) + length
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp_path, self.path)
+        stat = os.stat(self.path)
+        self._file_id = (stat.st_dev, stat.st_ino)
+        logger.debug(f"Compacted tool cache pack {self.path}: {self._file_size} -> {offset} bytes")
+        self._index = index
+        self._file_size = offset
+        self._live_bytes = offset - len(_MAGIC)
+        self._stats["compactions"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Report size, garbage and operation counters of the pack."""
+        return {
+            **self._stats,
+            "entries": len(self._index),
+            "file_bytes": self._file_size,
+            "garbage_bytes": self._file_size - len(_MAGIC) - self._live_bytes,
+        }
@@ -0,0 +1,296 @@
+"""
+Module/Package: WriteBehindStorage - Write coalescing in front of a storage backend
+
+High Level Concept:
+-------------------
+Every env var edit, API key change or mcpserver add saves the whole user document.
+A bulk edit from the UI turns into dozens of full rewrites of the same document.
+WriteBehindStorage wraps any storage backend and keeps a write-behind journal: saves
+of the same document within a short window are merged (the latest document wins)
+and written once.
+
+Architecture:
+-------------
+- Journal: document key ("global" / "user:<name>") -> latest pending document
+- Debounce: a document is written CONFIG_WRITE_BEHIND_DELAY seconds after its last
+  save, but at most CONFIG_WRITE_BEHIND_MAX_DELAY seconds after its first pending save
+- Reads see pending documents (read-your-writes), list_users overlays them
+- Deletes drop the pending document and are written immediately, so are user config
+  saves changing credentials or access (password, group, disabled flag, API keys) -
+  they are durable when the request returns
+- A failed write keeps the document pending and is retried with backoff
+- flush() writes everything pending - called on shutdown and by close()
+
+Notes:
+------
+- The wrapped backends replace documents atomically (temp file + fsync + rename,
+  or a sqlite transaction), so a crash loses at most the pending window, it can
+  not leave a truncated document
+- Other worker processes (and nodes sharing a KeyValueStorage) see a change once it is written (after the window)
+- Enabled when CONFIG_WRITE_BEHIND_DELAY > 0 (disabled by default)
+"""
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union
+from loguru import logger
+from mcpo_simple_server.config import CONFIG_WRITE_BEHIND_DELAY, CONFIG_WRITE_BEHIND_MAX_DELAY
+from mcpo_simple_server.services.config.models import GlobalConfigModel, UserConfigModel, UserIndexEntry
+from mcpo_simple_server.services.config.abstracts.storage_backend import StorageBackendAbstract, ApiKeyIndexChanges
+
+_GLOBAL_KEY = "global"
+# Longest pause between retries of a failed write
+_RETRY_MAX_DELAY = 60.0
+
+Document = Union[GlobalConfigModel, UserConfigModel]
+
+
+def _user_key(username: str) -> str:
+    return f"user:{username}"
+
+
+@dataclass
+class _PendingWrite:
+    document: Document
+    writer: Callable[[Any], Awaitable[None]]
+    first_saved_at: float
+    timer: Optional[asyncio.TimerHandle] = None
+    failures: int = 0
+
+
+class WriteBehindStorage(StorageBackendAbstract):
+    """Storage backend wrapper debouncing and merging config document writes."""
+
+    def __init__(
+        self,
+        backend: StorageBackendAbstract,
+        delay: float = CONFIG_WRITE_BEHIND_DELAY,
+        max_delay: float = CONFIG_WRITE_BEHIND_MAX_DELAY
+    ) -> None:
+        self._backend = backend
+        self._delay = delay
+        self._max_delay = max(max_delay, delay)
+        self._pending: Dict[str, _PendingWrite] = {}
+        # Documents being written - still served to readers until the write finished
+        self._flushing: Dict[str, Document] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats: Dict[str, int] = {"saves": 0, "writes": 0, "coalesced": 0, "failures": 0}
+        logger.info(f"📦 Write-behind enabled: delay {self._delay}s, max delay {self._max_delay}s")
+
+    # --------------------------------------------------------------------------
+    # Journal
+    # --------------------------------------------------------------------------
+    def _schedule(self, key: str, document: Document, writer: Callable[[Any], Awaitable[None]]) -> None:
+        now = time.monotonic()
+        self._stats["saves"] += 1
+        entry = self._pending.get(key)
+        if entry is None:
+            entry = self._pending[key] = _PendingWrite(document=document, writer=writer, first_saved_at=now)
+        else:
+            entry.document = document
+            self._stats["coalesced"] += 1
+            if entry.timer is not None:
+                entry.timer.cancel()
+        delay = max(min(self._delay, entry.first_saved_at + self._max_delay - now), 0)
+        entry.timer = asyncio.get_running_loop().call_later(delay, self._start_flush, key)
+
+    def _start_flush(self, key: str) -> None:
+        task = asyncio.create_task(self._flush_key(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_key(self, key: str) -> None:
+        entry = self._pending.pop(key, None)
+        if entry is None:
+            return
+        if entry.timer is not None:
+            entry.timer.cancel()
+        previous = self._inflight.get(key)
+        self._flushing[key] = entry.document
+        task = asyncio.current_task()
+        if task is not None:
+            self._inflight[key] = task
+        try:
+            if previous is not None and previous is not task:
+                # Keep writes of one document in order
+                await asyncio.wait([previous])
+            await entry.writer(entry.document)
+            self._stats["writes"] += 1
+        except Exception as e:
+            self._stats["failures"] += 1
+            self._retry(key, entry, e)
+        finally:
+            if self._flushing.get(key) is entry.document:
+                del self._flushing[key]
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+
+    def _retry(self, key: str, entry: _PendingWrite, error: Exception) -> None:
+        """Keep the document of a failed write pending, unless a newer save replaced it."""
+        if key in self._pending:
+            logger.error(f"Write-behind flush of '{key}' failed, a newer save is pending: {error}")
+            return
+        entry.failures += 1
+        delay = min(max(self._delay, 1.0) * 2 ** (entry.failures - 1), _RETRY_MAX_DELAY)
+        logger.error(f"Write-behind flush of '{key}' failed (attempt {entry.failures}), retrying in {delay:.0f}s: {error}")
+        entry.first_saved_at = time.monotonic()
+        entry.timer = asyncio.get_running_loop().call_later(delay, self._start_flush, key)
+        self._pending[key] = entry
+
+    def _peek(self, key: str) -> Optional[Document]:
+        entry = self._pending.get(key)
+        if entry is not None:
+            return entry.document
+        return self._flushing.get(key)
+
+    async def _drop(self, key: str) -> bool:
+        """Drop a pending document and wait for a write in progress, True if one was pending."""
+        entry = self._pending.pop(key, None)
+        if entry is not None and entry.timer is not None:
+            entry.timer.cancel()
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            await asyncio.wait([inflight])
+        return entry is not None
+
+    async def flush(self) -> None:
+        """Write all pending documents now and wait for writes in progress."""
+        keys = list(self._pending)
+        if keys:
+            logger.info(f"Flushing {len(keys)} pending config writes")
+        await asyncio.gather(*(self._flush_key(key) for key in keys))
+        if self._inflight:
+            await asyncio.wait(list(self._inflight.values()))
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Report the wrapped backend stats and the write-behind counters.
+        """
+        return {
+            **self._backend.get_cache_stats(),
+            "write_behind": {**self._stats, "pending": len(self._pending)},
+        }
+
+    # --------------------------------------------------------------------------
+    # Global Config
+    # --------------------------------------------------------------------------
+    async def get_global_config(self) -> GlobalConfigModel:
+        pending = self._peek(_GLOBAL_KEY)
+        if pending is not None:
+            return pending.model_copy(deep=True)
+        return await self._backend.get_global_config()
+
+    async def save_global_config(self, config: GlobalConfigModel) -> None:
+        self._schedule(_GLOBAL_KEY, config.model_copy(deep=True), self._backend.save_global_config)
+
+    # --------------------------------------------------------------------------
+    # User Config
+    # --------------------------------------------------------------------------
+    async def get_user_config(self, username: str) -> Optional[UserConfigModel]:
+        pending = self._peek(_user_key(username))
+        if pending is not None:
+            return pending.model_copy(deep=True)
+        return await self._backend.get_user_config(username)
+
+    async def save_user_config(self, config: UserConfigModel, api_key_index: Optional[ApiKeyIndexChanges] = None) -> None:
+        key = _user_key(config.username)
+        if api_key_index or await self._changes_access(config):
+            # Written through - the pending document is replaced by this save
+            await self._drop(key)
+            self._stats["saves"] += 1
+            await self._backend.save_user_config(config, api_key_index)
+            self._stats["writes"] += 1
+            return
+        self._schedule(key, config.model_copy(deep=True), self._backend.save_user_config)
+
+    async def _changes_access(self, config: UserConfigModel) -> bool:
+        """True if the save changes credentials or access of the user (or creates the user)."""
+        current = await self.get_user_config(config.username)
+        if current is None:
+            return True
+        return (
+            current.hashed_password != config.hashed_password
+            or current.group != config.group
+            or current.disabled != config.disabled
+            or current.api_keys != config.api_keys
+        )
+
+    async def delete_user_config(self, username: str, api_key_index: Optional[ApiKeyIndexChanges] = None) -> bool:
+        was_pending = await self._drop(_user_key(username))
+        deleted = await self._backend.delete_user_config(username, api_key_index)
+        return deleted or was_pending
+
+    async def list_users(self) -> Dict[str, UserConfigModel]:
+        users = await self._backend.list_users()
+        prefix = _user_key("")
+        for key in list(self._flushing) + list(self._pending):
+            document = self._peek(key)
+            if key.startswith(prefix) and document is not None:
+                users[key[len(prefix):]] = document.model_copy(deep=True)
+        return users
+
+    async def list_user_index(self) -> Dict[str, UserIndexEntry]:
+        index = await self._backend.list_user_index()
+        prefix = _user_key("")
+        for key in list(self._flushing) + list(self._pending):
+            document = self._peek(key)
+            if key.startswith(prefix) and isinstance(document, UserConfigModel):
+                index[key[len(prefix):]] = UserIndexEntry.from_config(document)
+        return index
+
+    async def clear_cache(self, username: Optional[str] = None) -> None:
+        await self._backend.clear_cache(username)
+
+    @property
+    def notifies_changes(self) -> bool:       # type: ignore[override]
+        return self._backend.notifies_changes
+
+    def set_change_listener(self, listener: Callable[[str], Awaitable[None]]) -> None:
+        self._backend.set_change_listener(listener)
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._pending:
+            logger.error(f"Config writes lost on close, storage failed: {', '.join(self._pending)}")
+            for entry in self._pending.values():
+                if entry.timer is not None:
+                    entry.timer.cancel()
+            self._pending.clear()
+        await self._backend.close()
+
+    # --------------------------------------------------------------------------
+    # Tool Caches, Tool Definitions, API Key Index - written through
+    # --------------------------------------------------------------------------
+    async def get_all_tool_caches(self) -> Dict[str, List[Dict[str, Any]]]:
+        return await self._backend.get_all_tool_caches()
+
+    async def write_tool_cache(self, mcpserver_name: str, cache: list[dict]) -> None:
+        await self._backend.write_tool_cache(mcpserver_name, cache)
+
+    async def read_tool_cache(self, mcpserver_name: str) -> Optional[list[dict]]:
+        return await self._backend.read_tool_cache(mcpserver_name)
+
+    async def delete_tool_cache(self, mcpserver_name: str) -> None:
+        await self._backend.delete_tool_cache(mcpserver_name)
+
+    async def write_tool_definitions(self, definitions: Dict[str, Dict[str, Any]]) -> None:
+        await self._backend.write_tool_definitions(definitions)
+
+    async def read_tool_definitions(self, digests: List[str]) -> Dict[str, Dict[str, Any]]:
+        return await self._backend.read_tool_definitions(digests)
+
+    async def list_tool_definitions(self) -> List[str]:
+        return await self._backend.list_tool_definitions()
+
+    async def delete_tool_definitions(self, digests: List[str]) -> None:
+        await self._backend.delete_tool_definitions(digests)
+
+    async def write_api_key_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        await self._backend.write_api_key_index(index)
+
+    async def read_api_key_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        return await self._backend.read_api_key_index()
+
+    async def read_api_key_index_entry(self, digest: str) -> Optional[Dict[str, Any]]:
+        return await self._backend.read_api_key_index_entry(digest)
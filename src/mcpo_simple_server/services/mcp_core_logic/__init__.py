@@ -8,6 +8,9 @@ High Level Concept:
 Architecture:
     - json_response: Generates MCP-compliant JSON-RPC responses
     - tools_handler: Manages tools-related MCP operations
+    - session_context: Principal of the current MCP session (contextvar), shared MCP server
+    - live_sessions: Caps, idle eviction and listing of the open sessions of all transports
+    - batch: JSON-RPC batch arrays split into concurrent single-message requests
 
 Workflow:
     Used by various transport layers (HTTP, SSE, WebSockets) to generate
@@ -20,8 +23,27 @@ Notes:
 
 from .list_tools import mcp_list_tools
 from .call_tool import mcp_call_tool
+from .session_context import (
+    McpSessionState,
+    SessionScopedMCPServer,
+    bind_mcp_session,
+    get_mcp_session,
+    get_mcp_session_username
+)
+from .live_sessions import LiveSessionTracker, SessionLimitExceeded, counting_send, get_live_sessions
+from .batch import handle_jsonrpc_batches
 
 __all__ = [
     "mcp_list_tools",
-    "mcp_call_tool"
+    "mcp_call_tool",
+    "McpSessionState",
+    "SessionScopedMCPServer",
+    "bind_mcp_session",
+    "get_mcp_session",
+    "get_mcp_session_username",
+    "LiveSessionTracker",
+    "SessionLimitExceeded",
+    "counting_send",
+    "get_live_sessions",
+    "handle_jsonrpc_batches"
 ]
@@ -0,0 +1,221 @@
+"""
+MCP JSON-RPC Batches - Accepts JSON-RPC batch arrays on the MCP message endpoints
+
+High Level Concept:
+    The MCP SDK transports accept one JSON-RPC message per POST. A POSTed batch (JSON
+    array) is split here into one internal sub-request per message. The sub-requests run
+    concurrently through the unchanged transport - the MCP server handles every request in
+    a task of its own, so the tools/call requests of a batch reach mcp_call_tool at the same
+    time - and their responses are collected into one batch response, ids preserved.
+
+Architecture:
+    - handle_jsonrpc_batches(): ASGI wrapper of a transport's POST handler, requests that
+      are not batches pass through unchanged (the body is read once and replayed)
+    - collect_responses=True (Streamable HTTP): the JSON-RPC responses of the sub-requests
+      (JSON or SSE framed) are answered as one JSON array, 202 if the batch only holds
+      notifications
+    - collect_responses=False (SSE): responses go over the event stream of the session as
+      usual, the POST is answered with 202 - with the errors of refused messages if any
+    - Messages refused by the transport (invalid JSON-RPC) get a JSON-RPC error each, only
+      transport-level refusals (auth, unknown session) answer the batch as a whole
+    - Cap: MCP_BATCH_MAX_MESSAGES messages per batch (413 beyond), 0 refuses batches
+
+Notes:
+    Batches must not contain `initialize`. Notifications and server requests sent while a
+    batched request runs (e.g. progress) are not forwarded on Streamable HTTP.
+"""
+import json
+from typing import Any, Dict, List, Optional, Tuple
+import anyio
+from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from mcp.types import INVALID_REQUEST, INTERNAL_ERROR
+from mcpo_simple_server.config import MCP_BATCH_MAX_MESSAGES
+
+# Statuses the transports refuse a request with before looking at its message (auth, unknown
+# session, headers) - a batch refused with one of them for every message is refused as a whole
+_TRANSPORT_REFUSALS = {401, 403, 404, 405, 406, 415}
+
+
+async def _send_json(send: Send, status: int, payload: Any) -> None:
+    body = json.dumps(payload).encode("utf-8")
+    await send({"type": "http.response.start", "status": status, "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode("latin-1"))
+    ]})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def _responses_of(status: int, headers: List[Tuple[bytes, bytes]], body: bytes) -> List[Dict[str, Any]]:
+    """JSON-RPC responses in the (JSON or SSE framed) answer to a sub-request."""
+    content_type = next((value for key, value in headers if key.lower() == b"content-type"), b"")
+    if status != 200 or not body:
+        return []
+    if not content_type.startswith(b"text/event-stream"):
+        message = json.loads(body)
+        return message if isinstance(message, list) else [message]
+    responses = []
+    for event in body.decode("utf-8").replace("\r\n", "\n").split("\n\n"):
+        data = "\n".join(line[5:].lstrip() for line in event.split("\n") if line.startswith("data:"))
+        if data:
+            message = json.loads(data)
+            if isinstance(message, dict) and "id" in message and ("result" in message or "error" in message):
+                responses.append(message)
+    return responses
+
+
+async def handle_jsonrpc_batches(app: ASGIApp, scope: Scope, receive: Receive, send: Send, collect_responses: bool = True) -> None:
+    """
+    Serve a request with `app`, splitting a POSTed JSON-RPC batch into concurrent sub-requests.
+
+    Args:
+        app: The transport's ASGI handler of single messages
+        scope, receive, send: The ASGI request
+        collect_responses: Answer with the batch of JSON-RPC responses (Streamable HTTP),
+            otherwise with 202 (SSE, the responses go over the event stream)
+    """
+    if scope.get("method") != "POST":
+        await app(scope, receive, send)
+        return
+
+    # Read the body to tell batches from single messages
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    body = b"".join(chunks)
+
+    batch: Optional[List[Any]] = None
+    if body.lstrip().startswith(b"["):
+        try:
+            batch = json.loads(body)
+        except ValueError:
+            batch = None  # Answered by the transport like any message it can not parse
+
+    if batch is None:
+        replayed = False
+
+        async def replay_receive() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await app(scope, replay_receive, send)
+        return
+
+    if not batch:
+        await _send_json(send, 400, _error(None, INVALID_REQUEST, "Invalid Request: empty batch"))
+        return
+    if not MCP_BATCH_MAX_MESSAGES:
+        await _send_json(send, 400, _error(None, INVALID_REQUEST, "Invalid Request: JSON-RPC batches are not supported"))
+        return
+    if len(batch) > MCP_BATCH_MAX_MESSAGES:
+        await _send_json(send, 413, _error(None, INVALID_REQUEST, f"Invalid Request: batch of {len(batch)} messages exceeds {MCP_BATCH_MAX_MESSAGES}"))
+        return
+    if any(isinstance(item, dict) and item.get("method") == "initialize" for item in batch):
+        await _send_json(send, 400, _error(None, INVALID_REQUEST, "Invalid Request: initialize must not be part of a batch"))
+        return
+    logger.debug(f"MCP JSON-RPC batch of {len(batch)} messages on {scope.get('path')}")
+
+    # Sub-requests see the real client disconnect only - SSE responses end when receive() reports it
+    disconnected = anyio.Event()
+    answers: List[Tuple[int, List[Tuple[bytes, bytes]], bytes]] = [(500, [], b"")] * len(batch)
+
+    async def watch_disconnect() -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
+        disconnected.set()
+
+    async def run_item(index: int, item: Any) -> None:
+        item_body = json.dumps(item).encode("utf-8")
+        item_scope = dict(scope)
+        item_scope["headers"] = [(key, value) for key, value in scope.get("headers", []) if key.lower() != b"content-length"]
+        item_scope["headers"].append((b"content-length", str(len(item_body)).encode("latin-1")))
+        received = False
+        status, headers, response_chunks = 500, [], []
+
+        async def item_receive() -> Message:
+            nonlocal received
+            if not received:
+                received = True
+                return {"type": "http.request", "body": item_body, "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def item_send(message: Message) -> None:
+            nonlocal status, headers
+            if message["type"] == "http.response.start":
+                status, headers = message["status"], list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                response_chunks.append(message.get("body", b""))
+
+        try:
+            await app(item_scope, item_receive, item_send)
+        except Exception as e:
+            logger.error(f"Error in MCP JSON-RPC batch message {index}: {e}")
+        answers[index] = (status, headers, b"".join(response_chunks))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(watch_disconnect)
+        async with anyio.create_task_group() as items:
+            for index, item in enumerate(batch):
+                items.start_soon(run_item, index, item)
+        tg.cancel_scope.cancel()
+    if disconnected.is_set():
+        return
+
+    # Refused as a whole by the transport (e.g. unknown session) - answer like a single message would be
+    statuses = {status for status, _, _ in answers}
+    if len(statuses) == 1 and next(iter(statuses)) in _TRANSPORT_REFUSALS:
+        status, headers, answer_body = answers[0]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": answer_body})
+        return
+
+    # Per message: its responses (Streamable HTTP) or the error of a refused message
+    responses: List[Dict[str, Any]] = []
+    accepted = False
+    for item, (status, headers, answer_body) in zip(batch, answers):
+        is_request = isinstance(item, dict) and "id" in item
+        accepted = accepted or status < 400
+        try:
+            item_responses = _responses_of(status, headers, answer_body)
+        except ValueError:
+            item_responses = []
+        if item_responses:
+            responses.extend(item_responses)
+        elif status >= 400 and (is_request or not isinstance(item, dict)):
+            try:
+                error = json.loads(answer_body).get("error") or {}
+            except (ValueError, AttributeError):
+                error = {}
+            responses.append(_error(
+                item.get("id") if is_request else None,
+                error.get("code", INTERNAL_ERROR if status >= 500 else INVALID_REQUEST),
+                error.get("message") or answer_body.decode("utf-8", errors="replace") or f"HTTP {status}"
+            ))
+
+    if not collect_responses:
+        # The responses of the accepted messages go over the event stream
+        if not responses:
+            await send({"type": "http.response.start", "status": 202, "headers": [(b"content-type", b"text/plain")]})
+            await send({"type": "http.response.body", "body": b"Accepted"})
+            return
+        await _send_json(send, 202 if accepted else 400, responses)
+        return
+
+    if not responses:
+        await send({"type": "http.response.start", "status": 202, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+        return
+    await _send_json(send, 200, responses)
@@ -13,18 +13,22 @@ Architecture:
         - Retrieves the McpServerService.
         - Gets the specific server instance using mcpserver_id.
         - Calls the tool on the server instance.
+        - Arguments not matching the tool inputSchema are rejected with INVALID_PARAMS (-32602)
+          before they are forwarded to the server process.
         - Returns the direct result of the tool execution or raises an appropriate exception.
 """
 
 from typing import Optional, Dict, Any, List, Union, Iterable
 from loguru import logger
+from fastapi import HTTPException
 
 from mcp.types import (
     TextContent,
     ImageContent,
     EmbeddedResource,
     ErrorData,
-    ContentBlock
+    ContentBlock,
+    INVALID_PARAMS
 )
 from mcp.server.lowlevel.server import StructuredContent, UnstructuredContent, CombinationContent
 from mcpo_simple_server.services.mcpserver.models import MCPoTool
@@ -131,6 +135,25 @@ async def mcp_call_tool(
             logger.info(f"Result contains structured_content {len(structured_content.__dict__)} content items.")
             return structured_content
 
+    except HTTPException as e:
+        if e.status_code != 422:
+            logger.error(f"Core: Error while executing tool '{tool_name}' on server '{mcpserver_id}': {e.detail}")
+            return ErrorData(
+                code=-32603,  # Internal error code
+                message=f"Error executing tool '{tool_name}': {e.detail}"
+            )
+        # Arguments rejected by the gateway inputSchema validation
+        errors = e.detail if isinstance(e.detail, list) else [e.detail]
+        messages = "; ".join(
+            f"{'.'.join(str(p) for p in err.get('loc', [])[1:]) or '<root>'}: {err.get('msg')}" if isinstance(err, dict) else str(err)
+            for err in errors
+        )
+        logger.info(f"Core: Invalid arguments for tool '{tool_name}': {messages}")
+        return ErrorData(
+            code=INVALID_PARAMS,
+            message=f"Invalid arguments for tool '{tool_name}': {messages}",
+            data=errors
+        )
     except Exception as e:  # Catch all exceptions and convert to JSONRPCError
         logger.error(f"Core: Error while executing tool '{tool_name}' on server '{mcpserver_id}': {e}", exc_info=True)
         return ErrorData(
@@ -0,0 +1,237 @@
+"""
+MCP Live Sessions - Caps, idle eviction and listing of the open MCP sessions of all transports
+
+High Level Concept:
+    SSE and stateful Streamable HTTP sessions live as long as the client keeps them open.
+    Every session is admitted here when it opens (global and per-user caps), released
+    when it ends, and closed by a periodic reaper once no MCP message was handled for
+    longer than the idle timeout. Keepalive pings on the SSE streams of the MCP transports
+    make dead sockets fail - and their sessions end - without waiting for the idle timeout.
+
+Architecture:
+    - LiveSessionTracker: session key -> McpSessionState of every open session
+    - Caps: MCP_MAX_SESSIONS in total (503), MCP_MAX_SESSIONS_PER_USER per user (429),
+      anonymous sessions are counted per client address
+    - Activity: the shared MCP server stamps `last_activity` for every handled message,
+      the transports count the bytes they send (counting_send)
+    - Eviction: the reaper calls the `close` callback of idle sessions, the transport
+      ends the session and releases it
+    - Revocation: on user changes the API keys of the user's sessions are checked against
+      the API key index, sessions of deleted / revoked keys are marked revoked and closed
+
+Notes:
+    Stateless Streamable HTTP requests are not sessions and are not tracked.
+"""
+import time
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+from loguru import logger
+from starlette.types import Message, Send
+from sse_starlette.sse import EventSourceResponse
+from mcp.server import sse as mcp_sse, streamable_http as mcp_streamable_http
+from mcpo_simple_server.config import (
+    MCP_MAX_SESSIONS,
+    MCP_MAX_SESSIONS_PER_USER,
+    MCP_SESSION_IDLE_TIMEOUT,
+    MCP_SESSION_REAP_INTERVAL,
+    MCP_KEEPALIVE_INTERVAL
+)
+from mcpo_simple_server.services.config.events import ConfigEvent, ConfigEventType
+from .session_context import McpSessionState
+
+
+class SessionLimitExceeded(Exception):
+    """A session cap is reached, the session can not be opened."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class KeepaliveEventSourceResponse(EventSourceResponse):
+    """SSE response of the MCP transports, pinging every MCP_KEEPALIVE_INTERVAL seconds (0 disables)."""
+    DEFAULT_PING_INTERVAL = MCP_KEEPALIVE_INTERVAL
+
+
+def use_keepalive_responses() -> None:
+    """
+    Send the SSE streams of the MCP transports with KeepaliveEventSourceResponse.
+
+    The transports create their responses without a `ping` argument, the response class
+    is replaced in their modules only - other SSE responses keep their own interval.
+    """
+    mcp_sse.EventSourceResponse = KeepaliveEventSourceResponse  # type: ignore[misc]
+    mcp_streamable_http.EventSourceResponse = KeepaliveEventSourceResponse  # type: ignore[misc]
+
+
+class LiveSessionTracker:
+    """Open MCP sessions of all transports, with caps and idle eviction."""
+
+    def __init__(self, max_sessions: int = 0, max_sessions_per_user: int = 0,
+                 idle_timeout: float = 0, reap_interval: float = 30):
+        self.max_sessions = max_sessions
+        self.max_sessions_per_user = max_sessions_per_user
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+        self._sessions: Dict[str, McpSessionState] = {}
+        self._per_owner: Dict[str, int] = {}
+        self._reaper: Optional[asyncio.Task] = None
+        self._unsubscribe: List[Callable[[], None]] = []
+        self._stats = {"admitted": 0, "rejected_global": 0, "rejected_user": 0, "evicted_idle": 0, "revoked": 0}
+
+    @staticmethod
+    def _owner(state: McpSessionState) -> str:
+        if state.username is not None:
+            return state.username
+        return "anonymous@" + state.client.rsplit(":", 1)[0]
+
+    def admit(self, state: McpSessionState) -> None:
+        """Track a session that opens, raise SessionLimitExceeded if a cap is reached."""
+        owner = self._owner(state)
+        if self.max_sessions and len(self._sessions) >= self.max_sessions:
+            self._stats["rejected_global"] += 1
+            logger.warning(f"MCP session of {owner} refused: {len(self._sessions)} sessions open")
+            raise SessionLimitExceeded(503, "Too many open MCP sessions")
+        if self.max_sessions_per_user and self._per_owner.get(owner, 0) >= self.max_sessions_per_user:
+            self._stats["rejected_user"] += 1
+            logger.warning(f"MCP session of {owner} refused: {self._per_owner[owner]} sessions of the user open")
+            raise SessionLimitExceeded(429, "Too many open MCP sessions for this user")
+        self._sessions[state.key] = state
+        self._per_owner[owner] = self._per_owner.get(owner, 0) + 1
+        self._stats["admitted"] += 1
+
+    def release(self, state: McpSessionState) -> None:
+        """Stop tracking a session that ended (no-op for sessions that are not tracked)."""
+        if self._sessions.pop(state.key, None) is None:
+            return
+        owner = self._owner(state)
+        remaining = self._per_owner.get(owner, 1) - 1
+        if remaining > 0:
+            self._per_owner[owner] = remaining
+        else:
+            self._per_owner.pop(owner, None)
+
+    async def reap_idle(self) -> int:
+        """Close the sessions idle for longer than the idle timeout, returns their number."""
+        if not self.idle_timeout:
+            return 0
+        now = time.time()
+        idle = [state for state in self._sessions.values()
+                if state.close is not None and now - state.last_activity > self.idle_timeout]
+        for state in idle:
+            logger.info(f"Closing idle MCP {state.transport} session {state.session_id or state.key} of {self._owner(state)}")
+            self._stats["evicted_idle"] += 1
+            try:
+                await state.close()  # type: ignore[misc]
+            except Exception as e:
+                logger.error(f"Error closing idle MCP session {state.session_id or state.key}: {e}")
+            # The transport releases the session when it ends, do not count it until then
+        return len(idle)
+
+    async def _on_user_changed(self, event: ConfigEvent) -> None:
+        # Lazy import - services.config is initialized after this module is imported
+        from mcpo_simple_server.services.config import get_config_service
+        api_key_index = get_config_service().api_key_index
+        for state in list(self._sessions.values()):
+            if state.username is None or state.revoked or state.credential is None:
+                continue
+            if event.username is not None and state.username != event.username:
+                continue
+            entry = api_key_index.lookup_digest(state.credential)
+            if entry is not None and entry.username == state.username:
+                continue
+            state.revoked = True
+            self._stats["revoked"] += 1
+            logger.info(f"MCP {state.transport} session {state.session_id or state.key} of user {state.username} revoked")
+            if state.close is not None:
+                try:
+                    await state.close()
+                except Exception as e:
+                    logger.error(f"Error closing revoked MCP session {state.session_id or state.key}: {e}")
+
+    async def _reap_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.reap_interval)
+            try:
+                await self.reap_idle()
+            except Exception as e:
+                logger.error(f"Error in MCP session reaper: {e}")
+
+    def start(self) -> None:
+        """Start the idle session reaper and the keepalive pings, re-check the API keys of open sessions on user changes."""
+        from mcpo_simple_server.services.config import get_config_service
+        use_keepalive_responses()
+        if self.idle_timeout and self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap_periodically())
+        if not self._unsubscribe:
+            self._unsubscribe = [get_config_service().events.subscribe(ConfigEventType.USER_CHANGED, self._on_user_changed)]
+
+    async def stop(self) -> None:
+        """Stop the idle session reaper and the revocation of sessions."""
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe = []
+        if self._reaper is not None:
+            self._reaper.cancel()
+            try:
+                await self._reaper
+            except asyncio.CancelledError:
+                pass
+            self._reaper = None
+
+    def list_sessions(self) -> List[Dict[str, Any]]:
+        """Open sessions with age, last activity and traffic, oldest first."""
+        now = time.time()
+        return [
+            {
+                "id": state.session_id or state.key,
+                "transport": state.transport,
+                "username": state.username,
+                "client": state.client,
+                "created_at": datetime.fromtimestamp(state.created_at, timezone.utc).isoformat(),
+                "age": round(now - state.created_at, 3),
+                "last_activity": datetime.fromtimestamp(state.last_activity, timezone.utc).isoformat(),
+                "idle": round(now - state.last_activity, 3),
+                "messages": state.messages,
+                "bytes_sent": state.bytes_sent,
+            }
+            for state in sorted(self._sessions.values(), key=lambda state: state.created_at)
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters of admitted, refused and evicted sessions and the configured limits."""
+        return {
+            **self._stats,
+            "open": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "max_sessions_per_user": self.max_sessions_per_user,
+            "idle_timeout": self.idle_timeout,
+            "keepalive_interval": MCP_KEEPALIVE_INTERVAL,
+        }
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+def counting_send(state: McpSessionState, send: Send) -> Send:
+    """Wrap an ASGI send to count the response body bytes sent to the session."""
+    async def _send(message: Message) -> None:
+        if message["type"] == "http.response.body":
+            state.bytes_sent += len(message.get("body", b""))
+        await send(message)
+    return _send
+
+
+_TRACKER = LiveSessionTracker(
+    max_sessions=MCP_MAX_SESSIONS,
+    max_sessions_per_user=MCP_MAX_SESSIONS_PER_USER,
+    idle_timeout=MCP_SESSION_IDLE_TIMEOUT,
+    reap_interval=MCP_SESSION_REAP_INTERVAL
+)
+
+
+def get_live_sessions() -> LiveSessionTracker:
+    """Get the tracker of the open MCP sessions."""
+    return _TRACKER
@@ -1,14 +1,60 @@
 
 
+import json
 from loguru import logger
-from typing import List, Optional
-from mcp.types import Tool as MCPTool, JSONRPCError, ListToolsResult
-from mcpo_simple_server.services.mcp_core_logic import mcp_list_tools
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Callable, List, Optional, Tuple, Any, Union
+from mcp.types import (
+    Tool as MCPTool,
+    JSONRPCError,
+    ListToolsRequest,
+    ListToolsResult,
+    CallToolRequest,
+    CallToolResult,
+    ErrorData,
+    ServerResult,
+    TextContent
+)
+from mcp.server.lowlevel.server import Server as MCPServer, StructuredContent, UnstructuredContent, CombinationContent
+from mcpo_simple_server.services import get_config_service, get_mcpserver_service
+from mcpo_simple_server.services.mcp_core_logic import mcp_list_tools, mcp_call_tool
+from mcpo_simple_server.services.mcp_core_logic.session_context import SessionScopedMCPServer, get_mcp_session, get_mcp_session_username
 
+# Default number of results for tools/list with a search query
+_LIST_TOOLS_QUERY_DEFAULT_LIMIT = 10
 
-async def _global_list_tools_handler(username: Optional[str] = None) -> List[MCPTool]:
+
+def _get_list_tools_query(mcp_server: Any) -> Tuple[Optional[str], int]:
+    """
+    Extract the optional search extension of tools/list from the current request.
+
+    Clients may send `{"method": "tools/list", "params": {"_meta": {"query": "...", "limit": 10}}}`
+    to get ranked search results instead of the full tool list.
+    """
+    try:
+        meta = mcp_server.request_context.meta
+    except LookupError:
+        return None, _LIST_TOOLS_QUERY_DEFAULT_LIMIT
+    query = getattr(meta, "query", None) if meta else None
+    limit = getattr(meta, "limit", None) if meta else None
+    if not isinstance(query, str) or not query.strip():
+        return None, _LIST_TOOLS_QUERY_DEFAULT_LIMIT
+    if not isinstance(limit, int) or limit <= 0:
+        limit = _LIST_TOOLS_QUERY_DEFAULT_LIMIT
+    return query, limit
+
+
+async def _global_list_tools_handler(username: Optional[str] = None, query: Optional[str] = None, limit: int = _LIST_TOOLS_QUERY_DEFAULT_LIMIT) -> List[MCPTool]:
     mcp_tools: List[MCPTool] = []
 
+    if query:
+        logger.debug(f"MCP _list_tools_handler search '{query}' invoked by user: {username}")
+        # Same user blacklist as tools/list (get_tools)
+        user_config = await get_config_service().user_config.get_config(username) if username else None
+        results = get_mcpserver_service().search_tools(query, username=username, limit=limit,
+                                                       blacklist=getattr(user_config, 'blacklist_tools', None))
+        return [MCPTool(**tool) for tool in results]
+
     logger.debug(f"MCP _list_tools_handler invoked by user: {username}")
     response_data = await mcp_list_tools(username=username)
 
@@ -28,3 +74,81 @@ async def _global_list_tools_handler(username: Optional[str] = None) -> List[MCP
         return mcp_tools
 
     return mcp_tools
+
+
+def _call_tool_result(result: Union[StructuredContent, UnstructuredContent, CombinationContent, ErrorData, None]) -> CallToolResult:
+    """Build the tools/call result of a mcp_call_tool result, errors are tool results with isError."""
+    if isinstance(result, ErrorData):
+        return CallToolResult(content=[TextContent(type="text", text=result.message)], isError=True)
+    if isinstance(result, tuple):
+        content, structured = result
+    elif isinstance(result, dict):
+        content, structured = [TextContent(type="text", text=json.dumps(result, indent=2))], result
+    else:
+        content, structured = result or [], None
+    return CallToolResult(content=list(content), structuredContent=structured, isError=False)
+
+
+def register_tool_handlers(mcp_server: MCPServer[None]) -> None:
+    """
+    Register the tools/list and tools/call handlers serving the caller of the current session.
+
+    The handlers are set in `request_handlers` instead of through the list_tools() / call_tool()
+    decorators: those keep one tool cache per server object, shared by the sessions of all
+    users. Tool arguments are validated by mcp_call_tool against the tool schema of the user.
+    """
+    async def _list_tools_handler(_request: ListToolsRequest) -> ServerResult:
+        query, limit = _get_list_tools_query(mcp_server)
+        tools = await _global_list_tools_handler(username=get_mcp_session_username(), query=query, limit=limit)
+        return ServerResult(ListToolsResult(tools=tools))
+
+    async def _call_tool_handler(request: CallToolRequest) -> ServerResult:
+        try:
+            result = await mcp_call_tool(
+                username=get_mcp_session_username(),
+                tool_name=request.params.name,
+                arguments=request.params.arguments
+            )
+        except Exception as e:
+            logger.error(f"MCP tools/call of '{request.params.name}' failed: {e}")
+            result = ErrorData(code=-32603, message=str(e))
+        return ServerResult(_call_tool_result(result))
+
+    mcp_server.request_handlers[ListToolsRequest] = _list_tools_handler
+    mcp_server.request_handlers[CallToolRequest] = _call_tool_handler
+
+
+@asynccontextmanager
+async def session_lifespan(server: MCPServer[None]) -> AsyncIterator[None]:
+    """Lifespan of the shared MCP server, entered once per session."""
+    session = get_mcp_session()
+    transport = session.transport if session is not None else "unknown"
+    client_info = session.client if session is not None else "unknown"
+    logger.debug(f"Lifespan ({transport}): Server '{server.name}' starting up - Client: {client_info}")
+    try:
+        yield
+    finally:
+        logger.debug(f"Lifespan ({transport}): Server '{server.name}' shutting down - Client: {client_info}")
+
+
+def create_mcp_server(
+    name: str,
+    instructions: str = "A simple MCP server for MCPoSimpleServer",
+    lifespan: Callable[[MCPServer[None]], AsyncContextManager[None]] = session_lifespan
+) -> MCPServer[None]:
+    """
+    Create the MCP server shared by all sessions of a transport, with the gateway tool handlers.
+
+    Run it inside bind_mcp_session() with the state of the authenticated session.
+
+    Args:
+        name: Server name reported to the clients
+        instructions: Instructions reported to the clients
+        lifespan: Context manager entered once per session
+
+    Returns:
+        An MCP server instance
+    """
+    mcp_server = SessionScopedMCPServer(name=name, instructions=instructions, lifespan=lifespan)
+    register_tool_handlers(mcp_server)
+    return mcp_server
@@ -0,0 +1,84 @@
+"""
+MCP Session Context - Principal of the current MCP session, carried in a contextvar
+
+High Level Concept:
+    One MCP server object serves all sessions of a transport. The caller is authenticated
+    once when the session is established, the resulting McpSessionState is bound to the
+    context the session runs in, and the tool handlers read it from there - without
+    re-parsing headers or looking up API keys per message.
+
+Architecture:
+    - McpSessionState: username (None = anonymous), client address, the credential the
+      session was opened with, and the activity counters of the session (see live_sessions)
+    - bind_mcp_session(): binds a state to the current context (and to tasks started from it)
+    - SessionScopedMCPServer: MCP server which records the last activity of the session
+      for every message it handles, its tool handlers (mcp_server_functions.register_tool_handlers)
+      serve the caller of the session
+
+Notes:
+    Tasks inherit the context they are started from, so handlers of a session run by
+    `server.run()` inside `bind_mcp_session()` see its state.
+"""
+import time
+from uuid import uuid4
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterator, Optional
+from mcp.server.lowlevel.server import Server as MCPServer
+
+
+@dataclass
+class McpSessionState:
+    """Authenticated principal and per-session data of one MCP session."""
+    username: Optional[str]
+    client: str = "unknown"
+    # Transport session ID and digest of the API key that opened the session (None = anonymous)
+    session_id: Optional[str] = None
+    credential: Optional[str] = None
+    revoked: bool = False
+    # Stable identity of the session (the transport session ID is only known after the opening request)
+    key: str = field(default_factory=lambda: uuid4().hex)
+    # Activity of the session (live_sessions): transport name, timestamps, traffic
+    transport: str = "unknown"
+    created_at: float = field(default_factory=time.time)
+    last_activity: float = field(default_factory=time.time)
+    messages: int = 0
+    bytes_sent: int = 0
+    # Ends the session from outside (idle eviction), set by the transport once it can
+    close: Optional[Callable[[], Awaitable[None]]] = None
+
+
+_current_session: ContextVar[Optional[McpSessionState]] = ContextVar("mcp_session_state", default=None)
+
+
+@contextmanager
+def bind_mcp_session(state: McpSessionState) -> Iterator[McpSessionState]:
+    """Bind the session state to the current context until the block exits."""
+    token = _current_session.set(state)
+    try:
+        yield state
+    finally:
+        _current_session.reset(token)
+
+
+def get_mcp_session() -> Optional[McpSessionState]:
+    """Get the state of the current MCP session, None outside of a session."""
+    return _current_session.get()
+
+
+def get_mcp_session_username() -> Optional[str]:
+    """Get the username of the current MCP session, None if anonymous or outside of a session."""
+    state = _current_session.get()
+    return state.username if state is not None else None
+
+
+class SessionScopedMCPServer(MCPServer[None]):
+    """Lowlevel MCP server shared by all sessions, recording the activity of the current session."""
+
+    async def _handle_message(self, message: Any, *args: Any, **kwargs: Any) -> None:
+        state = _current_session.get()
+        if state is not None:
+            state.last_activity = time.time()
+            state.messages += 1
+        await super()._handle_message(message, *args, **kwargs)
@@ -11,7 +11,7 @@ It mirrors the design philosophy of the mcp_streamable service, utilizing the co
 
 Architecture:
 -------------
-- Server: Manages SSE connections and event streaming.
+- Server: The MCP server shared by all SSE sessions (mcp_core_logic create_mcp_server).
 - Manager: Handles MCP session lifecycle and integration with the 'mcp' module.
 - Setup: Configures and initializes the SSE service and its routes.
 
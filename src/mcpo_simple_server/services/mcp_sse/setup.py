@@ -1,10 +1,16 @@
 from mcpo_simple_server.logger import logger
-from mcpo_simple_server.services.auth.api_key import get_username_from_api_key
+from mcpo_simple_server.services import get_config_service
+import anyio
+from functools import partial
 from fastapi import FastAPI
 from starlette.types import Scope, Receive, Send
 from mcp.server.lowlevel.server import NotificationOptions
 from mcp.server.sse import SseServerTransport
-from .server import create_mcp_server
+from mcpo_simple_server.services.mcp_core_logic.session_context import McpSessionState, bind_mcp_session
+from mcpo_simple_server.services.mcp_core_logic.live_sessions import SessionLimitExceeded, counting_send, get_live_sessions
+from mcpo_simple_server.services.mcp_core_logic.batch import handle_jsonrpc_batches
+from mcpo_simple_server.services.config.adapters.api_key_index import api_key_digest
+from mcpo_simple_server.services.mcp_core_logic.mcp_server_functions import create_mcp_server
 
 
 def setup_mcp_sse(
@@ -32,8 +38,16 @@ def setup_mcp_sse(
     # Initialize SseServerTransport with relative endpoint
     sse_transport = SseServerTransport(endpoint=endpoint)
 
-    # Mount the POST handler for messages before the GET sub-app to ensure correct routing
-    app.mount(msg_post, sse_transport.handle_post_message, name="mcp_sse_post_messages")
+    # Mount the POST handler for messages before the GET sub-app to ensure correct routing,
+    # JSON-RPC batches are split into single messages (responses go over the event stream)
+    app.mount(msg_post, partial(handle_jsonrpc_batches, sse_transport.handle_post_message, collect_responses=False),
+              name="mcp_sse_post_messages")
+
+    # One MCP server for all SSE sessions, the caller is bound per session (bind_mcp_session)
+    mcp_server = create_mcp_server("MCPoSimpleServer-SSE", "A simple MCP server for MCPoSimpleServer (SSE Transport)")
+    initialization_opts = mcp_server.create_initialization_options(
+        notification_options=NotificationOptions(prompts_changed=True, resources_changed=True, tools_changed=True)
+    )
 
     # SSE GET ASGI sub-app
     async def _sse_asgi(scope: Scope, receive: Receive, send: Send):
@@ -43,7 +57,10 @@ def setup_mcp_sse(
             await send({"type": "http.response.body", "body": b"Method Not Allowed"})
             return
 
-        # Extract and validate auth header early
+        # Authenticate once per session - handlers read the username from the session state,
+        # the session is closed when its API key is revoked (live session tracker)
+        username = None
+        credential = None
         headers = scope.get("headers", [])
         auth_header_bytes = next(
             (value for key, value in headers if key == b"authorization"),
@@ -64,7 +81,8 @@ def setup_mcp_sse(
             api_key = auth_header[7:]  # Remove "Bearer " prefix
             logger.debug(f"SSE: API key: {api_key}")
 
-            username = get_username_from_api_key(api_key)
+            user_config = await get_config_service().api_key_index.authenticate(api_key)
+            username = user_config.username if user_config else None
             logger.debug(f"SSE: Username: {username}")
             if not username:
                 logger.debug("SSE: API key is not valid or no username associated")
@@ -72,23 +90,41 @@ def setup_mcp_sse(
                 await send({"type": "http.response.body", "body": b"Unauthorized: Invalid API key"})
                 return
 
+            credential = api_key_digest(api_key)
             logger.debug(f"SSE connection request from {scope.get('client')} for path {scope.get('path')} with username: {username}")
 
-        mcp_server_instance = create_mcp_server()
-        setattr(mcp_server_instance, '_current_asgi_scope', scope)  # Attach current scope
-
-        async with sse_transport.connect_sse(scope, receive, send) as (read_stream, write_stream):
-            try:
-                initialization_opts = mcp_server_instance.create_initialization_options(
-                    notification_options=NotificationOptions(prompts_changed=True, resources_changed=True, tools_changed=True)
-                )
-                await mcp_server_instance.run(read_stream, write_stream, initialization_options=initialization_opts)
-            except Exception as e:
-                logger.error(f"Error during MCPServer run for SSE: {e}", exc_info=True)
-            finally:
-                if hasattr(mcp_server_instance, '_current_asgi_scope'):
-                    delattr(mcp_server_instance, '_current_asgi_scope')  # Clear current scope
-                logger.info(f"MCPServer (id: {id(mcp_server_instance)}) finished for SSE session.")
+        client = scope.get("client")
+        session = McpSessionState(
+            username=username,
+            client=f"{client[0]}:{client[1]}" if client else "unknown",
+            credential=credential,
+            transport="sse"
+        )
+        live_sessions = get_live_sessions()
+        try:
+            live_sessions.admit(session)
+        except SessionLimitExceeded as e:
+            await send({"type": "http.response.start", "status": e.status_code, "headers": [(b"content-type", b"text/plain")]})
+            await send({"type": "http.response.body", "body": e.detail.encode("utf-8")})
+            return
+
+        try:
+            # Cancelling the scope (idle eviction) ends the MCP server and the SSE response
+            with anyio.CancelScope() as cancel_scope:
+                async def close_session() -> None:
+                    cancel_scope.cancel()
+                session.close = close_session
+
+                async with sse_transport.connect_sse(scope, receive, counting_send(session, send)) as (read_stream, write_stream):
+                    with bind_mcp_session(session):
+                        try:
+                            await mcp_server.run(read_stream, write_stream, initialization_options=initialization_opts)
+                        except Exception as e:
+                            logger.error(f"Error during MCPServer run for SSE: {e}", exc_info=True)
+                        finally:
+                            logger.info(f"MCPServer SSE session of {session.client} (user: {username}) finished.")
+        finally:
+            live_sessions.release(session)
     # Mount ASGI sub-app for SSE GET (after POST mount)
     app.mount(prefix, _sse_asgi, name="mcp_sse_get")
     logger.info(f"MCP SSE endpoints mounted at '{sse_connect_path}' and '{sse_message_post_path}'.")
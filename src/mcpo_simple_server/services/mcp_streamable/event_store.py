@@ -0,0 +1,175 @@
+"""
+Package/Module: MCP Streamable Event Store - Bounded in-memory store for resumable streams
+
+High Level Concept:
+-------------------
+With an event store the Streamable HTTP transport numbers the SSE events it sends and
+keeps them, so a client whose connection dropped in the middle of a tool call can
+reconnect with `Last-Event-ID` and receive the rest of the response instead of calling
+the tool again.
+
+Architecture:
+-------------
+- Events are kept per session and stream (the transport's stream IDs are request IDs,
+  unique within a session only), each stream is a ring buffer of the latest events
+- All events share one byte budget and a TTL, the oldest events are evicted first
+- Replay is limited to the session the event belongs to (the session state bound to the
+  request, see session_context), events of other sessions are never replayed
+- Events of a session are dropped when the session ends
+
+Notes:
+------
+- The store lives in the memory of one worker, like the sessions it belongs to
+"""
+import time
+import itertools
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional
+from loguru import logger
+from mcp.server.streamable_http import EventCallback, EventId, EventMessage, EventStore, StreamId
+from mcp.types import JSONRPCMessage
+from mcpo_simple_server.services.mcp_core_logic.session_context import get_mcp_session
+
+
+@dataclass
+class _StoredEvent:
+    event_id: EventId
+    scope: str
+    stream_id: StreamId
+    message: Optional[JSONRPCMessage]
+    size: int
+    stored_at: float
+
+
+class InMemoryEventStore(EventStore):
+    """Event store with per-stream ring buffers, a global byte budget and TTL eviction."""
+
+    def __init__(self, max_events_per_stream: int = 256, max_bytes: int = 16 * 1024 * 1024, ttl: float = 300.0):
+        self.max_events_per_stream = max_events_per_stream
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._counter = itertools.count(1)
+        # All events, oldest first - the oldest event of a stream is also the first of its ring buffer
+        self._events: "OrderedDict[EventId, _StoredEvent]" = OrderedDict()
+        # Session scope -> stream ID -> events of the stream
+        self._streams: Dict[str, Dict[StreamId, Deque[_StoredEvent]]] = {}
+        self._bytes = 0
+        self._stats = {
+            "stored": 0,
+            "replays": 0,
+            "replay_hits": 0,
+            "replay_misses": 0,
+            "replayed_events": 0,
+            "evicted_stream_limit": 0,
+            "evicted_bytes": 0,
+            "evicted_ttl": 0,
+            "discarded": 0,
+        }
+
+    @staticmethod
+    def _current_scope() -> str:
+        session = get_mcp_session()
+        return session.key if session is not None else ""
+
+    async def store_event(self, stream_id: StreamId, message: Optional[JSONRPCMessage]) -> EventId:
+        """Store an event of a stream of the current session."""
+        scope = self._current_scope()
+        size = len(message.model_dump_json(by_alias=True, exclude_none=True)) if message is not None else 0
+        event = _StoredEvent(
+            event_id=str(next(self._counter)),
+            scope=scope,
+            stream_id=stream_id,
+            message=message,
+            size=size,
+            stored_at=time.monotonic()
+        )
+        self._events[event.event_id] = event
+        stream = self._streams.setdefault(scope, {}).setdefault(stream_id, deque())
+        stream.append(event)
+        self._bytes += size
+        self._stats["stored"] += 1
+
+        while len(stream) > self.max_events_per_stream:
+            self._remove(stream[0], "evicted_stream_limit")
+        self._evict(event.stored_at)
+        return event.event_id
+
+    async def replay_events_after(self, last_event_id: EventId, send_callback: EventCallback) -> Optional[StreamId]:
+        """Replay the events of the stream of `last_event_id` that followed it."""
+        self._evict(time.monotonic())
+        self._stats["replays"] += 1
+        last_event = self._events.get(last_event_id)
+        if last_event is None or last_event.scope != self._current_scope():
+            self._stats["replay_misses"] += 1
+            logger.debug(f"Event {last_event_id} not found for replay")
+            return None
+
+        self._stats["replay_hits"] += 1
+        stream = self._streams[last_event.scope][last_event.stream_id]
+        # Copy - events may be stored while the callback sends
+        for event in list(stream):
+            if int(event.event_id) <= int(last_event_id) or event.message is None:
+                continue
+            await send_callback(EventMessage(event.message, event.event_id))
+            self._stats["replayed_events"] += 1
+        return last_event.stream_id
+
+    def discard_session(self, scope: str) -> None:
+        """Drop all events of an ended session."""
+        streams = self._streams.get(scope)
+        if not streams:
+            return
+        for stream in list(streams.values()):
+            for event in list(stream):
+                self._remove(event, "discarded")
+
+    def _evict(self, now: float) -> None:
+        while self._events:
+            oldest = next(iter(self._events.values()))
+            if now - oldest.stored_at > self.ttl:
+                self._remove(oldest, "evicted_ttl")
+            elif self._bytes > self.max_bytes:
+                self._remove(oldest, "evicted_bytes")
+            else:
+                break
+
+    def _remove(self, event: _StoredEvent, reason: str) -> None:
+        # Events leave their stream in order, so the event is the head of its ring buffer
+        streams = self._streams[event.scope]
+        stream = streams[event.stream_id]
+        stream.popleft()
+        if not stream:
+            del streams[event.stream_id]
+            if not streams:
+                del self._streams[event.scope]
+        del self._events[event.event_id]
+        self._bytes -= event.size
+        self._stats[reason] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters of stored, replayed and evicted events and the current usage."""
+        return {
+            **self._stats,
+            "events": len(self._events),
+            "streams": sum(len(streams) for streams in self._streams.values()),
+            "sessions": len(self._streams),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "max_events_per_stream": self.max_events_per_stream,
+            "ttl": self.ttl,
+        }
+
+
+_EVENT_STORE: Optional[InMemoryEventStore] = None
+
+
+def get_event_store() -> Optional[InMemoryEventStore]:
+    """Get the event store of the stateful Streamable HTTP mount, None if disabled."""
+    return _EVENT_STORE
+
+
+def set_event_store(event_store: Optional[InMemoryEventStore]) -> None:
+    """Set (or clear) the event store of the stateful Streamable HTTP mount."""
+    global _EVENT_STORE
+    _EVENT_STORE = event_store
@@ -0,0 +1,71 @@
+"""
+Package/Module: MCP Streamable Sessions - Principals of open Streamable HTTP sessions
+
+High Level Concept:
+-------------------
+A Streamable HTTP session is authenticated once, by the request opening it. Its
+McpSessionState is bound to the context of the session (the MCP server task of the
+session inherits it), and registered here under the MCP session ID, so later requests
+of the session only have to prove they come from the same caller.
+
+Architecture:
+-------------
+- StreamableSessionRegistry: MCP session ID -> McpSessionState
+- Ownership: a request of a session must carry the credential that opened it (compared
+  by API key digest), otherwise it is answered like an unknown session (404)
+- Revocation: sessions of deleted / revoked API keys are marked revoked by the live
+  session tracker (mcp_core_logic.live_sessions) and refused from then on
+
+Notes:
+------
+- Sessions are forgotten when their MCP server task ends (see server.custom_lifespan)
+"""
+import hmac
+from typing import Dict, Optional
+from loguru import logger
+from mcpo_simple_server.services.mcp_core_logic.session_context import McpSessionState
+
+
+class StreamableSessionRegistry:
+    """Authenticated principals of the open Streamable HTTP sessions."""
+
+    def __init__(self) -> None:
+        self._sessions: Dict[str, McpSessionState] = {}
+
+    def register(self, session_id: str, state: McpSessionState) -> None:
+        """Register the state of a session opened by the current request."""
+        state.session_id = session_id
+        self._sessions[session_id] = state
+        logger.debug(f"MCP Streamable session {session_id} opened by user: {state.username}")
+
+    def get(self, session_id: str) -> Optional[McpSessionState]:
+        """Get the state of an open session."""
+        return self._sessions.get(session_id)
+
+    def forget(self, state: McpSessionState) -> None:
+        """Drop a session whose MCP server task ended."""
+        if state.session_id is not None and self._sessions.get(state.session_id) is state:
+            del self._sessions[state.session_id]
+            logger.debug(f"MCP Streamable session {state.session_id} of user {state.username} closed")
+
+    @staticmethod
+    def is_owner(state: McpSessionState, credential: Optional[str]) -> bool:
+        """Check that a request carries the credential (API key digest) that opened the session."""
+        if state.credential is None or credential is None:
+            return state.credential is None and credential is None
+        return hmac.compare_digest(state.credential, credential)
+
+    def close(self) -> None:
+        """Forget all sessions."""
+        self._sessions.clear()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+_SESSION_REGISTRY = StreamableSessionRegistry()
+
+
+def get_session_registry() -> StreamableSessionRegistry:
+    """Get the registry of open Streamable HTTP sessions."""
+    return _SESSION_REGISTRY
@@ -11,63 +11,107 @@ Architecture:
 - Direct integration with FastAPI lifecycle
 - Synchronous initialization of session manager
 - Simple ASGI application that handles HTTP requests
+- The request opening a session is authenticated, its principal is bound to the session
+  (contextvar of the session task + StreamableSessionRegistry by MCP session ID), later
+  requests of the session are only checked to carry the same credential
+- Two mounts can serve the same MCP server side by side: the stateful one (/api/v1/mcp)
+  and a stateless one (MCP_STREAMABLE_STATELESS_PATH) where every request is authenticated
+  and served on its own, so request/response tool traffic needs no session affinity and
+  can be balanced round-robin across workers and nodes
+- The stateful mount keeps sent events in a bounded InMemoryEventStore, so clients can
+  resume a dropped stream with Last-Event-ID instead of calling the tool again
+- Stateful sessions are admitted by the live session tracker (caps, idle eviction)
+- JSON-RPC batch arrays are accepted on both mounts, their messages run concurrently and
+  are answered as one JSON array (mcp_core_logic.batch)
 
 Workflow:
 ---------
 1. Create the MCP server using the McpServerService
-2. Create and initialize the session manager during startup
-3. Mount the ASGI handler at the specified path
+2. Create and initialize a session manager per mount during startup
+3. Mount the ASGI handlers at the specified paths
 4. Handle MCP requests through the mounted endpoint
 """
 
 from mcpo_simple_server.logger import logger
 from mcpo_simple_server.services.mcpserver import get_mcpserver_service
-from mcpo_simple_server.services.mcp_streamable.server import create_mcp_server, _request_usernames
-from mcpo_simple_server.services.auth.api_key import get_username_from_api_key
-from typing import Optional, Dict
-from contextlib import asynccontextmanager
+from mcpo_simple_server.services.mcp_streamable.server import custom_lifespan
+from mcpo_simple_server.services.mcp_core_logic.mcp_server_functions import create_mcp_server
+from mcpo_simple_server.services.mcp_streamable.sessions import get_session_registry
+from mcpo_simple_server.services.mcp_streamable.event_store import InMemoryEventStore, set_event_store
+from mcpo_simple_server.services.mcp_core_logic.session_context import McpSessionState, bind_mcp_session
+from mcpo_simple_server.services.mcp_core_logic.live_sessions import SessionLimitExceeded, counting_send, get_live_sessions
+from mcpo_simple_server.services.mcp_core_logic.batch import handle_jsonrpc_batches
+from mcpo_simple_server.services.config.adapters.api_key_index import api_key_digest
+from mcpo_simple_server.services import get_config_service
+from mcpo_simple_server.config import (
+    MCP_STREAMABLE_JSON_RESPONSE,
+    MCP_STREAMABLE_STATELESS_PATH,
+    MCP_STREAMABLE_STATELESS_JSON_RESPONSE,
+    MCP_STREAMABLE_EVENT_STORE,
+    MCP_STREAMABLE_EVENT_STORE_MAX_EVENTS,
+    MCP_STREAMABLE_EVENT_STORE_MAX_BYTES,
+    MCP_STREAMABLE_EVENT_STORE_TTL,
+    MCP_SESSION_IDLE_TIMEOUT
+)
+from typing import Dict, Optional
+from functools import partial
+from contextlib import AsyncExitStack, asynccontextmanager
 from fastapi import FastAPI
-from starlette.types import Scope, Receive, Send
+from starlette.types import Message, Scope, Receive, Send
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 
 
-# Global session manager instance
-_session_manager: Optional[StreamableHTTPSessionManager] = None
+# Global session manager instances, by stateless mode
+_session_managers: Dict[bool, StreamableHTTPSessionManager] = {}
 
-# Store authenticated usernames by session ID
-_authenticated_users: Dict[str, str] = {}
 
-
-def get_session_manager() -> Optional[StreamableHTTPSessionManager]:
-    """Get the global session manager instance."""
-    global _session_manager  # pylint: disable=global-variable-not-assigned
-    if _session_manager is None:
+def get_session_manager(stateless: bool = False) -> Optional[StreamableHTTPSessionManager]:
+    """Get the global session manager instance of the stateful (default) or stateless mount."""
+    session_manager = _session_managers.get(stateless)
+    if session_manager is None:
         raise ValueError("Session manager not initialized")
-    return _session_manager
+    return session_manager
+
+
+async def _send_text_response(send: Send, status: int, body: bytes) -> None:
+    await send({"type": "http.response.start", "status": status, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _terminate_session(session_id: str) -> None:
+    """Terminate an open session of the stateful mount like a client does (DELETE), its server task ends and forgets it."""
+    session_manager = _session_managers.get(False)
+    if session_manager is None:
+        return
+    scope: Scope = {
+        "type": "http",
+        "method": "DELETE",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(b"mcp-session-id", session_id.encode("latin-1"))],
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def discard(_message: Message) -> None:
+        pass
+    await session_manager.handle_request(scope, receive, discard)
 
 
 class MCPStreamableHandler:
     """ASGI handler for MCP Streamable HTTP requests."""
 
-    def __init__(self):
-        # The session manager will be accessed via the global _session_manager
+    def __init__(self, stateless: bool = False):
+        # The session manager will be accessed via the global _session_managers
         # in the __call__ method, after the lifespan has initialized it.
+        self.stateless = stateless
         logger.debug("MCPStreamableHandler instance created. Session manager will be accessed at request time via global.")
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Handle an ASGI HTTP request."""
-        global _session_manager  # pylint: disable=global-variable-not-assigned
-
         if scope["type"] != "http":
-            await send({
-                "type": "http.response.start",
-                "status": 400,
-                "headers": [(b"content-type", b"text/plain")]
-            })
-            await send({
-                "type": "http.response.body",
-                "body": b"Only HTTP requests are supported"
-            })
+            await _send_text_response(send, 400, b"Only HTTP requests are supported")
             return
 
         # Log request details
@@ -75,90 +119,116 @@ class MCPStreamableHandler:
         method = scope.get("method", "<unknown>")
         logger.debug(f"MCP Streamable handling {method} request for {path}")
 
-        # Extract and validate auth header
+        # Ensure session manager is available
+        session_manager = _session_managers.get(self.stateless)
+        if not session_manager:
+            logger.error("Session manager not initialized")
+            await _send_text_response(send, 503, b"MCP session manager not initialized")
+            return
+
         headers = scope.get("headers", [])
-        auth_header_bytes = next(
-            (value for key, value in headers if key == b"authorization"),
-            None
-        )
+        auth_header_bytes = next((value for key, value in headers if key == b"authorization"), None)
+        session_id_bytes = next((value for key, value in headers if key == b"mcp-session-id"), None)
 
-        # Store username in scope for the MCP server to access
-        username = None
+        api_key: Optional[str] = None
         if auth_header_bytes:
             auth_header = auth_header_bytes.decode("utf-8")
-            if auth_header.lower().startswith("bearer "):
-                api_key = auth_header[7:]  # Remove "Bearer " prefix
-                username = get_username_from_api_key(api_key)
-                if username:
-                    logger.debug(f"Authenticated request from user: {username}")
-                    # Use the existing MCP server instance from session manager
-                    mcp_server_instance = _session_manager.app  # type: ignore
-                    _request_usernames[id(mcp_server_instance)] = username
-                    logger.debug(f"Stored username for server instance {id(mcp_server_instance)}")
-                else:
-                    logger.debug("Invalid API key provided")
-                    await send({
-                        "type": "http.response.start",
-                        "status": 401,
-                        "headers": [(b"content-type", b"text/plain")]
-                    })
-                    await send({
-                        "type": "http.response.body",
-                        "body": b"Unauthorized: Invalid API key"
-                    })
-                    return
-            else:
+            if not auth_header.lower().startswith("bearer "):
                 logger.debug("Authorization header is not a Bearer token")
-                await send({
-                    "type": "http.response.start",
-                    "status": 401,
-                    "headers": [(b"content-type", b"text/plain")]
-                })
-                await send({
-                    "type": "http.response.body",
-                    "body": b"Unauthorized: Invalid Authorization format"
-                })
+                await _send_text_response(send, 401, b"Unauthorized: Invalid Authorization format")
+                return
+            api_key = auth_header[7:]  # Remove "Bearer " prefix
+        credential = api_key_digest(api_key) if api_key else None
+
+        registry = get_session_registry()
+        session = None
+        if session_id_bytes and not self.stateless:
+            session = registry.get(session_id_bytes.decode("latin-1"))
+        if session is not None:
+            # Request of an open session - authenticated when the session was opened
+            if not registry.is_owner(session, credential):
+                logger.debug(f"Credential does not match the one that opened session {session.session_id}")
+                await _send_text_response(send, 404, b"Session not found")
+                return
+            if session.revoked:
+                await _send_text_response(send, 401, b"Unauthorized: API key revoked")
                 return
+            # Bound again - events stored / replayed by this request are scoped to the session
+            with bind_mcp_session(session):
+                await self._forward(session_manager, scope, receive, counting_send(session, send))
+            return
+
+        # Request opening a session (or of an unknown session, answered by the session manager),
+        # on the stateless mount every request
+        username = None
+        if api_key:
+            user_config = await get_config_service().api_key_index.authenticate(api_key)
+            username = user_config.username if user_config else None
+            if not username:
+                logger.debug("Invalid API key provided")
+                await _send_text_response(send, 401, b"Unauthorized: Invalid API key")
+                return
+            logger.debug(f"Authenticated request from user: {username}")
         else:
             logger.debug("No Authorization header found - allowing anonymous access")
 
-        # Ensure session manager is available
-        if not _session_manager:
-            logger.error("Session manager not initialized")
-            await send({
-                "type": "http.response.start",
-                "status": 503,
-                "headers": [(b"content-type", b"text/plain")]
-            })
-            await send({
-                "type": "http.response.body",
-                "body": b"MCP session manager not initialized"
-            })
+        client = scope.get("client")
+        session = McpSessionState(
+            username=username,
+            client=f"{client[0]}:{client[1]}" if client else "unknown",
+            credential=credential,
+            transport="streamable-http-stateless" if self.stateless else "streamable-http"
+        )
+        if self.stateless:
+            with bind_mcp_session(session):
+                await self._forward(session_manager, scope, receive, send)
+            return
+
+        live_sessions = get_live_sessions()
+        try:
+            live_sessions.admit(session)
+        except SessionLimitExceeded as e:
+            await _send_text_response(send, e.status_code, e.detail.encode("utf-8"))
             return
 
+        async def send_registering_session(message: Message) -> None:
+            # The session ID is assigned by the session manager in the response to the opening request
+            if message["type"] == "http.response.start" and session.session_id is None:
+                new_session_id = next(
+                    (value for key, value in message.get("headers", []) if key.lower() == b"mcp-session-id"),
+                    None
+                )
+                if new_session_id:
+                    registry.register(new_session_id.decode("latin-1"), session)
+                    session.close = partial(_terminate_session, session.session_id)
+            await send(message)
+
+        # The MCP server task of a new session is started from this context and keeps the binding
         try:
-            # Forward the request to the MCP session manager
-            await _session_manager.handle_request(scope, receive, send)
+            with bind_mcp_session(session):
+                await self._forward(session_manager, scope, receive, counting_send(session, send_registering_session))
+        finally:
+            if session.session_id is None:
+                # No session was established (e.g. not an initialize request)
+                live_sessions.release(session)
+
+    @staticmethod
+    async def _forward(session_manager: StreamableHTTPSessionManager, scope: Scope, receive: Receive, send: Send) -> None:
+        """Forward the request to the MCP session manager."""
+        path = scope.get("path", "<unknown>")
+        method = scope.get("method", "<unknown>")
+        try:
+            # JSON-RPC batches are split into concurrent single-message requests
+            await handle_jsonrpc_batches(session_manager.handle_request, scope, receive, send)
             logger.debug(f"MCP Streamable successfully handled {method} request for {path}")
         except Exception as e:
             logger.error(f"Error in MCP Streamable HTTP request: {e}")
-            # Return a 500 error response
-            await send({
-                "type": "http.response.start",
-                "status": 500,
-                "headers": [(b"content-type", b"text/plain")]
-            })
-            await send({
-                "type": "http.response.body",
-                "body": f"MCP Streamable Error: {str(e)}".encode("utf-8")
-            })
+            await _send_text_response(send, 500, f"MCP Streamable Error: {str(e)}".encode("utf-8"))
 
 
 @asynccontextmanager
 async def mcp_streamable_lifespan():
     """Lifespan context manager for MCP Streamable HTTP."""
-    global _session_manager
-
     # Get the McpServerService
     mcpserver_service = get_mcpserver_service()
     if not mcpserver_service:
@@ -168,37 +238,65 @@ async def mcp_streamable_lifespan():
 
     # Create the MCP server
     logger.debug("Creating MCP server for Streamable HTTP integration")
-    mcp_server = create_mcp_server()
+    mcp_server = create_mcp_server("MCPoSimpleServer", lifespan=custom_lifespan)
 
-    # Create the session manager
-    logger.debug("Creating session manager for Streamable HTTP integration")
-    _session_manager = StreamableHTTPSessionManager(
+    # Create the session managers, both serve the same MCP server
+    logger.debug("Creating session managers for Streamable HTTP integration")
+    event_store = None
+    if MCP_STREAMABLE_EVENT_STORE:
+        event_store = InMemoryEventStore(
+            max_events_per_stream=MCP_STREAMABLE_EVENT_STORE_MAX_EVENTS,
+            max_bytes=MCP_STREAMABLE_EVENT_STORE_MAX_BYTES,
+            ttl=MCP_STREAMABLE_EVENT_STORE_TTL
+        )
+    set_event_store(event_store)
+    _session_managers[False] = StreamableHTTPSessionManager(
         app=mcp_server,
-        json_response=False,  # Use SSE streaming by default
-        stateless=False,      # Use stateful mode for session tracking
+        event_store=event_store,                     # Resumable streams (Last-Event-ID)
+        json_response=MCP_STREAMABLE_JSON_RESPONSE,  # SSE streaming by default
+        stateless=False,                             # Stateful mode for session tracking
+        session_idle_timeout=MCP_SESSION_IDLE_TIMEOUT or None,
     )
+    if MCP_STREAMABLE_STATELESS_PATH:
+        _session_managers[True] = StreamableHTTPSessionManager(
+            app=mcp_server,
+            json_response=MCP_STREAMABLE_STATELESS_JSON_RESPONSE,
+            stateless=True,
+        )
 
     try:
-        # Run the session manager in the lifespan context
-        logger.info("Starting MCP Streamable HTTP session manager")
-        async with _session_manager.run():
-            logger.info("MCP Streamable HTTP session manager initialized and running")
+        # Run the session managers in the lifespan context
+        logger.info("Starting MCP Streamable HTTP session managers")
+        async with AsyncExitStack() as stack:
+            for session_manager in _session_managers.values():
+                await stack.enter_async_context(session_manager.run())
+            logger.info(f"MCP Streamable HTTP session managers initialized and running (stateless: {True in _session_managers})")
             yield
     except Exception as e:
         logger.error(f"Error in MCP Streamable HTTP integration: {e}")
     finally:
         logger.info("Shutting down MCP Streamable HTTP session manager")
-        _session_manager = None
+        get_session_registry().close()
+        _session_managers.clear()
+        set_event_store(None)
 
 
-def setup_mcp_streamable(app: FastAPI, mount_path: str = "/api/v1/mcp") -> None:
+def setup_mcp_streamable(
+    app: FastAPI,
+    mount_path: str = "/api/v1/mcp",
+    stateless_mount_path: Optional[str] = MCP_STREAMABLE_STATELESS_PATH
+) -> None:
     """
-    Mounts the MCP Streamable HTTP handler to the FastAPI application.
+    Mounts the MCP Streamable HTTP handlers to the FastAPI application.
     The MCP session manager lifecycle should be handled by the main application's lifespan.
 
     Args:
         app: The FastAPI application
-        mount_path: The path to mount the MCP Streamable HTTP endpoint
+        mount_path: The path to mount the stateful MCP Streamable HTTP endpoint
+        stateless_mount_path: The path to mount the stateless endpoint, None / empty to skip it
     """
     logger.info(f"Mounting MCP Streamable HTTP handler at {mount_path}")
     app.mount(mount_path, MCPStreamableHandler())
+    if stateless_mount_path:
+        logger.info(f"Mounting stateless MCP Streamable HTTP handler at {stateless_mount_path}")
+        app.mount(stateless_mount_path, MCPStreamableHandler(stateless=True))
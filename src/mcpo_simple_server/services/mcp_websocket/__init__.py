@@ -0,0 +1,25 @@
+"""
+Package/Module: mcp_websocket - MCP WebSocket Transport Service
+
+High Level Concept:
+-------------------
+This package implements an MCP transport over one WebSocket per session, next to the SSE
+and Streamable HTTP transports. Messages flow in both directions over the same socket and
+the caller is authenticated once at the handshake, which keeps the per-message overhead
+and the connection count of chatty agents low.
+
+Architecture:
+-------------
+- Server: The MCP server shared by all WebSocket sessions (mcp_core_logic create_mcp_server,
+  same as SSE).
+- Setup: Authenticates the handshake and runs the server bound to the session state.
+
+Usage Example:
+--------------
+>>> from mcpo_simple_server.services.mcp_websocket import setup_mcp_websocket
+>>> setup_mcp_websocket(app, path="/api/v1/ws")
+"""
+
+from .setup import setup_mcp_websocket
+
+__all__ = ["setup_mcp_websocket"]
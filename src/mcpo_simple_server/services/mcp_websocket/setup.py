@@ -0,0 +1,159 @@
+"""
+Package/Module: MCP WebSocket Setup - FastAPI integration for the MCP WebSocket transport
+
+High Level Concept:
+-------------------
+One WebSocket per MCP session carries the messages in both directions. The caller is
+authenticated once, at the handshake, instead of per POSTed message as with SSE, so
+chatty agents pay neither HTTP request parsing nor authentication per message and hold
+one connection instead of two.
+
+Architecture:
+-------------
+- Handshake: Bearer API key in the Authorization header (anonymous without), refused
+  with HTTP 401 / 429 / 503 before the socket is accepted
+- Session: McpSessionState bound around the shared MCP server run (session_context),
+  admitted by the live session tracker (caps, idle eviction, listing), closed with 1008
+  once its API key is revoked
+- Framing: one JSON-RPC message per text (or binary) frame, subprotocol "mcp"
+- Compression: permessage-deflate is negotiated by the ASGI server
+  (MCP_WEBSOCKET_PER_MESSAGE_DEFLATE, passed to uvicorn)
+"""
+import anyio
+from fastapi import FastAPI
+from pydantic import ValidationError
+from starlette.responses import PlainTextResponse
+from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
+from mcp.server.lowlevel.server import NotificationOptions, Server as MCPServer
+from mcp.shared.message import SessionMessage
+from mcp.types import JSONRPCMessage
+from mcpo_simple_server.logger import logger
+from mcpo_simple_server.services import get_config_service
+from mcpo_simple_server.services.mcp_core_logic.session_context import McpSessionState, bind_mcp_session
+from mcpo_simple_server.services.mcp_core_logic.live_sessions import SessionLimitExceeded, get_live_sessions
+from mcpo_simple_server.services.mcp_core_logic.mcp_server_functions import create_mcp_server
+from mcpo_simple_server.services.config.adapters.api_key_index import api_key_digest
+
+
+async def _deny(websocket: WebSocket, status_code: int, detail: str) -> None:
+    """Refuse the handshake with an HTTP response (or a policy violation close if unsupported)."""
+    if "websocket.http.response" in websocket.scope.get("extensions", {}):
+        await websocket.send_denial_response(PlainTextResponse(detail, status_code=status_code))
+    else:
+        await websocket.close(code=1008, reason=detail)
+
+
+async def _run_session(websocket: WebSocket, mcp_server: MCPServer, initialization_opts, session: McpSessionState) -> None:
+    """Run the MCP server over an accepted WebSocket until either side closes."""
+    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+
+    async def ws_reader() -> None:
+        async with read_stream_writer:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                data = message.get("text")
+                if data is None:
+                    data = message.get("bytes") or b""
+                try:
+                    client_message = JSONRPCMessage.model_validate_json(data)
+                except ValidationError as exc:
+                    await read_stream_writer.send(exc)
+                    continue
+                await read_stream_writer.send(SessionMessage(client_message))
+
+    async def ws_writer() -> None:
+        async with write_stream_reader:
+            async for session_message in write_stream_reader:
+                text = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                session.bytes_sent += len(text.encode("utf-8"))
+                try:
+                    await websocket.send_text(text)
+                except WebSocketDisconnect:
+                    return
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(ws_reader)
+        tg.start_soon(ws_writer)
+        try:
+            await mcp_server.run(read_stream, write_stream, initialization_opts)
+        finally:
+            tg.cancel_scope.cancel()
+
+
+def setup_mcp_websocket(app: FastAPI, path: str = "/api/v1/ws") -> None:
+    """
+    Sets up the MCP WebSocket endpoint for the FastAPI application.
+
+    Args:
+        app: The FastAPI application instance.
+        path: The path where clients open the WebSocket of an MCP session.
+    """
+    # One MCP server for all WebSocket sessions, the caller is bound per session (bind_mcp_session)
+    mcp_server = create_mcp_server("MCPoSimpleServer-WebSocket", "A simple MCP server for MCPoSimpleServer (WebSocket Transport)")
+    initialization_opts = mcp_server.create_initialization_options(
+        notification_options=NotificationOptions(prompts_changed=True, resources_changed=True, tools_changed=True)
+    )
+
+    async def _websocket_endpoint(websocket: WebSocket) -> None:
+        # Authenticate once per session - handlers read the username from the session state,
+        # the session is closed when its API key is revoked (live session tracker)
+        username = None
+        credential = None
+        auth_header = websocket.headers.get("authorization")
+        if auth_header:
+            if not auth_header.lower().startswith("bearer "):
+                logger.debug("WebSocket: Authorization header is not a Bearer token")
+                await _deny(websocket, 401, "Unauthorized: Invalid Authorization format")
+                return
+            user_config = await get_config_service().api_key_index.authenticate(auth_header[7:])
+            username = user_config.username if user_config else None
+            if not username:
+                logger.debug("WebSocket: API key is not valid or no username associated")
+                await _deny(websocket, 401, "Unauthorized: Invalid API key")
+                return
+            credential = api_key_digest(auth_header[7:])
+
+        client = websocket.client
+        session = McpSessionState(
+            username=username,
+            client=f"{client.host}:{client.port}" if client else "unknown",
+            credential=credential,
+            transport="websocket"
+        )
+        live_sessions = get_live_sessions()
+        try:
+            live_sessions.admit(session)
+        except SessionLimitExceeded as e:
+            await _deny(websocket, e.status_code, e.detail)
+            return
+
+        try:
+            subprotocol = "mcp" if "mcp" in websocket.scope.get("subprotocols", []) else None
+            await websocket.accept(subprotocol=subprotocol)
+            logger.debug(f"WebSocket session of {session.client} (user: {username}) opened")
+
+            # Cancelling the scope (idle eviction, revocation) ends the MCP server, the socket is closed below
+            with anyio.CancelScope() as cancel_scope:
+                async def close_session() -> None:
+                    cancel_scope.cancel()
+                session.close = close_session
+
+                with bind_mcp_session(session):
+                    try:
+                        await _run_session(websocket, mcp_server, initialization_opts, session)
+                    except Exception as e:
+                        logger.error(f"Error during MCPServer run for WebSocket: {e}", exc_info=True)
+        finally:
+            live_sessions.release(session)
+            if websocket.application_state == WebSocketState.CONNECTED and websocket.client_state == WebSocketState.CONNECTED:
+                await websocket.close(code=1008 if session.revoked else 1000)
+            logger.info(f"MCPServer WebSocket session of {session.client} (user: {username}) finished.")
+
+    app.add_api_websocket_route(path, _websocket_endpoint, name="mcp_websocket")
+    logger.info(f"MCP WebSocket endpoint mounted at '{path}'.")
+
+
+__all__ = ["setup_mcp_websocket"]
@@ -25,9 +25,10 @@ Notes:
 This module contains operations that should only be accessible to system administrators.
 """
 import datetime
-from typing import Dict, List, Any, TYPE_CHECKING
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from loguru import logger
 from mcpo_simple_server.services.config import get_config_service
+from mcpo_simple_server.services.config.events import ConfigEventType
 from mcpo_simple_server.services.mcpserver.models import McpServerModel
 if TYPE_CHECKING:
     from mcpo_simple_server.services.mcpserver import McpServerService
@@ -67,12 +68,15 @@ class McpServerAdminManager:
         """
         logger.info("Loading all MCP mcpservers from configuration")
         try:
-            # Get all user configurations
-            config = await self.config_service.user_config.get_all_users_configs()
+            # Light index of all users, full configs are loaded only for users with mcpservers
+            users_index = await self.config_service.user_config.get_users_index()
             loaded_count = 0
 
-            for username, user_config in config.items():
-                if user_config.disabled:
+            for username, user_entry in users_index.items():
+                if user_entry.disabled or not user_entry.mcpservers:
+                    continue
+                user_config = await self.config_service.user_config.get_config(username)
+                if user_config is None or user_config.disabled:
                     continue
 
                 mcpservers: Dict[str, McpServerConfigModel] = getattr(user_config, "mcpServers", {})
@@ -80,28 +84,10 @@ class McpServerAdminManager:
                     # Build mcpserver identifier
                     mcpserver_id = f"{server_name}-{username}"
 
-                    self._mcpservers[mcpserver_id] = McpServerModel(
-                        name=server_name,
-                        command=server_config.command,
-                        args=server_config.args or [],
-                        env=server_config.env or {},
-                        description=server_config.description or "",
-                        username=username,
-                        type=server_config.mcpserver_type or "private",
-                        status="configured",
-                        tools_blacklist=getattr(server_config, "tools_blacklist", []),
-                        disabled=getattr(server_config, "disabled", False),
-                        pid=None,
-                        start_time=None,
-                        last_activity=None,
-                        process=None
-                    )
                     # Load cached tools if available
                     try:
-                        tools_cache = await self.config_service.tools_cache.get_tool_cache(mcpserver_id)
-                        if tools_cache:
-                            self._mcpservers[mcpserver_id].tools = tools_cache
-                            logger.info(f"Loaded {len(tools_cache)} tools from cache for {mcpserver_id}")
+                        if await self._register_configured_mcpserver(username, server_name, server_config):
+                            logger.info(f"Loaded {len(self._mcpservers[mcpserver_id].tools)} tools from cache for {mcpserver_id}")
                         else:
                             # If no tool cache is available, start the server and discover tools
                             logger.info(f"Tool cache not found for MCP server '{mcpserver_id}', starting server to discover tools")
@@ -119,6 +105,11 @@ class McpServerAdminManager:
                     logger.info(f"Loaded MCP mcpserver metadata: {mcpserver_id}")
 
             logger.info(f"Loaded {loaded_count} MCP mcpservers from configuration")
+            memory_report = self.parent.tools.get_tools_memory_report()
+            logger.info(
+                f"Tool definitions: {memory_report['references']} references, {memory_report['unique_definitions']} unique - "
+                f"{memory_report['bytes_without_dedup']} bytes without dedup, {memory_report['bytes_with_dedup']} bytes with dedup"
+            )
             return {
                 "status": "success",
                 "message": f"Loaded {loaded_count} MCP mcpservers from configuration",
@@ -132,6 +123,77 @@ class McpServerAdminManager:
                 "message": f"Failed to load MCP mcpservers: {str(e)}"
             }
 
+    async def _register_configured_mcpserver(
+        self, username: str, server_name: str, server_config: "McpServerConfigModel"
+    ) -> bool:
+        """
+        Register a configured (not started) mcpserver with the tools of its tool cache.
+
+        Returns:
+            True if cached tools were found
+        """
+        mcpserver_id = f"{server_name}-{username}"
+        self._mcpservers[mcpserver_id] = McpServerModel(
+            name=server_name,
+            command=server_config.command,
+            args=server_config.args or [],
+            env=server_config.env or {},
+            transport=server_config.transport or "stdio",
+            url=server_config.url,
+            headers=server_config.headers or {},
+            description=server_config.description or "",
+            username=username,
+            type=server_config.mcpserver_type or "private",
+            status="configured",
+            tools_blacklist=getattr(server_config, "tools_blacklist", []),
+            disabled=getattr(server_config, "disabled", False),
+            pid=None,
+            start_time=None,
+            last_activity=None,
+            process=None
+        )
+        tools_cache = await self.config_service.tools_cache.get_tool_cache(mcpserver_id)
+        if tools_cache:
+            self._mcpservers[mcpserver_id].tools = tools_cache
+            return True
+        return False
+
+    async def sync_user_mcpservers(self, username: Optional[str] = None) -> None:
+        """
+        Sync the registered mcpservers of a user (all users if None) with the stored config,
+        after it was changed by another node sharing the storage.
+
+        Newly configured mcpservers are registered as configured (started on first use),
+        mcpservers removed from the config (or of a deleted / disabled user) are stopped and deleted.
+        """
+        if username is None:
+            usernames = set(await self.config_service.user_config.get_users_index())
+            usernames.update(mcpserver.username for mcpserver in self._mcpservers.values())
+            for name in usernames:
+                await self.sync_user_mcpservers(name)
+            return
+
+        user_config = await self.config_service.user_config.get_config(username)
+        configured: Dict[str, McpServerConfigModel] = {}
+        if user_config is not None and not user_config.disabled:
+            configured = user_config.mcpServers or {}
+
+        for server_name, server_config in configured.items():
+            mcpserver_id = f"{server_name}-{username}"
+            if mcpserver_id in self._mcpservers:
+                continue
+            try:
+                await self._register_configured_mcpserver(username, server_name, server_config)
+                logger.info(f"Registered MCP mcpserver '{mcpserver_id}' added on another node")
+                await self.config_service.events.publish(ConfigEventType.SERVER_CHANGED, username=username, mcpserver_id=mcpserver_id)
+            except Exception as e:
+                logger.error(f"Failed to register MCP mcpserver '{mcpserver_id}': {str(e)}")
+
+        for mcpserver_id, mcpserver in list(self._mcpservers.items()):
+            if mcpserver.username == username and mcpserver.name not in configured:
+                logger.info(f"Removing MCP mcpserver '{mcpserver_id}' deleted on another node")
+                await self.parent.controller.delete_mcpserver(mcpserver.name, username)
+
     async def start_all_mcpservers(self, disabled: bool = False) -> Dict[str, Any]:
         """
         Start all configured MCP mcpservers.
@@ -167,7 +229,7 @@ class McpServerAdminManager:
                 continue
 
             # Skip already running mcpservers
-            if mcpserver.status == "running" and mcpserver.process and mcpserver.process.returncode is None:
+            if mcpserver.status == "running" and self.parent.process_manager.is_running(mcpserver_id):
                 results["mcpservers"][mcpserver_id] = {
                     "status": "skipped",
                     "message": "Mcpserver is already running"
@@ -223,7 +285,7 @@ class McpServerAdminManager:
 
         for mcpserver_id, mcpserver in self._mcpservers.items():
             # Skip mcpservers that are not running
-            if mcpserver.status != "running" or not mcpserver.process or mcpserver.process.returncode is not None:
+            if mcpserver.status != "running" or not self.parent.process_manager.is_running(mcpserver_id):
                 results["mcpservers"][mcpserver_id] = {
                     "status": "skipped",
                     "message": "Mcpserver is not running"
@@ -271,8 +333,8 @@ class McpServerAdminManager:
         logger.info(f"Updating global tool blacklist: {', '.join(tools)}")
 
         try:
-            # Update in-memory blacklist
-            self.parent.global_blacklist_tools = tools
+            # Update in-memory blacklist (in place - the list is shared by the subservices)
+            self.parent.global_blacklist_tools[:] = tools
 
             # Update in configuration
             config = await self.config_service.global_config.get_config()
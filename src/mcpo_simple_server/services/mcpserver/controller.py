@@ -32,6 +32,7 @@ from loguru import logger
 from fastapi import HTTPException
 from mcpo_simple_server.services.mcpserver.models import McpServerModel
 from mcpo_simple_server.services.config import get_config_service
+from mcpo_simple_server.services.config.events import ConfigEventType
 if TYPE_CHECKING:
     from mcpo_simple_server.services.mcpserver import McpServerService
     from mcpo_simple_server.services.config import ConfigService
@@ -83,6 +84,9 @@ class McpServerController:
                 command=mcpserver_model.command,
                 args=mcpserver_model.args,
                 env=mcpserver_model.env,
+                transport=mcpserver_model.transport,
+                url=mcpserver_model.url,
+                headers=mcpserver_model.headers,
                 description=mcpserver_model.description,
                 tools_blacklist=mcpserver_model.tools_blacklist,
                 disabled=mcpserver_model.disabled,
@@ -101,7 +105,8 @@ class McpServerController:
             self._mcpservers[mcpserver_id].start_time = datetime.datetime.now()
         except Exception as e:
             logger.error(f"Failed to start mcpserver {mcpserver_name} for user {mcpserver_model.username}: {str(e)}")
-            del self._mcpservers[mcpserver_id]
+            self._mcpservers.pop(mcpserver_id, None)
+            await self.config_service.events.publish(ConfigEventType.SERVER_CHANGED, username=mcpserver_model.username, mcpserver_id=mcpserver_id)
             raise
 
         logger.debug(f"McpServer '{mcpserver_name}' started successfully (PID: {self._mcpservers[mcpserver_id].pid}) - status: {self._mcpservers[mcpserver_id].status}")
@@ -138,6 +143,7 @@ class McpServerController:
 
         # Remove mcpserver from controller
         del self._mcpservers[mcpserver_id]
+        await self.config_service.events.publish(ConfigEventType.SERVER_CHANGED, username=username, mcpserver_id=mcpserver_id)
 
         return {"status": "success", "message": f"McpServer '{mcpserver_name}' deleted successfully"}
 
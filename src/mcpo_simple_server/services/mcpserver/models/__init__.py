@@ -1,4 +1,4 @@
 from .mcpserver import McpServerModel, McpServersListResponse
-from .mcpotool import MCPoTool
+from .mcpotool import MCPoTool, MCPoToolSearchResult
 
-__all__ = ["McpServerModel", "McpServersListResponse", "MCPoTool"]
+__all__ = ["McpServerModel", "McpServersListResponse", "MCPoTool", "MCPoToolSearchResult"]
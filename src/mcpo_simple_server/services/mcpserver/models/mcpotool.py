@@ -10,3 +10,7 @@ class MCPoTool(BaseModel):
 
     class Config:
         extra = "allow"
+
+
+class MCPoToolSearchResult(MCPoTool):
+    score: float
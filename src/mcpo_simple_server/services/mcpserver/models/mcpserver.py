@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field, validator
 import datetime
 import subprocess
 import asyncio
+from mcpo_simple_server.utils.tools.tool_definition_store import get_tool_definition_store
 
 
 class McpServerModel(BaseModel):
@@ -14,14 +15,17 @@ class McpServerModel(BaseModel):
     This model is used for both global and user-specific servers.
     """
     name: str = Field(..., description="The name of the MCP server")
-    command: str = Field(..., description="The command to run the server")
+    command: str = Field("", description="The command to run the server (stdio transport)")
     args: List[str] = Field(default_factory=list, description="Command line arguments")
     env: Dict[str, str] = Field(default_factory=dict, description="Environment variables")
+    transport: str = Field("stdio", description="MCP transport: 'stdio' (subprocess), 'streamable-http' or 'sse' (remote server)")
+    url: Optional[str] = Field(None, description="URL of the remote server (streamable-http and sse transports)")
+    headers: Dict[str, str] = Field(default_factory=dict, description="HTTP headers sent to the remote server")
     description: Optional[str] = Field(None, description="Server description")
     username: str = Field(..., description="MCPServer owner username")
     mcpserver_type: str = Field("private", alias="type", description="MCP server type: 'public' or 'private'")
     status: str = Field("configured", description="Current server status")
-    tools: List[Dict[str, Any]] = Field(default_factory=list, description="Available tools")
+    tools: List[Dict[str, Any]] = Field(default_factory=list, description="Available tools (interned, shared ToolDefinition objects)")
     tools_blacklist: Optional[List[str]] = Field(default=None, description="List of blocked tool names")
     disabled: bool = Field(False, description="Whether the server is disabled")
     pid: Optional[int] = Field(None, description="Process ID of the running server instance")
@@ -35,6 +39,11 @@ class McpServerModel(BaseModel):
         arbitrary_types_allowed = True  # Allow subprocess.Popen as a field type
         populate_by_name = True  # Allow both field names and aliases to be used
 
+    @validator('tools')
+    def intern_tools(cls, v: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Share identical tool definitions between mcpservers (and model copies)
+        return get_tool_definition_store().intern_tools(v)
+
     @validator('process', pre=True)
     def validate_process(cls, v: Any) -> Any:
         if v is not None and not (isinstance(v, subprocess.Popen) or isinstance(v, asyncio.subprocess.Process)):
@@ -13,6 +13,7 @@ Architecture:
 - Clean process termination
 - Process status tracking
 - Error handling for process operations
+- Remote (streamable-http / sse) mcpservers: sessions opened by the upstream manager
 
 Workflow:
 ---------
@@ -35,6 +36,7 @@ from loguru import logger
 from fastapi import HTTPException
 from typing import TYPE_CHECKING
 from mcpo_simple_server.services.config import get_config_service
+from mcpo_simple_server.services.config.events import ConfigEventType
 from mcpo_simple_server.services.mcpserver.models import McpServerModel
 from asyncio.subprocess import Process as AsyncProcess
 if TYPE_CHECKING:
@@ -78,10 +80,14 @@ class McpServerProcessManager:
             raise HTTPException(status_code=404, detail=f"McpServer '{mcpserver_id}' not found")
 
         # Check if server is already running
-        if self._is_running(mcpserver_id):
+        if self.is_running(mcpserver_id):
             logger.warning(f"mcpserver.process_manager.start_mcpserver: McpServer '{mcpserver_id}' is already running")
             raise HTTPException(status_code=400, detail=f"McpServer '{mcpserver.name}' already exists for user '{mcpserver.username}'")
 
+        # Remote mcpservers are not started, a session is opened on them
+        if self.parent.upstream.is_upstream(mcpserver.transport):
+            return await self._start_upstream_mcpserver(mcpserver_id)
+
         try:
             # Replace 'uvx' with 'uv' and handle different command formats
             original_command = copy.deepcopy(mcpserver.command)
@@ -170,6 +176,50 @@ class McpServerProcessManager:
         else:
             logger.warning(f"Cannot send initialization to {mcpserver.name}: stdin is not available")
 
+        await self._load_tools(mcpserver_id)
+
+        # Start log monitoring task
+        asyncio.create_task(self._monitor_process_logs(mcpserver_id, process))
+
+        print(self._mcpservers[mcpserver_id])
+        logger.info(f"mcpserver.process_manager.start_mcpserver: McpServer-ID: '{mcpserver_id}' started successfully (PID: {process.pid})")
+        await self.config_service.events.publish(ConfigEventType.SERVER_CHANGED, username=mcpserver.username, mcpserver_id=mcpserver_id)
+        return McpServerModel(**self._mcpservers[mcpserver_id].model_dump())
+
+    async def _start_upstream_mcpserver(self, mcpserver_id: str) -> McpServerModel:
+        """
+        Open a session on a remote (streamable-http / sse) mcpserver.
+
+        Args:
+            mcpserver_id: The identifier of the server to connect
+
+        Returns:
+            McpServerModel with status and metadata about the connected server
+        """
+        mcpserver = self._mcpservers[mcpserver_id]
+        try:
+            await self.parent.upstream.connect(mcpserver_id)
+        except Exception as e:
+            raise HTTPException(status_code=502, detail=f"Failed to connect mcpserver {mcpserver.name} ({mcpserver.url}): {str(e)}") from e
+
+        start_time = datetime.datetime.now()
+        mcpserver.status = "running"
+        mcpserver.start_time = start_time
+        mcpserver.last_activity = start_time
+
+        await self._load_tools(mcpserver_id)
+
+        logger.info(f"mcpserver.process_manager.start_mcpserver: McpServer-ID: '{mcpserver_id}' connected ({mcpserver.transport}: {mcpserver.url})")
+        await self.config_service.events.publish(ConfigEventType.SERVER_CHANGED, username=mcpserver.username, mcpserver_id=mcpserver_id)
+        return McpServerModel(**self._mcpservers[mcpserver_id].model_dump())
+
+    async def _load_tools(self, mcpserver_id: str) -> None:
+        """
+        Set the tools of a started mcpserver, from its tools cache or discovered (and cached).
+
+        Args:
+            mcpserver_id: The identifier of the started server
+        """
         # Check if mcpserver has tools cache
         mcpserver_tool_cache = await self.config_service.tools_cache.get_tool_cache(mcpserver_id)
         if mcpserver_tool_cache:
@@ -203,13 +253,6 @@ class McpServerProcessManager:
             else:
                 logger.info(f"McpServer '{mcpserver_id}' does not have any tools")
 
-        # Start log monitoring task
-        asyncio.create_task(self._monitor_process_logs(mcpserver_id, process))
-
-        print(self._mcpservers[mcpserver_id])
-        logger.info(f"mcpserver.process_manager.start_mcpserver: McpServer-ID: '{mcpserver_id}' started successfully (PID: {process.pid})")
-        return McpServerModel(**self._mcpservers[mcpserver_id].model_dump())
-
     async def stop_mcpserver(self, mcpserver_id: str, timeout: float = 5.0) -> McpServerModel:
         """
         Stop a running MCP server subprocess.
@@ -227,6 +270,17 @@ class McpServerProcessManager:
         if mcpserver_id not in self._mcpservers:
             raise HTTPException(status_code=404, detail=f"McpServer '{mcpserver_id}' not found")
 
+        # Close the session of remote mcpservers
+        if self.parent.upstream.is_upstream(self._mcpservers[mcpserver_id].transport):
+            await self.parent.upstream.disconnect(mcpserver_id)
+            self._mcpservers[mcpserver_id].status = "stopped"
+            await self.config_service.events.publish(
+                ConfigEventType.SERVER_CHANGED,
+                username=self._mcpservers[mcpserver_id].username,
+                mcpserver_id=mcpserver_id
+            )
+            return McpServerModel(**self._mcpservers[mcpserver_id].model_dump())
+
         # Get process
         process = self._mcpservers[mcpserver_id].process
 
@@ -256,13 +310,18 @@ class McpServerProcessManager:
             self._mcpservers[mcpserver_id].status = "stopped"
             self._mcpservers[mcpserver_id].process = None
             self._mcpservers[mcpserver_id].pid = None
+            await self.config_service.events.publish(
+                ConfigEventType.SERVER_CHANGED,
+                username=self._mcpservers[mcpserver_id].username,
+                mcpserver_id=mcpserver_id
+            )
             return McpServerModel(**self._mcpservers[mcpserver_id].model_dump())
 
         except Exception as e:
             logger.error(f"Error stopping mcpserver {mcpserver_id}: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to stop mcpserver: {str(e)}") from e
 
-    def _is_running(self, mcpserver_id: str) -> bool:
+    def is_running(self, mcpserver_id: str) -> bool:
         """
         Check if a server is currently running.
 
@@ -276,8 +335,10 @@ class McpServerProcessManager:
             return False
 
         mcpserver = self._mcpservers[mcpserver_id]
-        process = mcpserver.process
+        if self.parent.upstream.is_upstream(mcpserver.transport):
+            return self.parent.upstream.is_connected(mcpserver_id)
 
+        process = mcpserver.process
         if not process:
             return False
 
@@ -0,0 +1,244 @@
+"""
+Package/Module: McpServer Tool Search - Inverted index over MCP server tools
+
+High Level Concept:
+-------------------
+Users with many mcpservers expose hundreds of tools. Instead of paging through the
+whole tools/list output, clients can search tools by name, description and parameter
+names. Searches are served from an inverted index kept in sync with the tool registry.
+
+Architecture:
+-------------
+- Index unit is the (interned) tool definition digest, so identical tools shared by many
+  mcpservers are tokenized and indexed once
+- Postings: term -> {digest: weight}, with name tokens weighted above parameter
+  names and description terms
+- Server membership: digest -> owner username -> mcpserver ids, so per-user visibility
+  filtering only touches the user's own mcpservers
+- Sorted vocabulary for prefix matching of query terms
+
+Workflow:
+---------
+1. Before each search the index is synchronized incrementally: only mcpservers whose
+   tools list object changed (or which were removed) are re-indexed
+2. Query terms are matched exactly and by prefix, scored with term weight * idf
+3. Scores are expanded to mcpservers visible to the user and the top-k are returned
+
+Notes:
+------
+Visibility follows get_tools(): a user sees tools of their own mcpservers,
+unauthenticated callers see tools of public mcpservers only. Blacklisted tools
+(global, environment, per mcpserver and the user's own blacklist) are never returned.
+"""
+import re
+import math
+import heapq
+import bisect
+from typing import Dict, Iterable, List, Any, Optional, Set, Mapping, TYPE_CHECKING
+from mcpo_simple_server.utils.tools.tool_definition_store import ToolDefinition, tool_definition_digest
+if TYPE_CHECKING:
+    from mcpo_simple_server.services.mcpserver import McpServerService
+
+_NAME_WEIGHT = 3.0
+_PARAMETER_WEIGHT = 2.0
+_DESCRIPTION_WEIGHT = 1.0
+_PREFIX_MATCH_FACTOR = 0.5
+
+_CAMEL_CASE_RE = re.compile(r"([a-z0-9])([A-Z])")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase terms (camelCase, snake_case and kebab-case aware)."""
+    if not text:
+        return []
+    text = _CAMEL_CASE_RE.sub(r"\1 \2", str(text)).lower()
+    return [token for token in _TOKEN_RE.findall(text) if len(token) > 1]
+
+
+class McpServerToolSearchIndex:
+    """
+    Incrementally maintained inverted index over tools of all MCP servers.
+    """
+
+    def __init__(self, parent: "McpServerService"):
+        """
+        Initialize the McpServer Tool Search Index.
+
+        Args:
+            parent: Reference to the parent McpServerService
+        """
+        self.parent = parent
+        self._mcpservers = parent._mcpservers
+
+        self._indexed_tools: Dict[str, List[Any]] = {}          # mcpserver_id -> tools list object indexed
+        self._server_digests: Dict[str, Set[str]] = {}          # mcpserver_id -> definition digests
+        self._digest_servers: Dict[str, Dict[str, Set[str]]] = {}  # digest -> {owner username: mcpserver ids}
+        self._server_owner: Dict[str, str] = {}                 # mcpserver_id -> owner username
+        self._definitions: Dict[str, Mapping[str, Any]] = {}    # digest -> tool definition
+        self._definition_terms: Dict[str, Dict[str, float]] = {}  # digest -> {term: weight}
+        self._postings: Dict[str, Dict[str, float]] = {}        # term -> {digest: weight}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+
+    # --------------------------------------------------------------------------
+    # Index maintenance
+    # --------------------------------------------------------------------------
+    def sync(self) -> None:
+        """Re-index mcpservers whose tools changed and drop removed mcpservers."""
+        for mcpserver_id in [sid for sid in self._indexed_tools if sid not in self._mcpservers]:
+            self._remove_mcpserver(mcpserver_id)
+
+        for mcpserver_id, mcpserver in self._mcpservers.items():
+            tools = mcpserver.tools
+            if self._indexed_tools.get(mcpserver_id) is not tools:
+                self._index_mcpserver(mcpserver_id, mcpserver.username, tools)
+
+    def _index_mcpserver(self, mcpserver_id: str, owner: str, tools: List[Any]) -> None:
+        if self._server_owner.get(mcpserver_id, owner) != owner:
+            self._remove_mcpserver(mcpserver_id)
+        digests: Set[str] = set()
+        for tool in tools or []:
+            if not isinstance(tool, Mapping) or not tool.get("name"):
+                continue
+            digest = tool.digest if isinstance(tool, ToolDefinition) else tool_definition_digest(tool)
+            digests.add(digest)
+            if digest not in self._definitions:
+                self._add_definition(digest, tool)
+
+        previous = self._server_digests.get(mcpserver_id, set())
+        for digest in previous - digests:
+            self._unlink(mcpserver_id, digest)
+        for digest in digests - previous:
+            self._digest_servers.setdefault(digest, {}).setdefault(owner, set()).add(mcpserver_id)
+
+        self._server_owner[mcpserver_id] = owner
+        self._server_digests[mcpserver_id] = digests
+        self._indexed_tools[mcpserver_id] = tools
+
+    def _remove_mcpserver(self, mcpserver_id: str) -> None:
+        for digest in self._server_digests.pop(mcpserver_id, set()):
+            self._unlink(mcpserver_id, digest)
+        self._indexed_tools.pop(mcpserver_id, None)
+        self._server_owner.pop(mcpserver_id, None)
+
+    def _unlink(self, mcpserver_id: str, digest: str) -> None:
+        owners = self._digest_servers.get(digest)
+        owner = self._server_owner.get(mcpserver_id)
+        if owners is None or owner not in owners:
+            return
+        owners[owner].discard(mcpserver_id)
+        if not owners[owner]:
+            del owners[owner]
+        if not owners:
+            del self._digest_servers[digest]
+            self._remove_definition(digest)
+
+    def _add_definition(self, digest: str, tool: Mapping[str, Any]) -> None:
+        terms: Dict[str, float] = {}
+        for term in tokenize(tool.get("name")):
+            terms[term] = max(terms.get(term, 0.0), _NAME_WEIGHT)
+        input_schema = tool.get("inputSchema") or {}
+        properties = input_schema.get("properties") if isinstance(input_schema, Mapping) else None
+        for parameter in (properties or {}):
+            for term in tokenize(parameter):
+                terms[term] = max(terms.get(term, 0.0), _PARAMETER_WEIGHT)
+        for term in tokenize(tool.get("description")):
+            terms[term] = max(terms.get(term, 0.0), _DESCRIPTION_WEIGHT)
+
+        self._definitions[digest] = tool
+        self._definition_terms[digest] = terms
+        for term, weight in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocabulary_dirty = True
+            postings[digest] = weight
+
+    def _remove_definition(self, digest: str) -> None:
+        self._definitions.pop(digest, None)
+        for term in self._definition_terms.pop(digest, {}):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(digest, None)
+            if not postings:
+                del self._postings[term]
+                self._vocabulary_dirty = True
+
+    def _matching_terms(self, query_term: str) -> List[tuple]:
+        """Return (term, factor) pairs matching the query term exactly or by prefix."""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        matches = []
+        start = bisect.bisect_left(self._vocabulary, query_term)
+        for term in self._vocabulary[start:]:
+            if not term.startswith(query_term):
+                break
+            matches.append((term, 1.0 if term == query_term else _PREFIX_MATCH_FACTOR))
+        return matches
+
+    # --------------------------------------------------------------------------
+    # Search
+    # --------------------------------------------------------------------------
+    def _visible_mcpservers(self, digest: str, username: Optional[str]) -> List[str]:
+        owners = self._digest_servers.get(digest, {})
+        if username:
+            return list(owners.get(username, ()))
+        return [
+            mcpserver_id for mcpserver_ids in owners.values() for mcpserver_id in mcpserver_ids
+            if getattr(self._mcpservers.get(mcpserver_id), "mcpserver_type", None) == "public"
+        ]
+
+    def _blacklisted(self, mcpserver_id: str, tool_name: Any, blacklist: Set[str]) -> bool:
+        if tool_name in blacklist:
+            return True
+        mcpserver = self._mcpservers.get(mcpserver_id)
+        return bool(mcpserver and mcpserver.tools_blacklist and tool_name in mcpserver.tools_blacklist)
+
+    def search_tools(self, query: str, username: Optional[str] = None, limit: int = 10,
+                     blacklist: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Search tools visible to the user.
+
+        Args:
+            query: Free text query (matched against tool names, parameter names and descriptions)
+            username: Username for per-user visibility, None for public tools only
+            limit: Maximum number of results (top-k)
+            blacklist: Tool names blacklisted by the user (global, environment and per
+                mcpserver blacklists are always applied)
+
+        Returns:
+            List of tool dicts with 'mcpserver_id' and 'score', best match first
+        """
+        self.sync()
+        query_terms = tokenize(query)
+        if not query_terms or limit <= 0:
+            return []
+
+        total_definitions = max(len(self._definitions), 1)
+        scores: Dict[str, float] = {}
+        for query_term in dict.fromkeys(query_terms):
+            for term, factor in self._matching_terms(query_term):
+                postings = self._postings[term]
+                idf = math.log(1.0 + total_definitions / len(postings))
+                for digest, weight in postings.items():
+                    scores[digest] = scores.get(digest, 0.0) + weight * idf * factor
+
+        excluded = set(self.parent.global_blacklist_tools) | set(self.parent.env_blacklist_tools) | set(blacklist or ())
+        candidates = []
+        for digest, score in scores.items():
+            tool_name = self._definitions[digest].get("name")
+            for mcpserver_id in self._visible_mcpservers(digest, username):
+                if not self._blacklisted(mcpserver_id, tool_name, excluded):
+                    candidates.append((score, mcpserver_id, digest))
+
+        results = []
+        for score, mcpserver_id, digest in heapq.nlargest(limit, candidates, key=lambda c: (c[0], c[1])):
+            tool = dict(self._definitions[digest])
+            tool.pop("mcpserver", None)
+            tool["mcpserver_id"] = mcpserver_id
+            tool["score"] = round(score, 4)
+            results.append(tool)
+        return results
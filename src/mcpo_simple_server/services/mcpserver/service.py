@@ -5,9 +5,12 @@ from mcpo_simple_server.config import TOOLS_BLACKLIST
 from mcpo_simple_server.services.mcpserver.controller import McpServerController
 from mcpo_simple_server.services.mcpserver.process_manager import McpServerProcessManager
 from mcpo_simple_server.services.mcpserver.tools import McpServerToolsService
+from mcpo_simple_server.services.mcpserver.upstream import McpServerUpstreamManager
 from mcpo_simple_server.services.mcpserver.admin import McpServerAdminManager
+from mcpo_simple_server.services.mcpserver.search import McpServerToolSearchIndex
 from mcpo_simple_server.services.mcpserver.models.mcpserver import McpServerModel
 from mcpo_simple_server.services.config import get_config_service
+from mcpo_simple_server.services.config.events import ConfigEvent, ConfigEventType
 if TYPE_CHECKING:
     from mcpo_simple_server.services.config import ConfigService
 
@@ -29,11 +32,20 @@ class McpServerService:
       - start_mcpserver: Start a server process
       - stop_mcpserver: Stop a running server process
 
+    - Upstream Manager (McpServerUpstreamManager): Remote (streamable-http / sse) mcpservers
+      - connect / disconnect: Open / close a session on the remote server
+      - request: Send a JSON-RPC request over a shared, pooled HTTP client
+
     - Tools Service (McpServerToolsService): Tool management
-      - invoke_tool: Execute a tool on a server
+      - invoke_tool: Execute a tool on a server (optionally reporting its progress)
+      - check_tool_call: Check server and arguments of a call before it is sent
       - discover_tools: Find available tools
       - get_tool_metadata: Get metadata for a specific tool
       - list_all_tools: List all available tools across servers
+      - get_tools_memory_report: Memory used by (deduplicated) tool definitions
+
+    - Tool Search Index (McpServerToolSearchIndex): Tool search
+      - search_tools: Ranked search over tool names, descriptions and parameters
 
     - Admin Manager (McpServerAdminManager): Administrative operations
       - load_all_servers: Load all server configurations
@@ -52,13 +64,15 @@ class McpServerService:
         self._mcpservers: Dict[str, McpServerModel] = {}        # {mcpserver_id: McpServerModel}  <- this is controller database
         self.config_service: Optional['ConfigService'] = None
         self.env_blacklist_tools = TOOLS_BLACKLIST or []
-        self.global_blacklist_tools = []
+        self.global_blacklist_tools = []    # Shared by the subservices - always updated in place
 
         # Main Subservices
         self.controller = McpServerController(self)
         self.process_manager = McpServerProcessManager(self)
+        self.upstream = McpServerUpstreamManager(self)
         self.tools = McpServerToolsService(self)
         self.admin = McpServerAdminManager(self)
+        self.search = McpServerToolSearchIndex(self)
 
         # Delegate controller methods
         self.add_mcpserver = self.controller.add_mcpserver
@@ -72,9 +86,14 @@ class McpServerService:
 
         # Delegate tools handler methods
         self.invoke_tool = self.tools.invoke_tool
+        self.check_tool_call = self.tools.check_tool_call
         self.discover_tools = self.tools.discover_tools
         self.list_all_tools = self.tools.list_all_tools
         self.get_tools = self.tools.get_tools
+        self.get_tools_memory_report = self.tools.get_tools_memory_report
+
+        # Delegate tool search methods
+        self.search_tools = self.search.search_tools
 
         # Delegate admin methods
         self.load_all_mcpservers = self.admin.load_all_mcpservers
@@ -89,9 +108,49 @@ class McpServerService:
         """
         self.config_service = get_config_service()
         config = await self.config_service.get_config()
-        self.global_blacklist_tools = config.global_config.tools.blackList or []
+        self.global_blacklist_tools[:] = config.global_config.tools.blackList or []
         logger.info(f"🔧 TOOLS BLACKLIST (ENV): {', '.join(self.env_blacklist_tools)}")
         logger.info(f"🔧 TOOLS BLACKLIST (CONFIG): {', '.join(self.global_blacklist_tools)}")
+        # Subscribed before the tools routers, so they rebuild from the re-filtered tools
+        self.config_service.events.subscribe(ConfigEventType.BLACKLIST_CHANGED, self._on_blacklist_changed)
+        self.config_service.events.subscribe(ConfigEventType.USER_CHANGED, self._on_remote_user_changed)
+        self.config_service.events.subscribe(ConfigEventType.TOOLS_CHANGED, self._on_remote_tools_changed)
+
+    async def _on_blacklist_changed(self, _event: ConfigEvent) -> None:
+        """
+        Apply a changed global blacklist to the tools of all mcpservers (re-filtered from their tool caches).
+        """
+        if self.config_service is None:
+            return
+        global_config = await self.config_service.global_config.get_config()
+        self.global_blacklist_tools[:] = global_config.tools.blackList or []
+        logger.info(f"🔧 TOOLS BLACKLIST (CONFIG): {', '.join(self.global_blacklist_tools)}")
+        for mcpserver_id, mcpserver in self._mcpservers.items():
+            tools_cache = await self.config_service.tools_cache.get_tool_cache(mcpserver_id)
+            if tools_cache:
+                mcpserver.tools = self.tools.filter_tools(tools_cache, mcpserver.tools_blacklist)
+
+    async def _on_remote_user_changed(self, event: ConfigEvent) -> None:
+        """
+        Register / remove the mcpservers of a user changed by another node sharing the storage.
+        """
+        if event.remote:
+            await self.admin.sync_user_mcpservers(event.username)
+
+    async def _on_remote_tools_changed(self, event: ConfigEvent) -> None:
+        """
+        Take over the tools discovered by another node for mcpservers not running on this node.
+        """
+        if not event.remote or self.config_service is None:
+            return
+        mcpserver_ids = [event.mcpserver_id] if event.mcpserver_id else list(self._mcpservers)
+        for mcpserver_id in mcpserver_ids:
+            mcpserver = self._mcpservers.get(mcpserver_id)
+            if mcpserver is None or mcpserver.status == "running":
+                continue
+            tools_cache = await self.config_service.tools_cache.get_tool_cache(mcpserver_id)
+            if tools_cache:
+                mcpserver.tools = self.tools.filter_tools(tools_cache, mcpserver.tools_blacklist)
 
     def get_mcpserver(self, mcpserver_id: str) -> Optional[McpServerModel]:
         return self._mcpservers.get(mcpserver_id)
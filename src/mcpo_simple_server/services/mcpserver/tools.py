@@ -13,6 +13,7 @@ Architecture:
 - Tool invocation and response handling
 - Tool blacklisting and validation
 - Caching of tool metadata
+- Tool definitions are interned (deduplicated) across users and servers
 
 Workflow:
 ---------
@@ -30,14 +31,20 @@ import json
 import asyncio
 from datetime import datetime
 from pydantic import BaseModel
-from typing import Dict, List, Any, Optional, TYPE_CHECKING
+from typing import Callable, Dict, List, Any, Optional, TYPE_CHECKING
 from loguru import logger
 from fastapi import HTTPException
 from mcpo_simple_server.services.mcpserver.models.mcpotool import MCPoTool
 from mcpo_simple_server.services.config import get_config_service
+from mcpo_simple_server.utils.tools.validate_tool_arguments import validate_tool_arguments
+from mcpo_simple_server.utils.tools.tool_definition_store import get_tool_definition_store
+from mcpo_simple_server.config import TOOLS_VALIDATE_ARGUMENTS
 if TYPE_CHECKING:
     from mcpo_simple_server.services.mcpserver import McpServerService
+    from mcpo_simple_server.services.mcpserver.models import McpServerModel
 _INTERNAL_ERROR_CODE = -32603
+# Called with the params of every notifications/progress message of a tool call
+ProgressCallback = Callable[[Dict[str, Any]], None]
 
 
 class McpServerToolsService:
@@ -60,17 +67,26 @@ class McpServerToolsService:
         self.config_service = get_config_service()
         self.global_blacklist_tools = parent.global_blacklist_tools
         self.env_blacklist_tools = parent.env_blacklist_tools
+        self.tool_store = get_tool_definition_store()
 
         # Initialize request tracking structures
         self.pending_requests = {}
         self.request_counters = {}
         self.write_locks = {}
+        self.progress_handlers: Dict[str, Dict[Any, ProgressCallback]] = {}
 
         # Register with process manager to handle JSON-RPC responses
         if hasattr(self.parent.process_manager, 'register_json_message_handler'):
             self.parent.process_manager.register_json_message_handler(self._process_json_response)
 
-    async def invoke_tool(self, mcpserver_id: str, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def invoke_tool(
+        self,
+        mcpserver_id: str,
+        tool_name: str,
+        parameters: Dict[str, Any],
+        on_progress: Optional[ProgressCallback] = None,
+        checked: bool = False
+    ) -> Dict[str, Any]:
         """
         Invoke a tool on a specific MCP server.
 
@@ -78,19 +94,23 @@ class McpServerToolsService:
             mcpserver_id: The identifier of the server
             tool_name: The name of the tool to invoke
             parameters: The parameters to pass to the tool
+            on_progress: Called with the progress notifications of the call (a progress token is requested)
+            checked: The caller already ran check_tool_call for this call, skip it
 
         Returns:
             The response from the tool invocation
-        """
 
-        if mcpserver_id not in self._mcpservers:
-            raise HTTPException(status_code=404, detail=f"McpServer '{mcpserver_id}' not found")
-
-        mcpserver = self._mcpservers[mcpserver_id]
+        Raises:
+            HTTPException: 404 when the server is unknown, 422 when parameters do not match the tool inputSchema
+        """
+        if checked and mcpserver_id in self._mcpservers:
+            mcpserver = self._mcpservers[mcpserver_id]
+        else:
+            mcpserver = self.check_tool_call(mcpserver_id, tool_name, parameters)
 
         # Check if server is running
         # If not - then run it
-        if mcpserver.status != "running" or not mcpserver.process:
+        if mcpserver.status != "running" or not self.parent.process_manager.is_running(mcpserver_id):
             logger.info(f"McpServer '{mcpserver_id}' is not running (status: {mcpserver.status})")
             await self.parent.start_mcpserver(mcpserver_id)
 
@@ -98,13 +118,35 @@ class McpServerToolsService:
         try:
             # Implementation depends on the specific MCP server communication protocol
             # This is a placeholder for the actual implementation
-            response = await self._send_tool_request(mcpserver_id, tool_name, parameters)
+            response = await self._send_tool_request(mcpserver_id, tool_name, parameters, on_progress)
             self._mcpservers[mcpserver_id].last_activity = datetime.now()
             return response
         except Exception as e:
             logger.error(f"Failed to invoke tool {tool_name} on mcpserver {mcpserver_id}: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to invoke tool: {str(e)}") from e
 
+    def check_tool_call(self, mcpserver_id: str, tool_name: str, parameters: Dict[str, Any]) -> "McpServerModel":
+        """
+        Check that a tool call can be sent: the server exists and the arguments are valid.
+
+        Returns:
+            The model of the server
+
+        Raises:
+            HTTPException: 404 when the server is unknown, 422 when parameters do not match the tool inputSchema
+        """
+        if mcpserver_id not in self._mcpservers:
+            raise HTTPException(status_code=404, detail=f"McpServer '{mcpserver_id}' not found")
+
+        # Reject malformed arguments before they reach the mcpserver process
+        if TOOLS_VALIDATE_ARGUMENTS:
+            errors = self.validate_tool_arguments(mcpserver_id, tool_name, parameters)
+            if errors:
+                logger.info(f"Invalid arguments for tool {tool_name} on mcpserver {mcpserver_id}: {len(errors)} error(s)")
+                raise HTTPException(status_code=422, detail=errors)
+
+        return self._mcpservers[mcpserver_id]
+
     async def discover_tools(self, mcpserver_id: str) -> List[Dict[str, Any]]:
         """
         Get tools metadata from an MCP mcpserver using the tools/list request.
@@ -122,6 +164,16 @@ class McpServerToolsService:
             del self._mcpservers[mcpserver_id]
             raise HTTPException(status_code=404, detail=f"McpServer '{mcpserver_id}' not found")
 
+        if self.parent.upstream.is_upstream(self._mcpservers[mcpserver_id].transport):
+            try:
+                tools_data = await self.parent.upstream.list_tools(mcpserver_id)
+            except Exception as e:
+                logger.error(f"Error fetching tools for mcpserver-id '{mcpserver_id}': {str(e)}")
+                await self.parent.upstream.disconnect(mcpserver_id)
+                del self._mcpservers[mcpserver_id]
+                raise HTTPException(status_code=502, detail=f"Error fetching tools for mcpserver-id '{mcpserver_id}': {str(e)}") from e
+            return self._store_discovered_tools(mcpserver_id, tools_data)
+
         process_info = self._mcpservers[mcpserver_id].pid
         process = self._mcpservers[mcpserver_id].process
         logger.info(f"mcpserver.process_manager.get_mcpserver_tools_metadata: McpServer {mcpserver_id} is running with PID {process_info}")
@@ -211,26 +263,55 @@ class McpServerToolsService:
                 # Update cursor
                 next_cursor = cursor_response.get("result", {}).get("nextCursor")
 
-            # Get full list of tools without filtering
-            logger.debug(f"Discovered {len(tools_data)} total tools for mcpserver-id {mcpserver_id}")
-
-            # Update mcpserver metadata with all tools
-            self._mcpservers[mcpserver_id].tools = tools_data
-            self._mcpservers[mcpserver_id].status = "running"
-
-            # Generate mcpserver description that lists the tools it contains
-            if not self._mcpservers[mcpserver_id].description:
-                tool_names = [str(tool.get("name", "")) for tool in tools_data]
-                tools_list = ", ".join(tool_names)
-                self._mcpservers[mcpserver_id].description = f"McpServer-id '{mcpserver_id}' containing {len(tools_data)} tools: {tools_list}"
-
-            # Return the full, unfiltered list of tools
-            return tools_data
+            return self._store_discovered_tools(mcpserver_id, tools_data)
         except Exception as e:
             logger.error(f"Error fetching tools for mcpserver-id '{mcpserver_id}': {str(e)}")
             del self._mcpservers[mcpserver_id]
             raise HTTPException(status_code=500, detail=f"Error fetching tools for mcpserver-id '{mcpserver_id}': {str(e)}") from e
 
+    def _store_discovered_tools(self, mcpserver_id: str, tools_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Set the discovered tools of a mcpserver and return them (full, unfiltered list).
+        """
+        # Get full list of tools without filtering, shared definitions are reused across servers
+        tools_data = self.tool_store.intern_tools(tools_data)
+        logger.debug(f"Discovered {len(tools_data)} total tools for mcpserver-id {mcpserver_id}")
+
+        # Update mcpserver metadata with all tools
+        self._mcpservers[mcpserver_id].tools = tools_data
+        self._mcpservers[mcpserver_id].status = "running"
+
+        # Generate mcpserver description that lists the tools it contains
+        if not self._mcpservers[mcpserver_id].description:
+            tool_names = [str(tool.get("name", "")) for tool in tools_data]
+            tools_list = ", ".join(tool_names)
+            self._mcpservers[mcpserver_id].description = f"McpServer-id '{mcpserver_id}' containing {len(tools_data)} tools: {tools_list}"
+
+        # Return the full, unfiltered list of tools
+        return tools_data
+
+    def validate_tool_arguments(self, mcpserver_id: str, tool_name: str, parameters: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Validate tool parameters against the inputSchema of the tool on a specific MCP server.
+
+        Args:
+            mcpserver_id: The identifier of the server
+            tool_name: The name of the tool
+            parameters: The parameters which will be passed to the tool
+
+        Returns:
+            List of validation errors, empty when parameters are valid or the tool schema is unknown
+        """
+        mcpserver = self._mcpservers.get(mcpserver_id)
+        if not mcpserver or not mcpserver.tools:
+            return []
+
+        for tool in mcpserver.tools:
+            if isinstance(tool, dict) and tool.get("name") == tool_name:
+                return validate_tool_arguments(tool.get("inputSchema"), parameters)
+
+        return []
+
     def get_tool(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific tool across all controller servers.
@@ -263,7 +344,8 @@ class McpServerToolsService:
         self,
         mcpserver_id: str,
         tool_name: str,
-        parameters: Dict[str, Any]
+        parameters: Dict[str, Any],
+        on_progress: Optional[ProgressCallback] = None
     ) -> Dict[str, Any]:
         """
         Send a tool request to a specific MCP server.
@@ -272,12 +354,18 @@ class McpServerToolsService:
             mcpserver_id: The identifier of the server
             tool_name: The name of the tool to invoke
             parameters: The parameters to pass to the tool
+            on_progress: Called with the progress notifications of the request
 
         Returns:
             The response from the tool invocation
         """
         # Get server information
         mcpserver = self._mcpservers[mcpserver_id]
+
+        # Remote mcpservers - sent over the pooled HTTP client, the upstream manager numbers the requests
+        if self.parent.upstream.is_upstream(mcpserver.transport):
+            return await self.parent.upstream.request(mcpserver_id, "tools/call", {"name": tool_name, "arguments": parameters}, on_progress)
+
         process = mcpserver.process
 
         if not process:
@@ -308,6 +396,10 @@ class McpServerToolsService:
             "method": "tools/call",
             "params": {"name": tool_name, "arguments": parameters}
         }
+        # The request ID is unique per server, it doubles as the progress token
+        if on_progress is not None:
+            request["params"]["_meta"] = {"progressToken": req_id}
+            self.progress_handlers.setdefault(mcpserver_id, {})[req_id] = on_progress
         logger.debug(f"Sending request {req_id} to server '{mcpserver_id}'")
         logger.debug("\n" + json.dumps(request, indent=2))
 
@@ -327,6 +419,8 @@ class McpServerToolsService:
         except asyncio.TimeoutError:
             self.pending_requests[mcpserver_id].pop(req_id, None)
             return {"status": "error", "message": f"Timeout waiting for tool response (req_id: {req_id})"}
+        finally:
+            self.progress_handlers.get(mcpserver_id, {}).pop(req_id, None)
 
         # Return RAW reponse
         return response
@@ -339,6 +433,14 @@ class McpServerToolsService:
             mcpserver_id: The ID of the server that sent the message
             message: The parsed JSON message
         """
+        # Progress of a request - the progress token is the request ID
+        if message.get("method") == "notifications/progress":
+            params = message.get("params") or {}
+            handler = self.progress_handlers.get(mcpserver_id, {}).get(params.get("progressToken"))
+            if handler is not None:
+                handler(params)
+            return
+
         # Only process messages with an ID (responses to our requests)
         msg_id = message.get("id")
         if msg_id is None or mcpserver_id not in self.pending_requests:
@@ -372,6 +474,15 @@ class McpServerToolsService:
 
         return all_tools
 
+    def get_tools_memory_report(self) -> Dict[str, Any]:
+        """
+        Report memory used by tool definitions of all mcpservers with and without deduplication.
+
+        Returns:
+            Dict with reference/definition counts and approximate sizes in bytes
+        """
+        return self.tool_store.memory_report(mcpserver.tools for mcpserver in self._mcpservers.values())
+
     def filter_tools(self, tools: List[Dict[str, Any]], tools_blacklist: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Filter out blacklisted tools based on server-specific and global blacklists.
@@ -466,7 +577,8 @@ class McpServerToolsService:
                                     if isinstance(tool_obj, BaseModel):
                                         tool_dict = tool_obj.model_dump()
                                     elif isinstance(tool_obj, dict):
-                                        tool_dict = tool_obj
+                                        # Copy - tool definitions are shared and immutable
+                                        tool_dict = dict(tool_obj)
                                     else:
                                         logger.warning(f"Tool object {tool_name or 'UnknownTool'} on {mcpserver_id_in_controller} is not a Pydantic model or dict.")
                                         continue
@@ -490,7 +602,7 @@ class McpServerToolsService:
                                     if hasattr(tool_obj, 'model_dump'):
                                         tool_dict = tool_obj.model_dump()
                                     elif isinstance(tool_obj, dict):
-                                        tool_dict = tool_obj
+                                        tool_dict = dict(tool_obj)
                                     else:
                                         logger.warning(f"Public tool object {getattr(tool_obj, 'name', 'UnknownTool')} on {mcpserver_id} is not a Pydantic model or dict.")
                                         continue
@@ -0,0 +1,409 @@
+"""
+Package/Module: McpServer Upstream Manager - Remote MCP servers over Streamable HTTP and SSE
+
+High Level Concept:
+-------------------
+Mcpservers configured with `transport: "streamable-http"` or `transport: "sse"` and a `url`
+are not started as subprocesses, the gateway opens an MCP client session on the remote
+server instead. Starting such a mcpserver initializes the session, stopping it closes the
+session, tool discovery and tool calls are JSON-RPC requests sent over it.
+
+Architecture:
+-------------
+- One shared httpx.AsyncClient for all upstreams: a keep-alive connection pool, HTTP/2
+  when enabled and the `h2` package is installed (requests to one upstream are then
+  multiplexed over one connection)
+- Per-upstream limit: a semaphore caps the concurrent requests of one upstream, so a busy
+  upstream can not take the whole pool
+- streamable-http: every request is a POST answered with JSON or an SSE stream, the session
+  ID and protocol version are sent as headers, an expired session (404) is re-initialized
+- sse: a GET stream (kept open by a reader task) delivers the responses of the requests
+  POSTed to the endpoint announced by the server
+
+Workflow:
+---------
+1. connect(): initialize request, initialized notification
+2. request(): JSON-RPC request, returns the raw JSON-RPC response - progress notifications of
+   the request (its ID is the progress token) are passed to the on_progress callback
+3. disconnect(): ends the session (DELETE / stream closed)
+
+Notes:
+------
+- Discovered tools are cached in the tools cache like the ones of subprocess mcpservers
+- Server to client requests (sampling, roots) are not supported and are ignored
+"""
+import asyncio
+import itertools
+import importlib.util
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+from urllib.parse import urljoin
+import httpx
+from httpx_sse import EventSource, aconnect_sse
+from loguru import logger
+from mcp.types import LATEST_PROTOCOL_VERSION
+from mcpo_simple_server.config import (
+    MCP_UPSTREAM_HTTP2,
+    MCP_UPSTREAM_MAX_CONNECTIONS,
+    MCP_UPSTREAM_MAX_CONNECTIONS_PER_SERVER,
+    MCP_UPSTREAM_KEEPALIVE_EXPIRY,
+    MCP_UPSTREAM_CONNECT_TIMEOUT,
+    MCP_UPSTREAM_TIMEOUT
+)
+from mcpo_simple_server.metadata import __version__
+if TYPE_CHECKING:
+    from mcpo_simple_server.services.mcpserver import McpServerService
+
+UPSTREAM_TRANSPORTS = ("streamable-http", "sse")
+
+
+class UpstreamError(Exception):
+    """The upstream mcpserver could not be reached or answered with an error."""
+
+
+class _SessionExpired(Exception):
+    """The upstream answered 404 to a request of a session, the session is gone."""
+
+
+@dataclass
+class _UpstreamSession:
+    mcpserver_id: str
+    transport: str
+    url: str
+    headers: Dict[str, str]
+    limit: asyncio.Semaphore
+    request_ids: Any = field(default_factory=lambda: itertools.count(1))
+    protocol_version: str = LATEST_PROTOCOL_VERSION
+    # streamable-http: session ID assigned by the server (None for stateless servers)
+    session_id: Optional[str] = None
+    # sse: endpoint the requests are POSTed to, reader of the stream and its pending requests
+    endpoint: Optional[str] = None
+    reader: Optional[asyncio.Task] = None
+    pending: Dict[Any, asyncio.Future] = field(default_factory=dict)
+    # Progress callbacks of the running requests by progress token (the request ID)
+    progress: Dict[Any, Callable[[Dict[str, Any]], None]] = field(default_factory=dict)
+
+
+class McpServerUpstreamManager:
+    """
+    Client sessions on remote (Streamable HTTP / SSE) mcpservers over a shared connection pool.
+    """
+
+    def __init__(self, parent: "McpServerService"):
+        """
+        Initialize the McpServer Upstream Manager.
+
+        Args:
+            parent: Reference to the parent McpServerService
+        """
+        self.parent = parent
+        self._mcpservers = parent._mcpservers
+        self._sessions: Dict[str, _UpstreamSession] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._stats = {"requests": 0, "errors": 0, "sessions_opened": 0, "sessions_renewed": 0}
+
+    @staticmethod
+    def is_upstream(transport: Optional[str]) -> bool:
+        """Check if a transport is served by a remote mcpserver."""
+        return transport in UPSTREAM_TRANSPORTS
+
+    @property
+    def http2(self) -> bool:
+        """HTTP/2 is used when enabled and the optional `h2` package is installed."""
+        return MCP_UPSTREAM_HTTP2 and importlib.util.find_spec("h2") is not None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=MCP_UPSTREAM_MAX_CONNECTIONS or None,
+                    max_keepalive_connections=MCP_UPSTREAM_MAX_CONNECTIONS or None,
+                    keepalive_expiry=MCP_UPSTREAM_KEEPALIVE_EXPIRY
+                ),
+                timeout=httpx.Timeout(MCP_UPSTREAM_TIMEOUT, connect=MCP_UPSTREAM_CONNECT_TIMEOUT),
+                headers={"User-Agent": f"mcpo-simple-server/{__version__}"}
+            )
+            logger.info(f"Upstream mcpserver connection pool created (HTTP/2: {self.http2}, max connections: {MCP_UPSTREAM_MAX_CONNECTIONS})")
+        return self._client
+
+    def is_connected(self, mcpserver_id: str) -> bool:
+        """Check if a session on the upstream of a mcpserver is open."""
+        session = self._sessions.get(mcpserver_id)
+        if session is None:
+            return False
+        if session.transport == "sse":
+            return session.reader is not None and not session.reader.done()
+        return True
+
+    async def connect(self, mcpserver_id: str) -> None:
+        """
+        Open an MCP session on the upstream of a mcpserver.
+
+        Args:
+            mcpserver_id: The identifier of the mcpserver
+
+        Raises:
+            UpstreamError: If the upstream can not be reached or refuses the session
+        """
+        mcpserver = self._mcpservers[mcpserver_id]
+        if not mcpserver.url:
+            raise UpstreamError(f"McpServer '{mcpserver_id}' has no url for transport '{mcpserver.transport}'")
+        await self.disconnect(mcpserver_id)
+
+        session = _UpstreamSession(
+            mcpserver_id=mcpserver_id,
+            transport=mcpserver.transport,
+            url=mcpserver.url,
+            headers=dict(mcpserver.headers or {}),
+            limit=asyncio.Semaphore(MCP_UPSTREAM_MAX_CONNECTIONS_PER_SERVER or 1_000_000)
+        )
+        try:
+            if session.transport == "sse":
+                await self._open_sse_stream(session)
+            await self._initialize(session)
+        except BaseException:
+            await self._close_session(session)
+            raise
+        self._sessions[mcpserver_id] = session
+        self._stats["sessions_opened"] += 1
+        logger.info(f"Upstream mcpserver '{mcpserver_id}' connected ({session.transport}: {session.url})")
+
+    async def disconnect(self, mcpserver_id: str) -> None:
+        """Close the session on the upstream of a mcpserver (no-op if not connected)."""
+        session = self._sessions.pop(mcpserver_id, None)
+        if session is not None:
+            await self._close_session(session)
+            logger.info(f"Upstream mcpserver '{mcpserver_id}' disconnected")
+
+    async def request(
+        self,
+        mcpserver_id: str,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a JSON-RPC request to the upstream of a mcpserver.
+
+        Args:
+            mcpserver_id: The identifier of the mcpserver
+            method: The JSON-RPC method
+            params: The parameters of the request
+            on_progress: Called with the params of the progress notifications of the request
+
+        Returns:
+            The raw JSON-RPC response (result or error)
+
+        Raises:
+            UpstreamError: If the mcpserver is not connected, the upstream fails or does not answer in time
+        """
+        session = self._sessions.get(mcpserver_id)
+        if session is None:
+            raise UpstreamError(f"Upstream mcpserver '{mcpserver_id}' is not connected")
+        self._stats["requests"] += 1
+        try:
+            return await asyncio.wait_for(self._request(session, method, params or {}, on_progress), timeout=MCP_UPSTREAM_TIMEOUT)
+        except asyncio.TimeoutError:
+            self._stats["errors"] += 1
+            raise UpstreamError(f"Timeout waiting for '{method}' response of upstream mcpserver '{mcpserver_id}'") from None
+        except (UpstreamError, httpx.HTTPError) as e:
+            self._stats["errors"] += 1
+            raise UpstreamError(f"Upstream mcpserver '{mcpserver_id}' failed: {str(e) or type(e).__name__}") from e
+
+    async def list_tools(self, mcpserver_id: str) -> List[Dict[str, Any]]:
+        """
+        Get all tools of the upstream of a mcpserver (following pagination).
+
+        Args:
+            mcpserver_id: The identifier of the mcpserver
+
+        Returns:
+            List of tools metadata
+        """
+        tools: List[Dict[str, Any]] = []
+        params: Dict[str, Any] = {}
+        while True:
+            response = await self.request(mcpserver_id, "tools/list", params)
+            if "result" not in response:
+                raise UpstreamError(f"tools/list of upstream mcpserver '{mcpserver_id}' failed: {response.get('error')}")
+            tools.extend(response["result"].get("tools", []))
+            next_cursor = response["result"].get("nextCursor")
+            if not next_cursor:
+                return tools
+            params = {"cursor": next_cursor}
+
+    async def close(self) -> None:
+        """Close all upstream sessions and the connection pool."""
+        for mcpserver_id in list(self._sessions):
+            await self.disconnect(mcpserver_id)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters of upstream requests and sessions and the pool configuration."""
+        return {
+            **self._stats,
+            "connected": sorted(self._sessions),
+            "http2": self.http2,
+            "max_connections": MCP_UPSTREAM_MAX_CONNECTIONS,
+            "max_connections_per_server": MCP_UPSTREAM_MAX_CONNECTIONS_PER_SERVER,
+        }
+
+    # ---------------------------------------------------------------------------------------------
+    # Protocol
+    # ---------------------------------------------------------------------------------------------
+
+    async def _initialize(self, session: _UpstreamSession) -> None:
+        response = await self._request(session, "initialize", {
+            "protocolVersion": LATEST_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "mcpo-simple-server", "version": __version__}
+        })
+        if "result" not in response:
+            raise UpstreamError(f"initialize refused: {response.get('error')}")
+        session.protocol_version = response["result"].get("protocolVersion", LATEST_PROTOCOL_VERSION)
+        await self._send(session, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+    async def _request(
+        self,
+        session: _UpstreamSession,
+        method: str,
+        params: Dict[str, Any],
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        message = {"jsonrpc": "2.0", "id": next(session.request_ids), "method": method, "params": params}
+        if on_progress is not None:
+            # The request ID doubles as the progress token
+            message["params"] = {**params, "_meta": {**params.get("_meta", {}), "progressToken": message["id"]}}
+            session.progress[message["id"]] = on_progress
+        try:
+            if session.transport == "sse":
+                return await self._request_sse(session, message)
+            try:
+                response = await self._send(session, message)
+            except _SessionExpired:
+                # The upstream forgot the session (restart, idle timeout) - open a new one and retry once
+                logger.info(f"Session of upstream mcpserver '{session.mcpserver_id}' expired, re-initializing")
+                self._stats["sessions_renewed"] += 1
+                session.session_id = None
+                await self._initialize(session)
+                response = await self._send(session, message)
+        finally:
+            session.progress.pop(message["id"], None)
+        if response is None:
+            raise UpstreamError(f"No response to '{method}'")
+        return response
+
+    @staticmethod
+    def _dispatch_progress(session: _UpstreamSession, message: Dict[str, Any]) -> None:
+        """Pass a progress notification to the callback of its request."""
+        if message.get("method") != "notifications/progress":
+            return
+        params = message.get("params") or {}
+        handler = session.progress.get(params.get("progressToken"))
+        if handler is not None:
+            handler(params)
+
+    def _headers(self, session: _UpstreamSession) -> Dict[str, str]:
+        headers = {
+            **session.headers,
+            "Accept": "application/json, text/event-stream",
+            "Content-Type": "application/json",
+            "mcp-protocol-version": session.protocol_version
+        }
+        if session.session_id:
+            headers["mcp-session-id"] = session.session_id
+        return headers
+
+    async def _send(self, session: _UpstreamSession, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """POST a message, for requests of streamable-http returns the response (from JSON or SSE)."""
+        url = session.endpoint if session.transport == "sse" else session.url
+        async with session.limit:
+            async with self._get_client().stream("POST", url, headers=self._headers(session), json=message) as response:
+                if response.status_code == 404 and session.session_id and message.get("method") != "initialize":
+                    raise _SessionExpired()
+                if response.status_code >= 400:
+                    await response.aread()
+                    raise UpstreamError(f"HTTP {response.status_code}: {response.text[:200]}")
+                if session.transport == "sse" or "id" not in message:
+                    return None
+                if message["method"] == "initialize" and response.headers.get("mcp-session-id"):
+                    session.session_id = response.headers["mcp-session-id"]
+
+                if response.headers.get("content-type", "").startswith("text/event-stream"):
+                    async for event in EventSource(response).aiter_sse():
+                        if event.event == "message" and event.data:
+                            reply = json.loads(event.data)
+                            if reply.get("id") == message["id"] and ("result" in reply or "error" in reply):
+                                return reply
+                            self._dispatch_progress(session, reply)
+                    raise UpstreamError("Event stream ended without a response")
+                return json.loads(await response.aread())
+
+    async def _request_sse(self, session: _UpstreamSession, message: Dict[str, Any]) -> Dict[str, Any]:
+        if session.reader is None or session.reader.done():
+            raise UpstreamError("Event stream of the upstream is closed")
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        session.pending[message["id"]] = future
+        try:
+            await self._send(session, message)
+            return await future
+        finally:
+            session.pending.pop(message["id"], None)
+
+    async def _open_sse_stream(self, session: _UpstreamSession) -> None:
+        endpoint: asyncio.Future = asyncio.get_running_loop().create_future()
+        session.reader = asyncio.create_task(self._read_sse_stream(session, endpoint))
+        try:
+            session.endpoint = await asyncio.wait_for(asyncio.shield(endpoint), timeout=MCP_UPSTREAM_CONNECT_TIMEOUT + MCP_UPSTREAM_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise UpstreamError("No endpoint event received on the event stream") from None
+
+    async def _read_sse_stream(self, session: _UpstreamSession, endpoint: asyncio.Future) -> None:
+        error: Exception = UpstreamError("Event stream of the upstream closed")
+        try:
+            headers = {**session.headers, "Accept": "text/event-stream"}
+            # No read timeout - the stream stays open (and mostly silent) for the whole session
+            timeout = httpx.Timeout(MCP_UPSTREAM_TIMEOUT, connect=MCP_UPSTREAM_CONNECT_TIMEOUT, read=None)
+            async with aconnect_sse(self._get_client(), "GET", session.url, headers=headers, timeout=timeout) as event_source:
+                event_source.response.raise_for_status()
+                async for event in event_source.aiter_sse():
+                    if event.event == "endpoint":
+                        if not endpoint.done():
+                            endpoint.set_result(urljoin(session.url, event.data))
+                    elif event.event == "message" and event.data:
+                        reply = json.loads(event.data)
+                        self._dispatch_progress(session, reply)
+                        future = session.pending.get(reply.get("id"))
+                        if future is not None and not future.done() and ("result" in reply or "error" in reply):
+                            future.set_result(reply)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = UpstreamError(f"Event stream of the upstream failed: {str(e) or type(e).__name__}")
+            logger.warning(f"Upstream mcpserver '{session.mcpserver_id}': {error}")
+        finally:
+            for future in [endpoint, *session.pending.values()]:
+                if not future.done():
+                    future.set_exception(error)
+            # Mark the mcpserver stopped, it is reconnected by the next tool call
+            mcpserver = self._mcpservers.get(session.mcpserver_id)
+            if self._sessions.get(session.mcpserver_id) is session and mcpserver is not None:
+                mcpserver.status = "stopped"
+
+    async def _close_session(self, session: _UpstreamSession) -> None:
+        if session.reader is not None:
+            session.reader.cancel()
+            try:
+                await session.reader
+            except (asyncio.CancelledError, Exception):
+                pass
+        elif session.session_id:
+            # Tell the upstream to end the session, servers without support answer 405
+            try:
+                await self._get_client().delete(session.url, headers=self._headers(session))
+            except httpx.HTTPError as e:
+                logger.debug(f"Ending the session of upstream mcpserver '{session.mcpserver_id}' failed: {e}")
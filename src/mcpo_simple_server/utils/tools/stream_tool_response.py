@@ -0,0 +1,122 @@
+"""
+Package/Module: Streaming Tool Response - Server-Sent Events variant of the REST tool endpoints
+
+High Level Concept:
+-------------------
+With `Accept: text/event-stream` the REST tool endpoints answer with an event stream
+instead of one JSON document. The response starts as soon as the call is sent, progress
+of long running tools reaches the client while the tool runs, and the result is written
+one content block at a time instead of being converted and serialized as a whole.
+
+Architecture:
+-------------
+- The tool call runs in a task of its own, its progress notifications go through a
+  bounded queue (the oldest pending notification is dropped when the client lags)
+- Events:
+  - `progress`: params of a notifications/progress message (progress, total, message)
+  - `content`: one content block, processed like process_tool_response does
+  - `done`: end of the result, with the isError flag of the tool result
+  - `error`: status code and detail the JSON endpoint would have answered with
+- The tool call is cancelled when the client goes away
+
+Notes:
+------
+The mcpserver sends the JSON-RPC result of a call as one message, content blocks are
+streamed once it has arrived. Errors found before the call is sent (unknown server,
+invalid arguments) are answered as plain HTTP errors by the endpoints.
+"""
+import json
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Union
+from fastapi import HTTPException, Request, status
+from loguru import logger
+from sse_starlette.sse import ServerSentEvent
+from mcpo_simple_server.utils.tools.process_tool_response import process_tool_response
+from mcpo_simple_server.services.mcpserver.tools import ProgressCallback
+
+# Progress notifications waiting to be written to the client
+MAX_PENDING_PROGRESS = 100
+
+# OpenAPI `responses` of the tool endpoints - documents the event stream variant
+STREAM_TOOL_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {200: {
+    "description": "Tool execution result, or with `Accept: text/event-stream` progress, content, done and error events",
+    "content": {"text/event-stream": {}}
+}}
+
+
+def wants_event_stream(request: Request) -> bool:
+    """True if the client asks for the Server-Sent Events variant of a tool endpoint."""
+    return "text/event-stream" in request.headers.get("accept", "")
+
+
+def _event(event: str, data: Any) -> ServerSentEvent:
+    return ServerSentEvent(json.dumps(data), event=event)
+
+
+async def stream_tool_response(
+        tool_name: str,
+        invoke: Callable[[ProgressCallback], Awaitable[Dict[str, Any]]]
+) -> AsyncIterator[ServerSentEvent]:
+    """
+    Run a tool call and yield its progress and result as Server-Sent Events.
+
+    Args:
+        tool_name: Name of the tool (for logging)
+        invoke: Starts the tool call with the given progress callback, returns the JSON-RPC response
+
+    Yields:
+        `progress` events while the tool runs, then `content` events and `done` - or `error`
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_PROGRESS)
+
+    def on_progress(params: Dict[str, Any]) -> None:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait({key: value for key, value in params.items() if key != "progressToken"})
+
+    task = asyncio.create_task(invoke(on_progress))
+    try:
+        try:
+            while not task.done():
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    getter.cancel()
+                    break
+                yield _event("progress", getter.result())
+            while not queue.empty():
+                yield _event("progress", queue.get_nowait())
+            response = task.result()
+        except HTTPException as e:
+            logger.error(f"Failed to execute tool {tool_name}: {e.detail}")
+            yield _event("error", {"status_code": e.status_code, "detail": e.detail})
+            return
+        except Exception as e:
+            logger.error(f"Failed to execute tool {tool_name}: {str(e)}")
+            yield _event("error", {"status_code": status.HTTP_500_INTERNAL_SERVER_ERROR, "detail": f"Tool execution failed: {str(e)}"})
+            return
+
+        result = response.get("result") or {}
+        if response.get("isError"):
+            yield _event("error", {"status_code": status.HTTP_404_NOT_FOUND, "detail": result})
+            return
+
+        blocks = result.pop("content", None)
+        if blocks is None:
+            if result.get("structuredContent") is None:
+                yield _event("error", {"status_code": status.HTTP_404_NOT_FOUND, "detail": "No result returned from tool execution"})
+                return
+            yield _event("content", result["structuredContent"])
+        else:
+            # Processed and released one block at a time
+            blocks.reverse()
+            while blocks:
+                for value in process_tool_response({"content": [blocks.pop()]}):
+                    yield _event("content", value)
+
+        logger.info(f"Tool {tool_name} executed successfully (streamed)")
+        yield _event("done", {"isError": bool(result.get("isError", False))})
+    finally:
+        # Client went away - do not keep the tool running for nobody
+        if not task.done():
+            task.cancel()
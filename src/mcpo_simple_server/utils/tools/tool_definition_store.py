@@ -0,0 +1,223 @@
+"""
+Package/Module: Tool Definition Store - Content-addressed, deduplicated tool definitions
+
+High Level Concept:
+-------------------
+The same MCP server configured by many users exposes identical tool definitions
+(name, description, inputSchema). Instead of every `{name}-{username}` mcpserver
+holding its own copy, definitions are interned in a content-addressed store keyed
+by the hash of their canonical JSON form. Mcpservers and tool caches reference
+the shared definition by digest.
+
+Architecture:
+-------------
+- ToolDefinition: immutable dict subclass (slots: digest, size) shared by all references,
+  nested dicts and lists (inputSchema) are frozen copies of the interned tool
+- ToolDefinitionStore: digest -> ToolDefinition map, weak so unused definitions are freed
+- Tool caches persist `{"$ref": "<digest>"}` entries, definitions are stored once
+
+Workflow:
+---------
+1. Tools discovered from a mcpserver (or read from cache) are interned
+2. Identical definitions resolve to the same ToolDefinition object
+3. memory_report() compares the size with and without deduplication
+
+Notes:
+------
+ToolDefinition is a read-only dict, so existing code reading tools as dicts keeps
+working. Code which needs to modify a tool must work on a copy: `copy.deepcopy(tool)`
+gives plain, mutable dicts and lists (`dict(tool)` only the top level).
+"""
+import sys
+import json
+import hashlib
+import threading
+import weakref
+from typing import Dict, List, Any, Iterable, Mapping, Optional
+
+# Key used in persisted tool caches to reference a stored definition
+TOOL_DEFINITION_REF_KEY = "$ref"
+# Approximate cost of one reference (list slot pointer) held by a mcpserver
+_REFERENCE_SIZE = 8
+
+
+def tool_definition_digest(tool: Mapping[str, Any]) -> str:
+    """Return the content digest of a tool definition (sha256 of canonical JSON)."""
+    canonical = json.dumps(tool, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _deep_sizeof(obj: Any) -> int:
+    """Approximate memory size of a JSON-like structure in bytes."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_sizeof(k) + _deep_sizeof(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_deep_sizeof(item) for item in obj)
+    return size
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError("ToolDefinition is immutable, use copy.deepcopy(tool) to get a mutable copy")
+
+
+class _FrozenDict(dict):
+    """Read-only dict nested in a ToolDefinition."""
+    __slots__ = ()
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class _FrozenList(list):
+    """Read-only list nested in a ToolDefinition."""
+    __slots__ = ()
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    clear = _readonly
+    sort = _readonly
+    reverse = _readonly
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of a JSON-like value - the interned definition shares nothing with its source."""
+    if isinstance(value, Mapping):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return _FrozenList(_freeze(item) for item in value)
+    return value
+
+
+class ToolDefinition(dict):
+    """
+    Immutable, interned tool definition.
+
+    Behaves like the original tool dict ({"name", "description", "inputSchema", ...})
+    for readers, but cannot be modified and is shared between all mcpservers exposing it.
+    """
+    __slots__ = ("digest", "size", "__weakref__")
+
+    def __init__(self, tool: Mapping[str, Any], digest: str):
+        dict.__init__(self, ((key, _freeze(value)) for key, value in tool.items()))
+        object.__setattr__(self, "digest", digest)
+        object.__setattr__(self, "size", _deep_sizeof(self))
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __setattr__ = _readonly
+    __delattr__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    # Interned objects are compared by content like dicts; hash by digest for set/dict usage
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(self.digest)
+
+    def __reduce__(self):
+        # copy/deepcopy/pickle produce plain (mutable) dicts
+        return (dict, (dict(self),))
+
+    def __repr__(self) -> str:
+        return f"ToolDefinition({self.get('name')!r}, digest={self.digest[:12]})"
+
+
+class ToolDefinitionStore:
+    """Content-addressed store of interned tool definitions."""
+
+    def __init__(self) -> None:
+        self._definitions: "weakref.WeakValueDictionary[str, ToolDefinition]" = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def intern(self, tool: Mapping[str, Any]) -> ToolDefinition:
+        """
+        Return the shared ToolDefinition for the given tool dict.
+
+        Args:
+            tool: Tool definition dict (or an already interned ToolDefinition)
+
+        Returns:
+            Interned ToolDefinition
+        """
+        if isinstance(tool, ToolDefinition):
+            with self._lock:
+                return self._definitions.setdefault(tool.digest, tool)
+
+        digest = tool_definition_digest(tool)
+        with self._lock:
+            definition = self._definitions.get(digest)
+            if definition is None:
+                definition = ToolDefinition(tool, digest)
+                self._definitions[digest] = definition
+            return definition
+
+    def intern_tools(self, tools: Optional[Iterable[Mapping[str, Any]]]) -> List[ToolDefinition]:
+        """Intern a list of tool dicts, preserving order."""
+        return [self.intern(tool) for tool in tools or []]
+
+    def get(self, digest: str) -> Optional[ToolDefinition]:
+        """Get an interned definition by digest."""
+        with self._lock:
+            return self._definitions.get(digest)
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+    def memory_report(self, tool_lists: Iterable[Iterable[Mapping[str, Any]]]) -> Dict[str, Any]:
+        """
+        Report memory used by tool definitions with and without deduplication.
+
+        Args:
+            tool_lists: Tool lists held by mcpservers (one list per mcpserver)
+
+        Returns:
+            Dict with reference/definition counts and approximate sizes in bytes
+        """
+        references = 0
+        bytes_without_dedup = 0
+        unique: Dict[int, int] = {}
+        for tools in tool_lists:
+            for tool in tools or []:
+                references += 1
+                size = tool.size if isinstance(tool, ToolDefinition) else _deep_sizeof(tool)
+                bytes_without_dedup += size
+                unique[id(tool)] = size
+
+        bytes_with_dedup = sum(unique.values()) + references * _REFERENCE_SIZE
+        return {
+            "references": references,
+            "unique_definitions": len(unique),
+            "stored_definitions": len(self),
+            "bytes_without_dedup": bytes_without_dedup,
+            "bytes_with_dedup": bytes_with_dedup,
+            "bytes_saved": max(bytes_without_dedup - bytes_with_dedup, 0)
+        }
+
+
+_TOOL_DEFINITION_STORE = ToolDefinitionStore()
+
+
+def get_tool_definition_store() -> ToolDefinitionStore:
+    """Get the process-wide tool definition store."""
+    return _TOOL_DEFINITION_STORE
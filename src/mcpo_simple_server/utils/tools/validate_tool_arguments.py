@@ -0,0 +1,127 @@
+"""
+Package/Module: Tool Arguments Validation - JSON Schema validation of tool arguments
+
+High Level Concept:
+-------------------
+Tool arguments are validated against the tool's `inputSchema` inside the gateway,
+before the call is forwarded to the mcpserver process. Malformed calls are rejected
+immediately instead of occupying a stdio round-trip to the child.
+
+Architecture:
+-------------
+- Compiled validators are cached per schema (content hash of the canonical JSON form)
+- A fast path keyed by the schema object identity avoids re-hashing hot schemas
+- Both caches are bounded (TOOLS_SCHEMA_VALIDATOR_CACHE_SIZE) and evicted LRU
+
+Workflow:
+---------
+1. Look up (or compile and cache) the validator for the tool's `inputSchema`
+2. Collect all validation errors for the arguments
+3. Return errors in the FastAPI validation error shape (loc/msg/type)
+
+Notes:
+------
+Schemas which are not valid JSON Schema documents are never used for validation,
+the call is forwarded unchanged and the child server decides.
+"""
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+from loguru import logger
+from jsonschema import validators
+from jsonschema.exceptions import SchemaError
+from mcpo_simple_server.config import TOOLS_SCHEMA_VALIDATOR_CACHE_SIZE
+
+# Marker for schemas that failed `check_schema` - cached so they are not re-checked
+_INVALID_SCHEMA = object()
+
+_validators_by_hash: "OrderedDict[str, Any]" = OrderedDict()
+# id(schema) -> (schema, validator); holding the schema keeps its id() from being reused
+_validators_by_id: "OrderedDict[int, Tuple[Dict[str, Any], Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _schema_hash(schema: Dict[str, Any]) -> str:
+    """Return a content hash of the canonical JSON form of the schema."""
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _compile_validator(schema: Dict[str, Any]) -> Any:
+    """Compile a validator for the schema or return _INVALID_SCHEMA."""
+    validator_cls = validators.validator_for(schema)
+    try:
+        validator_cls.check_schema(schema)
+    except SchemaError as e:
+        logger.warning(f"Tool inputSchema is not a valid JSON Schema, arguments will not be validated: {e.message}")
+        return _INVALID_SCHEMA
+    return validator_cls(schema)
+
+
+def get_schema_validator(schema: Optional[Dict[str, Any]]) -> Optional[Any]:
+    """
+    Get a compiled validator for the given schema, compiling it on first use.
+
+    Args:
+        schema: JSON Schema dict (tool inputSchema)
+
+    Returns:
+        Compiled validator or None if the schema is missing or invalid
+    """
+    if not schema or not isinstance(schema, dict):
+        return None
+
+    with _cache_lock:
+        entry = _validators_by_id.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            _validators_by_id.move_to_end(id(schema))
+            validator = entry[1]
+            return None if validator is _INVALID_SCHEMA else validator
+
+    schema_key = _schema_hash(schema)
+    with _cache_lock:
+        validator = _validators_by_hash.get(schema_key)
+        if validator is not None:
+            _validators_by_hash.move_to_end(schema_key)
+
+    if validator is None:
+        validator = _compile_validator(schema)
+
+    with _cache_lock:
+        _validators_by_hash[schema_key] = validator
+        _validators_by_id[id(schema)] = (schema, validator)
+        while len(_validators_by_hash) > TOOLS_SCHEMA_VALIDATOR_CACHE_SIZE:
+            _validators_by_hash.popitem(last=False)
+        while len(_validators_by_id) > TOOLS_SCHEMA_VALIDATOR_CACHE_SIZE:
+            _validators_by_id.popitem(last=False)
+
+    return None if validator is _INVALID_SCHEMA else validator
+
+
+def validate_tool_arguments(schema: Optional[Dict[str, Any]], arguments: Any) -> List[Dict[str, Any]]:
+    """
+    Validate tool arguments against the tool inputSchema.
+
+    Args:
+        schema: Tool inputSchema
+        arguments: Arguments which will be sent to the tool
+
+    Returns:
+        List of errors in FastAPI validation error format, empty when arguments are valid.
+        Example: [{'loc': ['body', 'timezone'], 'msg': "'timezone' is a required property", 'type': 'json_schema.required'}]
+    """
+    validator = get_schema_validator(schema)
+    if validator is None:
+        return []
+
+    errors = []
+    for error in validator.iter_errors(arguments if arguments is not None else {}):
+        errors.append({
+            "loc": ["body", *error.absolute_path],
+            "msg": error.message,
+            "type": f"json_schema.{error.validator}"
+        })
+    return errors
+
@@ -0,0 +1,95 @@
+"""
+Storage backend benchmark - throughput of user config operations per backend.
+
+Populates each backend with the same users (API keys, env, mcpServers) and measures
+operations per second of:
+
+- get_user_config:  concurrent lookups of random users
+- save_user_config: saves of random users (serialized by the backend)
+- list_users:       loading all users
+
+Usage:
+    PYTHONPATH=src JWT_SECRET_KEY=x API_KEY_ENCRYPTION_KEY=<fernet key> \\
+        python tests/server-stress-tests/bench_storage_backends.py [--users 1000] [--seconds 3]
+"""
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from mcpo_simple_server.services.config.models import UserConfigModel
+from mcpo_simple_server.services.config.storage import DDBStorage, NoSQLiteStorage, SQLiteStorage
+
+BACKENDS = {"ddb": DDBStorage, "nosqlite": NoSQLiteStorage, "sqlite": SQLiteStorage}
+
+
+def make_user(index: int) -> UserConfigModel:
+    return UserConfigModel(
+        username=f"bench_user_{index}",
+        hashed_password="$2b$12$" + "x" * 53,
+        group="users",
+        api_keys={f"st-{index}-{k}": {"description": f"key {k}"} for k in range(3)},
+        env={f"ENV_{k}": f"value_{k}" for k in range(5)},
+        mcpServers={
+            f"server_{k}": {"command": "uvx", "args": [f"mcp-server-{k}"], "env": {"TOKEN": "secret"}}
+            for k in range(3)
+        },
+    )
+
+
+async def measure(operation: Callable[[], Awaitable[Any]], seconds: float, concurrency: int) -> float:
+    count = 0
+    deadline = time.perf_counter() + seconds
+
+    async def worker() -> None:
+        nonlocal count
+        while time.perf_counter() < deadline:
+            await operation()
+            count += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return count / (time.perf_counter() - started)
+
+
+async def run_backend(name: str, users: List[UserConfigModel], seconds: float, concurrency: int) -> Dict[str, float]:
+    storage = BACKENDS[name](tempfile.mkdtemp(prefix=f"bench_storage_{name}_"))
+    for user in users:
+        await storage.save_user_config(user)
+    # Drop warm caches so every backend starts from what it keeps after startup
+    await storage.clear_cache()
+
+    results = {
+        "get_user_config": await measure(
+            lambda: storage.get_user_config(random.choice(users).username), seconds, concurrency
+        ),
+        "save_user_config": await measure(lambda: storage.save_user_config(random.choice(users)), seconds, concurrency),
+        "list_users": await measure(storage.list_users, seconds, 1),
+    }
+    await storage.close()
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=["ddb", "nosqlite", "sqlite"])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent get/save callers")
+    args = parser.parse_args()
+
+    users = [make_user(i) for i in range(args.users)]
+    print(f"users={args.users} concurrency={args.concurrency} seconds={args.seconds} (ops/sec)")
+    print(f"{'backend':<10}{'get_user_config':>18}{'save_user_config':>18}{'list_users':>12}")
+    for name in args.backends:
+        result = await run_backend(name, users, args.seconds, args.concurrency)
+        print(
+            f"{name:<10}{result['get_user_config']:>18.0f}{result['save_user_config']:>18.0f}"
+            f"{result['list_users']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""
+Storage I/O benchmark - tail latency of concurrent tool calls during config writes.
+
+Simulated tool calls (short awaits, as a proxied tool call spends most of its time
+waiting) run concurrently with a writer that keeps saving a large tool cache and a
+user config. The storage methods are executed in two modes:
+
+- on-loop:  the blocking method body runs directly on the event loop (previous behavior)
+- executor: the method runs in the storage I/O thread pool (current behavior)
+
+Usage:
+    PYTHONPATH=src JWT_SECRET_KEY=x API_KEY_ENCRYPTION_KEY=<fernet key> \\
+        python tests/server-stress-tests/bench_storage_io.py [--backend ddb|nosqlite] [--seconds 5]
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from mcpo_simple_server.services.config.models import UserConfigModel
+from mcpo_simple_server.services.config.storage import DDBStorage, NoSQLiteStorage
+
+TOOL_CALL_DURATION = 0.002
+
+
+def make_tool_cache(size: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": f"tool_{i}",
+            "description": "Benchmark tool " * 20,
+            "inputSchema": {"type": "object", "properties": {f"arg_{j}": {"type": "string"} for j in range(10)}},
+        }
+        for i in range(size)
+    ]
+
+
+async def tool_call_worker(latencies: List[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TOOL_CALL_DURATION)
+        latencies.append(time.perf_counter() - started)
+
+
+async def config_writer(storage: Any, on_loop: bool, tool_cache: List[Dict[str, Any]], stop: asyncio.Event) -> int:
+    user = UserConfigModel(username="bench_user", hashed_password="x", group="users")
+    writes = 0
+    while not stop.is_set():
+        if on_loop:
+            type(storage).write_tool_cache.__wrapped__(storage, "bench_server", tool_cache)
+            type(storage).save_user_config.__wrapped__(storage, user)
+            await asyncio.sleep(0)
+        else:
+            await storage.write_tool_cache("bench_server", tool_cache)
+            await storage.save_user_config(user)
+        writes += 1
+    return writes
+
+
+async def run_mode(backend: str, on_loop: bool, seconds: float, workers: int, tool_cache_size: int) -> Dict[str, float]:
+    storage_class = DDBStorage if backend == "ddb" else NoSQLiteStorage
+    storage = storage_class(tempfile.mkdtemp(prefix="bench_storage_io_"))
+    tool_cache = make_tool_cache(tool_cache_size)
+    latencies: List[float] = []
+    stop = asyncio.Event()
+
+    tasks = [asyncio.create_task(tool_call_worker(latencies, stop)) for _ in range(workers)]
+    writer = asyncio.create_task(config_writer(storage, on_loop, tool_cache, stop))
+    await asyncio.sleep(seconds)
+    stop.set()
+    writes = await writer
+    await asyncio.gather(*tasks)
+    await storage.close()
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "tool_calls": len(latencies),
+        "config_writes": writes,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["ddb", "nosqlite"], default="ddb")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=50, help="Concurrent simulated tool calls")
+    parser.add_argument("--tools", type=int, default=500, help="Number of tools in the written tool cache")
+    args = parser.parse_args()
+
+    print(f"backend={args.backend} workers={args.workers} tools={args.tools} tool_call={TOOL_CALL_DURATION * 1000:.0f}ms")
+    print(f"{'mode':<10}{'tool calls':>12}{'writes':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for mode, on_loop in (("on-loop", True), ("executor", False)):
+        result = await run_mode(args.backend, on_loop, args.seconds, args.workers, args.tools)
+        print(
+            f"{mode:<10}{result['tool_calls']:>12}{result['config_writes']:>10}"
+            f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['max_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+"""
+Tool cache load benchmark - loading all tool caches, one file per server vs. the packed store.
+
+Writes the same tool caches for N mcpservers as one JSON file per server (previous
+layout) and into the tool cache pack, then measures loading all of them:
+
+- files:      listdir + open/json.load per server (previous get_all_tool_caches)
+- pack:       one sequential read, entries decoded on access (all entries accessed)
+- pack-index: one sequential read, no entry accessed (lazy decoding)
+
+Usage:
+    PYTHONPATH=src JWT_SECRET_KEY=x API_KEY_ENCRYPTION_KEY=<fernet key> \\
+        python tests/server-stress-tests/bench_tool_cache_load.py [--servers 5000] [--tools 10]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from mcpo_simple_server.services.config.storage.tool_cache_pack import PackedToolCacheStore, TOOL_CACHE_PACK_FILE
+
+
+def make_tool_cache(server: int, size: int) -> List[Dict[str, Any]]:
+    return [{"$ref": f"{server:032x}{i:032x}"} for i in range(size)]
+
+
+def load_files(tools_cache_dir: str) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    for filename in os.listdir(tools_cache_dir):
+        if filename.endswith(".json"):
+            with open(os.path.join(tools_cache_dir, filename), "r", encoding="utf-8") as f:
+                result[os.path.splitext(filename)[0]] = json.load(f)
+    return result
+
+
+def best_of(runs: int, func: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--servers", type=int, default=5000)
+    parser.add_argument("--tools", type=int, default=10, help="Tools per server")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    base_dir = tempfile.mkdtemp(prefix="bench_tool_cache_load_")
+    tools_cache_dir = os.path.join(base_dir, "tools_cache")
+    os.makedirs(tools_cache_dir)
+    pack = PackedToolCacheStore(os.path.join(base_dir, TOOL_CACHE_PACK_FILE))
+    for server in range(args.servers):
+        cache = make_tool_cache(server, args.tools)
+        with open(os.path.join(tools_cache_dir, f"server_{server}-user.json"), "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        pack.write(f"server_{server}-user", cache)
+
+    print(f"servers={args.servers} tools={args.tools} pack={os.path.getsize(pack.path)} bytes (best of {args.runs})")
+    print(f"{'layout':<12}{'load all ms':>14}")
+    print(f"{'files':<12}{best_of(args.runs, lambda: load_files(tools_cache_dir)):>14.1f}")
+    print(f"{'pack':<12}{best_of(args.runs, lambda: dict(PackedToolCacheStore(pack.path).read_all())):>14.1f}")
+    print(f"{'pack-index':<12}{best_of(args.runs, lambda: PackedToolCacheStore(pack.path).read_all()):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
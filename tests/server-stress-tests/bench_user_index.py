@@ -0,0 +1,100 @@
+"""
+Startup user loading benchmark - full user configs vs. the light user index.
+
+Populates each backend with N users (every 10th one with mcpservers), then measures
+time and memory kept after the startup scan:
+
+- list_users:      validates a full UserConfigModel for every user (previous startup)
+- list_user_index: light (username, disabled, mcpserver names/types) entry per user,
+                   plus get_user_config for the users that have mcpservers
+
+Usage:
+    PYTHONPATH=src JWT_SECRET_KEY=x API_KEY_ENCRYPTION_KEY=<fernet key> \\
+        python tests/server-stress-tests/bench_user_index.py [--users 5000]
+"""
+import argparse
+import asyncio
+import gc
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from mcpo_simple_server.services.config.models import UserConfigModel
+from mcpo_simple_server.services.config.storage import DDBStorage, NoSQLiteStorage, SQLiteStorage
+
+BACKENDS = {"ddb": DDBStorage, "nosqlite": NoSQLiteStorage, "sqlite": SQLiteStorage}
+
+
+def make_user(index: int) -> UserConfigModel:
+    return UserConfigModel(
+        username=f"bench_user_{index}",
+        hashed_password="$2b$12$" + "x" * 53,
+        group="users",
+        api_keys={f"st-{index}-{k}": {"description": f"key {k}"} for k in range(3)},
+        env={f"ENV_{k}": f"value_{k}" for k in range(5)},
+        mcpServers={
+            f"server_{k}": {"command": "uvx", "args": [f"mcp-server-{k}"], "env": {"TOKEN": "secret"}}
+            for k in range(3)
+        } if index % 10 == 0 else {},
+    )
+
+
+async def measure(scan: Callable[[], Awaitable[Any]], clear: Callable[[], Awaitable[None]]) -> Tuple[float, int]:
+    """
+    Run the scan twice, returns (milliseconds, bytes still allocated while the result is kept).
+    Time is measured without tracemalloc, which slows down every allocation.
+    """
+    await clear()
+    gc.collect()
+    started = time.perf_counter()
+    result = await scan()
+    elapsed = (time.perf_counter() - started) * 1000
+    del result
+
+    await clear()
+    gc.collect()
+    tracemalloc.start()
+    result = await scan()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return elapsed, retained
+
+
+async def run_backend(name: str, users: int) -> Dict[str, Tuple[float, int]]:
+    storage = BACKENDS[name](tempfile.mkdtemp(prefix=f"bench_user_index_{name}_"))
+    for index in range(users):
+        await storage.save_user_config(make_user(index))
+
+    async def full_scan() -> Any:
+        return await storage.list_users()
+
+    async def index_scan() -> Any:
+        index = await storage.list_user_index()
+        configs = [await storage.get_user_config(username) for username, entry in index.items() if entry.mcpservers]
+        return index, configs
+
+    results = {}
+    for label, scan in (("list_users", full_scan), ("list_user_index", index_scan)):
+        results[label] = await measure(scan, storage.clear_cache)
+    await storage.close()
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=["ddb", "nosqlite", "sqlite"])
+    parser.add_argument("--users", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"users={args.users} (every 10th with mcpservers)")
+    print(f"{'backend':<10}{'scan':<18}{'ms':>10}{'retained KiB':>16}")
+    for name in args.backends:
+        for label, (elapsed, retained) in (await run_backend(name, args.users)).items():
+            print(f"{name:<10}{label:<18}{elapsed:>10.1f}{retained / 1024:>16.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,7 +2,9 @@
 import os
 import sys
 import shutil
+import socket
 import subprocess
+import threading
 import time
 import pytest
 import httpx
@@ -14,6 +16,11 @@ from pathlib import Path
 SRC = Path(__file__).parent.parent.parent / 'src' / 'mcpo_simple_server'
 DST = Path('/tmp/testing/mcpo_simple_server')
 CLEAN_URL = 'http://localhost:9999'
+# Secrets of the test server (and of the server package imported by in-process tests)
+TEST_SERVER_ENV = {
+    'JWT_SECRET_KEY': 'esO9RA/36qmedvGaMwCgHqwu1FiRjVeQiNoXRWpvLZXaCXxXlr1/3hwcKST760tKCg+ZnYI3UhjUiFFdrq/byQ==',
+    'API_KEY_ENCRYPTION_KEY': '5zxll-BxzZ3ecE8e1ByvysOorLCuKBJwFssiVW8O8S8='
+}
 
 # Create test environment directory if it doesn't exist
 if not DST.parent.exists():
@@ -97,10 +104,7 @@ def server_url(request):
 
     # Prepare environment variables
     env = os.environ.copy()
-    env.update({
-        'JWT_SECRET_KEY': 'esO9RA/36qmedvGaMwCgHqwu1FiRjVeQiNoXRWpvLZXaCXxXlr1/3hwcKST760tKCg+ZnYI3UhjUiFFdrq/byQ==',
-        'API_KEY_ENCRYPTION_KEY': '5zxll-BxzZ3ecE8e1ByvysOorLCuKBJwFssiVW8O8S8='
-    })
+    env.update(TEST_SERVER_ENV)
 
     # Create log directory if it doesn't exist
     log_dir = Path('/tmp/testing/logs')
@@ -142,6 +146,22 @@ def server_url(request):
     proc.wait(timeout=10)
 
 
+@pytest.fixture(scope='session')
+def server_package(server_url, tmp_path_factory):       # pylint: disable=redefined-outer-name
+    """
+    Make the package of the test server importable in the test process, for tests of
+    internals (storage backends, adapters) which do not need the HTTP API.
+    Instances created by such tests must use their own storage (e.g. tmp_path).
+    """
+    for key, value in TEST_SERVER_ENV.items():
+        os.environ.setdefault(key, value)
+    os.environ.setdefault('CONFIG_STORAGE_PATH', str(tmp_path_factory.mktemp('config')))
+    if str(DST.parent) not in sys.path:
+        sys.path.insert(0, str(DST.parent))
+    import mcpo_simple_server       # pylint: disable=import-outside-toplevel
+    return mcpo_simple_server
+
+
 # Add fixture to obtain and return admin access token for authenticated tests
 @pytest.fixture(scope='session')
 def admin_auth_token(server_url):       # pylint: disable=redefined-outer-name
@@ -154,3 +174,54 @@ def admin_auth_token(server_url):       # pylint: disable=redefined-outer-name
     print(response)
     assert response.status_code == 200
     return response.json()["access_token"]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# Stand-in remote MCP servers for the streamable-http and sse transports of mcpservers
+@pytest.fixture(scope='session')
+def upstream_urls():
+    """Run stand-in MCP servers (one per transport) with `echo`, `wait` and `count` tools in threads of the test process."""
+    import asyncio
+    import uvicorn
+    from mcp.server.fastmcp import Context, FastMCP
+
+    stand_in = FastMCP("stand-in")
+
+    @stand_in.tool()
+    def echo(text: str) -> str:
+        """Echo the text back."""
+        return f"echo: {text}"
+
+    @stand_in.tool()
+    async def wait(seconds: float) -> str:
+        """Wait and answer how long."""
+        await asyncio.sleep(seconds)
+        return f"waited: {seconds}"
+
+    @stand_in.tool()
+    async def count(n: int, ctx: Context) -> list[str]:
+        """Count to n, reporting progress on the way."""
+        for i in range(n):
+            await ctx.report_progress(i + 1, n, f"counted {i + 1}")
+            await asyncio.sleep(0.05)
+        return [f"item {i + 1}" for i in range(n)]
+
+    servers, urls = [], {}
+    for transport, app, path in (("streamable-http", stand_in.streamable_http_app(), "/mcp"), ("sse", stand_in.sse_app(), "/sse")):
+        port = _free_port()
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+        threading.Thread(target=server.run, daemon=True).start()
+        servers.append(server)
+        urls[transport] = f"http://127.0.0.1:{port}{path}"
+    deadline = time.time() + 10
+    while not all(server.started for server in servers):
+        assert time.time() < deadline, "Stand-in MCP servers did not start"
+        time.sleep(0.05)
+    yield urls
+    for server in servers:
+        server.should_exit = True
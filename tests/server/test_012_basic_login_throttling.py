@@ -0,0 +1,44 @@
+import asyncio
+import pytest
+import httpx
+
+
+@pytest.mark.asyncio
+async def test_login_throttling(server_url, admin_auth_token):
+    """
+    Test that repeated failed logins for a username are throttled with 429
+    and that login stats are reported to admins.
+    """
+    async with httpx.AsyncClient() as client:
+        username = "throttle_test_user"
+        status_codes = []
+        for _ in range(6):
+            resp = await client.post(
+                f"{server_url}/api/v1/user/login", json={"username": username, "password": "wrong-password"}
+            )
+            status_codes.append(resp.status_code)
+        assert status_codes[:5] == [401] * 5, f"Expected 401 for the first failed logins, got {status_codes}"
+        assert status_codes[5] == 429, f"Expected 429 after too many failed logins, got {status_codes}"
+        assert "retry-after" in resp.headers, "Expected Retry-After header on throttled login"
+
+        headers = {"Authorization": f"Bearer {admin_auth_token}"}
+        resp = await client.get(f"{server_url}/api/v1/admin/auth/login-stats", headers=headers)
+        assert resp.status_code == 200, f"Login stats failed: {resp.text}"
+        stats = resp.json()
+        assert stats["failed"] >= 5, f"Expected failed logins counted, got {stats}"
+        assert stats["throttled"] >= 1, f"Expected throttled logins counted, got {stats}"
+        assert stats["samples"] >= 5, f"Expected latency samples, got {stats}"
+        assert stats["latency_ms"]["p50"] <= stats["latency_ms"]["p99"], f"Unexpected percentiles: {stats}"
+
+
+@pytest.mark.asyncio
+async def test_login_throttling_concurrent(server_url):
+    """Test that concurrent failed logins cannot pass the throttle check before the first of them failed."""
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        username = "throttle_concurrent_user"
+        responses = await asyncio.gather(*(
+            client.post(f"{server_url}/api/v1/user/login", json={"username": username, "password": "wrong-password"})
+            for _ in range(10)
+        ))
+        status_codes = sorted(resp.status_code for resp in responses)
+        assert status_codes == [401] * 5 + [429] * 5, f"Expected 5 failed and 5 throttled logins, got {status_codes}"
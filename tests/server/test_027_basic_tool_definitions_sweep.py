@@ -0,0 +1,78 @@
+"""Test for the sweep of unreferenced tool definitions and the frozen nested schemas of interned tools."""
+import copy
+import types
+
+import pytest
+
+TOOL_A = {"name": "tool_a", "description": "A", "inputSchema": {"type": "object", "properties": {"x": {"type": "string"}}, "required": ["x"]}}
+TOOL_B = {"name": "tool_b", "description": "B", "inputSchema": {"type": "object", "properties": {}}}
+
+
+def _backend(kind, tmp_path):
+    from mcpo_simple_server.services.config.storage import (
+        DDBStorage, NoSQLiteStorage, SQLiteStorage, KeyValueStorage, InMemoryKeyValueClient
+    )
+    from mcpo_simple_server.services.config.storage.memory_kv_client import InMemoryKeyValueServer
+    if kind == "ddb":
+        return DDBStorage(str(tmp_path))
+    if kind == "nosqlite":
+        return NoSQLiteStorage(str(tmp_path))
+    if kind == "sqlite":
+        return SQLiteStorage(str(tmp_path))
+    return KeyValueStorage(InMemoryKeyValueClient(InMemoryKeyValueServer()))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["ddb", "nosqlite", "sqlite", "memory"])
+async def test_tool_definitions_sweep(server_package, tmp_path, kind):
+    """
+    Test that stored tool definitions live as long as a tool cache references them:
+    1. Two tool caches share a definition - both definitions are stored
+    2. Replacing a cache drops the definition only it referenced
+    3. Deleting a cache keeps the definition still referenced by the other one
+    4. Deleting the last cache leaves no definition behind
+    """
+    from mcpo_simple_server.services.config.events import ConfigEventBus
+    from mcpo_simple_server.services.config.adapters.tools_cache import ToolsCacheAdapter
+
+    backend = _backend(kind, tmp_path)
+    adapter = ToolsCacheAdapter(types.SimpleNamespace(_storage_backend=backend, events=ConfigEventBus()))
+
+    # 1. Shared definition
+    await adapter.write_tool_cache("sweep_a-admin", [TOOL_A, TOOL_B])
+    await adapter.write_tool_cache("sweep_b-admin", [TOOL_A])
+    assert len(await backend.list_tool_definitions()) == 2
+
+    # 2. Replaced cache
+    await adapter.write_tool_cache("sweep_a-admin", [TOOL_A])
+    stored = await backend.list_tool_definitions()
+    assert len(stored) == 1
+    assert [tool["name"] for tool in (await backend.read_tool_definitions(stored)).values()] == ["tool_a"]
+
+    # 3. Still referenced
+    await adapter.delete_tool_cache("sweep_a-admin")
+    assert len(await backend.list_tool_definitions()) == 1
+    assert [tool["name"] for tool in await adapter.get_tool_cache("sweep_b-admin")] == ["tool_a"]
+
+    # 4. Last reference gone
+    await adapter.delete_tool_cache("sweep_b-admin")
+    assert await backend.list_tool_definitions() == []
+
+
+def test_tool_definition_nested_schema_frozen(server_package):
+    """Test that the nested inputSchema of an interned tool is a read-only copy of the source."""
+    from mcpo_simple_server.utils.tools.tool_definition_store import ToolDefinitionStore
+
+    source = copy.deepcopy(TOOL_A)
+    definition = ToolDefinitionStore().intern(source)
+    source["inputSchema"]["required"].append("y")
+    assert definition["inputSchema"]["required"] == ["x"], "Interned definition shares the schema of its source"
+
+    with pytest.raises(TypeError):
+        definition["inputSchema"]["properties"]["y"] = {"type": "string"}
+    with pytest.raises(TypeError):
+        definition["inputSchema"]["required"].append("y")
+
+    mutable = copy.deepcopy(definition)
+    mutable["inputSchema"]["required"].append("y")
+    assert mutable["inputSchema"]["required"] == ["x", "y"] and definition["inputSchema"]["required"] == ["x"]
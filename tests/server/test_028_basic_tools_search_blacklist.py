@@ -0,0 +1,41 @@
+"""Test that tool search applies the same blacklists as tools/list."""
+import types
+
+
+def _tool(name, description):
+    return {"name": name, "description": description, "inputSchema": {"type": "object", "properties": {}}}
+
+
+def test_tools_search_blacklist(server_package):
+    """
+    Test that blacklisted tools are never returned by the search index:
+    1. Without blacklists both matching tools are found
+    2. Global, environment, per mcpserver and user blacklists each hide a tool
+    """
+    from mcpo_simple_server.services.mcpserver.search import McpServerToolSearchIndex
+
+    tools = [_tool("read_file", "Read a file"), _tool("write_file", "Write a file")]
+    mcpserver = types.SimpleNamespace(tools=tools, username="alice", tools_blacklist=[], mcpserver_type="private")
+    parent = types.SimpleNamespace(_mcpservers={"files-alice": mcpserver}, global_blacklist_tools=[], env_blacklist_tools=[])
+    index = McpServerToolSearchIndex(parent)
+
+    def found(**kwargs):
+        return sorted(tool["name"] for tool in index.search_tools("file", username="alice", **kwargs))
+
+    # 1. No blacklists
+    assert found() == ["read_file", "write_file"]
+
+    # 2. Each blacklist
+    parent.global_blacklist_tools.append("write_file")
+    assert found() == ["read_file"], "Global blacklist not applied"
+    parent.global_blacklist_tools.clear()
+
+    parent.env_blacklist_tools.append("read_file")
+    assert found() == ["write_file"], "Environment blacklist not applied"
+    parent.env_blacklist_tools.clear()
+
+    mcpserver.tools_blacklist = ["write_file"]
+    assert found() == ["read_file"], "Mcpserver blacklist not applied"
+    mcpserver.tools_blacklist = []
+
+    assert found(blacklist=["read_file"]) == ["write_file"], "User blacklist not applied"
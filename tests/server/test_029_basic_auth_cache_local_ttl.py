@@ -0,0 +1,25 @@
+"""Test for the lifetime of cached authentication results with and without a storage change feed."""
+import types
+
+
+def test_auth_cache_local_ttl(server_package, tmp_path, monkeypatch):
+    """
+    Test that cached principals expire soon when other processes cannot notify changes:
+    1. A storage with a change feed (KeyValueStorage) keeps the configured TTL
+    2. A file storage caps the TTL to AUTH_CACHE_LOCAL_TTL
+    """
+    from mcpo_simple_server.config import AUTH_CACHE_LOCAL_TTL
+    from mcpo_simple_server.services.auth import auth_cache
+    from mcpo_simple_server.services.config.events import ConfigEventBus
+    from mcpo_simple_server.services.config.adapters.user_config import UserConfigAdapter
+    from mcpo_simple_server.services.config.storage import SQLiteStorage, KeyValueStorage, InMemoryKeyValueClient
+
+    # 1. Change feed
+    cache = auth_cache.AuthCache(ttl=300)
+    monkeypatch.setattr(auth_cache, "_AUTH_CACHE", cache)
+    UserConfigAdapter(types.SimpleNamespace(_storage_backend=KeyValueStorage(InMemoryKeyValueClient()), events=ConfigEventBus()))
+    assert cache._ttl == 300
+
+    # 2. File storage
+    UserConfigAdapter(types.SimpleNamespace(_storage_backend=SQLiteStorage(str(tmp_path)), events=ConfigEventBus()))
+    assert cache._ttl == min(300, AUTH_CACHE_LOCAL_TTL)
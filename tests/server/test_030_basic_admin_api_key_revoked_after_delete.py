@@ -0,0 +1,35 @@
+import pytest
+import httpx
+import json
+
+
+@pytest.mark.asyncio
+async def test_admin_api_key_revoked_after_delete(server_url, admin_auth_token):
+    """
+    Test that a deleted API key is rejected immediately, even after it was
+    used (and its authentication result cached) before the deletion.
+    """
+    async with httpx.AsyncClient() as client:
+        headers = {"Authorization": f"Bearer {admin_auth_token}"}
+        resp = await client.post(f"{server_url}/api/v1/user/api-key", headers=headers)
+        assert resp.status_code == 200, f"API key creation failed: {resp.text}"
+        api_key = resp.json().get("api_key")
+        assert api_key, "No api_key returned in response"
+
+        # Use the API key twice - second request is served from the auth cache
+        api_key_headers = {"Authorization": f"Bearer {api_key}"}
+        for _ in range(2):
+            resp = await client.get(f"{server_url}/api/v1/user/tools/search", headers=api_key_headers, params={"q": "time"})
+            assert resp.status_code == 200, f"API key authentication failed: {resp.text}"
+
+        delete_headers = {"Authorization": f"Bearer {admin_auth_token}", "Content-Type": "application/json"}
+        delete_resp = await client.request(
+            "DELETE",
+            f"{server_url}/api/v1/user/api-key",
+            headers=delete_headers,
+            content=json.dumps({"api_key": api_key})
+        )
+        assert delete_resp.status_code == 204, f"API key deletion failed: {delete_resp.text}"
+
+        resp = await client.get(f"{server_url}/api/v1/user/tools/search", headers=api_key_headers, params={"q": "time"})
+        assert resp.status_code == 401, f"Expected 401 for deleted API key, got {resp.status_code}: {resp.text}"
@@ -0,0 +1,120 @@
+"""Test for the API key index stored with the user configs."""
+import types
+
+import pytest
+
+API_KEY = "st-index-test-key"
+
+
+def _config_service(kind, tmp_path):
+    """Adapters of a ConfigService on a backend of their own."""
+    from mcpo_simple_server.services.config.events import ConfigEventBus
+    from mcpo_simple_server.services.config.adapters.user_config import UserConfigAdapter
+    from mcpo_simple_server.services.config.adapters.api_key_index import ApiKeyIndexAdapter
+    from mcpo_simple_server.services.config.storage import (
+        DDBStorage, NoSQLiteStorage, SQLiteStorage, KeyValueStorage, InMemoryKeyValueClient
+    )
+    from mcpo_simple_server.services.config.storage.memory_kv_client import InMemoryKeyValueServer
+
+    if kind == "ddb":
+        backend = DDBStorage(str(tmp_path))
+    elif kind == "nosqlite":
+        backend = NoSQLiteStorage(str(tmp_path))
+    elif kind == "sqlite":
+        backend = SQLiteStorage(str(tmp_path))
+    else:
+        backend = KeyValueStorage(InMemoryKeyValueClient(InMemoryKeyValueServer()))
+    service = types.SimpleNamespace(_storage_backend=backend, events=ConfigEventBus())
+    service.user_config = UserConfigAdapter(service)
+    service.api_key_index = ApiKeyIndexAdapter(service)
+    return service
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["ddb", "nosqlite", "sqlite", "memory"])
+async def test_api_key_index_consistency(server_package, tmp_path, kind):
+    """
+    Test that the stored API key index follows the user config and never grants access on its own:
+    1. Saving a user with a key stores its index entry and the key authenticates
+    2. A stale stored entry (key not in the owner's config) is rejected after a reload
+    3. Revoking the key deletes its entry
+    4. Deleting the user deletes the remaining entries
+    """
+    from mcpo_simple_server.services.config.models import UserConfigModel
+    from mcpo_simple_server.services.config.models.user_config_model import ApiKeyMetadataModel
+    from mcpo_simple_server.services.config.adapters.api_key_index import api_key_digest
+
+    service = _config_service(kind, tmp_path)
+    backend = service._storage_backend
+    await service.api_key_index.load()
+
+    # 1. Key created
+    user = UserConfigModel(username="index_user", hashed_password="x", group="users", api_keys={API_KEY: ApiKeyMetadataModel(description="test")})
+    assert await service.user_config.save_config(user)
+    stored = await backend.read_api_key_index()
+    assert set(stored) == {api_key_digest(API_KEY)}
+    assert stored[api_key_digest(API_KEY)]["username"] == "index_user"
+    assert (await service.api_key_index.authenticate(API_KEY)).username == "index_user"
+
+    # 2. Stale entry
+    second = UserConfigModel(username="index_user", hashed_password="x", group="users", api_keys={
+        API_KEY: ApiKeyMetadataModel(description="test"), "st-stale-key": ApiKeyMetadataModel()
+    })
+    assert await service.user_config.save_config(second)
+    await backend.save_user_config(user)            # Config without the key, index entry left behind
+    await backend.clear_cache()
+    await service.api_key_index.load()
+    assert service.api_key_index.lookup("st-stale-key") is not None
+    assert await service.api_key_index.authenticate("st-stale-key") is None, "Stale index entry granted access"
+
+    # 3. Key revoked
+    user.api_keys = {}
+    assert await service.user_config.save_config(user)
+    assert await service.api_key_index.authenticate(API_KEY) is None
+    assert api_key_digest(API_KEY) not in (await backend.read_api_key_index() or {})
+
+    # 4. User deleted
+    assert await service.user_config.delete_config("index_user")
+    assert not await backend.read_api_key_index()
+    await backend.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["ddb", "nosqlite", "sqlite"])
+async def test_api_key_created_by_other_process(server_package, tmp_path, kind):
+    """
+    Test that a key created through another ConfigService on the same storage path authenticates:
+    1. Key with a stored index entry
+    2. Key stored without an index entry (owner taken from the encrypted key)
+    3. Key revoked by the other service is rejected, unknown keys are rejected
+    """
+    from mcpo_simple_server.services.auth.api_key import create_api_key
+    from mcpo_simple_server.services.config.models import UserConfigModel
+    from mcpo_simple_server.services.config.models.user_config_model import ApiKeyMetadataModel
+
+    writer = _config_service(kind, tmp_path)
+    reader = _config_service(kind, tmp_path)
+    await writer.api_key_index.load()
+    await reader.api_key_index.load()
+    indexed_key, unindexed_key = create_api_key("other_user"), create_api_key("other_user")
+
+    # 1. Stored index entry
+    user = UserConfigModel(username="other_user", hashed_password="x", group="users", api_keys={indexed_key: ApiKeyMetadataModel()})
+    assert await writer.user_config.save_config(user)
+    assert (await reader.api_key_index.authenticate(indexed_key)).username == "other_user"
+    assert reader.api_key_index.lookup(indexed_key) is not None, "Verified key was not added to the index"
+
+    # 2. No index entry
+    user.api_keys = {indexed_key: ApiKeyMetadataModel(), unindexed_key: ApiKeyMetadataModel()}
+    await writer._storage_backend.save_user_config(user)
+    assert (await reader.api_key_index.authenticate(unindexed_key)).username == "other_user"
+
+    # 3. Revoked and unknown keys
+    user.api_keys = {}
+    assert await writer.user_config.save_config(user)
+    if kind != "nosqlite":      # NoSQLiteStorage serves cached user configs without checking the database
+        assert await reader.api_key_index.authenticate(indexed_key) is None, "Key revoked by the other service granted access"
+    assert await reader.api_key_index.authenticate(create_api_key("other_user")) is None
+    assert await reader.api_key_index.authenticate("st-not-a-key") is None
+    await writer._storage_backend.close()
+    await reader._storage_backend.close()
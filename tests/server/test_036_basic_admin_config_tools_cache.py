@@ -0,0 +1,19 @@
+import pytest
+import httpx
+
+
+@pytest.mark.asyncio
+async def test_admin_config_tools_cache(server_url, admin_auth_token):
+    """
+    Test that the tool caches are loaded into the admin config response on demand.
+    """
+    async with httpx.AsyncClient() as client:
+        headers = {"Authorization": f"Bearer {admin_auth_token}"}
+        first = await client.get(f"{server_url}/api/v1/user/config", headers=headers)
+        assert first.status_code == 200, f"Get config failed: {first.text}"
+        assert isinstance(first.json()["tools_cache"], dict), f"Expected tools_cache for admin: {first.json()}"
+
+        # Served from the memoized snapshot
+        second = await client.get(f"{server_url}/api/v1/user/config", headers=headers)
+        assert second.status_code == 200, f"Get config failed: {second.text}"
+        assert second.json()["tools_cache"] == first.json()["tools_cache"]
@@ -0,0 +1,31 @@
+import pytest
+import httpx
+
+
+@pytest.mark.asyncio
+async def test_admin_storage_write_coalescing(server_url, admin_auth_token):
+    """
+    Test that a burst of user config changes is merged into fewer writes and reads see the latest change.
+    """
+    async with httpx.AsyncClient() as client:
+        headers = {"Authorization": f"Bearer {admin_auth_token}"}
+        resp = await client.get(f"{server_url}/api/v1/admin/storage/stats", headers=headers)
+        assert resp.status_code == 200, f"Storage stats failed: {resp.text}"
+        if "write_behind" not in resp.json():
+            pytest.skip("Write-behind is disabled (CONFIG_WRITE_BEHIND_DELAY=0)")
+        before = resp.json()["write_behind"]
+
+        for i in range(5):
+            resp = await client.put(f"{server_url}/api/v1/user/env/WRITE_BEHIND_TEST", headers=headers, json={"value": str(i)})
+            assert resp.status_code == 204, f"Set env failed: {resp.text}"
+
+        resp = await client.get(f"{server_url}/api/v1/user/env", headers=headers)
+        assert resp.status_code == 200, f"Get env failed: {resp.text}"
+        assert resp.json()["WRITE_BEHIND_TEST"] == "4", f"Expected the latest value: {resp.json()}"
+
+        resp = await client.get(f"{server_url}/api/v1/admin/storage/stats", headers=headers)
+        after = resp.json()["write_behind"]
+        assert after["coalesced"] > before["coalesced"], f"Expected coalesced writes, before: {before}, after: {after}"
+
+        resp = await client.delete(f"{server_url}/api/v1/user/env/WRITE_BEHIND_TEST", headers=headers)
+        assert resp.status_code == 204, f"Delete env failed: {resp.text}"
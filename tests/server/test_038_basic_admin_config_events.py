@@ -0,0 +1,34 @@
+import pytest
+import httpx
+
+
+@pytest.mark.asyncio
+async def test_admin_config_change_events(server_url, admin_auth_token):
+    """
+    Test that a user config change publishes a user_changed event and derived caches are refreshed.
+    """
+    async with httpx.AsyncClient() as client:
+        headers = {"Authorization": f"Bearer {admin_auth_token}"}
+        resp = await client.get(f"{server_url}/api/v1/user/tools/openapi.json", headers=headers)
+        assert resp.status_code == 200, f"User tools openapi failed: {resp.text}"
+
+        resp = await client.get(f"{server_url}/api/v1/admin/storage/stats", headers=headers)
+        assert resp.status_code == 200, f"Storage stats failed: {resp.text}"
+        before = resp.json()["events"]
+        assert before["subscribers"]["user_changed"] >= 2, f"Expected auth cache and user tools subscribers: {before}"
+
+        resp = await client.put(f"{server_url}/api/v1/user/env/CONFIG_EVENTS_TEST", headers=headers, json={"value": "1"})
+        assert resp.status_code == 204, f"Set env failed: {resp.text}"
+
+        resp = await client.get(f"{server_url}/api/v1/admin/storage/stats", headers=headers)
+        after = resp.json()["events"]
+        assert after["published"]["user_changed"] > before["published"]["user_changed"], \
+            f"Expected a user_changed event, before: {before}, after: {after}"
+        assert after["errors"] == before["errors"], f"Config event handlers failed: {after}"
+
+        # The user stays authenticated and the tools schema is rebuilt after the invalidation
+        resp = await client.get(f"{server_url}/api/v1/user/tools/openapi.json", headers=headers)
+        assert resp.status_code == 200, f"User tools openapi failed after change: {resp.text}"
+
+        resp = await client.delete(f"{server_url}/api/v1/user/env/CONFIG_EVENTS_TEST", headers=headers)
+        assert resp.status_code == 204, f"Delete env failed: {resp.text}"
@@ -0,0 +1,40 @@
+"""Test for the light user index of the ddb backend."""
+import json
+import os
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_ddb_user_index(server_package, tmp_path):
+    """
+    Test that the user index matches the full user configs, also for documents of older versions:
+    1. Index entries of current and legacy (api_keys list) documents match list_users
+    2. The legacy user with mcpservers is cached with migrated api_keys
+    """
+    from mcpo_simple_server.services.config.models import UserConfigModel, UserIndexEntry
+    from mcpo_simple_server.services.config.storage import DDBStorage
+
+    backend = DDBStorage(str(tmp_path))
+    await backend.save_user_config(UserConfigModel(username="current_user", hashed_password="x", group="users", disabled=True))
+    with open(os.path.join(str(tmp_path), "users", "legacy_user.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            "username": "legacy_user", "hashed_password": "x", "group": "users",
+            "api_keys": ["st-legacy-key"],
+            "mcpServers": {"time": {"command": "uvx", "args": ["mcp-server-time"], "mcpserver_type": "public"}},
+        }, f)
+    await backend.clear_cache()
+
+    # 1. Index
+    index = await backend.list_user_index()
+    users = await backend.list_users()
+    assert set(index) == set(users) == {"current_user", "legacy_user"}
+    assert index == {username: UserIndexEntry.from_config(config) for username, config in users.items()}
+    assert index["legacy_user"].mcpservers == {"time": "public"}
+
+    # 2. Cached legacy user
+    assert backend.get_cache_stats()["cached_users"] == 1
+    legacy = await backend.get_user_config("legacy_user")
+    assert list(legacy.api_keys) == ["st-legacy-key"]
+    assert backend.get_cache_stats()["hits"] == 1
+    await backend.close()
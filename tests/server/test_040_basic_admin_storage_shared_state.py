@@ -0,0 +1,35 @@
+import asyncio
+import pytest
+import httpx
+
+
+@pytest.mark.asyncio
+async def test_admin_storage_shared_state(server_url, admin_auth_token):
+    """
+    Test that the shared (key-value) storage is subscribed to changes and serves repeated reads from the local cache.
+    """
+    async with httpx.AsyncClient() as client:
+        headers = {"Authorization": f"Bearer {admin_auth_token}"}
+        resp = await client.get(f"{server_url}/api/v1/admin/storage/stats", headers=headers)
+        assert resp.status_code == 200, f"Storage stats failed: {resp.text}"
+        if resp.json()["storage_type"] not in ("redis", "memory"):
+            pytest.skip("Shared state stats are reported by the redis / memory backends")
+
+        # Pending (write-behind) saves are served without the local cache - wait until written
+        for _ in range(50):
+            resp = await client.get(f"{server_url}/api/v1/admin/storage/stats", headers=headers)
+            before = resp.json()
+            if before.get("write_behind", {}).get("pending", 0) == 0:
+                break
+            await asyncio.sleep(0.1)
+        assert before["subscribed"] is True, f"Expected the change subscription: {before}"
+        assert before["node_id"], f"Expected a node id: {before}"
+
+        for _ in range(3):
+            resp = await client.get(f"{server_url}/api/v1/user/env", headers=headers)
+            assert resp.status_code == 200, f"Get env failed: {resp.text}"
+
+        resp = await client.get(f"{server_url}/api/v1/admin/storage/stats", headers=headers)
+        after = resp.json()
+        assert after["hits"] >= before["hits"] + 2, f"Expected local cache hits, before: {before}, after: {after}"
+        assert after["remote_reads"] <= before["remote_reads"] + 1, f"Expected no repeated store reads, before: {before}, after: {after}"
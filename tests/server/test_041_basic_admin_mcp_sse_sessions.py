@@ -0,0 +1,77 @@
+import json
+import asyncio
+import pytest
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+
+async def _list_tools_twice(url, headers):
+    async with sse_client(url, headers=headers) as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            first = await session.list_tools()
+            second = await session.list_tools()
+            return [tool.name for tool in first.tools], [tool.name for tool in second.tools]
+
+
+@pytest.mark.asyncio
+async def test_admin_mcp_sse_sessions(server_url, admin_auth_token):
+    """
+    Test that concurrent SSE sessions of different callers are served by the shared MCP server.
+    """
+    async with httpx.AsyncClient() as client:
+        headers = {"Authorization": f"Bearer {admin_auth_token}"}
+        resp = await client.post(f"{server_url}/api/v1/user/api-key", headers=headers)
+        assert resp.status_code == 200, f"API key creation failed: {resp.text}"
+        api_key = resp.json()["api_key"]
+
+        resp = await client.get(f"{server_url}/api/v1/sse/", headers={"Authorization": "Bearer st-invalid"})
+        assert resp.status_code == 401, f"Expected 401 for an invalid API key: {resp.text}"
+
+    try:
+        admin_tools, anonymous_tools = await asyncio.wait_for(asyncio.gather(
+            _list_tools_twice(f"{server_url}/api/v1/sse/", {"Authorization": f"Bearer {api_key}"}),
+            _list_tools_twice(f"{server_url}/api/v1/sse/", {}),
+        ), timeout=30)
+        # The principal is bound once per session and stays the same for every message
+        assert admin_tools[0] == admin_tools[1], f"Tools of the admin session changed: {admin_tools}"
+        assert anonymous_tools[0] == anonymous_tools[1], f"Tools of the anonymous session changed: {anonymous_tools}"
+        assert set(anonymous_tools[0]) <= set(admin_tools[0]), \
+            f"Anonymous session sees tools the admin session does not: {anonymous_tools[0]} / {admin_tools[0]}"
+    finally:
+        async with httpx.AsyncClient() as client:
+            headers = {"Authorization": f"Bearer {admin_auth_token}", "Content-Type": "application/json"}
+            resp = await client.request("DELETE", f"{server_url}/api/v1/user/api-key", headers=headers, content=json.dumps({"api_key": api_key}))
+            assert resp.status_code == 204, f"API key deletion failed: {resp.text}"
+
+
+@pytest.mark.asyncio
+async def test_admin_mcp_sse_session_revoked(server_url, admin_auth_token):
+    """
+    Test that an SSE session is closed once the API key that opened it is deleted.
+    """
+    admin_headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    async with httpx.AsyncClient() as client:
+        resp = await client.post(f"{server_url}/api/v1/user/api-key", headers=admin_headers)
+        assert resp.status_code == 200, f"API key creation failed: {resp.text}"
+        api_key = resp.json()["api_key"]
+
+        async with sse_client(f"{server_url}/api/v1/sse/", headers={"Authorization": f"Bearer {api_key}"}) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                resp = await client.get(f"{server_url}/api/v1/admin/mcp/sessions", headers=admin_headers)
+                before = {s["id"] for s in resp.json()["sessions"] if s["transport"] == "sse" and s["username"] == "admin"}
+                assert len(before) == 1, f"Expected the SSE session of admin: {resp.text}"
+
+                headers = {**admin_headers, "Content-Type": "application/json"}
+                resp = await client.request("DELETE", f"{server_url}/api/v1/user/api-key", headers=headers, content=json.dumps({"api_key": api_key}))
+                assert resp.status_code == 204, f"API key deletion failed: {resp.text}"
+
+                for _ in range(50):
+                    resp = await client.get(f"{server_url}/api/v1/admin/mcp/sessions", headers=admin_headers)
+                    if not before & {s["id"] for s in resp.json()["sessions"]}:
+                        break
+                    await asyncio.sleep(0.1)
+                assert not before & {s["id"] for s in resp.json()["sessions"]}, f"Revoked SSE session still open: {resp.text}"
+                assert resp.json()["stats"]["revoked"] >= 1, f"Expected a revoked session: {resp.text}"
@@ -0,0 +1,66 @@
+import json
+import pytest
+import httpx
+
+MCP_HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+def _jsonrpc_message(resp):
+    """Get the JSON-RPC message of a Streamable HTTP response (JSON or SSE framed)."""
+    if resp.headers.get("content-type", "").startswith("text/event-stream"):
+        data = [line[5:].strip() for line in resp.text.splitlines() if line.startswith("data:")]
+        return json.loads(data[-1])
+    return resp.json()
+
+
+@pytest.mark.asyncio
+async def test_admin_mcp_streamable_sessions(server_url, admin_auth_token):
+    """
+    Test that a Streamable HTTP session is bound to the API key that opened it and refused once the key is deleted.
+    """
+    url = f"{server_url}/api/v1/mcp/"
+    admin_headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    delete_headers = {**admin_headers, "Content-Type": "application/json"}
+    api_keys = []
+    async with httpx.AsyncClient() as client:
+        for _ in range(2):
+            resp = await client.post(f"{server_url}/api/v1/user/api-key", headers=admin_headers)
+            assert resp.status_code == 200, f"API key creation failed: {resp.text}"
+            api_keys.append(resp.json()["api_key"])
+        owner_key, other_key = api_keys
+
+        try:
+            resp = await client.post(url, headers={**MCP_HEADERS, "Authorization": f"Bearer {owner_key}"}, json={
+                "jsonrpc": "2.0", "id": 1, "method": "initialize",
+                "params": {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "test", "version": "1.0"}}
+            })
+            assert resp.status_code == 200, f"Initialize failed: {resp.text}"
+            session_headers = {**MCP_HEADERS, "mcp-session-id": resp.headers["mcp-session-id"]}
+            owner_headers = {**session_headers, "Authorization": f"Bearer {owner_key}"}
+
+            resp = await client.post(url, headers=owner_headers, json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+            assert resp.status_code == 202, f"Initialized notification failed: {resp.text}"
+
+            resp = await client.post(url, headers=owner_headers, json={"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+            assert resp.status_code == 200, f"tools/list failed: {resp.text}"
+            assert "tools" in _jsonrpc_message(resp)["result"], f"Unexpected tools/list result: {resp.text}"
+
+            # Other API keys (even of the same user) and anonymous callers can not use the session
+            resp = await client.post(url, headers={**session_headers, "Authorization": f"Bearer {other_key}"},
+                                     json={"jsonrpc": "2.0", "id": 3, "method": "tools/list"})
+            assert resp.status_code == 404, f"Expected 404 for another API key: {resp.status_code} {resp.text}"
+            resp = await client.post(url, headers=session_headers, json={"jsonrpc": "2.0", "id": 4, "method": "tools/list"})
+            assert resp.status_code == 404, f"Expected 404 for an anonymous caller: {resp.status_code} {resp.text}"
+
+            # Deleting the API key revokes the session
+            resp = await client.request("DELETE", f"{server_url}/api/v1/user/api-key", headers=delete_headers,
+                                        content=json.dumps({"api_key": owner_key}))
+            assert resp.status_code == 204, f"API key deletion failed: {resp.text}"
+            api_keys.remove(owner_key)
+            resp = await client.post(url, headers=owner_headers, json={"jsonrpc": "2.0", "id": 5, "method": "tools/list"})
+            assert resp.status_code == 401, f"Expected 401 for a revoked session: {resp.status_code} {resp.text}"
+        finally:
+            for api_key in api_keys:
+                resp = await client.request("DELETE", f"{server_url}/api/v1/user/api-key", headers=delete_headers,
+                                            content=json.dumps({"api_key": api_key}))
+                assert resp.status_code == 204, f"API key deletion failed: {resp.text}"
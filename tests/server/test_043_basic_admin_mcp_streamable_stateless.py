@@ -0,0 +1,37 @@
+import json
+import pytest
+import httpx
+
+MCP_HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+@pytest.mark.asyncio
+async def test_admin_mcp_streamable_stateless(server_url, admin_auth_token):
+    """
+    Test that the stateless Streamable HTTP mount answers independent requests with plain JSON and no session.
+    """
+    url = f"{server_url}/api/v1/mcp-stateless/"
+    async with httpx.AsyncClient() as client:
+        headers = {"Authorization": f"Bearer {admin_auth_token}"}
+        resp = await client.post(f"{server_url}/api/v1/user/api-key", headers=headers)
+        assert resp.status_code == 200, f"API key creation failed: {resp.text}"
+        api_key = resp.json()["api_key"]
+
+        try:
+            resp = await client.post(url, headers={**MCP_HEADERS, "Authorization": "Bearer st-invalid"},
+                                     json={"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+            assert resp.status_code == 401, f"Expected 401 for an invalid API key: {resp.text}"
+
+            # Every request stands on its own - no initialize, no session ID
+            for request_id in (2, 3):
+                resp = await client.post(url, headers={**MCP_HEADERS, "Authorization": f"Bearer {api_key}"},
+                                         json={"jsonrpc": "2.0", "id": request_id, "method": "tools/list"})
+                assert resp.status_code == 200, f"tools/list failed: {resp.text}"
+                assert resp.headers["content-type"].startswith("application/json"), f"Expected a JSON response: {resp.headers}"
+                assert "mcp-session-id" not in resp.headers, f"Unexpected session ID: {resp.headers}"
+                body = resp.json()
+                assert body["id"] == request_id and "tools" in body["result"], f"Unexpected tools/list result: {resp.text}"
+        finally:
+            headers = {**headers, "Content-Type": "application/json"}
+            resp = await client.request("DELETE", f"{server_url}/api/v1/user/api-key", headers=headers, content=json.dumps({"api_key": api_key}))
+            assert resp.status_code == 204, f"API key deletion failed: {resp.text}"
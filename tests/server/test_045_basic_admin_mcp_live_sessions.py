@@ -0,0 +1,80 @@
+import json
+import asyncio
+import pytest
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+MCP_HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+@pytest.mark.asyncio
+async def test_admin_mcp_live_sessions(server_url, admin_auth_token):
+    """
+    Test that open MCP sessions are listed with their user, activity and traffic, and removed when they end.
+    """
+    admin_headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    async with httpx.AsyncClient() as client:
+        resp = await client.post(f"{server_url}/api/v1/user/api-key", headers=admin_headers)
+        assert resp.status_code == 200, f"API key creation failed: {resp.text}"
+        api_key = resp.json()["api_key"]
+
+        try:
+            async with sse_client(f"{server_url}/api/v1/sse/", headers={"Authorization": f"Bearer {api_key}"}) as (read_stream, write_stream):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    await session.list_tools()
+
+                    resp = await client.get(f"{server_url}/api/v1/admin/mcp/sessions", headers=admin_headers)
+                    assert resp.status_code == 200, f"Session listing failed: {resp.text}"
+                    listing = resp.json()
+                    sse_sessions = [s for s in listing["sessions"] if s["transport"] == "sse" and s["username"] == "admin"]
+                    assert len(sse_sessions) == 1, f"Expected the SSE session of admin: {listing}"
+                    live = sse_sessions[0]
+                    assert live["messages"] >= 1 and live["bytes_sent"] > 0, f"Expected activity of the session: {live}"
+                    assert live["age"] >= live["idle"] >= 0, f"Unexpected age / idle time: {live}"
+                    assert listing["stats"]["open"] == len(listing["sessions"]), f"Unexpected stats: {listing}"
+
+            # The server notices the closed connection shortly after
+            for _ in range(50):
+                resp = await client.get(f"{server_url}/api/v1/admin/mcp/sessions", headers=admin_headers)
+                if live["id"] not in [s["id"] for s in resp.json()["sessions"]]:
+                    break
+                await asyncio.sleep(0.1)
+            assert live["id"] not in [s["id"] for s in resp.json()["sessions"]], f"Closed session still listed: {resp.text}"
+        finally:
+            headers = {**admin_headers, "Content-Type": "application/json"}
+            resp = await client.request("DELETE", f"{server_url}/api/v1/user/api-key", headers=headers, content=json.dumps({"api_key": api_key}))
+            assert resp.status_code == 204, f"API key deletion failed: {resp.text}"
+
+
+@pytest.mark.asyncio
+async def test_admin_mcp_live_sessions_terminated(server_url, admin_auth_token):
+    """
+    Test that closing a Streamable HTTP session from the server (revoked API key) ends it and removes it from the listing.
+    """
+    admin_headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    async with httpx.AsyncClient() as client:
+        resp = await client.post(f"{server_url}/api/v1/user/api-key", headers=admin_headers)
+        assert resp.status_code == 200, f"API key creation failed: {resp.text}"
+        api_key = resp.json()["api_key"]
+
+        resp = await client.post(f"{server_url}/api/v1/mcp/", headers={**MCP_HEADERS, "Authorization": f"Bearer {api_key}"}, json={
+            "jsonrpc": "2.0", "id": 1, "method": "initialize",
+            "params": {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "test", "version": "1.0"}}
+        })
+        assert resp.status_code == 200, f"Initialize failed: {resp.text}"
+        session_id = resp.headers["mcp-session-id"]
+        resp = await client.get(f"{server_url}/api/v1/admin/mcp/sessions", headers=admin_headers)
+        assert session_id in [s["id"] for s in resp.json()["sessions"]], f"Session not listed: {resp.text}"
+
+        headers = {**admin_headers, "Content-Type": "application/json"}
+        resp = await client.request("DELETE", f"{server_url}/api/v1/user/api-key", headers=headers, content=json.dumps({"api_key": api_key}))
+        assert resp.status_code == 204, f"API key deletion failed: {resp.text}"
+
+        for _ in range(50):
+            resp = await client.get(f"{server_url}/api/v1/admin/mcp/sessions", headers=admin_headers)
+            if session_id not in [s["id"] for s in resp.json()["sessions"]]:
+                break
+            await asyncio.sleep(0.1)
+        assert session_id not in [s["id"] for s in resp.json()["sessions"]], f"Terminated session still listed: {resp.text}"
@@ -0,0 +1,77 @@
+import json
+import asyncio
+import pytest
+import httpx
+from websockets.asyncio.client import connect
+from websockets.exceptions import ConnectionClosed, InvalidStatus
+
+
+@pytest.mark.asyncio
+async def test_admin_mcp_websocket(server_url, admin_auth_token):
+    """
+    Test an MCP session over the WebSocket transport, authenticated once at the handshake.
+    """
+    ws_url = server_url.replace("http://", "ws://", 1) + "/api/v1/ws"
+    admin_headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    async with httpx.AsyncClient() as client:
+        resp = await client.post(f"{server_url}/api/v1/user/api-key", headers=admin_headers)
+        assert resp.status_code == 200, f"API key creation failed: {resp.text}"
+        api_key = resp.json()["api_key"]
+
+        try:
+            with pytest.raises(InvalidStatus) as denied:
+                async with connect(ws_url, additional_headers={"Authorization": "Bearer st-invalid"}, subprotocols=["mcp"]):
+                    pass
+            assert denied.value.response.status_code == 401, f"Expected 401 for an invalid API key: {denied.value}"
+
+            async with connect(ws_url, additional_headers={"Authorization": f"Bearer {api_key}"}, subprotocols=["mcp"]) as ws:
+                assert ws.subprotocol == "mcp", f"Unexpected subprotocol: {ws.subprotocol}"
+                await ws.send(json.dumps({
+                    "jsonrpc": "2.0", "id": 1, "method": "initialize",
+                    "params": {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "test", "version": "1.0"}}
+                }))
+                initialized = json.loads(await ws.recv())
+                assert initialized["id"] == 1 and "serverInfo" in initialized["result"], f"Initialize failed: {initialized}"
+                await ws.send(json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}))
+
+                # Several messages over the same socket, no further authentication
+                for request_id in (2, 3):
+                    await ws.send(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": "tools/list"}))
+                    listed = json.loads(await ws.recv())
+                    assert listed["id"] == request_id and "tools" in listed["result"], f"tools/list failed: {listed}"
+
+                resp = await client.get(f"{server_url}/api/v1/admin/mcp/sessions", headers=admin_headers)
+                sessions = [s for s in resp.json()["sessions"] if s["transport"] == "websocket" and s["username"] == "admin"]
+                assert len(sessions) == 1 and sessions[0]["messages"] >= 2, f"Expected the WebSocket session of admin: {resp.text}"
+        finally:
+            headers = {**admin_headers, "Content-Type": "application/json"}
+            resp = await client.request("DELETE", f"{server_url}/api/v1/user/api-key", headers=headers, content=json.dumps({"api_key": api_key}))
+            assert resp.status_code == 204, f"API key deletion failed: {resp.text}"
+
+
+@pytest.mark.asyncio
+async def test_admin_mcp_websocket_revoked(server_url, admin_auth_token):
+    """
+    Test that a WebSocket session is closed (1008) once the API key of its handshake is deleted.
+    """
+    ws_url = server_url.replace("http://", "ws://", 1) + "/api/v1/ws"
+    admin_headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    async with httpx.AsyncClient() as client:
+        resp = await client.post(f"{server_url}/api/v1/user/api-key", headers=admin_headers)
+        assert resp.status_code == 200, f"API key creation failed: {resp.text}"
+        api_key = resp.json()["api_key"]
+
+        async with connect(ws_url, additional_headers={"Authorization": f"Bearer {api_key}"}, subprotocols=["mcp"]) as ws:
+            await ws.send(json.dumps({
+                "jsonrpc": "2.0", "id": 1, "method": "initialize",
+                "params": {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "test", "version": "1.0"}}
+            }))
+            assert "result" in json.loads(await ws.recv()), "Initialize failed"
+
+            headers = {**admin_headers, "Content-Type": "application/json"}
+            resp = await client.request("DELETE", f"{server_url}/api/v1/user/api-key", headers=headers, content=json.dumps({"api_key": api_key}))
+            assert resp.status_code == 204, f"API key deletion failed: {resp.text}"
+
+            with pytest.raises(ConnectionClosed) as closed:
+                await asyncio.wait_for(ws.recv(), timeout=10)
+            assert closed.value.rcvd is not None and closed.value.rcvd.code == 1008, f"Expected a policy violation close: {closed.value}"
@@ -0,0 +1,81 @@
+"""Test for remote mcpservers (streamable-http and sse transports) against an in-process stand-in server."""
+import json
+
+import httpx
+import pytest
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["streamable-http", "sse"])
+async def test_admin_mcpserver_upstream(server_url, admin_auth_token, upstream_urls, transport):
+    """
+    Test that a remote mcpserver is connected instead of started:
+    1. Add the mcpserver with its transport and url - tools are discovered
+    2. Call its tool through the REST tool endpoint
+    3. Stop and start it again - tools come from the tools cache, calls still work
+    4. Delete it
+    """
+    headers = {"Authorization": f"Bearer {admin_auth_token}", "Content-Type": "application/json"}
+    server_name = f"test_upstream_{transport.replace('-', '_')}"
+
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        await client.delete(f"{server_url}/api/v1/mcpservers/{server_name}", headers=headers)
+
+        # 1. Add the remote mcpserver
+        resp = await client.post(f"{server_url}/api/v1/mcpservers", headers=headers, content=json.dumps({
+            "mcpServers": {server_name: {"transport": transport, "url": upstream_urls[transport]}}
+        }))
+        assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+        result = resp.json()[0]
+        assert result["status"] == "running", f"Remote mcpserver not connected: {result}"
+        assert result["pid"] is None, f"Remote mcpserver must not have a process: {result}"
+        assert "echo" in result["tools"], f"Unexpected tools: {result}"
+
+        try:
+            # 2. Call the tool
+            tool_url = f"{server_url}/api/v1/user/tool/{server_name}/echo"
+            resp = await client.post(tool_url, headers=headers, content=json.dumps({"text": "hello"}))
+            assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+            assert "echo: hello" in resp.text, f"Unexpected tool result: {resp.text}"
+
+            # 3. Stop and start again
+            resp = await client.post(f"{server_url}/api/v1/mcpservers/{server_name}/stop", headers=headers)
+            assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+            assert resp.json()["status"] == "stopped", f"Remote mcpserver not stopped: {resp.text}"
+            resp = await client.post(f"{server_url}/api/v1/mcpservers/{server_name}/start", headers=headers)
+            assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+            assert resp.json()["status"] == "running", f"Remote mcpserver not connected: {resp.text}"
+
+            resp = await client.post(tool_url, headers=headers, content=json.dumps({"text": "again"}))
+            assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+            assert "echo: again" in resp.text, f"Unexpected tool result: {resp.text}"
+        finally:
+            # 4. Delete the mcpserver
+            resp = await client.delete(f"{server_url}/api/v1/mcpservers/{server_name}", headers=headers)
+            assert resp.status_code == 204, f"Expected 204, got {resp.status_code}: {resp.text}"
+
+
+@pytest.mark.asyncio
+async def test_admin_mcpserver_upstream_requires_url(server_url, admin_auth_token):
+    """Test that a remote transport without url is refused."""
+    headers = {"Authorization": f"Bearer {admin_auth_token}", "Content-Type": "application/json"}
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        resp = await client.post(f"{server_url}/api/v1/mcpservers", headers=headers, content=json.dumps({
+            "mcpServers": {"test_upstream_no_url": {"transport": "streamable-http"}}
+        }))
+        assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+        result = resp.json()[0]
+        assert result["status"] == "error" and "url" in result["message"], f"Expected a url error: {result}"
+
+
+def test_stored_mcpserver_config_is_loaded_as_is(server_package):
+    """Test that a stored mcpserver entry without its transport fields does not make the user config unreadable."""
+    from mcpo_simple_server.services.config.models import UserConfigModel
+
+    user = UserConfigModel(username="stored_user", hashed_password="hash", group="users", mcpServers={
+        "broken": {"transport": "streamable-http"},
+        "legacy": {"transport": None, "headers": None, "command": "uvx", "args": ["mcp-server-time"]},
+    })
+    assert user.mcpServers["legacy"].transport == "stdio" and user.mcpServers["legacy"].headers == {}
+    with pytest.raises(ValueError, match="url"):
+        user.mcpServers["broken"].validate_transport()
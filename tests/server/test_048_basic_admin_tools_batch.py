@@ -0,0 +1,69 @@
+"""Test for the batch tool execution endpoint."""
+import json
+
+import httpx
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_admin_tools_batch(server_url, admin_auth_token, upstream_urls, server_package):
+    """
+    Test that a batch of tool calls runs concurrently with per-call results:
+    1. Add two remote mcpservers
+    2. Batch with succeeding and failing calls - one result per call, in request order
+    3. Same batch as NDJSON - results stream in completion order
+    4. Batch over the cap is refused with 413
+    5. Delete the mcpservers
+    """
+    from mcpo_simple_server.config import TOOLS_BATCH_MAX_CALLS
+
+    headers = {"Authorization": f"Bearer {admin_auth_token}", "Content-Type": "application/json"}
+    servers = {"test_batch_http": "streamable-http", "test_batch_sse": "sse"}
+    batch_url = f"{server_url}/api/v1/user/tools/batch"
+
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        # 1. Add the mcpservers
+        for server_name in servers:
+            await client.delete(f"{server_url}/api/v1/mcpservers/{server_name}", headers=headers)
+        resp = await client.post(f"{server_url}/api/v1/mcpservers", headers=headers, content=json.dumps({
+            "mcpServers": {name: {"transport": transport, "url": upstream_urls[transport]} for name, transport in servers.items()}
+        }))
+        assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+        assert [result["status"] for result in resp.json()] == ["running", "running"], f"Mcpservers not connected: {resp.text}"
+
+        try:
+            calls = [
+                {"server": "test_batch_http", "tool": "wait", "arguments": {"seconds": 1}},
+                {"server": "test_batch_sse", "tool": "echo", "arguments": {"text": "sse"}},
+                {"server": "test_batch_http", "tool": "echo", "arguments": {"text": 5}},
+                {"server": "test_batch_missing", "tool": "echo", "arguments": {"text": "missing"}},
+                {"server": "test_batch_http", "tool": "echo", "arguments": {"text": "http"}},
+            ]
+
+            # 2. Results in request order, failures do not fail the batch
+            resp = await client.post(batch_url, headers=headers, content=json.dumps(calls))
+            assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+            results = resp.json()
+            assert [result["index"] for result in results] == [0, 1, 2, 3, 4], f"Unexpected order: {results}"
+            assert [result["status_code"] for result in results] == [200, 200, 422, 404, 200], f"Unexpected status codes: {results}"
+            assert "waited: 1" in json.dumps(results[0]["result"]), f"Unexpected result: {results[0]}"
+            assert "echo: sse" in json.dumps(results[1]["result"]), f"Unexpected result: {results[1]}"
+            assert results[2]["error"] and results[2]["result"] is None, f"Expected an error: {results[2]}"
+            assert "echo: http" in json.dumps(results[4]["result"]), f"Unexpected result: {results[4]}"
+
+            # 3. NDJSON - the slow call finishes last
+            resp = await client.post(batch_url, headers={**headers, "Accept": "application/x-ndjson"}, content=json.dumps(calls))
+            assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+            assert resp.headers["content-type"].startswith("application/x-ndjson"), f"Unexpected content type: {resp.headers}"
+            lines = [json.loads(line) for line in resp.text.splitlines() if line]
+            assert sorted(line["index"] for line in lines) == [0, 1, 2, 3, 4], f"Unexpected lines: {lines}"
+            assert lines[-1]["index"] == 0, f"Expected the slow call last: {lines}"
+
+            # 4. Cap
+            resp = await client.post(batch_url, headers=headers, content=json.dumps([calls[1]] * (TOOLS_BATCH_MAX_CALLS + 1)))
+            assert resp.status_code == 413, f"Expected 413, got {resp.status_code}: {resp.text}"
+        finally:
+            # 5. Delete the mcpservers
+            for server_name in servers:
+                resp = await client.delete(f"{server_url}/api/v1/mcpservers/{server_name}", headers=headers)
+                assert resp.status_code == 204, f"Expected 204, got {resp.status_code}: {resp.text}"
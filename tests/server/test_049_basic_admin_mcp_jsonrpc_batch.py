@@ -0,0 +1,130 @@
+"""Test for JSON-RPC batch arrays on the Streamable HTTP and SSE MCP endpoints."""
+import json
+import time
+import asyncio
+
+import httpx
+import pytest
+
+MCP_HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+INITIALIZE = {
+    "jsonrpc": "2.0", "id": 0, "method": "initialize",
+    "params": {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "test", "version": "1.0"}}
+}
+
+
+def _call(request_id, tool, arguments):
+    return {"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": {"name": tool, "arguments": arguments}}
+
+
+@pytest.mark.asyncio
+async def test_admin_mcp_jsonrpc_batch(server_url, admin_auth_token, upstream_urls):
+    """
+    Test that a JSON-RPC batch runs its tool calls concurrently and answers with the ids of the requests:
+    1. Add a remote mcpserver with `echo` and `wait` tools
+    2. Streamable HTTP: batch of calls and a notification - one JSON array, concurrent waits
+    3. Streamable HTTP: batch over the cap, batch with initialize and unknown session are refused,
+       invalid messages get an error each
+    4. SSE: batch POST is accepted, the responses arrive on the event stream
+    5. Delete the mcpserver
+    """
+    admin_headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    delete_headers = {**admin_headers, "Content-Type": "application/json"}
+    server_name = "test_jsonrpc_batch"
+
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        # 1. Add the mcpserver
+        await client.delete(f"{server_url}/api/v1/mcpservers/{server_name}", headers=delete_headers)
+        resp = await client.post(f"{server_url}/api/v1/mcpservers", headers=delete_headers, content=json.dumps({
+            "mcpServers": {server_name: {"transport": "streamable-http", "url": upstream_urls["streamable-http"]}}
+        }))
+        assert resp.status_code == 200 and resp.json()[0]["status"] == "running", f"Mcpserver not connected: {resp.text}"
+        resp = await client.post(f"{server_url}/api/v1/user/api-key", headers=admin_headers)
+        assert resp.status_code == 200, f"API key creation failed: {resp.text}"
+        api_key = resp.json()["api_key"]
+        auth = {"Authorization": f"Bearer {api_key}"}
+
+        try:
+            # 2. Streamable HTTP batch
+            url = f"{server_url}/api/v1/mcp/"
+            resp = await client.post(url, headers={**MCP_HEADERS, **auth}, json=INITIALIZE)
+            assert resp.status_code == 200, f"Initialize failed: {resp.text}"
+            session_headers = {**MCP_HEADERS, **auth, "mcp-session-id": resp.headers["mcp-session-id"]}
+            resp = await client.post(url, headers=session_headers, json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+            assert resp.status_code == 202, f"Initialized notification failed: {resp.text}"
+
+            batch = [
+                _call("first", "wait", {"seconds": 1}),
+                _call("second", "wait", {"seconds": 1}),
+                {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": "unknown"}},
+                _call(3, "echo", {"text": "batched"}),
+                _call(4, "no_such_tool", {}),
+            ]
+            started = time.monotonic()
+            resp = await client.post(url, headers=session_headers, json=batch)
+            elapsed = time.monotonic() - started
+            assert resp.status_code == 200, f"Batch failed: {resp.status_code} {resp.text}"
+            responses = resp.json()
+            assert isinstance(responses, list), f"Expected a batch response: {responses}"
+            assert [response["id"] for response in responses] == ["first", "second", 3, 4], f"Unexpected ids: {responses}"
+            assert "waited: 1" in json.dumps(responses[0]["result"]), f"Unexpected result: {responses[0]}"
+            assert "echo: batched" in json.dumps(responses[2]["result"]), f"Unexpected result: {responses[2]}"
+            assert "error" in responses[3] or responses[3]["result"].get("isError"), f"Expected an error: {responses[3]}"
+            assert elapsed < 1.9, f"Calls of the batch did not run concurrently: {elapsed:.2f}s"
+
+            # 3. Refused batches
+            resp = await client.post(url, headers=session_headers, json=[_call(i, "echo", {"text": "x"}) for i in range(21)])
+            assert resp.status_code == 413, f"Expected 413 for a batch over the cap: {resp.status_code} {resp.text}"
+            resp = await client.post(url, headers=session_headers, json=[INITIALIZE, _call(1, "echo", {"text": "x"})])
+            assert resp.status_code == 400, f"Expected 400 for initialize in a batch: {resp.status_code} {resp.text}"
+            resp = await client.post(url, headers=session_headers, json=[1, 2])
+            assert resp.status_code == 200, f"Expected per-message errors: {resp.status_code} {resp.text}"
+            assert [(r["id"], "error" in r) for r in resp.json()] == [(None, True), (None, True)], f"Unexpected errors: {resp.text}"
+            resp = await client.post(url, headers={**session_headers, "mcp-session-id": "unknown"}, json=[_call(1, "echo", {"text": "x"})])
+            assert resp.status_code == 404, f"Expected 404 for an unknown session: {resp.status_code} {resp.text}"
+
+            # 4. SSE batch - the responses go over the event stream
+            async with client.stream("GET", f"{server_url}/api/v1/sse/", headers=auth) as stream:
+                lines = stream.aiter_lines()
+
+                async def next_event():
+                    event, data = None, []
+                    async for line in lines:
+                        if line.startswith("event:"):
+                            event = line[6:].strip()
+                        elif line.startswith("data:"):
+                            data.append(line[5:].strip())
+                        elif not line and data:
+                            return event, "\n".join(data)
+                    raise AssertionError("Event stream ended")
+
+                async def next_message():
+                    while True:
+                        event, data = await next_event()
+                        if event == "message":
+                            return json.loads(data)
+
+                event, endpoint = await asyncio.wait_for(next_event(), timeout=10)
+                assert event == "endpoint", f"Expected the endpoint event: {event} {endpoint}"
+                post_url = f"{server_url}{endpoint}"
+                resp = await client.post(post_url, json=INITIALIZE)
+                assert resp.status_code == 202, f"Initialize failed: {resp.text}"
+                assert (await asyncio.wait_for(next_message(), timeout=10))["id"] == 0
+                resp = await client.post(post_url, json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+                assert resp.status_code == 202, f"Initialized notification failed: {resp.text}"
+
+                resp = await client.post(post_url, json=[_call("a", "echo", {"text": "a"}), _call("b", "echo", {"text": "b"})])
+                assert resp.status_code == 202, f"Expected 202 for an SSE batch: {resp.status_code} {resp.text}"
+                messages = [await asyncio.wait_for(next_message(), timeout=10) for _ in range(2)]
+                assert sorted(message["id"] for message in messages) == ["a", "b"], f"Unexpected responses: {messages}"
+                for message in messages:
+                    assert f"echo: {message['id']}" in json.dumps(message["result"]), f"Unexpected result: {message}"
+                resp = await client.post(post_url, json=[1, 2])
+                assert resp.status_code == 400 and len(resp.json()) == 2, f"Expected per-message errors: {resp.status_code} {resp.text}"
+        finally:
+            # 5. Delete the mcpserver and the API key
+            resp = await client.delete(f"{server_url}/api/v1/mcpservers/{server_name}", headers=delete_headers)
+            assert resp.status_code == 204, f"Expected 204, got {resp.status_code}: {resp.text}"
+            resp = await client.request("DELETE", f"{server_url}/api/v1/user/api-key", headers=delete_headers,
+                                        content=json.dumps({"api_key": api_key}))
+            assert resp.status_code == 204, f"API key deletion failed: {resp.text}"
@@ -0,0 +1,75 @@
+"""Test for the Server-Sent Events variant of the REST tool endpoint."""
+import json
+
+import httpx
+import pytest
+
+
+def _events(text):
+    """(event, data) pairs of an event stream body."""
+    events = []
+    for block in text.replace("\r\n", "\n").split("\n\n"):
+        event, data = None, []
+        for line in block.split("\n"):
+            if line.startswith("event:"):
+                event = line[6:].strip()
+            elif line.startswith("data:"):
+                data.append(line[5:].strip())
+        if data:
+            events.append((event, json.loads("\n".join(data))))
+    return events
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["streamable-http", "sse"])
+async def test_admin_tool_event_stream(server_url, admin_auth_token, upstream_urls, transport):
+    """
+    Test that a tool call with `Accept: text/event-stream` streams progress and content blocks:
+    1. Add a remote mcpserver with a `count` tool reporting progress
+    2. Streamed call - progress events, one content event per block, done
+    3. Without the Accept header the JSON result is unchanged
+    4. Unknown server and invalid arguments are plain HTTP errors
+    5. Delete the mcpserver
+    """
+    headers = {"Authorization": f"Bearer {admin_auth_token}", "Content-Type": "application/json"}
+    stream_headers = {**headers, "Accept": "text/event-stream"}
+    server_name = f"test_tool_stream_{transport.replace('-', '_')}"
+
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        # 1. Add the mcpserver
+        await client.delete(f"{server_url}/api/v1/mcpservers/{server_name}", headers=headers)
+        resp = await client.post(f"{server_url}/api/v1/mcpservers", headers=headers, content=json.dumps({
+            "mcpServers": {server_name: {"transport": transport, "url": upstream_urls[transport]}}
+        }))
+        assert resp.status_code == 200 and resp.json()[0]["status"] == "running", f"Mcpserver not connected: {resp.text}"
+
+        try:
+            tool_url = f"{server_url}/api/v1/user/tool/{server_name}/count"
+
+            # 2. Streamed call
+            resp = await client.post(tool_url, headers=stream_headers, content=json.dumps({"n": 3}))
+            assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+            assert resp.headers["content-type"].startswith("text/event-stream"), f"Unexpected content type: {resp.headers}"
+            events = _events(resp.text)
+            names = [event for event, _ in events]
+            assert names == ["progress"] * 3 + ["content"] * 3 + ["done"], f"Unexpected events: {events}"
+            assert [data["progress"] for _, data in events[:3]] == [1, 2, 3], f"Unexpected progress: {events}"
+            assert events[0][1]["total"] == 3 and events[0][1]["message"] == "counted 1", f"Unexpected progress: {events[0]}"
+            assert [data for _, data in events[3:6]] == ["item 1", "item 2", "item 3"], f"Unexpected content: {events}"
+            assert events[-1][1] == {"isError": False}, f"Unexpected done event: {events[-1]}"
+
+            # 3. JSON result without the Accept header
+            resp = await client.post(tool_url, headers=headers, content=json.dumps({"n": 2}))
+            assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+            assert resp.json() == ["item 1", "item 2"], f"Unexpected result: {resp.text}"
+
+            # 4. Errors before the stream starts
+            resp = await client.post(f"{server_url}/api/v1/user/tool/test_tool_stream_missing/count", headers=stream_headers,
+                                     content=json.dumps({"n": 1}))
+            assert resp.status_code == 404, f"Expected 404, got {resp.status_code}: {resp.text}"
+            resp = await client.post(tool_url, headers=stream_headers, content=json.dumps({"n": "three"}))
+            assert resp.status_code == 422, f"Expected 422, got {resp.status_code}: {resp.text}"
+        finally:
+            # 5. Delete the mcpserver
+            resp = await client.delete(f"{server_url}/api/v1/mcpservers/{server_name}", headers=headers)
+            assert resp.status_code == 204, f"Expected 204, got {resp.status_code}: {resp.text}"
@@ -0,0 +1,32 @@
+import asyncio
+import pytest
+import httpx
+
+
+@pytest.mark.asyncio
+async def test_admin_storage_cache_stats(server_url, admin_auth_token):
+    """
+    Test that repeated user config reads are served from the storage cache.
+    """
+    async with httpx.AsyncClient() as client:
+        headers = {"Authorization": f"Bearer {admin_auth_token}"}
+        # Pending (write-behind) saves are served without the storage cache - wait until written
+        for _ in range(50):
+            resp = await client.get(f"{server_url}/api/v1/admin/storage/stats", headers=headers)
+            assert resp.status_code == 200, f"Storage stats failed: {resp.text}"
+            before = resp.json()
+            if before.get("write_behind", {}).get("pending", 0) == 0:
+                break
+            await asyncio.sleep(0.1)
+
+        for _ in range(3):
+            resp = await client.get(f"{server_url}/api/v1/user/env", headers=headers)
+            assert resp.status_code == 200, f"Get env failed: {resp.text}"
+
+        resp = await client.get(f"{server_url}/api/v1/admin/storage/stats", headers=headers)
+        assert resp.status_code == 200, f"Storage stats failed: {resp.text}"
+        after = resp.json()
+        if after["storage_type"] != "ddb":
+            pytest.skip("Storage cache stats are reported by the ddb backend")
+        assert after["hits"] >= before["hits"] + 2, f"Expected cache hits, before: {before}, after: {after}"
+        assert after["disk_reads"] <= before["disk_reads"] + 1, f"Expected no repeated disk reads, before: {before}, after: {after}"
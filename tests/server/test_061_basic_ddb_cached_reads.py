@@ -0,0 +1,34 @@
+"""Test that DDB serves cached user configs without waiting for the backend lock."""
+import asyncio
+import os
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_ddb_cached_reads(server_package, tmp_path):
+    """
+    Test the DDB user config cache:
+    1. A cached user config is returned while a write holds the backend lock
+    2. A change of the file on disk is picked up on the next read
+    """
+    from mcpo_simple_server.services.config.models import UserConfigModel
+    from mcpo_simple_server.services.config.storage import DDBStorage
+
+    backend = DDBStorage(str(tmp_path))
+    await backend.save_user_config(UserConfigModel(username="hot_user", hashed_password="x", group="users"))
+    assert (await backend.get_user_config("hot_user")).username == "hot_user"
+
+    # 1. Cache hit while locked
+    async with backend._lock:
+        cached = await asyncio.wait_for(backend.get_user_config("hot_user"), timeout=1)
+    assert cached.username == "hot_user"
+    cached.group = "admins"
+    assert (await backend.get_user_config("hot_user")).group == "users", "Cached instance handed out"
+
+    # 2. Changed on disk
+    path = os.path.join(str(tmp_path), "users", "hot_user.json")
+    backend._write_document("users/hot_user", {**UserConfigModel(username="hot_user", hashed_password="x", group="users").model_dump(mode="json"), "group": "admins"})
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1_000_000))
+    assert (await backend.get_user_config("hot_user")).group == "admins"
+    await backend.close()
@@ -0,0 +1,108 @@
+"""Test for the sqlite storage backend and the storage migration tool."""
+import pytest
+
+TOOLS = [{"name": "echo", "description": "Echo", "inputSchema": {"type": "object", "properties": {"text": {"type": "string"}}}}]
+
+
+def _user(username, **kwargs):
+    from mcpo_simple_server.services.config.models import UserConfigModel
+    from mcpo_simple_server.services.config.models.user_config_model import ApiKeyMetadataModel
+    return UserConfigModel(
+        username=username,
+        hashed_password="hash",
+        group="admins",
+        api_keys={f"st-{username}-key": ApiKeyMetadataModel(description="ci", blackListTools=["rm"])},
+        env={"HOME": f"/home/{username}"},
+        mcpServers={"time": {"command": "uvx", "args": ["mcp-server-time"], "mcpserver_type": "public"}},
+        preferences={"theme": "dark"},
+        **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_round_trip(server_package, tmp_path):
+    """
+    Test that the sqlite backend returns what was stored:
+    1. The default global config is created once and saved configs are read back
+    2. A user config with API keys, env, mcpServers and preferences is read back unchanged
+    3. The user index lists users and mcpserver types
+    4. An empty API key index is a built (empty) index, no rebuild marker row is stored
+    5. Deleting the user removes its rows
+    """
+    from mcpo_simple_server.services.config.storage import SQLiteStorage
+
+    backend = SQLiteStorage(str(tmp_path))
+
+    # 1. Global config
+    default = await backend.get_global_config()
+    assert await backend.get_global_config() == default
+    default.tools.blackList = ["rm"]
+    await backend.save_global_config(default)
+    assert (await backend.get_global_config()).tools.blackList == ["rm"]
+
+    # 2. User config
+    assert await backend.read_api_key_index() == {}
+    user = _user("sqlite_user", disabled=True)
+    await backend.save_user_config(user)
+    assert await backend.get_user_config("sqlite_user") == user
+    assert (await backend.list_users())["sqlite_user"] == user
+    assert await backend.get_user_config("missing_user") is None
+
+    # 3. User index
+    entry = (await backend.list_user_index())["sqlite_user"]
+    assert entry.disabled is True and entry.mcpservers == {"time": "public"}
+
+    # 4. Empty API key index
+    assert await backend.read_api_key_index() is None, "Stored keys without index entries must trigger a rebuild"
+    await backend.write_api_key_index({})
+    assert await backend.read_api_key_index() is None
+    await backend.write_api_key_index({"digest": {"username": "sqlite_user", "metadata": {}}})
+    assert await backend.read_api_key_index() == {"digest": {"username": "sqlite_user", "metadata": {}}}
+
+    # 5. Delete
+    assert await backend.delete_user_config("sqlite_user", {"digest": None})
+    assert await backend.get_user_config("sqlite_user") is None
+    assert await backend.read_api_key_index() == {}
+    assert not await backend.delete_user_config("sqlite_user")
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_storage_migration_ddb_to_sqlite(server_package, tmp_path):
+    """
+    Test that the migration tool copies all data from ddb to sqlite:
+    1. Global config, users, tool caches with their shared definitions and the API key index are copied
+    2. The migrated tool caches resolve to the source tools
+    """
+    from mcpo_simple_server.services.config.events import ConfigEventBus
+    from mcpo_simple_server.services.config.adapters.tools_cache import ToolsCacheAdapter
+    from mcpo_simple_server.services.config.adapters.api_key_index import api_key_digest
+    from mcpo_simple_server.services.config.storage import DDBStorage, SQLiteStorage
+    from mcpo_simple_server.services.config.storage.migrate import migrate_storage
+    import types
+
+    source = DDBStorage(str(tmp_path / "ddb"))
+    target = SQLiteStorage(str(tmp_path / "sqlite"))
+    global_config = await source.get_global_config()
+    global_config.tools.blackList = ["rm"]
+    await source.save_global_config(global_config)
+    users = {username: _user(username) for username in ("migrated_a", "migrated_b")}
+    index = {}
+    for user in users.values():
+        await source.save_user_config(user)
+        index[api_key_digest(f"st-{user.username}-key")] = {"username": user.username, "metadata": {"description": "ci"}}
+    await source.write_api_key_index(index)
+    await ToolsCacheAdapter(types.SimpleNamespace(_storage_backend=source, events=ConfigEventBus())).write_tool_cache("time-admin", TOOLS)
+
+    # 1. Copied
+    counts = await migrate_storage(source, target)
+    assert counts == {"users": 2, "tool_caches": 1, "tool_definitions": 1, "api_keys": 2}
+    assert (await target.get_global_config()).tools.blackList == ["rm"]
+    assert await target.list_users() == users
+    assert await target.read_api_key_index() == index
+
+    # 2. Tool caches
+    adapter = ToolsCacheAdapter(types.SimpleNamespace(_storage_backend=target, events=ConfigEventBus()))
+    assert await adapter.get_tool_cache("time-admin") == TOOLS
+    await source.close()
+    await target.close()
@@ -0,0 +1,103 @@
+"""Test for the packed tool cache store."""
+import os
+
+TOOLS_A = [{"name": "tool_a", "description": "A", "inputSchema": {"type": "object", "properties": {}}}]
+TOOLS_B = [{"name": "tool_b", "description": "B", "inputSchema": {"type": "object", "properties": {}}}]
+
+
+def test_tool_cache_pack_round_trip(server_package, tmp_path):
+    """
+    Test that tool caches are read back after writes, deletes and a reopen of the pack:
+    1. Written caches are read back, one by one and all at once
+    2. A deleted cache is gone, also after reopening the pack
+    3. Compaction keeps the live caches
+    """
+    from mcpo_simple_server.services.config.storage.tool_cache_pack import PackedToolCacheStore
+
+    path = str(tmp_path / "tools_cache.pack")
+    pack = PackedToolCacheStore(path)
+    assert pack.created
+
+    # 1. Written
+    pack.write("a-admin", TOOLS_A)
+    pack.write("b-admin", TOOLS_A)
+    pack.write("b-admin", TOOLS_B)
+    assert pack.read("a-admin") == TOOLS_A
+    assert pack.read_all() == {"a-admin": TOOLS_A, "b-admin": TOOLS_B}
+
+    # 2. Deleted
+    assert pack.delete("a-admin")
+    assert not pack.delete("a-admin")
+    assert pack.read("a-admin") is None
+    reopened = PackedToolCacheStore(path)
+    assert not reopened.created
+    assert reopened.read_all() == {"b-admin": TOOLS_B}
+
+    # 3. Compaction
+    pack.compact()
+    assert pack.get_stats()["garbage_bytes"] == 0
+    assert PackedToolCacheStore(path).read_all() == {"b-admin": TOOLS_B}
+
+
+def test_tool_cache_pack_processes(server_package, tmp_path):
+    """
+    Test that two stores on one pack (two worker processes) see each other's changes:
+    1. A write of one store is read by the other
+    2. After one store compacted the pack, the other reads and writes at the right offsets
+    """
+    from mcpo_simple_server.services.config.storage.tool_cache_pack import PackedToolCacheStore
+
+    path = str(tmp_path / "tools_cache.pack")
+    worker_1 = PackedToolCacheStore(path)
+    worker_2 = PackedToolCacheStore(path)
+
+    # 1. Shared writes
+    worker_1.write("a-admin", TOOLS_A)
+    assert worker_2.read("a-admin") == TOOLS_A
+    worker_2.write("b-admin", TOOLS_B)
+    worker_2.delete("a-admin")
+    assert worker_1.read_all() == {"b-admin": TOOLS_B}
+
+    # 2. Compacted by the other worker
+    for _ in range(3):
+        worker_1.write("a-admin", TOOLS_A)
+    worker_1.compact()
+    assert worker_2.read("b-admin") == TOOLS_B
+    worker_2.write("c-admin", TOOLS_A)
+    assert worker_1.read_all() == {"a-admin": TOOLS_A, "b-admin": TOOLS_B, "c-admin": TOOLS_A}
+    assert PackedToolCacheStore(path).read_all() == worker_2.read_all()
+
+
+def test_tool_cache_pack_damaged_records(server_package, tmp_path):
+    """
+    Test that damaged records only lose themselves:
+    1. A record failing its checksum is skipped, the records after it are kept
+    2. A torn record at the end of the pack is dropped
+    """
+    from mcpo_simple_server.services.config.storage.tool_cache_pack import PackedToolCacheStore
+
+    path = str(tmp_path / "tools_cache.pack")
+    pack = PackedToolCacheStore(path)
+    pack.write("a-admin", TOOLS_A)
+    pack.write("b-admin", TOOLS_B)
+    offset, length = pack._index["a-admin"]
+
+    # 1. Checksum failure
+    with open(path, "r+b") as f:
+        f.seek(offset + length - 1)
+        last = f.read(1)
+        f.seek(offset + length - 1)
+        f.write(bytes([last[0] ^ 0xFF]))
+    size = os.path.getsize(path)
+    damaged = PackedToolCacheStore(path)
+    assert damaged.read_all() == {"b-admin": TOOLS_B}
+    assert damaged.get_stats()["skipped_records"] == 1
+    assert os.path.getsize(path) == size, "Valid records after the damaged one were truncated"
+
+    # 2. Torn tail
+    with open(path, "ab") as f:
+        f.write(b"\x10\x00\x00")
+    reopened = PackedToolCacheStore(path)
+    assert os.path.getsize(path) == size
+    reopened.write("c-admin", TOOLS_A)
+    assert PackedToolCacheStore(path).read_all() == {"b-admin": TOOLS_B, "c-admin": TOOLS_A}
@@ -0,0 +1,78 @@
+"""Test for the write-behind storage wrapper."""
+import pytest
+
+
+def _user(**kwargs):
+    from mcpo_simple_server.services.config.models import UserConfigModel
+    return UserConfigModel(**{"username": "wb_user", "hashed_password": "hash", "group": "users", **kwargs})
+
+
+@pytest.mark.asyncio
+async def test_write_behind_read_your_writes(server_package, tmp_path):
+    """
+    Test that pending saves are visible and credential changes are durable right away:
+    1. A new user is written through
+    2. An env change is pending, reads see it, the backend gets it on flush
+    3. A password change is written through and replaces the pending document
+    """
+    from mcpo_simple_server.services.config.storage import DDBStorage, WriteBehindStorage
+
+    backend = DDBStorage(str(tmp_path))
+    storage = WriteBehindStorage(backend, delay=60, max_delay=60)
+
+    # 1. New user
+    await storage.save_user_config(_user())
+    assert await backend.get_user_config("wb_user") == _user()
+
+    # 2. Pending change
+    await storage.save_user_config(_user(env={"A": "1"}))
+    await storage.save_user_config(_user(env={"A": "2"}))
+    assert (await storage.get_user_config("wb_user")).env == {"A": "2"}
+    assert (await storage.list_users())["wb_user"].env == {"A": "2"}
+    assert (await backend.get_user_config("wb_user")).env == {}
+    await storage.flush()
+    assert (await backend.get_user_config("wb_user")).env == {"A": "2"}
+
+    # 3. Password change
+    await storage.save_user_config(_user(env={"A": "3"}))
+    await storage.save_user_config(_user(env={"A": "3"}, hashed_password="new-hash"))
+    stored = await backend.get_user_config("wb_user")
+    assert stored.hashed_password == "new-hash" and stored.env == {"A": "3"}
+    assert storage.get_cache_stats()["write_behind"]["pending"] == 0
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_failed_write(server_package, tmp_path, monkeypatch):
+    """
+    Test that a failed write is not lost:
+    1. The document stays pending and readable after the backend write failed
+    2. The retry writes it once the backend works again
+    """
+    from mcpo_simple_server.services.config.storage import DDBStorage, WriteBehindStorage
+
+    backend = DDBStorage(str(tmp_path))
+    storage = WriteBehindStorage(backend, delay=60, max_delay=60)
+    await storage.save_user_config(_user())
+    save = backend.save_user_config
+    disk_full = True
+
+    async def failing_save(config, api_key_index=None):
+        if disk_full:
+            raise OSError("disk full")
+        await save(config, api_key_index)
+
+    # 1. Failed write
+    monkeypatch.setattr(backend, "save_user_config", failing_save)
+    await storage.save_user_config(_user(env={"A": "1"}))
+    await storage.flush()
+    stats = storage.get_cache_stats()["write_behind"]
+    assert stats["failures"] == 1 and stats["pending"] == 1
+    assert (await storage.get_user_config("wb_user")).env == {"A": "1"}
+
+    # 2. Retried
+    disk_full = False
+    await storage.flush()
+    assert (await backend.get_user_config("wb_user")).env == {"A": "1"}
+    assert storage.get_cache_stats()["write_behind"]["pending"] == 0
+    await storage.close()
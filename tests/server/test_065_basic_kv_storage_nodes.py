@@ -0,0 +1,85 @@
+"""Test for two gateway nodes sharing one key-value store."""
+import asyncio
+
+import pytest
+
+API_KEY = "st-shared-node-key"
+
+
+def _user(**kwargs):
+    from mcpo_simple_server.services.config.models import UserConfigModel
+    return UserConfigModel(username="shared_user", hashed_password="hash", group="users", **kwargs)
+
+
+def _node(monkeypatch, server):
+    """ConfigService of a node with a KeyValueStorage client of its own on the shared server."""
+    from mcpo_simple_server.services.config import service as service_module
+    from mcpo_simple_server.services.config.storage import KeyValueStorage, InMemoryKeyValueClient
+
+    client = InMemoryKeyValueClient(server)
+    writes = []
+    for name in ("set", "hset", "delete", "hdel", "transaction"):
+        method = getattr(client, name)
+
+        async def counted(*args, _name=name, _method=method, **kwargs):
+            writes.append(_name)
+            return await _method(*args, **kwargs)
+        setattr(client, name, counted)
+    backend = KeyValueStorage(client)
+    monkeypatch.setattr(service_module, "SELECTED_STORAGE_BACKEND", None)
+    monkeypatch.setattr(service_module, "_select_storage_backend", lambda db_path: backend)
+    return service_module.ConfigService(), writes
+
+
+async def _until(condition):
+    for _ in range(100):
+        if await condition():
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+@pytest.mark.asyncio
+async def test_kv_storage_nodes(server_package, monkeypatch):
+    """
+    Test that an API key change of one node is applied by the other node without writes of its own:
+    1. A transaction is applied as a whole, unsupported commands are rejected before any write
+    2. A key saved on node A authenticates on node B
+    3. A key revoked on node A is rejected by node B
+    4. Node B only read the store
+    """
+    from mcpo_simple_server.services.config.storage.memory_kv_client import InMemoryKeyValueServer, InMemoryKeyValueClient
+    from mcpo_simple_server.services.config.models.user_config_model import ApiKeyMetadataModel
+
+    # 1. Transactions
+    client = InMemoryKeyValueClient(InMemoryKeyValueServer())
+    assert await client.transaction([("SET", "a", "1"), ("HSET", "h", "f", "v", "g", "w"), ("HDEL", "h", "g"), ("DEL", "a", "b")]) == ["OK", 2, 1, 1]
+    assert await client.hgetall("h") == {"f": "v"}
+    with pytest.raises(ValueError):
+        await client.transaction([("SET", "c", "1"), ("INCR", "c")])
+    assert await client.get("c") is None
+
+    server = InMemoryKeyValueServer()
+    node_a, _ = _node(monkeypatch, server)
+    node_b, node_b_writes = _node(monkeypatch, server)
+    await node_a.api_key_index.load()
+    await node_b.api_key_index.load()
+    node_b_writes.clear()
+
+    # 2. Key saved on node A
+    assert await node_a.user_config.save_config(_user(api_keys={API_KEY: ApiKeyMetadataModel(description="shared")}))
+
+    async def authenticated():
+        user = await node_b.api_key_index.authenticate(API_KEY)
+        return user is not None and user.username == "shared_user"
+    assert await _until(authenticated), "Node B did not pick up the key of node A"
+
+    # 3. Key revoked on node A
+    assert await node_a.user_config.save_config(_user())
+
+    async def rejected():
+        return await node_b.api_key_index.authenticate(API_KEY) is None
+    assert await _until(rejected), "Node B still accepts the revoked key"
+
+    # 4. No writes of node B
+    assert node_b_writes == [], f"Node B wrote to the store: {node_b_writes}"
@@ -0,0 +1,72 @@
+"""Test for gateway-side validation of tool arguments against the tool inputSchema."""
+import json
+
+import httpx
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_admin_tool_arguments_validation(server_url, admin_auth_token):
+    """
+    Test that invalid tool arguments are rejected before reaching the MCP server:
+    1. Create and start a new time server
+    2. Call tool without required argument - expect 422
+    3. Call tool with wrong argument type - expect 422
+    4. Call tool with valid arguments - expect 200
+    5. Delete the server
+    """
+    headers = {"Authorization": f"Bearer {admin_auth_token}", "Content-Type": "application/json"}
+    server_name = "test_validation_server"
+
+    # Clean up existing test server if it exists
+    async with httpx.AsyncClient() as client:
+        await client.delete(
+            f"{server_url}/api/v1/mcpservers/{server_name}",
+            headers=headers
+        )
+    # 1. Create and start a new time server
+    time_server_config = {
+        "mcpServers": {
+            server_name: {
+                "command": "uvx",
+                "args": [
+                    "mcp-server-time",
+                    "--local-timezone=Europe/Warsaw"
+                ],
+                "env": {},
+                "description": "Test arguments validation server",
+                "disabled": False
+            }
+        }
+    }
+
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        resp = await client.post(
+            f"{server_url}/api/v1/mcpservers",
+            headers=headers,
+            content=json.dumps(time_server_config)
+        )
+        assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+
+        tool_url = f"{server_url}/api/v1/user/tool/{server_name}/get_current_time"
+
+        # 2. Missing required argument
+        resp = await client.post(tool_url, headers=headers, content=json.dumps({}))
+        assert resp.status_code == 422, f"Expected 422, got {resp.status_code}: {resp.text}"
+        errors = resp.json().get("detail")
+        assert isinstance(errors, list) and errors, f"Expected list of errors, got {errors}"
+        assert errors[0]["type"] == "json_schema.required", f"Unexpected error: {errors[0]}"
+
+        # 3. Wrong argument type
+        resp = await client.post(tool_url, headers=headers, content=json.dumps({"timezone": 5}))
+        assert resp.status_code == 422, f"Expected 422, got {resp.status_code}: {resp.text}"
+        errors = resp.json().get("detail")
+        assert errors[0]["loc"] == ["body", "timezone"], f"Unexpected error location: {errors[0]}"
+
+        # 4. Valid arguments
+        resp = await client.post(tool_url, headers=headers, content=json.dumps({"timezone": "Europe/Warsaw"}))
+        assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+
+        # 5. Delete the server
+        resp = await client.delete(f"{server_url}/api/v1/mcpservers/{server_name}", headers=headers)
+        assert resp.status_code == 204, f"Expected 204, got {resp.status_code}: {resp.text}"
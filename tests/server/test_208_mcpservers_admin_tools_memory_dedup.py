@@ -0,0 +1,51 @@
+"""Test for deduplicated tool definitions across MCP servers."""
+import json
+
+import httpx
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_admin_tools_memory_dedup(server_url, admin_auth_token):
+    """
+    Test that identical tool definitions are shared between MCP servers:
+    1. Create two time servers exposing identical tools
+    2. Check memory report - definitions are stored once
+    3. Delete the servers
+    """
+    headers = {"Authorization": f"Bearer {admin_auth_token}", "Content-Type": "application/json"}
+    server_names = ["test_dedup_server_a", "test_dedup_server_b"]
+
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        # Clean up existing test servers if they exist
+        for server_name in server_names:
+            await client.delete(f"{server_url}/api/v1/mcpservers/{server_name}", headers=headers)
+
+        # 1. Create two identical time servers
+        for server_name in server_names:
+            config = {
+                "mcpServers": {
+                    server_name: {
+                        "command": "uvx",
+                        "args": ["mcp-server-time", "--local-timezone=Europe/Warsaw"],
+                        "env": {},
+                        "description": "Test dedup server",
+                        "disabled": False
+                    }
+                }
+            }
+            resp = await client.post(f"{server_url}/api/v1/mcpservers", headers=headers, content=json.dumps(config))
+            assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+
+        # 2. Memory report
+        resp = await client.get(f"{server_url}/api/v1/admin/tools/memory", headers=headers)
+        assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+        report = resp.json()
+        assert report["references"] >= 4, f"Expected at least 4 tool references, got {report}"
+        assert report["unique_definitions"] <= report["references"] - 2, f"Expected shared definitions, got {report}"
+        assert report["bytes_with_dedup"] < report["bytes_without_dedup"], f"Expected memory saving, got {report}"
+
+        # 3. Delete the servers
+        for server_name in server_names:
+            resp = await client.delete(f"{server_url}/api/v1/mcpservers/{server_name}", headers=headers)
+            assert resp.status_code == 204, f"Expected 204, got {resp.status_code}: {resp.text}"
@@ -0,0 +1,61 @@
+"""Test for the tool search endpoint."""
+import json
+
+import httpx
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_admin_tools_search(server_url, admin_auth_token):
+    """
+    Test searching tools of the user's MCP servers:
+    1. Create and start a new time server
+    2. Search by description/parameter terms - expect ranked results
+    3. Search for unknown term - expect empty result
+    4. Delete the server - tools are no longer found
+    """
+    headers = {"Authorization": f"Bearer {admin_auth_token}", "Content-Type": "application/json"}
+    server_name = "test_search_server"
+
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        await client.delete(f"{server_url}/api/v1/mcpservers/{server_name}", headers=headers)
+
+        # 1. Create and start a new time server
+        config = {
+            "mcpServers": {
+                server_name: {
+                    "command": "uvx",
+                    "args": ["mcp-server-time", "--local-timezone=Europe/Warsaw"],
+                    "env": {},
+                    "description": "Test search server",
+                    "disabled": False
+                }
+            }
+        }
+        resp = await client.post(f"{server_url}/api/v1/mcpservers", headers=headers, content=json.dumps(config))
+        assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+
+        # 2. Search
+        resp = await client.get(f"{server_url}/api/v1/user/tools/search", headers=headers, params={"q": "convert time", "limit": 5})
+        assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+        results = resp.json()
+        assert results, "Expected search results"
+        assert results[0]["name"] == "convert_time", f"Expected 'convert_time' first, got {results[0]['name']}"
+        # Other time servers of the user expose the same tool with the same score
+        resp = await client.get(f"{server_url}/api/v1/user/tools/search", headers=headers, params={"q": "convert time", "limit": 50})
+        assert any(
+            r["name"] == "convert_time" and r["mcpserver_id"] == f"{server_name}-admin" for r in resp.json()
+        ), f"Expected 'convert_time' of {server_name}, got {resp.json()}"
+        assert all(a["score"] >= b["score"] for a, b in zip(results, results[1:])), "Expected results sorted by score"
+
+        # 3. Unknown term
+        resp = await client.get(f"{server_url}/api/v1/user/tools/search", headers=headers, params={"q": "nonexistentterm"})
+        assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+        assert resp.json() == [], f"Expected no results, got {resp.json()}"
+
+        # 4. Delete the server
+        resp = await client.delete(f"{server_url}/api/v1/mcpservers/{server_name}", headers=headers)
+        assert resp.status_code == 204, f"Expected 204, got {resp.status_code}: {resp.text}"
+        resp = await client.get(f"{server_url}/api/v1/user/tools/search", headers=headers, params={"q": "convert time"})
+        assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
+        assert all(r["mcpserver_id"] != f"{server_name}-admin" for r in resp.json()), "Deleted server tools still found"